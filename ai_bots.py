@@ -6,13 +6,17 @@ Non-hostile NPCs with autonomous behavior
 import random
 import time
 from navigation import Ship
+from seeding import derive_rng
 
 class AIBot:
-    def __init__(self, name, bot_type, starting_system, game):
+    def __init__(self, name, bot_type, starting_system, game, rng=None):
+        # Each bot owns a random stream (handed out by BotManager from the
+        # world seed) so its starting state and choices are reproducible.
+        self.rng = rng or random.Random()
         self.name = name
         self.bot_type = bot_type
         self.game = game
-        self.credits = random.randint(50000, 200000)
+        self.credits = self.rng.randint(50000, 200000)
         self.inventory = {}
         self.ship = None
         self.current_goal = None
@@ -20,6 +24,8 @@ class AIBot:
         self.reputation = 0  # Player's reputation with this bot
         self.last_action_time = 0
         self.trade_history = []
+        self.route = []          # Remaining hops of the current planned route
+        self.route_goal = None   # Coordinates the route was planned toward
         self.personality = self.generate_personality()
         
         # Create bot's ship
@@ -38,13 +44,13 @@ class AIBot:
             "Opportunistic": {"risk_tolerance": 0.7, "trade_frequency": 0.9, "exploration_tendency": 0.6}
         }
         
-        personality_type = random.choice(list(personalities.keys()))
+        personality_type = self.rng.choice(list(personalities.keys()))
         return {"type": personality_type, **personalities[personality_type]}
     
     def create_bot_ship(self, starting_system):
         """Create a ship for the bot"""
         ship_types = ["Aurora-Class Freighter", "Stellar Voyager", "Nebula Drifter", "Basic Transport"]
-        ship_class = random.choice(ship_types)
+        ship_class = self.rng.choice(ship_types)
         
         self.ship = Ship(f"{self.name}'s Ship", ship_class)
         self.ship.coordinates = starting_system['coordinates']
@@ -52,9 +58,9 @@ class AIBot:
         # Give bot some starting cargo
         from goods import commodities
         for category, items in commodities.items():
-            if random.random() < 0.3:  # 30% chance for each category
-                item = random.choice(items)
-                quantity = random.randint(5, 25)
+            if self.rng.random() < 0.3:  # 30% chance for each category
+                item = self.rng.choice(items)
+                quantity = self.rng.randint(5, 25)
                 self.inventory[item['name']] = quantity
     
     def set_new_goal(self):
@@ -78,7 +84,7 @@ class AIBot:
         if self.personality["trade_frequency"] > 0.7:
             goals.extend(["trade", "collect_goods"])
         
-        self.current_goal = random.choice(goals)
+        self.current_goal = self.rng.choice(goals)
         self.find_goal_target()
     
     def find_goal_target(self):
@@ -89,31 +95,31 @@ class AIBot:
             # Find a system with good trade opportunities
             systems_with_markets = [s for s in galaxy.systems.values() 
                                    if s['type'] in ['Trading Hub', 'Core World', 'Industrial']]
-            self.goal_target = random.choice(systems_with_markets) if systems_with_markets else None
+            self.goal_target = self.rng.choice(systems_with_markets) if systems_with_markets else None
             
         elif self.current_goal == "explore":
             # Find an unvisited system
             unvisited = [s for s in galaxy.systems.values() if not s['visited']]
-            self.goal_target = random.choice(unvisited) if unvisited else random.choice(list(galaxy.systems.values()))
+            self.goal_target = self.rng.choice(unvisited) if unvisited else self.rng.choice(list(galaxy.systems.values()))
             
         elif self.current_goal == "visit_research_stations":
             # Find research systems
             research_systems = [s for s in galaxy.systems.values() if s['type'] == 'Research']
-            self.goal_target = random.choice(research_systems) if research_systems else None
+            self.goal_target = self.rng.choice(research_systems) if research_systems else None
             
         elif self.current_goal == "visit_industrial":
             # Find industrial systems
             industrial_systems = [s for s in galaxy.systems.values() if s['type'] == 'Industrial']
-            self.goal_target = random.choice(industrial_systems) if industrial_systems else None
+            self.goal_target = self.rng.choice(industrial_systems) if industrial_systems else None
             
         elif self.current_goal == "visit_core_worlds":
             # Find core world systems
             core_systems = [s for s in galaxy.systems.values() if s['type'] == 'Core World']
-            self.goal_target = random.choice(core_systems) if core_systems else None
+            self.goal_target = self.rng.choice(core_systems) if core_systems else None
             
         else:
             # Default: random system
-            self.goal_target = random.choice(list(galaxy.systems.values()))
+            self.goal_target = self.rng.choice(list(galaxy.systems.values()))
     
     def update_behavior(self):
         """Update bot behavior - called periodically"""
@@ -147,34 +153,48 @@ class AIBot:
         galaxy = self.game.navigation.galaxy
         
         # Check if we can reach the target
-        if self.ship.can_jump_to(target_coords, galaxy):
+        if self.ship.can_jump_to(target_coords, galaxy, self.game):
             success, message = self.ship.jump_to(target_coords, galaxy, self.game)
             if success:
                 # Mark system as visited
-                system = galaxy.get_system_at(*target_coords)
-                if system:
-                    system['visited'] = True
+                galaxy.mark_visited(target_coords)
         else:
-            # Can't reach target directly, find intermediate destination
-            nearby_systems = galaxy.get_nearby_systems(
-                *self.ship.coordinates, self.ship.jump_range
-            )
-            
-            if nearby_systems:
-                # Choose system closest to our goal
-                best_system = None
-                best_distance = float('inf')
-                
-                for system, distance in nearby_systems:
-                    goal_distance = galaxy.calculate_distance(
-                        system['coordinates'], target_coords
-                    )
-                    if goal_distance < best_distance:
-                        best_distance = goal_distance
-                        best_system = system
-                
-                if best_system and self.ship.can_jump_to(best_system['coordinates'], galaxy):
-                    self.ship.jump_to(best_system['coordinates'], galaxy, self.game)
+            # Can't reach target directly — follow a planned multi-jump route.
+            next_hop = self.get_next_route_hop(target_coords)
+            if next_hop is None:
+                # Goal is unreachable on the jump graph; pick something else
+                # rather than wandering toward it forever.
+                self.route = []
+                self.set_new_goal()
+                return
+
+            if self.ship.can_jump_to(next_hop, galaxy, self.game):
+                success, message = self.ship.jump_to(next_hop, galaxy, self.game)
+                if success and self.route and self.route[0] == next_hop:
+                    self.route.pop(0)
+            else:
+                # Not enough fuel for the next leg (or the graph changed) — replan next time.
+                self.route = []
+    
+    def get_next_route_hop(self, target_coords):
+        """Return the next coordinates on the planned route to target_coords.
+
+        The route is planned once per goal with the galaxy's RoutePlanner and
+        replayed hop by hop; it's only recomputed when the goal changes or the
+        remaining route has been cleared.
+        """
+        route = self.route
+        if self.route_goal != target_coords or not route:
+            planner = self.game.navigation.galaxy.get_route_planner()
+            plan = planner.plan_route(self.ship, self.ship.coordinates, target_coords, self.game)
+            if not plan or plan['jumps'] == 0:
+                self.route = []
+                self.route_goal = None
+                return None
+            route = list(plan['path'][1:])
+            self.route = route
+            self.route_goal = target_coords
+        return route[0]
     
     def execute_goal_action(self):
         """Execute action at goal location"""
@@ -210,7 +230,7 @@ class AIBot:
         
         for commodity, quantity in list(self.inventory.items()):
             if commodity in market['demand'] and market['demand'][commodity] > 0:
-                sell_quantity = min(quantity, market['demand'][commodity], random.randint(1, 10))
+                sell_quantity = min(quantity, market['demand'][commodity], self.rng.randint(1, 10))
                 
                 if sell_quantity > 0:
                     success, message, credits_earned = self.game.economy.sell_commodity(
@@ -235,7 +255,7 @@ class AIBot:
                 max_affordable = self.credits // price
                 
                 if max_affordable > 0:
-                    buy_quantity = min(max_affordable, supply, random.randint(1, 15))
+                    buy_quantity = min(max_affordable, supply, self.rng.randint(1, 15))
                     
                     success, message = self.game.economy.buy_commodity(
                         system_name, commodity, buy_quantity, self.credits
@@ -253,17 +273,13 @@ class AIBot:
     
     def explore_system(self):
         """Explore current system"""
-        system = self.game.navigation.galaxy.get_system_at(*self.ship.coordinates)
-        if system:
-            system['visited'] = True
-            # Could add exploration bonuses or discoveries here
+        self.game.navigation.galaxy.mark_visited(self.ship.coordinates)
+        # Could add exploration bonuses or discoveries here
     
     def visit_system(self):
         """Visit system for specific purpose"""
-        system = self.game.navigation.galaxy.get_system_at(*self.ship.coordinates)
+        system = self.game.navigation.galaxy.mark_visited(self.ship.coordinates)
         if system:
-            system['visited'] = True
-            
             # Refuel if needed
             if self.ship.fuel < self.ship.max_fuel * 0.3:  # Refuel if below 30%
                 fuel_needed = self.ship.max_fuel - self.ship.fuel
@@ -291,7 +307,7 @@ class AIBot:
             cost = self.game.station_manager.station_types[station_type]['cost']
             
             # Bots are more willing to buy cheaper stations
-            if cost <= self.credits and (cost < 800000 or random.random() < 0.3):
+            if cost <= self.credits and (cost < 800000 or self.rng.random() < 0.3):
                 # "Purchase" the station (set owner to bot name instead of "Player")
                 station['owner'] = self.name
                 self.credits -= cost
@@ -348,13 +364,17 @@ class AIBot:
         }
         
         if interaction_type in responses and self.bot_type in responses[interaction_type]:
-            return random.choice(responses[interaction_type][self.bot_type])
+            return self.rng.choice(responses[interaction_type][self.bot_type])
         
         return f"{self.name} acknowledges your presence."
 
 class BotManager:
-    def __init__(self, game):
+    def __init__(self, game, seed=None):
         self.game = game
+        if seed is None:
+            seed = getattr(game, 'world_seed', None)
+        self.seed = seed
+        self.rng = derive_rng(seed, "bots") if seed is not None else random.Random()
         self.bots = []
         self.create_initial_bots()
     
@@ -378,10 +398,16 @@ class BotManager:
         # Spread bots across random systems so they don't all cluster at the start.
         galaxy = self.game.navigation.galaxy
         systems = list(galaxy.systems.values())
-        starting_systems = random.sample(systems, min(len(bot_configs), len(systems)))
+        starting_systems = self.rng.sample(systems, min(len(bot_configs), len(systems)))
 
+        # Track each bot's stream in the game's registry so saves record it
+        registry = getattr(self.game, 'rng', None)
         for config, starting_system in zip(bot_configs, starting_systems):
-            bot = AIBot(config["name"], config["type"], starting_system, self.game)
+            stream = f"bots.{config['name']}"
+            bot_rng = derive_rng(self.seed, stream) if self.seed is not None else random.Random()
+            if registry is not None:
+                bot_rng = registry.adopt(stream, bot_rng)
+            bot = AIBot(config["name"], config["type"], starting_system, self.game, rng=bot_rng)
             self.bots.append(bot)
     
     def update_all_bots(self):
@@ -0,0 +1,242 @@
+"""
+backend/actor.py — Single-writer game actor for the web backend.
+
+Every change to the live Game goes through one GameActor, which applies them
+strictly one at a time in arrival (FIFO) order:
+
+  exclusive()  — async context manager; the holder is the only writer until it
+                 exits.  The backend's request middleware wraps API calls in
+                 it, so two tabs clicking at once are applied in order rather
+                 than interleaved.
+  submit(fn)   — queue a plain callable (or coroutine function) and await its
+                 result; it runs on the actor's owner coroutine in the same
+                 queue as requests.
+  every(s, fn) — periodic background job (e.g. Game.run_background_tick)
+                 scheduled through submit(), so background simulation never
+                 races a request handler.
+  suspended()  — inside exclusive(): give the slot to the next in line for
+                 the duration of the block, then queue for it again; the
+                 caller must keep its own state out of reach meanwhile.
+
+A read never observes a half-applied command: handlers run on the event loop
+between commands.
+
+With one game per player (backend/sessions.py) a single process-wide slot
+would make every player wait on every other.  SessionSlots keeps one FIFO
+writer slot per session id instead: the web backend holds the caller's slot
+for each API call, so one player's tabs are applied in order while other
+players' calls run alongside.  The backend's GameActor is left with the
+periodic background tick, which visits each session in turn.
+
+Everything here must be used from the event loop thread.  Work running on
+other threads hands its result back with submit() via
+asyncio.run_coroutine_threadsafe().
+"""
+
+import asyncio
+import contextvars
+import inspect
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+
+# (actor, hold) for the exclusive() block the current task is inside
+_held: contextvars.ContextVar = contextvars.ContextVar("game_actor_held", default=None)
+
+
+class _Hold:
+    """The release future of one exclusive() block; replaced on re-acquire."""
+
+    __slots__ = ("released",)
+
+    def __init__(self, released: asyncio.Future):
+        self.released = released
+
+
+class GameActor:
+    """FIFO command queue with one owner coroutine applying each command."""
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._owner: Optional[asyncio.Task] = None
+        self._periodic: List[asyncio.Task] = []
+        self.processed = 0          # commands applied since start()
+        self.failed = 0             # submitted callables that raised
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._owner is not None and not self._owner.done()
+
+    def start(self):
+        """Start the owner coroutine on the running loop (idempotent)."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._owner = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Cancel periodic jobs and the owner; pending commands are dropped."""
+        for task in self._periodic:
+            task.cancel()
+        self._periodic = []
+        if self._owner is not None:
+            self._owner.cancel()
+            try:
+                await self._owner
+            except asyncio.CancelledError:
+                pass
+        self._owner = None
+        self._queue = None
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+
+    async def submit(self, fn: Callable, *args, **kwargs) -> Any:
+        """Apply fn(*args, **kwargs) in queue order and return its result."""
+        self.start()
+        done = asyncio.get_running_loop().create_future()
+        await self._queue.put((fn, args, kwargs, done))
+        return await done
+
+    async def _acquire(self) -> asyncio.Future:
+        """Queue for the writer slot; return the future that releases it."""
+        self.start()
+        loop = asyncio.get_running_loop()
+        granted, released = loop.create_future(), loop.create_future()
+        await self._queue.put((None, (granted, released), None, None))
+        try:
+            await granted
+        except asyncio.CancelledError:
+            # Cancelled just after the grant landed: give the slot back
+            if granted.done() and not granted.cancelled():
+                released.set_result(None)
+            raise
+        return released
+
+    @asynccontextmanager
+    async def exclusive(self):
+        """Hold the writer slot for the duration of the block (FIFO)."""
+        hold = _Hold(await self._acquire())
+        token = _held.set((self, hold))
+        try:
+            yield
+        finally:
+            _held.reset(token)
+            if not hold.released.done():
+                hold.released.set_result(None)
+
+    def held(self) -> bool:
+        """True inside exclusive() while the slot is held (not suspended)."""
+        held = _held.get()
+        return held is not None and held[0] is self and not held[1].released.done()
+
+    @asynccontextmanager
+    async def suspended(self):
+        """
+        Release the slot held by the enclosing exclusive() block, run the
+        block, then wait in line for the slot again before continuing.
+        """
+        held = _held.get()
+        if held is None or held[0] is not self:
+            raise RuntimeError("suspended() used outside exclusive()")
+        hold = held[1]
+        hold.released.set_result(None)
+        try:
+            yield
+        finally:
+            hold.released = await self._acquire()
+
+    def every(self, seconds: float, fn: Callable, *args) -> asyncio.Task:
+        """Run fn(*args) through the queue every `seconds` until stop()."""
+        async def _loop():
+            while True:
+                await asyncio.sleep(seconds)
+                try:
+                    await self.submit(fn, *args)
+                except Exception as _e:
+                    print(f"[4X] Warning: background job {getattr(fn, '__name__', fn)} failed: {_e}")
+
+        task = asyncio.get_running_loop().create_task(_loop())
+        self._periodic.append(task)
+        return task
+
+    # ------------------------------------------------------------------
+    # Owner coroutine
+    # ------------------------------------------------------------------
+
+    async def _run(self):
+        queue = self._queue
+        while True:
+            fn, args, kwargs, done = await queue.get()
+            if fn is None:
+                # exclusive() grant: hand over the writer slot, wait for release
+                granted, released = args
+                if not granted.done():
+                    granted.set_result(None)
+                    await asyncio.shield(released)
+                self.processed += 1
+                continue
+            if done.cancelled():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+            except Exception as exc:
+                self.failed += 1
+                if not done.done():
+                    done.set_exception(exc)
+            else:
+                if not done.done():
+                    done.set_result(result)
+            self.processed += 1
+
+
+class _Slot:
+    """One key's lock and the number of callers holding or queued for it."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class SessionSlots:
+    """One FIFO writer slot per key (the backend uses session ids)."""
+
+    def __init__(self):
+        self._slots: Dict[str, _Slot] = {}
+
+    @asynccontextmanager
+    async def exclusive(self, key: str):
+        """Hold key's slot for the duration of the block; other keys are not
+        held up.  The key counts as in use from the call, not just once the
+        slot is granted."""
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = _Slot()
+        slot.users += 1
+        try:
+            async with slot.lock:
+                yield
+        finally:
+            slot.users -= 1
+            if not slot.users:
+                del self._slots[key]
+
+    def in_use(self, key: str) -> bool:
+        """True while a call holds or waits for key's slot."""
+        return key in self._slots
+
+    def __len__(self) -> int:
+        return len(self._slots)
@@ -0,0 +1,129 @@
+"""
+backend/assets.py — Content-versioned frontend asset URLs.
+
+The frontend is plain ES modules served straight from frontend/.  To stop
+browsers running stale JS after an edit, every response used to carry
+Cache-Control: no-store, so each page load re-downloaded every file.
+
+AssetVersioner instead fingerprints the whole frontend tree (a hash of every
+file's path and contents — the build id) and rewrites URLs on the way out:
+
+  index.html   <script src="/js/main.js">     -> /js/main.js?v=<build id>
+  *.js         import ... from "./state.js"   -> "./state.js?v=<build id>"
+               import("../main.js")           -> import("../main.js?v=<build id>")
+
+A URL carrying the current build id never changes content, so main.py serves
+it with a one-year immutable Cache-Control; index.html itself (and any
+unversioned URL) is sent with no-cache plus an ETag, so the browser
+revalidates it cheaply with a 304.  One id for the whole tree (rather than one
+per file) keeps every module URL consistent — ES modules are identified by
+URL, so main.js must not load once as ?v=a and again as ?v=b.  Editing any
+file changes the id, and the next page load picks everything up.
+
+The fingerprint is re-checked from file sizes and mtimes (a stat per file) at
+most every RECHECK_SECONDS, and contents are only re-hashed when those move.
+"""
+
+import hashlib
+import mimetypes
+import os
+import re
+import time
+from typing import Dict, Optional, Tuple
+
+
+RECHECK_SECONDS = 1.0
+
+#: Extensions whose contents get URL rewriting; everything else is served as-is.
+_REWRITTEN = (".js", ".html")
+
+_HTML_REF_RE = re.compile(r'''((?:src|href)\s*=\s*)(["'])(/(?:js|css)/[^"'?#]+\.(?:js|css))\2''')
+_JS_IMPORT_RE = re.compile(r'''(\bfrom\s*|\bimport\s*\(?\s*)(["'])(\.{1,2}/[^"'?#]+\.js)\2''')
+
+
+class AssetVersioner:
+    """Build id, URL rewriting and a rendered-file cache for one directory."""
+
+    def __init__(self, root: str):
+        self.root = os.path.realpath(root)
+        self._build_id: Optional[str] = None
+        self._stamp: Optional[tuple] = None
+        self._checked_at = 0.0
+        self._rendered: Dict[str, Tuple[bytes, str, str]] = {}
+
+    # ------------------------------------------------------------------
+    # Fingerprint
+    # ------------------------------------------------------------------
+
+    def _files(self):
+        for dirpath, _dirs, filenames in os.walk(self.root):
+            for name in filenames:
+                yield os.path.join(dirpath, name)
+
+    def build_id(self) -> str:
+        """Hash of every file under root; recomputed only when a file changes."""
+        now = time.monotonic()
+        if self._build_id is not None and now - self._checked_at < RECHECK_SECONDS:
+            return self._build_id
+        self._checked_at = now
+        stamp = []
+        for path in self._files():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stamp.append((os.path.relpath(path, self.root), st.st_size, st.st_mtime_ns))
+        stamp = tuple(sorted(stamp))
+        if stamp != self._stamp:
+            digest = hashlib.sha256()
+            for rel, _size, _mtime in stamp:
+                digest.update(rel.encode("utf-8"))
+                try:
+                    with open(os.path.join(self.root, rel), "rb") as fh:
+                        digest.update(fh.read())
+                except OSError:
+                    pass
+            self._build_id = digest.hexdigest()[:12]
+            self._stamp = stamp
+            self._rendered.clear()
+        return self._build_id
+
+    # ------------------------------------------------------------------
+    # Rewriting
+    # ------------------------------------------------------------------
+
+    def rewrite_html(self, text: str, build_id: str) -> str:
+        return _HTML_REF_RE.sub(lambda m: f"{m.group(1)}{m.group(2)}{m.group(3)}?v={build_id}{m.group(2)}", text)
+
+    def rewrite_js(self, text: str, build_id: str) -> str:
+        return _JS_IMPORT_RE.sub(lambda m: f"{m.group(1)}{m.group(2)}{m.group(3)}?v={build_id}{m.group(2)}", text)
+
+    def render(self, rel_path: str) -> Tuple[bytes, str, str]:
+        """
+        Return (body, media_type, etag) for a file under root, with URLs
+        rewritten for the current build.  Raises FileNotFoundError for
+        anything missing or outside root.
+        """
+        build_id = self.build_id()
+        cached = self._rendered.get(rel_path)
+        if cached is not None:
+            return cached
+        path = os.path.realpath(os.path.join(self.root, rel_path))
+        if not path.startswith(self.root + os.sep) or not os.path.isfile(path):
+            raise FileNotFoundError(rel_path)
+        with open(path, "rb") as fh:
+            body = fh.read()
+        if path.endswith(_REWRITTEN):
+            text = body.decode("utf-8")
+            if path.endswith(".html"):
+                text = self.rewrite_html(text, build_id)
+            else:
+                text = self.rewrite_js(text, build_id)
+            body = text.encode("utf-8")
+        media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if path.endswith(".js"):
+            media_type = "text/javascript"
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        rendered = (body, media_type, etag)
+        self._rendered[rel_path] = rendered
+        return rendered
@@ -160,6 +160,15 @@ class ColonyManager:
         self.game = game
         # planet_name → ColonyGrid
         self.colonies: dict[str, ColonyGrid] = {}
+        # Bumped by every change that can alter production (founding, builds,
+        # upgrades, demolitions, governing-system switches, load).  Callers
+        # outside this class that edit tiles or systems must call mark_changed().
+        self.version = 0
+        self._production_cache: Optional[tuple[int, dict[str, float]]] = None
+
+    def mark_changed(self) -> None:
+        """Record a production-affecting change (invalidates cached totals)."""
+        self.version += 1
 
     # -----------------------------------------------------------------------
     # Colony lifecycle
@@ -191,6 +200,7 @@ class ColonyManager:
             population=10_000,
         )
         self.colonies[planet_name] = colony
+        self.mark_changed()
         return True, f"Colony founded on {planet_name}.", colony
 
     # -----------------------------------------------------------------------
@@ -252,6 +262,7 @@ class ColonyManager:
         self.game.credits -= cost
         tile.improvement = improvement_type
         tile.improvement_turn_built = self.game.current_turn
+        self.mark_changed()
 
         prod = self.calculate_tile_production(tile)
         summary = ", ".join(f"+{v} {k}" for k, v in prod.items() if v > 0)
@@ -286,6 +297,7 @@ class ColonyManager:
         # Apply the upgrade
         self.game.credits -= cost
         tile.improvement_level += 1
+        self.mark_changed()
 
         new_level_name = f"Tier {tile.improvement_level + 1}"
         prod = self.calculate_tile_production(tile)
@@ -316,6 +328,7 @@ class ColonyManager:
         name = tile.improvement
         tile.improvement = None
         tile.improvement_turn_built = 0
+        self.mark_changed()
         return True, f"Demolished {name}. Refund: {refund:,} credits.", refund
 
     # -----------------------------------------------------------------------
@@ -431,6 +444,20 @@ class ColonyManager:
                 totals[resource] = totals.get(resource, 0.0) + amount
         return {k: round(v, 1) for k, v in totals.items()}
 
+    def cached_production(self) -> dict[str, float]:
+        """
+        calculate_all_production(), recomputed only after mark_changed().
+
+        Read-only callers (HUD indices, research rate) hit this every state
+        refresh; the totals only move when a colony is founded, built on or
+        switches governing system.  Treat the returned dict as read-only.
+        """
+        cache = self._production_cache
+        if cache is None or cache[0] != self.version:
+            cache = (self.version, self.calculate_all_production())
+            self._production_cache = cache
+        return cache[1]
+
     # -----------------------------------------------------------------------
     # Turn advancement hook
     # -----------------------------------------------------------------------
@@ -650,6 +677,7 @@ class ColonyManager:
     def deserialize(self, data: dict) -> None:
         """Restore colony state from a serialised dict (after load_game)."""
         self.colonies = {}
+        self.mark_changed()
         for planet_name, colony_data in data.items():
             tiles = {}
             for key, td in colony_data.get("tiles", {}).items():
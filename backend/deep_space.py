@@ -456,12 +456,14 @@ class DeepSpaceManager:
         if obj:
             obj.discovered = True
 
-    def encounter(self, q: int, r: int) -> Dict:
+    def encounter(self, q: int, r: int, rng: Optional[random.Random] = None) -> Dict:
         """
         Trigger a random derelict encounter at (q, r).
 
         Picks a weighted-random outcome, applies loot/damage modifiers, marks
         the derelict as depleted, and returns the full encounter result dict.
+        The outcome is drawn from rng - the game's seeded "encounters" stream
+        - so a seeded game replays it; the random module without one.
 
         Raises ValueError if there is no derelict here or it is already depleted.
 
@@ -489,7 +491,7 @@ class DeepSpaceManager:
 
         # Pick outcome
         weights = [o["weight"] for o in ENCOUNTER_OUTCOMES]
-        outcome = random.choices(ENCOUNTER_OUTCOMES, weights=weights, k=1)[0]
+        outcome = (rng or random).choices(ENCOUNTER_OUTCOMES, weights=weights, k=1)[0]
 
         # Base loot from the derelict's loot table
         # Structure: {"credits": int, "cargo": {resource: amount, ...}}
@@ -559,6 +561,10 @@ class DeepSpaceManager:
     def list_all(self) -> List[DeepSpaceObject]:
         return list(self._objects.values())
 
+    def count(self) -> int:
+        """Number of objects, without copying them out like list_all()."""
+        return len(self._objects)
+
     def list_discovered(self) -> List[DeepSpaceObject]:
         return [o for o in self._objects.values() if o.discovered or o.type == "outpost_site"]
 
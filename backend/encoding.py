@@ -0,0 +1,142 @@
+"""
+backend/encoding.py — Response encodings: compression and columnar records.
+
+Two independent, negotiated ways to shrink the big map/tree payloads:
+
+  compression — gzip (stdlib) or Brotli (only if the optional `brotli`
+                package is installed), chosen from the request's
+                Accept-Encoding.  Applied by main.py's compress_responses
+                middleware to any compressible response over
+                MIN_COMPRESS_BYTES.
+
+  columnar    — opt-in with ?layout=columnar.  A list of records that all
+                share the same keys, e.g.
+                    [{"name": "Sol", "hex_q": 1}, {"name": "Vega", "hex_q": 4}]
+                is sent as one array per field:
+                    {"$columns": {"name": ["Sol", "Vega"], "hex_q": [1, 4]},
+                     "$count": 2}
+                so each key name appears once instead of once per record.
+                Lists whose records differ in shape are left as they are, so
+                expanding is always exact.  frontend/js/api.js expands tables
+                back into records (expandColumnar) before callers see them.
+
+Everything here is plain Python (no web framework imports) so it can be
+unit-tested on its own.
+"""
+
+import gzip
+from typing import Iterable, List, Optional
+
+try:
+    import brotli   # optional: pip install brotli
+except ImportError:
+    brotli = None
+
+
+#: Bodies smaller than this go out uncompressed — the framing costs more.
+MIN_COMPRESS_BYTES = 1024
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5   # fast enough per request; most of the ratio of q11
+
+_COMPRESSIBLE_TYPES = (
+    "application/json", "application/javascript", "text/javascript",
+    "text/css", "text/html", "text/plain", "image/svg+xml",
+)
+
+COLUMNAR_LAYOUT = "columnar"
+
+
+# ---------------------------------------------------------------------------
+# Compression
+# ---------------------------------------------------------------------------
+
+def _accepted(accept_encoding: str) -> dict:
+    """Accept-Encoding -> {coding: q}."""
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        pieces = part.strip().split(";")
+        coding = pieces[0].strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in pieces[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Best supported content-coding for the header: "br", "gzip" or None."""
+    accepted = _accepted(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    if brotli is not None and accepted.get("br", wildcard) > 0:
+        return "br"
+    if accepted.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    return media_type in _COMPRESSIBLE_TYPES
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+    raise ValueError(f"unsupported content-coding: {encoding}")
+
+
+# ---------------------------------------------------------------------------
+# Columnar records
+# ---------------------------------------------------------------------------
+
+def to_columnar(records: List[dict]):
+    """
+    One array per field if every record is a dict with the same keys, else
+    the list unchanged.
+    """
+    if not records or not all(isinstance(r, dict) for r in records):
+        return records
+    fields = list(records[0])
+    field_set = set(fields)
+    if any(len(r) != len(fields) or r.keys() != field_set for r in records):
+        return records
+    return {
+        "$columns": {f: [r[f] for r in records] for f in fields},
+        "$count":   len(records),
+    }
+
+
+def from_columnar(table) -> list:
+    """Inverse of to_columnar (non-tables pass through)."""
+    if not isinstance(table, dict) or "$columns" not in table:
+        return table
+    columns = table["$columns"]
+    fields = list(columns)
+    return [
+        {f: columns[f][i] for f in fields}
+        for i in range(table.get("$count", 0))
+    ]
+
+
+def columnarize(payload: dict, keys: Iterable[str], layout: Optional[str]) -> dict:
+    """
+    If layout == "columnar", return a shallow copy of payload with each list
+    under `keys` replaced by its columnar table; otherwise payload itself.
+    """
+    if layout != COLUMNAR_LAYOUT:
+        return payload
+    out = dict(payload)
+    for key in keys:
+        if isinstance(out.get(key), list):
+            out[key] = to_columnar(out[key])
+    return out
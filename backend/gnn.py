@@ -253,7 +253,10 @@ def generate_gnn_summary(game, colony_manager, events: list,
         "closing":     str,
     }
     """
-    rng = random.Random()   # unseeded — different every call
+    # The game's "gnn" stream: saved with the game, so a replayed turn
+    # reads the same broadcast
+    registry = getattr(game, "rng", None)
+    rng = registry.stream("gnn") if registry is not None else random.Random()
 
     turn = game.current_turn
     news_items = []
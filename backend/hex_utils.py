@@ -1,11 +1,14 @@
 """
 backend/hex_utils.py — Hex coordinate mathematics and 3D→2D galaxy projection.
 
-This module is pure math — no game state, no FastAPI, no side effects.
-It provides two things:
+This module is pure math — no game state, no FastAPI.  The only side effect
+is GalaxyHexIndex writing 'hex_q' / 'hex_r' onto the system records it syncs.
+It provides three things:
   1. Axial hex coordinate helpers (shared logic with the JS hex-math.js)
   2. A function that takes the galaxy's 3D system coordinates and projects
      them onto a 2D axial hex grid for the frontend to render.
+  3. GalaxyHexIndex — that projection cached per galaxy, with a reverse
+     (q, r) → system lookup.
 
 Coordinate system used: AXIAL (q, r).
   - q is the column axis (east/west)
@@ -157,6 +160,58 @@ def resolve_hex_collisions(systems: list[dict]) -> list[dict]:
     return systems
 
 
+class GalaxyHexIndex:
+    """
+    Collision-resolved hex positions for every system in a galaxy, computed
+    once and kept in step with the galaxy instead of re-projected per request.
+
+    Holds two maps:
+      hex_of  — system coordinates → HexCoord
+      by_hex  — HexCoord → system coordinates (the reverse index)
+
+    sync() is a no-op until the galaxy's systems change.  New systems are
+    placed against the hexes already taken (the same nudge rule as
+    resolve_hex_collisions), so existing systems never move; removed systems
+    just free their hex.  The resolved position is also written onto each
+    system record as 'hex_q' / 'hex_r'.
+    """
+
+    def __init__(self):
+        self.hex_of: dict[tuple, HexCoord] = {}
+        self.by_hex: dict[HexCoord, tuple] = {}
+        self._version = None
+
+    def sync(self, systems: dict, version=None) -> bool:
+        """Bring the index up to date with ``systems`` ({coords: record}).
+        Returns True if anything was (re)computed."""
+        if version == self._version and len(systems) == len(self.hex_of):
+            return False
+
+        for coords in [c for c in self.hex_of if c not in systems]:
+            self.by_hex.pop(self.hex_of.pop(coords), None)
+
+        for coords, record in systems.items():
+            coord = self.hex_of.get(coords)
+            if coord is None:
+                coord = _find_free_hex(galaxy_coords_to_hex(coords[0], coords[1]), self.by_hex)
+                self.hex_of[coords] = coord
+                self.by_hex[coord] = coords
+            if record.get("hex_q") != coord.q or record.get("hex_r") != coord.r:
+                record["hex_q"] = coord.q
+                record["hex_r"] = coord.r
+
+        self._version = version
+        return True
+
+    def system_at(self, q: int, r: int):
+        """Coordinates of the system drawn at hex (q, r), or None."""
+        return self.by_hex.get(HexCoord(q, r))
+
+    def occupied(self) -> set[HexCoord]:
+        """Every hex that holds a system."""
+        return set(self.by_hex)
+
+
 def _find_free_hex(preferred: HexCoord, occupied: set[HexCoord]) -> HexCoord:
     """
     Return `preferred` if it's free, otherwise spiral outward until an
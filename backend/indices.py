@@ -0,0 +1,465 @@
+"""
+backend/indices.py — Incrementally cached strategic indices (SPI / REI / KII / ECI).
+
+The four HUD indices are sums of ~30 named sub-components.  Rebuilding them
+from scratch on every state refresh meant summing colony production over
+every tile, counting visited systems across the whole galaxy and re-walking
+the profession/faction tables — work that grows with the empire even when
+nothing relevant changed.
+
+IndexEngine splits the computation in two layers:
+
+  inputs      — scalar values read from the game by a handful of cheap
+                readers (stats, completed research, credits, fleet, colony
+                production, visited count, faction standing, profession).
+                Each reader is O(1): colony totals come from
+                ColonyManager.cached_production() and the visited count from
+                Galaxy.visited_count(), both maintained incrementally.
+  components  — one per tooltip line.  Each declares the inputs (or earlier
+                components) it reads; on refresh() only components whose
+                dependencies changed value are recomputed, and a change only
+                propagates further if the component's own value moved.
+
+refresh() returns the same dict shape the HUD has always consumed
+({spi, rei, kii, eci, fleet_pool, details, inputs}); breakdown() exposes the
+per-component view (value, dependencies, recompute count).
+
+Formulas live in COMPONENTS below — add a sub-component by appending an
+entry there; the profession multiplier tables are REI/KII/ECI_PROFESSION_BONUSES.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from factions import factions
+
+
+# ===========================================================================
+# Profession multipliers
+# ===========================================================================
+# Values are fractional multipliers applied to each sub-component total; the
+# final bonus is further scaled by profession_level / 10 so that a level-1
+# player gets 10% of the stated value and a level-10 master gets the full
+# 100%.  Add new professions or adjust weights here only — no other code
+# changes are needed to pick them up.
+
+REI_PROFESSION_BONUSES: Dict[str, Dict[str, float]] = {
+    # ── Directly extractive ─────────────────────────────────────────────────
+    "Resource Vein Prospector":              {"raw": 0.20, "energy": 0.05, "prospecting": 0.15},
+    "Atmospheric Harvest Technician":        {"energy": 0.25},
+    "Etheric Materials Synthesist":          {"energy": 0.15, "raw": 0.05},
+    "Salvage Systems Diver":                 {"raw": 0.10},
+    "Nano-Fabrication Artisan":              {"raw": 0.10},
+    "Bio-Integrated Manufacturing Director": {"raw": 0.15},
+    "Terraforming Ecologist":                {"raw": 0.05, "energy": 0.05},
+    "Planetary Renewal Engineer":            {"raw": 0.05},
+    # ── Exploration and surveying ────────────────────────────────────────────
+    "Void Cartographer":                     {"logistics": 0.15, "prospecting": 0.10},
+    "Deep Space Reconnaissance Operative":   {"logistics": 0.10, "prospecting": 0.15},
+    "Chrono-Synthetic Flux Analyst":          {"prospecting": 0.10},
+    # ── Logistics and infrastructure ────────────────────────────────────────
+    "Ether Drive Tuner":                     {"energy": 0.10, "logistics": 0.10},
+    "Gravitic Systems Engineer":             {"logistics": 0.15},
+    "Wormline Infrastructure Engineer":      {"logistics": 0.20},
+    "Orbital Dockmaster":                    {"logistics": 0.15},
+    "Interstellar Quartermaster":            {"logistics": 0.20},
+    "Habitat Systems Warden":                {"logistics": 0.10},
+}
+
+KII_PROFESSION_BONUSES: Dict[str, Dict[str, float]] = {
+    # ── Research and analysis ────────────────────────────────────────────────
+    "Astrobiologist":                       {"research": 0.15, "innovation": 0.05},
+    "Quantum Computer Scientist":           {"research": 0.20, "ai": 0.15},
+    "Ancient Systems Decipherer":           {"research": 0.15, "education": 0.10},
+    "Etheric Historian":                    {"education": 0.15, "research": 0.05},
+    "Memory Forensics Analyst":             {"research": 0.10, "education": 0.10},
+    "Chrono-Synthetic Flux Analyst":        {"research": 0.10, "innovation": 0.10},
+    "Myth-Systems Scholar":                 {"education": 0.10},
+    "Cultural Pattern Archivist":           {"education": 0.10},
+    "Relic Recovery Specialist":            {"research": 0.10},
+    # ── Consciousness, AI, and cognition ────────────────────────────────────
+    "Consciousness Engineer":               {"ai": 0.20, "innovation": 0.10},
+    "AI-Ether Integration Specialist":      {"ai": 0.25},
+    "Cognitive Archive Curator":            {"education": 0.15, "ai": 0.10},
+    "Quantum Consciousness Transfer Technician": {"ai": 0.10},
+    "Collective Consciousness Integrator":  {"ai": 0.15, "innovation": 0.10},
+    "Consciousness Confluence Architect":   {"ai": 0.20, "research": 0.10},
+    "Shared Mind Systems Steward":          {"ai": 0.10, "education": 0.10},
+    # ── Education and mentorship ─────────────────────────────────────────────
+    "Adaptive Education Designer":          {"education": 0.20},
+    "Knowledge Systems Mentor":             {"education": 0.20, "innovation": 0.05},
+    "Cognitive Apprenticeship Instructor":  {"education": 0.15},
+    "Inter-Species Education Facilitator":  {"education": 0.15},
+    "Foundational Learning Guide":          {"education": 0.10},
+    # ── Exploration feeding discovery ────────────────────────────────────────
+    "Quantum Navigator":                    {"innovation": 0.10, "ai": 0.05},
+    "Void Cartographer":                    {"research": 0.05, "innovation": 0.05},
+    "Deep Space Reconnaissance Operative":  {"research": 0.05},
+}
+
+ECI_PROFESSION_BONUSES: Dict[str, Dict[str, float]] = {
+    # ── Trade, commerce, and brokerage ──────────────────────────────────────
+    "Exotic Commodities Broker":            {"trade": 0.25, "liquidity": 0.10},
+    "Trade Route Adjudicator":              {"trade": 0.20},
+    "Interstellar Diplomatic Attaché":      {"trade": 0.10, "liquidity": 0.05},
+    "Faction Liaison Officer":              {"trade": 0.10},
+    "Universal Translation Mediator":       {"trade": 0.10},
+    # ── Industrial production ────────────────────────────────────────────────
+    "Bio-Integrated Manufacturing Director":{"industrial": 0.20},
+    "Nano-Fabrication Artisan":             {"industrial": 0.15},
+    "Closed-Loop Sustainability Planner":   {"industrial": 0.15, "energy": 0.05},
+    "Terraforming Ecologist":               {"industrial": 0.10},
+    "Planetary Renewal Engineer":           {"industrial": 0.10},
+    "Programmable Matter Architect":        {"industrial": 0.15, "energy": 0.05},
+    "Nano-Swarm Systems Engineer":          {"industrial": 0.10},
+    "Programmable Matter Fabrication Technician": {"industrial": 0.10},
+    # ── Energy and resource conversion ───────────────────────────────────────
+    "Atmospheric Harvest Technician":       {"energy": 0.20},
+    "Etheric Materials Synthesist":         {"energy": 0.15},
+    "Gravitic Systems Engineer":            {"energy": 0.10},
+    "Ether Drive Tuner":                    {"energy": 0.10},
+    # ── Logistics, supply, and operations ───────────────────────────────────
+    "Interstellar Quartermaster":           {"industrial": 0.10, "trade": 0.10},
+    "Orbital Dockmaster":                   {"trade": 0.15},
+    "Habitat Systems Warden":               {"industrial": 0.05, "liquidity": 0.05},
+    "Wormline Infrastructure Engineer":     {"trade": 0.10},
+}
+
+# Faction focuses that earn a rep-gated bonus on each index, with the
+# (rep > 75, rep > 50, rep > 10) bonus tiers.
+FACTION_BONUSES: Dict[str, Tuple[frozenset, Tuple[int, int, int]]] = {
+    "spi": (frozenset({"Industry", "Technology"}),          (25, 12, 4)),
+    "rei": (frozenset({"Industry", "Exploration"}),         (30, 15, 5)),
+    "kii": (frozenset({"Technology", "Science"}),           (30, 15, 5)),
+    "eci": (frozenset({"Trade", "Commerce", "Industry"}),   (30, 15, 5)),
+}
+
+
+def _faction_bonus(index: str, focus: str, rep: int) -> int:
+    focuses, (large, medium, small) = FACTION_BONUSES[index]
+    if focus not in focuses:
+        return 0
+    if rep > 75:
+        return large
+    if rep > 50:
+        return medium
+    if rep > 10:
+        return small
+    return 0
+
+
+def _profession_bonus(table: Dict[str, Dict[str, float]], v: dict, parts) -> int:
+    """Sum of component × multiplier × level scale for the player's profession."""
+    mults = table.get(v["prof_name"], {})
+    scale = v["prof_level"] / 10.0   # level 1 → 0.10,  level 10 → 1.0
+    total = 0
+    for key, component in parts:
+        total = total + v[component] * mults.get(key, 0) * scale
+    return int(total)
+
+
+# ===========================================================================
+# Inputs
+# ===========================================================================
+
+_COLONY_RESOURCES = (
+    ("minerals", "minerals"), ("food", "food"), ("ether", "ether"),
+    ("research_pts", "research"), ("credits_prod", "credits"),
+    ("defense_pts", "defense"), ("refined_ore", "refined_ore"),
+)
+
+
+def _read_stats(game, _colonies):
+    stats = game.character_stats or {}
+    # Character stat shortcuts (base 30; range 30-100)
+    return {
+        "kin": stats.get("KIN", 30), "int": stats.get("INT", 30),
+        "aef": stats.get("AEF", 30), "syn": stats.get("SYN", 30),
+        "coh": stats.get("COH", 30),
+    }
+
+
+def _read_economy(game, _colonies):
+    return {
+        "n_completed": len(game.completed_research or []),
+        "credits":     max(0, game.credits),
+        "ships":       len(getattr(game, "fleet", {})),
+        # Fleet pool — the canonical, production-chain-backed military strength.
+        "fleet_pool":  max(0, getattr(game, "fleet_pool", 0)),
+    }
+
+
+def _read_colonies(_game, colony_manager):
+    prod = {}
+    if colony_manager and colony_manager.colonies:
+        prod = colony_manager.cached_production()
+    values = {name: int(prod.get(key, 0)) for name, key in _COLONY_RESOURCES}
+    values["empire_size"] = len(colony_manager.colonies) if colony_manager else 0
+    return values
+
+
+def _read_visited(game, _colonies):
+    # Systems the player has visited — used as a proxy for scouting / logistics
+    try:
+        return {"visited": game.navigation.galaxy.visited_count()}
+    except Exception:
+        return {"visited": 0}
+
+
+def _read_faction(game, _colonies):
+    allied = getattr(game, "character_faction", "") or ""
+    rep = 0
+    try:
+        rep = game.faction_system.player_relations.get(allied, 0)
+    except Exception:
+        pass
+    return {
+        "faction_name":  allied,
+        "faction_focus": factions.get(allied, {}).get("primary_focus", ""),
+        "faction_rep":   rep,
+    }
+
+
+def _read_profession(game, _colonies):
+    name = getattr(game, "character_profession", "") or ""
+    system = getattr(game, "profession_system", None)
+    return {
+        "prof_name":  name,
+        "prof_level": system.profession_levels.get(name, 1) if system else 1,
+    }
+
+
+INPUT_READERS: Tuple[Callable, ...] = (
+    _read_stats, _read_economy, _read_colonies,
+    _read_visited, _read_faction, _read_profession,
+)
+
+
+# ===========================================================================
+# Components
+# ===========================================================================
+
+@dataclass(frozen=True)
+class Component:
+    key:   str                      # unique id, e.g. "rei.raw"
+    index: str                      # "spi" / "rei" / "kii" / "eci"
+    label: str                      # tooltip label in details[index]
+    deps:  Tuple[str, ...]          # input names or earlier component keys
+    fn:    Callable[[dict], int]
+
+
+def _c(key, label, deps, fn):
+    return Component(key, key.split(".", 1)[0], label, tuple(deps), fn)
+
+
+_REI_PARTS = (("raw", "rei.raw"), ("energy", "rei.energy"),
+              ("logistics", "rei.logistics"), ("prospecting", "rei.prospecting"))
+_KII_PARTS = (("research", "kii.research"), ("education", "kii.education"),
+              ("ai", "kii.ai"), ("innovation", "kii.innovation"))
+_ECI_PARTS = (("industrial", "eci.industrial"), ("trade", "eci.trade"),
+              ("energy", "eci.energy"), ("liquidity", "eci.liquidity"))
+_PROF = ("prof_name", "prof_level")
+_FACTION = ("faction_focus", "faction_rep")
+
+#: Every sub-component, in tooltip order.  Dependencies must be inputs or
+#: components listed earlier.
+COMPONENTS: Tuple[Component, ...] = (
+    # ── SPI ──────────────────────────────────────────────────────────────────
+    # Fleet Strength: backed entirely by the production chain (fleet_pool).
+    _c("spi.fleet", "Fleet Strength (pool)", ("fleet_pool",),
+       lambda v: v["fleet_pool"]),
+    # Defense Grid: actual built infrastructure.  Zero until colonies exist.
+    _c("spi.defense", "Defense Grid", ("defense_pts", "empire_size"),
+       lambda v: v["defense_pts"] * 25 + v["empire_size"] * 20),
+    # Combat Doctrine: learned military techniques and kinetic aptitude (KIN).
+    _c("spi.doctrine", "Combat Doctrine", ("n_completed", "kin"),
+       lambda v: v["n_completed"] * 4 + v["kin"] // 20),
+    # Intelligence Capability: deliberately small so raw stats never dominate.
+    _c("spi.intel", "Intelligence Capability", ("int", "coh"),
+       lambda v: v["int"] // 20 + v["coh"] // 20),
+    _c("spi.faction", "Faction Bonus", _FACTION,
+       lambda v: _faction_bonus("spi", v["faction_focus"], v["faction_rep"])),
+
+    # ── REI ──────────────────────────────────────────────────────────────────
+    # refined_ore represents processed industrial capacity upstream of the chain.
+    _c("rei.raw", "Raw Material Access", ("minerals", "refined_ore", "visited"),
+       lambda v: v["minerals"] * 8 + v["refined_ore"] * 6 + v["visited"] * 2),
+    _c("rei.energy", "Energy Production", ("ether", "aef"),
+       lambda v: v["ether"] * 10 + v["aef"] // 5),
+    _c("rei.logistics", "Logistics Capacity", ("ships", "visited"),
+       lambda v: v["ships"] * 12 + v["visited"] * 3),
+    # KIN drilling precision, SYN tech integration, COH long-range focus
+    _c("rei.extraction", "Extraction Aptitude", ("kin", "syn", "coh"),
+       lambda v: v["kin"] // 8 + v["syn"] // 10 + v["coh"] // 12),
+    # AEF senses etheric deposits; breadth of exploration multiplies discovery
+    _c("rei.prospecting", "Prospecting Advantage", ("aef", "visited"),
+       lambda v: v["aef"] // 6 + v["visited"]),
+    _c("rei.profession", "Profession Bonus", _PROF + tuple(c for _k, c in _REI_PARTS),
+       lambda v: _profession_bonus(REI_PROFESSION_BONUSES, v, _REI_PARTS)),
+    _c("rei.faction", "Faction Bonus", _FACTION,
+       lambda v: _faction_bonus("rei", v["faction_focus"], v["faction_rep"])),
+
+    # ── KII ──────────────────────────────────────────────────────────────────
+    _c("kii.research", "Research Output", ("research_pts", "int"),
+       lambda v: v["research_pts"] * 8 + v["int"] // 4),
+    _c("kii.education", "Education Level", ("n_completed", "int"),
+       lambda v: v["n_completed"] * 6 + v["int"] // 3),
+    _c("kii.ai", "AI Capability", ("syn", "aef"),
+       lambda v: v["syn"] // 3 + v["aef"] // 6),
+    _c("kii.innovation", "Innovation Rate", ("syn", "coh"),
+       lambda v: v["syn"] // 5 + v["coh"] // 8),
+    # Raw intellectual and perceptual capacity — flavour, not dominance.
+    _c("kii.cognitive", "Cognitive Aptitude", ("int", "coh", "aef"),
+       lambda v: v["int"] // 6 + v["coh"] // 8 + v["aef"] // 8),
+    # The more you know and have seen, the faster new connections form.
+    _c("kii.network", "Knowledge Network", ("n_completed", "visited"),
+       lambda v: v["n_completed"] * 3 + v["visited"] // 2),
+    _c("kii.profession", "Profession Bonus", _PROF + tuple(c for _k, c in _KII_PARTS),
+       lambda v: _profession_bonus(KII_PROFESSION_BONUSES, v, _KII_PARTS)),
+    _c("kii.faction", "Faction Bonus", _FACTION,
+       lambda v: _faction_bonus("kii", v["faction_focus"], v["faction_rep"])),
+
+    # ── ECI ──────────────────────────────────────────────────────────────────
+    _c("eci.industrial", "Industrial Output", ("minerals", "food"),
+       lambda v: v["minerals"] * 4 + v["food"] * 3),
+    _c("eci.trade", "Trade Volume", ("credits_prod", "credits"),
+       lambda v: v["credits_prod"] * 10 + v["credits"] // 5000),
+    _c("eci.energy", "Energy Output", ("ether", "aef"),
+       lambda v: v["ether"] * 6 + v["aef"] // 5),
+    _c("eci.liquidity", "Financial Liquidity", ("credits",),
+       lambda v: min(500, v["credits"] // 2000)),
+    # INT contract evaluation, SYN alien market systems, COH long-term relationships
+    _c("eci.acumen", "Commercial Acumen", ("int", "syn", "coh"),
+       lambda v: v["int"] // 8 + v["syn"] // 10 + v["coh"] // 12),
+    # Colony count, ship network reach and upstream industrial maturity
+    _c("eci.infrastructure", "Infrastructure Depth", ("empire_size", "ships", "refined_ore"),
+       lambda v: v["empire_size"] * 4 + v["ships"] * 3 + v["refined_ore"] * 2),
+    _c("eci.profession", "Profession Bonus", _PROF + tuple(c for _k, c in _ECI_PARTS),
+       lambda v: _profession_bonus(ECI_PROFESSION_BONUSES, v, _ECI_PARTS)),
+    _c("eci.faction", "Faction Bonus", _FACTION,
+       lambda v: _faction_bonus("eci", v["faction_focus"], v["faction_rep"])),
+)
+
+INDEX_NAMES = ("spi", "rei", "kii", "eci")
+
+
+# ===========================================================================
+# Engine
+# ===========================================================================
+
+class IndexEngine:
+    """Dependency-tracked cache of every index sub-component for one game."""
+
+    def __init__(self, components: Tuple[Component, ...] = COMPONENTS):
+        self.components = components
+        self._dependents: Dict[str, list] = {}
+        for comp in components:
+            for dep in comp.deps:
+                self._dependents.setdefault(dep, []).append(comp)
+        self.reset()
+
+    def reset(self):
+        self._owner: Optional[tuple] = None   # (game, colony_manager)
+        self.values: dict = {}          # input name / component key → value
+        self.recompute_counts: Dict[str, int] = {c.key: 0 for c in self.components}
+        self.last_recomputed: Tuple[str, ...] = ()
+        self._result: Optional[dict] = None
+
+    def refresh(self, game, colony_manager=None) -> dict:
+        """
+        Bring every component up to date and return the HUD indices dict.
+
+        Only components downstream of an input whose value changed since the
+        previous call are recomputed.  The returned dict is shared between
+        calls while nothing changes — treat it as read-only.
+        """
+        # Compare by identity, not id(): a replaced game's id can be reused
+        owner = self._owner
+        if owner is None or owner[0] is not game or owner[1] is not colony_manager:
+            self.reset()
+            self._owner = (game, colony_manager)
+
+        values = self.values
+        changed = []
+        for reader in INPUT_READERS:
+            for name, value in reader(game, colony_manager).items():
+                if name not in values or values[name] != value:
+                    values[name] = value
+                    changed.append(name)
+        if not changed and self._result is not None:
+            self.last_recomputed = ()
+            return self._result
+
+        first_run = self._result is None
+        dirty = set()
+        for name in changed:
+            for comp in self._dependents.get(name, ()):
+                dirty.add(comp.key)
+
+        recomputed = []
+        for comp in self.components:          # declaration order is topological
+            if not first_run and comp.key not in dirty:
+                continue
+            value = comp.fn(values)
+            self.recompute_counts[comp.key] += 1
+            recomputed.append(comp.key)
+            if values.get(comp.key) != value or comp.key not in values:
+                values[comp.key] = value
+                for downstream in self._dependents.get(comp.key, ()):
+                    dirty.add(downstream.key)
+        self.last_recomputed = tuple(recomputed)
+        self._result = self._assemble()
+        return self._result
+
+    def breakdown(self) -> dict:
+        """Per-component view: {index: [{key, label, value, deps, recomputed}]}."""
+        out = {name: [] for name in INDEX_NAMES}
+        for comp in self.components:
+            out[comp.index].append({
+                "key":        comp.key,
+                "label":      comp.label,
+                "value":      self.values.get(comp.key),
+                "deps":       {dep: self.values.get(dep) for dep in comp.deps},
+                "recomputed": self.recompute_counts[comp.key],
+            })
+        return out
+
+    def _assemble(self) -> dict:
+        v = self.values
+        details = {name: {} for name in INDEX_NAMES}
+        for comp in self.components:
+            details[comp.index][comp.label] = v[comp.key]
+        prof_scale = f"{int(v['prof_level'] / 10.0 * 100)}%"
+        inputs = {
+            "Ships owned":              v["ships"],
+            "KIN stat":                 v["kin"],
+            "INT stat":                 v["int"],
+            "AEF stat":                 v["aef"],
+            "SYN stat":                 v["syn"],
+            "COH stat":                 v["coh"],
+            "Research completed":       v["n_completed"],
+            "Colony minerals/turn":     v["minerals"],
+            "Colony food/turn":         v["food"],
+            "Colony ether/turn":        v["ether"],
+            "Colony research/turn":     v["research_pts"],
+            "Colony credits/turn":      v["credits_prod"],
+            "Colony defense/turn":      v["defense_pts"],
+            "Colony refined ore/turn":  v["refined_ore"],
+            "Colonies founded":         v["empire_size"],
+            "Systems visited":          v["visited"],
+            "Credits":                  v["credits"],
+            "Fleet pool":               v["fleet_pool"],
+            "Allied faction":           v["faction_name"] or "None",
+            "Faction focus":            v["faction_focus"] or "None",
+            "Faction reputation":       v["faction_rep"],
+        }
+        # Profession inputs (same values, displayed under whichever index is clicked)
+        for name in ("REI", "KII", "ECI"):
+            inputs[f"{name} Profession"]       = v["prof_name"] or "None"
+            inputs[f"{name} Profession level"] = v["prof_level"]
+            inputs[f"{name} Profession scale"] = prof_scale
+        result = {name: sum(details[name].values()) for name in INDEX_NAMES}
+        result["fleet_pool"] = v["fleet_pool"]   # also exposed at top level for HUD/GNN use
+        result["details"] = details
+        result["inputs"] = inputs
+        return result
@@ -16,18 +16,24 @@ Design rules:
     routes always win over the file-server.
 """
 
+import asyncio
+import contextvars
+import functools
 import hashlib
+import inspect
 import math
 import os
 import sys
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi import params as fastapi_params
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 # ---------------------------------------------------------------------------
 # Path setup — add the project root so all existing game modules are importable
@@ -58,7 +64,7 @@ from species import get_playable_species
 from factions import factions                                  # module-level dict
 from research import all_research, RESEARCH_PATH_CATEGORIES, EXTENDED_UNLOCKS  # research data
 from energies import all_energies                              # 50 energy types
-from backend.hex_utils import resolve_hex_collisions, galaxy_coords_to_hex, _find_free_hex, HexCoord, hex_ring, HEX_DIRECTIONS
+from backend.hex_utils import GalaxyHexIndex, galaxy_coords_to_hex, _find_free_hex, HexCoord, hex_ring, HEX_DIRECTIONS
 from backend.colony import ColonyManager                       # colony system
 from backend.backstory import generate_backstory               # procedural origin story
 from backend.colony_systems import (                            # governing system logic
@@ -81,14 +87,55 @@ except (FileNotFoundError, _json.JSONDecodeError):
     FACTION_SYSTEM_PREFS: dict = {}
 from backend.deep_space import DeepSpaceManager                # deep space objects
 from backend.gnn import generate_gnn_summary                   # end-of-turn broadcast
+from backend.push import PushHub, format_sse                   # live HUD push channel
+from backend.indices import IndexEngine                        # cached SPI/REI/KII/ECI
+from backend.actor import GameActor, SessionSlots              # background tick queue / per-player writer slots
+from backend.workers import WorkerPool, current_job            # worker threads for long engine calls
+from backend.sessions import SessionRegistry, SESSION_COOKIE   # per-player engine bundles
+from backend.encoding import (                                  # compression / columnar layout
+    MIN_COMPRESS_BYTES, columnarize, compress, is_compressible, negotiate_encoding,
+)
+from backend.assets import AssetVersioner                      # content-hashed static URLs
+from backend.projection import FieldSelection, Pager           # ?fields= / ?cursor= on heavy reads
+from backend.world_pool import WorldPool                       # pre-generated worlds for New Game
 
 # ---------------------------------------------------------------------------
-# Singleton instances — one pair per server process, replaced on new game
+# Per-player engine state — these module globals are rebound to the requesting
+# player's session bundle while that player's endpoint code runs (see
+# _bind_session below); otherwise they hold an unused default bundle.
 # ---------------------------------------------------------------------------
 game: Optional[Game] = None
 colony_manager: Optional[ColonyManager] = None
 deep_space_manager: Optional[DeepSpaceManager] = None
 
+# Live HUD push channel — one SSE subscription per open browser tab
+push_hub = PushHub()
+
+# Cached index sub-components; resets itself when the game is replaced
+_index_engine = IndexEngine()
+
+# One writer slot per player: each API call holds its session's slot, so a
+# player's calls apply one at a time in arrival order while other players'
+# calls run alongside (see backend/actor.py).
+session_slots = SessionSlots()
+
+# Queue for the periodic background tick (see _background_tick).
+game_actor = GameActor()
+
+# Worker threads for long engine calls (new game, turn end, save/load), so
+# the event loop keeps serving other players meanwhile — see _offload().
+workers = WorkerPool()
+
+# Default worlds kept pre-generated (on a background thread) so New Game and
+# Load don't wait for galaxy generation.  0 disables the pool.
+WORLD_POOL_SIZE = 2
+world_pool = WorldPool(lambda: Game(background_thread=False), WORLD_POOL_SIZE)
+
+# Real-time bot/event tick (the terminal game's 5-second thread), scheduled
+# through game_actor.  None keeps the web game turn-paced: bots and events
+# advance in resolve_end_turn() only.
+BACKGROUND_TICK_SECONDS: Optional[float] = None
+
 # GNN accumulator — collects events / financial data across 3 turns so the
 # broadcast covers a full 3-turn window rather than a single turn.
 _gnn_accumulator: dict = {
@@ -98,22 +145,115 @@ _gnn_accumulator: dict = {
     "credits_after":     0,
 }
 
+# ---------------------------------------------------------------------------
+# Sessions — one isolated engine bundle per player (backend/sessions.py)
+# ---------------------------------------------------------------------------
+# Module globals that make up a player's bundle.  The first four are pickled
+# when an idle session is evicted to disk; the rest are push channels and
+# derived caches, rebuilt fresh on rehydrate.
+_SESSION_GLOBALS = (
+    "game", "colony_manager", "deep_space_manager", "_gnn_accumulator",
+    "push_hub", "_index_engine", "_state_cache", "_last_pushed", "_push_pending",
+)
+_SESSION_TRANSIENT = ("push_hub", "_index_engine", "_state_cache", "_last_pushed", "_push_pending")
+
+# Session whose bundle is currently bound (None between calls)
+_current_session = None
+
+
+def _new_session_state() -> dict:
+    """A fresh bundle: no game yet, empty accumulators and caches."""
+    return {
+        "game":               None,
+        "colony_manager":     None,
+        "deep_space_manager": None,
+        "_gnn_accumulator":   {"events": [], "financial_summary": {},
+                               "credits_before": None, "credits_after": 0},
+        "push_hub":           PushHub(),
+        "_index_engine":      IndexEngine(),
+        "_state_cache":       {"game": None, "token": None, "version": None, "body": None},
+        "_last_pushed":       {},
+        "_push_pending":      False,
+    }
+
+
+# What the module globals hold while no session is bound
+_UNBOUND_STATE = _new_session_state()
+
+
+def _rebind(session) -> None:
+    """
+    Write the bound session's globals back into its bundle, then point the
+    globals at *session*'s bundle (or at the unused default when None).
+    Synchronous, so nothing can interleave with it.
+    """
+    global _current_session
+    module = globals()
+    if _current_session is not None:
+        _current_session.state.update({name: module[name] for name in _SESSION_GLOBALS})
+    state = session.state if session is not None else _UNBOUND_STATE
+    module.update({name: state[name] for name in _SESSION_GLOBALS})
+    _current_session = session
+
+
+@contextmanager
+def _bind_session(session):
+    """
+    Point this module's per-player globals at *session*'s bundle for the
+    duration of the block, then write any reassignments (new_game replaces
+    game, etc.) back into the bundle and leave nothing bound.
+
+    Each session's bundle is the authority, not whatever happened to be
+    bound on entry: a handler suspended in _offload() rebinds its own
+    bundle when it resumes, and the block never runs across an await other
+    than that one.  Blocks do not nest.
+    """
+    _rebind(session)
+    try:
+        yield session
+    finally:
+        _rebind(None)
+
+
+def _session_evictable(session) -> bool:
+    """Keep sessions that have a call in flight, run a job or stream SSE in memory."""
+    return (not session_slots.in_use(session.id)
+            and not workers.busy(session.id)
+            and not session.state["push_hub"].subscriber_count)
+
+
+sessions = SessionRegistry(
+    factory=_new_session_state,
+    directory=save_game_module.SAVE_DIR / "sessions",
+    transient=_SESSION_TRANSIENT,
+    can_evict=_session_evictable,
+)
+
 # ---------------------------------------------------------------------------
 # Scan / discovery tracking
 # ---------------------------------------------------------------------------
-# Set of system names the player has ever had in scan range.  Persists for
-# the session; seeded from visited systems on first use so save-loads work.
-_discovered_systems: set[str] = set()
-_discovery_seeded: bool = False
+# Fog-of-war state lives on game.discovery (discovery.DiscoveryEngine): the
+# systems, deep-space stations and DSOs the player has ever had in scan range,
+# refreshed when the ship moves or its scan range changes.
+
+# Values several read endpoints derive from the same live state.  Inside one
+# /api/batch call (a single consistent snapshot — nothing mutates between its
+# operations) _batch_memo holds them so each is computed once per batch;
+# outside a batch it is None and every call computes afresh.
+_batch_memo: Optional[dict] = None
+
+
+def _memo(key, compute):
+    if _batch_memo is None:
+        return compute()
+    if key not in _batch_memo:
+        _batch_memo[key] = compute()
+    return _batch_memo[key]
 
-# Dicts of previously-seen stations and DSOs keyed by name / "q,r".
-# Stored so that objects outside current scan range can still be ghost-rendered.
-_discovered_stations: dict[str, dict] = {}   # key = station name
-_discovered_dsos:     dict[str, dict] = {}   # key = "hex_q,hex_r"
 
 def _effective_scan_range() -> float:
     """Delegate to the engine's get_effective_scan_range(); see game.py."""
-    return get_effective_scan_range(game)
+    return _memo("scan_range", lambda: get_effective_scan_range(game))
 
 
 def _effective_fuel_efficiency() -> float:
@@ -121,27 +261,13 @@ def _effective_fuel_efficiency() -> float:
     return get_effective_fuel_efficiency(game)
 
 
-def _seed_discovery() -> None:
-    """Pre-populate _discovered_systems from visited systems (called once after load)."""
-    global _discovery_seeded
-    if _discovery_seeded or not game or not game.character_created:
-        return
-    try:
-        for data in game.navigation.galaxy.systems.values():
-            if data.get("visited", False):
-                _discovered_systems.add(data.get("name", ""))
-        _discovery_seeded = True
-    except Exception:
-        pass
-
-
 
 def _colony_research_output() -> int:
     """Extract current research RP from all colonies (backend glue — passed to game method)."""
     if not (colony_manager and colony_manager.colonies):
         return 0
     try:
-        return int(colony_manager.calculate_all_production().get("research", 0))
+        return int(colony_manager.cached_production().get("research", 0))
     except Exception:
         return 0
 
@@ -150,18 +276,53 @@ def _colony_research_output() -> int:
 async def lifespan(app: FastAPI):
     """
     FastAPI lifespan hook.
-    Creates the initial (empty) Game instance at startup so the /api/game/state
-    endpoint can safely report "not initialized" before the player starts a game.
+    Starts the background-tick queue.  Engines are per player and created on demand:
+    a session with no game reports "not initialized" from /api/game/state
+    until /api/game/new or /api/game/load builds one.  Live sessions are
+    written to disk on shutdown and rehydrated on their next request.
+
+    No world is built here — the world pool starts filling in the
+    background, so the server is ready at once.
     """
-    global game, colony_manager, deep_space_manager
-    game = Game()
-    colony_manager = ColonyManager(game)
-    deep_space_manager = DeepSpaceManager()
+    pruned = sessions.prune()
+    if pruned:
+        print(f"[4X] Pruned {pruned} stale stored session(s).")
+    game_actor.start()
+    world_pool.start()
+    if BACKGROUND_TICK_SECONDS:
+        game_actor.every(BACKGROUND_TICK_SECONDS, _background_tick)
     print("[4X] Game engine ready.")
     yield
+    await game_actor.stop()
+    world_pool.stop()
+    workers.shutdown()
+    sessions.evict_all()
     print("[4X] Shutting down.")
 
 
+def _background_tick() -> None:
+    """Periodic bot/event simulation, queued on game_actor.  Synchronous, so
+    it never interleaves with an endpoint body; sessions whose game a worker
+    thread holds are skipped."""
+    for session in sessions.live():
+        if workers.busy(session.id):
+            continue  # a worker thread owns this game right now
+        with _bind_session(session):
+            if game and game.character_created:
+                game.run_background_tick()
+                game.bump_world_version()
+
+
+def _ensure_engine(prebuilt: Optional[Game] = None) -> None:
+    """Give the current session an engine (Game + managers) if it has none."""
+    global game, colony_manager, deep_space_manager
+    if game is None:
+        game = prebuilt if prebuilt is not None else Game(background_thread=False)
+        game.add_change_listener(_on_game_change)
+        colony_manager = ColonyManager(game)
+        deep_space_manager = DeepSpaceManager()
+
+
 # ---------------------------------------------------------------------------
 # Application factory
 # ---------------------------------------------------------------------------
@@ -171,6 +332,46 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+
+# (session, mutating) for the API call running in this context; set by the
+# session middleware, read by the endpoint wrapper below.
+_request_call: contextvars.ContextVar = contextvars.ContextVar("request_call", default=None)
+
+
+def _session_bound(endpoint):
+    """
+    Wrap an endpoint so its body runs with the caller's session bound.
+
+    Binding here rather than in the middleware keeps it adjacent to the
+    endpoint code: request parsing and other players' calls may run at any
+    await before the endpoint starts, but from entry to return the only
+    suspension point is _offload(), which rebinds on resume.  A mutating
+    call bumps game.world_version before its bundle is unbound.
+    """
+    @functools.wraps(endpoint)
+    async def bound(*args, **kwargs):
+        call = _request_call.get()
+        if call is None:
+            return await endpoint(*args, **kwargs)
+        session, mutating = call
+        with _bind_session(session):
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                if mutating and game:
+                    game.bump_world_version()
+    return bound
+
+
+class _SessionRoute(APIRoute):
+    """APIRoute whose endpoint runs under _session_bound()."""
+
+    def __init__(self, path, endpoint, **kwargs):
+        super().__init__(path, _session_bound(endpoint), **kwargs)
+
+
+app.router.route_class = _SessionRoute
+
 # CORS — allow the browser to call the API from any origin (localhost dev)
 app.add_middleware(
     CORSMiddleware,
@@ -179,19 +380,89 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# No-cache middleware — forces the browser to always fetch fresh JS/CSS/HTML
-# so that frontend edits are immediately visible without a hard reload.
+# Session middleware — every API call runs against the caller's own engine
+# bundle (SESSION_COOKIE; a new visitor gets a fresh one).  The call holds its
+# session's writer slot (session_slots), so one player's tabs are applied in
+# arrival order, while calls from other players run concurrently.  The bundle
+# itself is bound onto this module's globals only while the endpoint body runs
+# (_SessionRoute).  The SSE stream and job-progress poll are the exception —
+# they only resolve their session, then run unbound and without the slot.
+#
+# A call for a session whose game a worker thread is busy with (see
+# _offload) waits until that job finishes, so it never reads or writes the
+# game mid-job; other players carry on meanwhile.
+#
+# Any mutating call may change what the HUD shows, so game.world_version is
+# bumped before the bundle is unbound.  /api/game/state derives its ETag from
+# that counter and can answer an unchanged poll with a bare 304.
+_MUTATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+_READ_ONLY_POSTS = {"/api/batch"}      # POST only to carry a body
+_UNBOUND_API_PATHS = {"/api/events/stream", "/api/jobs/current"}
+_SESSION_COOKIE_MAX_AGE = 30 * 24 * 3600
+
+
 @app.middleware("http")
-async def no_cache_static(request: Request, call_next):
-    response = await call_next(request)
+async def track_world_version(request: Request, call_next):
     path = request.url.path
-    if path.endswith((".js", ".css", ".html")) or path == "/":
-        response.headers["Cache-Control"] = "no-store"
-        if "etag" in response.headers:
-            del response.headers["etag"]
+    if not path.startswith("/api/"):
+        return await call_next(request)
+    session = sessions.get(request.cookies.get(SESSION_COOKIE))
+    request.state.session = session
+    if path in _UNBOUND_API_PATHS:
+        response = await call_next(request)
+    else:
+        mutating = request.method in _MUTATING_METHODS and path not in _READ_ONLY_POSTS
+        async with session_slots.exclusive(session.id):
+            # A job left running by a cancelled call still owns the game
+            await workers.wait_idle(session.id)
+            token = _request_call.set((session, mutating))
+            try:
+                response = await call_next(request)
+            finally:
+                _request_call.reset(token)
+    if session.is_new:
+        response.set_cookie(SESSION_COOKIE, session.id, max_age=_SESSION_COOKIE_MAX_AGE,
+                            httponly=True, samesite="lax")
+        session.is_new = False
     return response
 
 
+# Compression middleware — registered last, so it is the outermost layer and
+# sees the final body of API and static responses alike.  Compressible bodies
+# over MIN_COMPRESS_BYTES are re-encoded with the best coding the client
+# accepts (br if the optional brotli package is installed, else gzip).
+# Streams (SSE) and 304s pass through untouched; the ETag is weakened because
+# the bytes on the wire are no longer the identity representation.
+@app.middleware("http")
+async def compress_responses(request: Request, call_next):
+    response = await call_next(request)
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+    if (encoding is None
+            or response.status_code != 200
+            or "content-encoding" in response.headers
+            or not is_compressible(response.headers.get("content-type"))):
+        return response
+    length = response.headers.get("content-length")
+    if length is not None and int(length) < MIN_COMPRESS_BYTES:
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    if len(body) >= MIN_COMPRESS_BYTES:
+        body = compress(body, encoding)
+        response.headers["Content-Encoding"] = encoding
+        etag = response.headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            response.headers["ETag"] = f"W/{etag}"
+    vary = response.headers.get("vary")
+    if not vary:
+        response.headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        response.headers["Vary"] = f"{vary}, Accept-Encoding"
+    response.headers["Content-Length"] = str(len(body))
+    return Response(content=body, status_code=response.status_code,
+                    headers=response.headers, background=response.background)
+
+
 # ===========================================================================
 # Request body models
 # ===========================================================================
@@ -207,6 +478,10 @@ class NewGameRequest(BaseModel):
     research_paths: list[str] = []
     # 7 stats: VIT, KIN, INT, AEF, COH, INF, SYN — each 30–100
     stats: dict[str, int] = {}
+    # Optional world seed — the same seed always generates the same galaxy.
+    seed: Optional[int] = None
+    # Optional procedural system count (default 300; large galaxies are fine).
+    num_systems: Optional[int] = Field(None, ge=0, le=20000)
 
 
 class SaveRequest(BaseModel):
@@ -219,6 +494,18 @@ class LoadRequest(BaseModel):
     save_path: str
 
 
+class BatchOp(BaseModel):
+    """One read operation inside /api/batch."""
+    op: str                        # key of _BATCH_OPS, e.g. "galaxy_map"
+    args: dict = {}                # the endpoint's path/query parameters
+    id: Optional[str] = None       # echoed back to help the caller match results
+
+
+class BatchRequest(BaseModel):
+    """Read operations to run against one snapshot, in order."""
+    ops: list[BatchOp]
+
+
 # ===========================================================================
 # Helper — four composite power indices derived from live game state
 # ===========================================================================
@@ -230,6 +517,10 @@ def _compute_indices() -> dict:
     Each index is the integer sum of its named sub-components so the
     frontend can display both the total and a per-component tooltip.
 
+    The formulas live in backend/indices.py; _index_engine caches every
+    sub-component and only recomputes those whose inputs changed since the
+    last call (see IndexEngine).
+
     SPI  Strategic Power Index
          Fleet_Strength + Defense_Grid + Strategic_Weapons + Intelligence_Capability + Faction_Bonus
          Starts near zero; grows only through fleet production, colony defense, and research.
@@ -239,470 +530,60 @@ def _compute_indices() -> dict:
          + Extraction_Aptitude + Prospecting_Advantage + Profession_Bonus + Faction_Bonus
          Profession bonus: 20 extraction/logistics professions apply per-component multipliers
            scaled by profession level (level 1 = 10%, level 10 = 100% of stated multiplier).
-           Add future extraction modifiers (upgrades, events, policies) to _REI_PROFESSION_BONUSES.
+           Add future extraction modifiers (upgrades, events, policies) to REI_PROFESSION_BONUSES.
     KII  Knowledge & Innovation Index
          Research_Output + Education_Level + AI_Capability + Innovation_Rate
          + Cognitive_Aptitude + Knowledge_Network + Profession_Bonus + Faction_Bonus
          Profession bonus: 25 research/education/AI professions apply per-component multipliers
            scaled by profession level.  Technology/Science factions add rep-gated bonus.
-         Add future KII modifiers to _KII_PROFESSION_BONUSES.
+         Add future KII modifiers to KII_PROFESSION_BONUSES.
     ECI  Economic Capability Index
          Industrial_Output + Trade_Volume + Energy_Output + Financial_Liquidity
          + Commercial_Acumen + Infrastructure_Depth + Profession_Bonus + Faction_Bonus
          Profession bonus: 20 trade/industrial/logistics professions apply per-component
            multipliers scaled by profession level.
          Trade / Commerce / Industry factions add rep-gated bonus.
-         Add future ECI modifiers to _ECI_PROFESSION_BONUSES.
+         Add future ECI modifiers to ECI_PROFESSION_BONUSES.
     """
     if not game or not game.character_created:
         return {}
-
-    stats     = game.character_stats or {}
-    completed = game.completed_research or []
-    ships     = len(getattr(game, 'fleet', {}))
-    credits   = max(0, game.credits)
-
-    # Character stat shortcuts (base 30; range 30-100)
-    kin = stats.get("KIN", 30)
-    int_ = stats.get("INT", 30)
-    aef  = stats.get("AEF", 30)
-    syn  = stats.get("SYN", 30)
-    coh  = stats.get("COH", 30)
-    n_completed = len(completed)
-
-    # Colony production totals (zero when no colonies exist)
-    prod = {}
-    if colony_manager and colony_manager.colonies:
-        prod = colony_manager.calculate_all_production()
-
-    minerals     = int(prod.get("minerals",  0))
-    food         = int(prod.get("food",      0))
-    ether        = int(prod.get("ether",     0))
-    research_pts = int(prod.get("research",  0))
-    credits_prod = int(prod.get("credits",   0))
-    defense_pts  = int(prod.get("defense",   0))
-    refined_ore  = int(prod.get("refined_ore", 0))
-
-    # Systems the player has visited — used as a proxy for scouting / logistics
-    try:
-        visited = sum(
-            1 for s in game.navigation.galaxy.systems.values()
-            if s.get("visited")
-        )
-    except Exception:
-        visited = 0
-
-    # Fleet pool — the canonical, production-chain-backed military strength.
-    # Grows each turn via Shipyards (amplified by Ore Processors).
-    fleet_pool  = max(0, getattr(game, "fleet_pool", 0))
-
-    # Number of colonized systems — contributes to defense depth.
-    empire_size = len(colony_manager.colonies) if colony_manager else 0
-
-    # ── SPI ──────────────────────────────────────────────────────────────────
-    # Fleet Strength: backed entirely by the production chain (fleet_pool).
-    # Starts at 0 and grows only via Shipyards — no free points from stats.
-    fleet_strength = fleet_pool
-
-    # Defense Grid: actual built infrastructure.  Zero until colonies exist.
-    defense_grid = defense_pts * 25 + empire_size * 20
-
-    # Combat Doctrine: reflects learned military techniques (completed research)
-    # and the commander's kinetic aptitude (KIN).  No weapon hardware implied.
-    combat_doctrine = n_completed * 4 + kin // 20
-
-    # Intelligence Capability: passive cognitive advantage; deliberately small
-    # so that raw stats never dominate the index at game start.
-    intelligence_capability = int_ // 20 + coh // 20
-
-    # Faction Bonus: allied factions with military-adjacent focus provide a
-    # reputational boost to SPI.  Rep starts at +25 (from faction allegiance),
-    # so Industry / Technology players get a small head-start.
-    #   rep >  10 → small bonus   (+4)
-    #   rep >  50 → medium bonus  (+12)
-    #   rep >  75 → large bonus   (+25)
-    _SPI_FACTION_FOCUSES = {"Industry", "Technology"}
-    _allied_faction       = getattr(game, "character_faction", "") or ""
-    _faction_focus        = factions.get(_allied_faction, {}).get("primary_focus", "")
-    _faction_rep          = 0
-    try:
-        _faction_rep = game.faction_system.player_relations.get(_allied_faction, 0)
-    except Exception:
-        pass
-    if _faction_focus in _SPI_FACTION_FOCUSES:
-        if _faction_rep > 75:
-            faction_bonus_spi = 25
-        elif _faction_rep > 50:
-            faction_bonus_spi = 12
-        elif _faction_rep > 10:
-            faction_bonus_spi = 4
-        else:
-            faction_bonus_spi = 0
-    else:
-        faction_bonus_spi = 0
-
-    spi = fleet_strength + defense_grid + combat_doctrine + intelligence_capability + faction_bonus_spi
-
-    # ── REI ──────────────────────────────────────────────────────────────────
-    # Professions that directly boost REI sub-components.
-    # Keys: sub-component names used in the formula below.
-    # Values are fractional multipliers applied to each sub-component total;
-    # the final bonus is further scaled by profession_level / 10 so that
-    # a level-1 player gets 10% of the stated value and a level-10 master
-    # gets the full 100%.  Add new professions or adjust weights here only —
-    # no other code changes are needed to pick them up.
-    _REI_PROFESSION_BONUSES: dict[str, dict[str, float]] = {
-        # ── Directly extractive ─────────────────────────────────────────────
-        "Resource Vein Prospector":              {"raw": 0.20, "energy": 0.05, "prospecting": 0.15},
-        "Atmospheric Harvest Technician":        {"energy": 0.25},
-        "Etheric Materials Synthesist":          {"energy": 0.15, "raw": 0.05},
-        "Salvage Systems Diver":                 {"raw": 0.10},
-        "Nano-Fabrication Artisan":              {"raw": 0.10},
-        "Bio-Integrated Manufacturing Director": {"raw": 0.15},
-        "Terraforming Ecologist":                {"raw": 0.05, "energy": 0.05},
-        "Planetary Renewal Engineer":            {"raw": 0.05},
-        # ── Exploration and surveying ────────────────────────────────────────
-        "Void Cartographer":                     {"logistics": 0.15, "prospecting": 0.10},
-        "Deep Space Reconnaissance Operative":   {"logistics": 0.10, "prospecting": 0.15},
-        "Chrono-Synthetic Flux Analyst":          {"prospecting": 0.10},
-        # ── Logistics and infrastructure ────────────────────────────────────
-        "Ether Drive Tuner":                     {"energy": 0.10, "logistics": 0.10},
-        "Gravitic Systems Engineer":             {"logistics": 0.15},
-        "Wormline Infrastructure Engineer":      {"logistics": 0.20},
-        "Orbital Dockmaster":                    {"logistics": 0.15},
-        "Interstellar Quartermaster":            {"logistics": 0.20},
-        "Habitat Systems Warden":                {"logistics": 0.10},
-    }
-
-    # Base colony-production chain
-    # refined_ore represents processed industrial capacity upstream of the chain.
-    raw_material_access = minerals * 8 + refined_ore * 6 + visited * 2
-    energy_production   = ether * 10 + aef // 5
-    logistics_capacity  = ships * 12 + visited * 3
-
-    # Stat-driven contributions
-    # KIN — physical precision in drilling, recovery, and field operations
-    # SYN — ability to integrate heterogeneous extraction technologies
-    # COH — sustained focus across distributed long-range mining sites
-    extraction_aptitude = kin // 8 + syn // 10 + coh // 12
-
-    # Prospecting advantage
-    # AEF amplifies etheric deposit sensing; breadth of exploration multiplies discovery chance
-    prospecting_advantage = aef // 6 + visited
-
-    # Profession bonus: multiply base sub-components by stated weights, scaled by level
-    _prof_name   = getattr(game, "character_profession", "") or ""
-    _prof_system = getattr(game, "profession_system", None)
-    _prof_level  = _prof_system.profession_levels.get(_prof_name, 1) if _prof_system else 1
-    _prof_scale  = _prof_level / 10.0   # level 1 → 0.10,  level 10 → 1.0
-    _prof_mults  = _REI_PROFESSION_BONUSES.get(_prof_name, {})
-
-    profession_bonus_rei = int(
-        raw_material_access   * _prof_mults.get("raw",         0) * _prof_scale
-        + energy_production   * _prof_mults.get("energy",      0) * _prof_scale
-        + logistics_capacity  * _prof_mults.get("logistics",   0) * _prof_scale
-        + prospecting_advantage * _prof_mults.get("prospecting", 0) * _prof_scale
-    )
-
-    # Faction bonus: Industry / Exploration factions provide better extraction networks
-    # (same rep-gating pattern as SPI faction bonus)
-    _REI_FACTION_FOCUSES = {"Industry", "Exploration"}
-    if _faction_focus in _REI_FACTION_FOCUSES:
-        if _faction_rep > 75:
-            faction_bonus_rei = 30
-        elif _faction_rep > 50:
-            faction_bonus_rei = 15
-        elif _faction_rep > 10:
-            faction_bonus_rei = 5
-        else:
-            faction_bonus_rei = 0
-    else:
-        faction_bonus_rei = 0
-
-    rei = (
-        raw_material_access
-        + energy_production
-        + logistics_capacity
-        + extraction_aptitude
-        + prospecting_advantage
-        + profession_bonus_rei
-        + faction_bonus_rei
-    )
-
-    # ── KII ──────────────────────────────────────────────────────────────────
-    # Professions that directly boost KII sub-components.
-    # Same scaling rule as REI: multiplier × (profession_level / 10).
-    # Add new professions or adjust weights here only.
-    _KII_PROFESSION_BONUSES: dict[str, dict[str, float]] = {
-        # ── Research and analysis ────────────────────────────────────────────
-        "Astrobiologist":                       {"research": 0.15, "innovation": 0.05},
-        "Quantum Computer Scientist":           {"research": 0.20, "ai": 0.15},
-        "Ancient Systems Decipherer":           {"research": 0.15, "education": 0.10},
-        "Etheric Historian":                    {"education": 0.15, "research": 0.05},
-        "Memory Forensics Analyst":             {"research": 0.10, "education": 0.10},
-        "Chrono-Synthetic Flux Analyst":        {"research": 0.10, "innovation": 0.10},
-        "Myth-Systems Scholar":                 {"education": 0.10},
-        "Cultural Pattern Archivist":           {"education": 0.10},
-        "Relic Recovery Specialist":            {"research": 0.10},
-        # ── Consciousness, AI, and cognition ────────────────────────────────
-        "Consciousness Engineer":               {"ai": 0.20, "innovation": 0.10},
-        "AI-Ether Integration Specialist":      {"ai": 0.25},
-        "Cognitive Archive Curator":            {"education": 0.15, "ai": 0.10},
-        "Quantum Consciousness Transfer Technician": {"ai": 0.10},
-        "Collective Consciousness Integrator":  {"ai": 0.15, "innovation": 0.10},
-        "Consciousness Confluence Architect":   {"ai": 0.20, "research": 0.10},
-        "Shared Mind Systems Steward":          {"ai": 0.10, "education": 0.10},
-        # ── Education and mentorship ─────────────────────────────────────────
-        "Adaptive Education Designer":          {"education": 0.20},
-        "Knowledge Systems Mentor":             {"education": 0.20, "innovation": 0.05},
-        "Cognitive Apprenticeship Instructor":  {"education": 0.15},
-        "Inter-Species Education Facilitator":  {"education": 0.15},
-        "Foundational Learning Guide":          {"education": 0.10},
-        # ── Exploration feeding discovery ────────────────────────────────────
-        "Quantum Navigator":                    {"innovation": 0.10, "ai": 0.05},
-        "Void Cartographer":                    {"research": 0.05, "innovation": 0.05},
-        "Deep Space Reconnaissance Operative":  {"research": 0.05},
-    }
-
-    # Base production-chain components (existing formulas unchanged)
-    research_output = research_pts * 8 + int_ // 4
-    education_level = n_completed * 6 + int_ // 3
-    ai_capability   = syn // 3 + aef // 6
-    innovation_rate = syn // 5 + coh // 8
-
-    # Cognitive aptitude: raw intellectual and perceptual capacity
-    # INT — analytical processing; COH — sustained mental coherence across long research arcs;
-    # AEF — etheric pattern recognition that amplifies discovery in anomalous phenomena.
-    # Deliberately kept smaller than per-component stat terms so it adds flavour,
-    # not dominance, at game start.
-    cognitive_aptitude = int_ // 6 + coh // 8 + aef // 8
-
-    # Knowledge network: breadth of completed research and explored space reinforces itself —
-    # the more you know and have seen, the faster new connections form.
-    knowledge_network = n_completed * 3 + visited // 2
-
-    # Profession bonus: apply per-component multipliers scaled by profession level
-    _kii_prof_mults = _KII_PROFESSION_BONUSES.get(_prof_name, {})
-
-    profession_bonus_kii = int(
-        research_output     * _kii_prof_mults.get("research",   0) * _prof_scale
-        + education_level   * _kii_prof_mults.get("education",  0) * _prof_scale
-        + ai_capability     * _kii_prof_mults.get("ai",         0) * _prof_scale
-        + innovation_rate   * _kii_prof_mults.get("innovation", 0) * _prof_scale
-    )
-
-    # Faction bonus: Technology / Science factions provide access to research networks,
-    # knowledge archives, and collaborative discovery infrastructure.
-    _KII_FACTION_FOCUSES = {"Technology", "Science"}
-    if _faction_focus in _KII_FACTION_FOCUSES:
-        if _faction_rep > 75:
-            faction_bonus_kii = 30
-        elif _faction_rep > 50:
-            faction_bonus_kii = 15
-        elif _faction_rep > 10:
-            faction_bonus_kii = 5
-        else:
-            faction_bonus_kii = 0
-    else:
-        faction_bonus_kii = 0
-
-    kii = (
-        research_output
-        + education_level
-        + ai_capability
-        + innovation_rate
-        + cognitive_aptitude
-        + knowledge_network
-        + profession_bonus_kii
-        + faction_bonus_kii
-    )
-
-    # ── ECI ──────────────────────────────────────────────────────────────────
-    # Professions that directly boost ECI sub-components.
-    # Same scaling rule as REI/KII: multiplier × (profession_level / 10).
-    # Add new professions or adjust weights here only.
-    _ECI_PROFESSION_BONUSES: dict[str, dict[str, float]] = {
-        # ── Trade, commerce, and brokerage ──────────────────────────────────
-        "Exotic Commodities Broker":            {"trade": 0.25, "liquidity": 0.10},
-        "Trade Route Adjudicator":              {"trade": 0.20},
-        "Interstellar Diplomatic Attaché":      {"trade": 0.10, "liquidity": 0.05},
-        "Faction Liaison Officer":              {"trade": 0.10},
-        "Universal Translation Mediator":       {"trade": 0.10},
-        # ── Industrial production ────────────────────────────────────────────
-        "Bio-Integrated Manufacturing Director":{"industrial": 0.20},
-        "Nano-Fabrication Artisan":             {"industrial": 0.15},
-        "Closed-Loop Sustainability Planner":   {"industrial": 0.15, "energy": 0.05},
-        "Terraforming Ecologist":               {"industrial": 0.10},
-        "Planetary Renewal Engineer":           {"industrial": 0.10},
-        "Programmable Matter Architect":        {"industrial": 0.15, "energy": 0.05},
-        "Nano-Swarm Systems Engineer":          {"industrial": 0.10},
-        "Programmable Matter Fabrication Technician": {"industrial": 0.10},
-        # ── Energy and resource conversion ───────────────────────────────────
-        "Atmospheric Harvest Technician":       {"energy": 0.20},
-        "Etheric Materials Synthesist":         {"energy": 0.15},
-        "Gravitic Systems Engineer":            {"energy": 0.10},
-        "Ether Drive Tuner":                    {"energy": 0.10},
-        # ── Logistics, supply, and operations ───────────────────────────────
-        "Interstellar Quartermaster":           {"industrial": 0.10, "trade": 0.10},
-        "Orbital Dockmaster":                   {"trade": 0.15},
-        "Habitat Systems Warden":               {"industrial": 0.05, "liquidity": 0.05},
-        "Wormline Infrastructure Engineer":     {"trade": 0.10},
-    }
-
-    # Base colony-production chain (existing formulas unchanged)
-    industrial_output   = minerals * 4 + food * 3
-    trade_volume        = credits_prod * 10 + credits // 5000
-    energy_output       = ether * 6 + aef // 5
-    financial_liquidity = min(500, credits // 2000)
-
-    # Commercial acumen: stat-driven capacity for negotiation, resource valuation,
-    # and optimizing transactions.
-    # INT — analytical pricing and contract evaluation
-    # SYN — integrating diverse market systems and alien economic frameworks
-    # COH — maintaining reliable long-term trade relationships
-    commercial_acumen = int_ // 8 + syn // 10 + coh // 12
-
-    # Infrastructure depth: how well-developed the empire's physical and
-    # logistical foundations are — colony count amplifies per-turn output,
-    # ship network enables trade reach, and refined ore signals upstream
-    # industrial maturity.
-    infrastructure_depth = empire_size * 4 + ships * 3 + refined_ore * 2
-
-    # Profession bonus: apply per-component multipliers scaled by profession level
-    _eci_prof_mults = _ECI_PROFESSION_BONUSES.get(_prof_name, {})
-
-    profession_bonus_eci = int(
-        industrial_output   * _eci_prof_mults.get("industrial", 0) * _prof_scale
-        + trade_volume      * _eci_prof_mults.get("trade",      0) * _prof_scale
-        + energy_output     * _eci_prof_mults.get("energy",     0) * _prof_scale
-        + financial_liquidity * _eci_prof_mults.get("liquidity", 0) * _prof_scale
-    )
-
-    # Faction bonus: Trade / Commerce factions open access to preferred
-    # shipping lanes, tariff exemptions, and market intelligence.
-    _ECI_FACTION_FOCUSES = {"Trade", "Commerce", "Industry"}
-    if _faction_focus in _ECI_FACTION_FOCUSES:
-        if _faction_rep > 75:
-            faction_bonus_eci = 30
-        elif _faction_rep > 50:
-            faction_bonus_eci = 15
-        elif _faction_rep > 10:
-            faction_bonus_eci = 5
-        else:
-            faction_bonus_eci = 0
-    else:
-        faction_bonus_eci = 0
-
-    eci = (
-        industrial_output
-        + trade_volume
-        + energy_output
-        + financial_liquidity
-        + commercial_acumen
-        + infrastructure_depth
-        + profession_bonus_eci
-        + faction_bonus_eci
-    )
-
-    return {
-        "spi": spi,
-        "rei": rei,
-        "kii": kii,
-        "eci": eci,
-        "fleet_pool": fleet_pool,   # also exposed at top level for HUD/GNN use
-        "details": {
-            "spi": {
-                "Fleet Strength (pool)":   fleet_strength,
-                "Defense Grid":            defense_grid,
-                "Combat Doctrine":         combat_doctrine,
-                "Intelligence Capability": intelligence_capability,
-                "Faction Bonus":           faction_bonus_spi,
-            },
-            "rei": {
-                "Raw Material Access":    raw_material_access,
-                "Energy Production":      energy_production,
-                "Logistics Capacity":     logistics_capacity,
-                "Extraction Aptitude":    extraction_aptitude,
-                "Prospecting Advantage":  prospecting_advantage,
-                "Profession Bonus":       profession_bonus_rei,
-                "Faction Bonus":          faction_bonus_rei,
-            },
-            "kii": {
-                "Research Output":    research_output,
-                "Education Level":    education_level,
-                "AI Capability":      ai_capability,
-                "Innovation Rate":    innovation_rate,
-                "Cognitive Aptitude": cognitive_aptitude,
-                "Knowledge Network":  knowledge_network,
-                "Profession Bonus":   profession_bonus_kii,
-                "Faction Bonus":      faction_bonus_kii,
-            },
-            "eci": {
-                "Industrial Output":    industrial_output,
-                "Trade Volume":         trade_volume,
-                "Energy Output":        energy_output,
-                "Financial Liquidity":  financial_liquidity,
-                "Commercial Acumen":    commercial_acumen,
-                "Infrastructure Depth": infrastructure_depth,
-                "Profession Bonus":     profession_bonus_eci,
-                "Faction Bonus":        faction_bonus_eci,
-            },
-        },
-        "inputs": {
-            "Ships owned":              ships,
-            "KIN stat":                 kin,
-            "INT stat":                 int_,
-            "AEF stat":                 aef,
-            "SYN stat":                 syn,
-            "COH stat":                 coh,
-            "Research completed":       n_completed,
-            "Colony minerals/turn":     minerals,
-            "Colony food/turn":         food,
-            "Colony ether/turn":        ether,
-            "Colony research/turn":     research_pts,
-            "Colony credits/turn":      credits_prod,
-            "Colony defense/turn":      defense_pts,
-            "Colony refined ore/turn":  refined_ore,
-            "Colonies founded":         empire_size,
-            "Systems visited":          visited,
-            "Credits":                  credits,
-            "Fleet pool":               fleet_pool,
-            "Allied faction":           _allied_faction or "None",
-            "Faction focus":            _faction_focus  or "None",
-            "Faction reputation":       _faction_rep,
-            # Profession inputs (same values, displayed under whichever index is clicked)
-            "REI Profession":           _prof_name or "None",
-            "REI Profession level":     _prof_level,
-            "REI Profession scale":     f"{int(_prof_scale * 100)}%",
-            "KII Profession":           _prof_name or "None",
-            "KII Profession level":     _prof_level,
-            "KII Profession scale":     f"{int(_prof_scale * 100)}%",
-            "ECI Profession":           _prof_name or "None",
-            "ECI Profession level":     _prof_level,
-            "ECI Profession scale":     f"{int(_prof_scale * 100)}%",
-        },
-    }
+    return _index_engine.refresh(game, colony_manager)
 
 
 # ===========================================================================
 # Helper — player proximity checks
 # ===========================================================================
 
+def _galaxy_hexes(galaxy) -> GalaxyHexIndex:
+    """
+    Return the galaxy's cached, collision-resolved hex projection.
+
+    Owned by the galaxy (Galaxy.get_hex_index), so the map, NPC, deep-space
+    and system endpoints all agree on where every system is drawn without
+    re-projecting the whole galaxy per request.
+    """
+    return _memo(("hexes", id(galaxy)), galaxy.get_hex_index)
+
+
 def _ship_coords():
     """Return the current ship's (x, y, z) coordinates, or None."""
-    try:
-        return game.navigation.current_ship.coordinates
-    except Exception:
-        return None
+    def _coords():
+        try:
+            return game.navigation.current_ship.coordinates
+        except Exception:
+            return None
+    return _memo("ship_coords", _coords)
 
 
 def _current_system_name() -> str | None:
     """Return the name of the system the ship is currently in, or None."""
-    try:
-        info = game.get_active_ship_info()
-        return info.get("current_system") if info else None
-    except Exception:
-        return None
+    def _name():
+        try:
+            info = game.get_active_ship_info()
+            return info.get("current_system") if info else None
+        except Exception:
+            return None
+    return _memo("current_system", _name)
 
 
 def _player_is_in_system(system_name: str) -> bool:
@@ -875,8 +756,10 @@ def _init_station_manager(g) -> None:
     string (e.g. "Trading Post") was passed instead, causing a KeyError that
     silently swallowed every station market on startup.
     """
-    import random as _rnd
+    from seeding import derive_rng
     _RICHNESS = ["Poor", "Moderate", "Moderate", "Rich", "Abundant"]
+    # Seeded from the world seed so a regenerated world gets the same markets.
+    _rnd = derive_rng(getattr(g, "world_seed", None), "stations.markets")
 
     try:
         from station_manager import SpaceStationManager
@@ -911,41 +794,40 @@ def _init_deep_space(g) -> None:
     """
     (Re-)generate deep space objects for the current galaxy.
 
-    Uses the galaxy object count as a seed offset so the DSO layout is
-    deterministic for a given galaxy while being independent of the default seed.
+    Seeds the DSO layout from the world seed so it is deterministic for a
+    given galaxy while being independent of the other generators' streams.
     Objects are placed only on empty hexes (no star system).
     """
     global deep_space_manager
 
     try:
         galaxy = g.navigation.galaxy
-        # Build the set of hexes that already have star systems
-        system_hex_set = set()
-        for _sys in galaxy.systems.values():
-            hq = _sys.get("hex_q")
-            hr = _sys.get("hex_r")
-            if hq is not None and hr is not None:
-                system_hex_set.add((hq, hr))
-            else:
-                # Fall back to projection if hex coords not yet assigned
-                from backend.hex_utils import galaxy_coords_to_hex
-                coords = _sys.get("coordinates", (0, 0, 0))
-                h = galaxy_coords_to_hex(coords[0], coords[1])
-                system_hex_set.add((h.q, h.r))
+        # Hexes that already have star systems (collision-resolved, as drawn)
+        system_hex_set = {(h.q, h.r) for h in _galaxy_hexes(galaxy).occupied()}
 
         # Build exclusion zone: all hexes within 4 hex-steps of Proxima b (q=4, r=2)
         from backend.hex_utils import hex_spiral, HexCoord
         _start_hex = HexCoord(4, 2)
         exclusion_zone = {(h.q, h.r) for h in hex_spiral(_start_hex, 4)}
 
-        # Use len(galaxy.systems) as a stable, per-galaxy seed offset
-        seed = 1000 + len(galaxy.systems)
+        # Derive the DSO layout seed from the world seed; fall back to the
+        # system count for games created before world seeds existed.
+        _world_seed = getattr(g, "world_seed", None)
+        if _world_seed is not None:
+            from seeding import derive_rng
+            seed = derive_rng(_world_seed, "deep_space").getrandbits(32)
+        else:
+            seed = 1000 + len(galaxy.systems)
         deep_space_manager = DeepSpaceManager(galaxy_seed=seed)
         deep_space_manager.generate(system_hex_set, exclusion_zone=exclusion_zone)
     except Exception as _e:
         print(f"[4X] Warning: deep_space_manager init failed: {_e}")
         deep_space_manager = DeepSpaceManager()
 
+    # Fog of war reveals DSOs as the ship's scanner sweeps over them
+    if getattr(g, "discovery", None) is not None:
+        g.discovery.dso_manager = deep_space_manager
+
 
 # ===========================================================================
 # Game lifecycle endpoints
@@ -959,20 +841,30 @@ async def new_game(request: NewGameRequest):
     Creates a brand-new Game instance (discarding any previous session) and
     calls initialize_new_game() with the player's character choices.
     """
-    global game, colony_manager, deep_space_manager, \
-           _discovered_systems, _discovery_seeded, \
-           _discovered_stations, _discovered_dsos
-    # Always start with a clean slate
-    game = Game()
+    global game, colony_manager, deep_space_manager
+    # Always start with a clean slate.  The world version carries on from the
+    # previous game so it never repeats (a stale ETag must not match).
+    _previous_version = getattr(game, "world_version", 0) if game else 0
+    if game:
+        game.stop_bot_updates()
+    # Galaxy generation is the slow part (seconds for large galaxies).  A
+    # default world comes ready-made from the pool; anything else (or a dry
+    # pool) is built on a worker thread so other players are not frozen.
+    pooled = None
+    if request.seed is None and request.num_systems is None:
+        pooled = world_pool.take()
+    if pooled is not None:
+        game = pooled
+    else:
+        game = await _offload("new_game", "Generating galaxy", _generate_world,
+                              request.seed, request.num_systems)
+    game.world_version = _previous_version + 1
+    game.add_change_listener(_on_game_change)
     colony_manager = ColonyManager(game)
     _gnn_accumulator["events"]            = []
     _gnn_accumulator["financial_summary"] = {}
     _gnn_accumulator["credits_before"]    = None
     _gnn_accumulator["credits_after"]     = 0
-    _discovered_systems  = set()
-    _discovery_seeded    = False
-    _discovered_stations = {}
-    _discovered_dsos     = {}
 
     character_data = {
         "name": request.name,
@@ -1025,19 +917,18 @@ async def new_game(request: NewGameRequest):
         )
         if start_sys:
             game.navigation.current_ship.coordinates = start_sys["coordinates"]
-            start_sys["visited"] = True
+            galaxy.mark_visited(start_sys["coordinates"])
 
             # Enforce a 4-hex (~50 unit) exclusion zone around Proxima b.
             # generate_procedural_systems() only avoids 15 units, so we cull
             # any procedural system that spawned too close after the fact.
             _px, _py, _pz = start_sys["coordinates"]
             _too_close = [
-                coords for coords, sys_data in list(galaxy.systems.items())
-                if sys_data.get("name") != "Proxima b"
-                and ((_px - coords[0])**2 + (_py - coords[1])**2 + (_pz - coords[2])**2) ** 0.5 < 50
+                coords for coords, sys_data, dist in galaxy.get_systems_in_radius(_px, _py, _pz, 50)
+                if sys_data.get("name") != "Proxima b" and dist < 50
             ]
             for _coords in _too_close:
-                del galaxy.systems[_coords]
+                galaxy.remove_system(_coords)
 
     # Give the starter ship a generous fuel load so new players can explore freely.
     ship = game.navigation.current_ship
@@ -1091,15 +982,270 @@ async def new_game(request: NewGameRequest):
     }
 
 
+# Distinguishes this server process in ETags: world versions restart at 0
+# when the server restarts, so a browser's cached ETag must not match then.
+_STATE_ETAG_EPOCH = os.urandom(4).hex()
+
+# Last snapshot served by /api/game/state, for one game object (held, not
+# its id(): a new game can reuse a freed address) and one world version.
+# "token" tells that game's ETags apart from any earlier game's - a new
+# game's world_version starts over at 0.
+_state_cache: dict = {"game": None, "token": None, "version": None, "body": None}
+
+
+def _state_etag() -> Optional[str]:
+    """ETag for the current world version (None before the engine exists)."""
+    if not game:
+        return None
+    return f'"{_STATE_ETAG_EPOCH}-{_state_game_token()}-{getattr(game, "world_version", 0)}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True if an If-None-Match header lists *etag* (weak or strong) or '*'."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
 @app.get("/api/game/state")
-async def get_game_state():
+async def get_game_state(request: Request):
     """
     Return the current game state.
 
     The frontend polls this endpoint roughly once per second to keep the HUD
     up to date (credits, turn, active research bar, etc.).
+
+    Responses carry an ETag derived from game.world_version.  A poll that
+    sends it back in If-None-Match while nothing has changed gets a 304 with
+    no body and no recomputation; a poll without it still reuses the last
+    snapshot built for the current version.
     """
-    return _build_state_snapshot()
+    etag = _state_etag()
+    headers = {"Cache-Control": "no-cache"}
+    if etag is None:
+        return JSONResponse(_build_state_snapshot(), headers=headers)
+    headers["ETag"] = etag
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    return JSONResponse(_current_state_snapshot(), headers=headers)
+
+
+def _state_game_token() -> str:
+    """Token for the current game object; reset (with the cache) on a new game."""
+    if _state_cache["game"] is not game:
+        _state_cache.update(game=game, token=os.urandom(4).hex(), version=None, body=None)
+    return _state_cache["token"]
+
+
+def _current_state_snapshot() -> dict:
+    """_build_state_snapshot(), built at most once per game and world version."""
+    _state_game_token()
+    version = getattr(game, "world_version", 0)
+    if _state_cache["version"] != version or _state_cache["body"] is None:
+        _state_cache["body"] = _build_state_snapshot()
+        _state_cache["version"] = version
+    return _state_cache["body"]
+
+
+# ---------------------------------------------------------------------------
+# Live push channel (Server-Sent Events)
+# ---------------------------------------------------------------------------
+# Game.emit_change() reports every world-version bump (mutating requests,
+# resolve_end_turn) and research completions.  Bumps are folded into a single
+# diff of the HUD sections per event-loop pass; changed sections go out as
+# deltas through push_hub, which coalesces them per subscriber.
+
+# Snapshot section -> how to read it.  "credits" is split out of "player"
+# because it is the one player field that changes during play.
+_PUSH_SECTIONS = {
+    "initialized": lambda snap: snap.get("initialized", False),
+    "credits":     lambda snap: (snap.get("player") or {}).get("credits"),
+    "player":      lambda snap: {k: v for k, v in (snap.get("player") or {}).items() if k != "credits"},
+    "turn":        lambda snap: snap.get("turn"),
+    "research":    lambda snap: snap.get("research"),
+    "ship":        lambda snap: snap.get("ship"),
+    "indices":     lambda snap: snap.get("indices"),
+}
+
+_last_pushed: dict = {}
+_push_pending = False
+
+
+def _on_game_change(kind: str, payload) -> None:
+    """Change listener attached to every Game the server creates."""
+    job = current_job()
+    if job is not None:
+        # On a worker thread, where the module globals may belong to another
+        # player: replay on the event loop once the job is done (_offload).
+        job.defer(_on_game_change, kind, payload)
+        return
+    if not push_hub.subscriber_count:
+        return
+    if kind == "research_complete":
+        push_hub.notify("research_complete", payload)
+    elif kind == "world_version":
+        _schedule_state_push()
+
+
+def _schedule_state_push() -> None:
+    """Run _push_state_deltas() once the current request/turn has finished."""
+    global _push_pending
+    if _push_pending or _current_session is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # no event loop (CLI / tests) — nobody to push to
+    _push_pending = True
+    loop.call_soon(_push_state_deltas, _current_session)
+
+
+def _push_state_deltas(session) -> None:
+    """Diff the session's HUD sections against what was last pushed; publish changes."""
+    # Synchronous, so binding here can't interleave with another call; any
+    # handler suspended in _offload() rebinds its own bundle on resume.
+    # While a job has the game, leave _push_pending set: _offload() pushes
+    # once the job is done.
+    if workers.busy(session.id):
+        return
+    with _bind_session(session):
+        _publish_state_deltas()
+
+
+def _publish_state_deltas() -> None:
+    global _push_pending
+    _push_pending = False
+    if not push_hub.subscriber_count:
+        return
+    try:
+        snap = _current_state_snapshot()
+    except Exception as _e:
+        print(f"[4X] Warning: push snapshot failed: {_e}")
+        return
+    for section, read in _PUSH_SECTIONS.items():
+        value = read(snap)
+        if section not in _last_pushed or _last_pushed[section] != value:
+            _last_pushed[section] = value
+            push_hub.publish(section, value)
+
+
+# ---------------------------------------------------------------------------
+# Long engine calls on worker threads (backend/workers.py)
+# ---------------------------------------------------------------------------
+
+async def _offload(kind: str, label: str, fn, *args):
+    """
+    Run fn(job, *args) on a worker thread and return its result.
+
+    Called from a handler, with the caller's session bound and its slot
+    held.  While the call runs the event loop serves other players, whose
+    calls bind their own bundles; this session's other calls wait for its
+    slot.  fn must only touch the objects it is given — the module globals
+    may be rebound to another session while it runs.
+
+    Progress is pushed to this session's tabs as "progress" notices, and is
+    readable from GET /api/jobs/current.  Game change notifications raised
+    on the worker are replayed here afterwards, with the session bound again.
+
+    Inside /api/batch (whose memo is a module global) fn just runs inline.
+    """
+    global _push_pending
+    session = _current_session
+    if session is None or _batch_memo is not None:
+        return fn(_InlineJob(), *args)
+
+    _rebind(session)        # bring the bundle up to date before yielding
+    hub = push_hub
+    job = workers.new_job(session.id, kind, label,
+                          on_progress=lambda snapshot: hub.notify("progress", snapshot))
+    try:
+        return await workers.run(job, fn, *args)
+    finally:
+        _rebind(session)
+        job.run_deferred()
+        _push_pending = False
+        _schedule_state_push()
+
+
+class _InlineJob:
+    """Stand-in Job for calls that run inline: progress goes nowhere."""
+
+    def report(self, fraction: float, stage: Optional[str] = None):
+        pass
+
+
+@app.get("/api/jobs/current")
+async def get_current_job(request: Request):
+    """
+    Progress of the long operation (new game, turn end, save, load) running
+    for this player, or {"job": null}.  Answered without waiting for it.
+    """
+    session = request.state.session
+    job = workers.active(session.id)
+    return {"job": job.snapshot() if job else None}
+
+
+@app.get("/api/events/stream")
+async def event_stream(request: Request):
+    """
+    Server-Sent Events stream of HUD changes.
+
+    Each message is ``event: delta`` with
+    ``{"version": n, "deltas": {section: value}, "notices": [...]}``; deltas
+    carry the latest full value of each changed section (credits, turn,
+    research, ship, indices, player, initialized), notices are one-offs
+    (research_complete, gnn).  The client fetches /api/game/state once on
+    (re)connect and applies deltas from then on.  Nothing is sent while the
+    game is idle.
+    """
+    # Runs unbound (a stream would otherwise hold the writer slot forever):
+    # read this player's bundle explicitly instead of the module globals.
+    state = request.state.session.state
+    hub = state["push_hub"]
+    sub = hub.subscribe()
+
+    async def _stream():
+        try:
+            while True:
+                batch = await sub.next_batch()
+                if await request.is_disconnected():
+                    break
+                batch["version"] = getattr(state.get("game"), "world_version", 0)
+                yield format_sse(batch)
+        finally:
+            hub.unsubscribe(sub)
+
+    return StreamingResponse(
+        _stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/game/indices/breakdown")
+async def get_indices_breakdown():
+    """
+    Per-component view of the four strategic indices.
+
+    Returns {index: [{key, label, value, deps: {input: value}, recomputed}]}
+    where recomputed counts how often the cache has had to re-evaluate that
+    sub-component since the game started.
+    """
+    if not game or not game.character_created:
+        raise HTTPException(status_code=400, detail="No game in progress.")
+    _compute_indices()
+    return {
+        "components":      _index_engine.breakdown(),
+        "last_recomputed": list(_index_engine.last_recomputed),
+    }
 
 
 @app.get("/api/debug/nav")
@@ -1115,9 +1261,7 @@ async def debug_nav():
     current = None
     nearby = []
     if coords:
-        for sys_coords, sys_data in game.navigation.galaxy.systems.items():
-            import math as _math
-            dist = _math.sqrt(sum((a - b) ** 2 for a, b in zip(coords, sys_coords)))
+        for sys_coords, sys_data, dist in game.navigation.galaxy.get_systems_in_radius(*coords, 20):
             entry = {"name": sys_data.get("name"), "coords": list(sys_coords), "distance": round(dist, 2)}
             if dist < 1.0:
                 current = entry
@@ -1131,16 +1275,46 @@ async def debug_nav():
     }
 
 
+# ---------------------------------------------------------------------------
+# Worker-thread bodies for _offload() — they touch only what they are given
+# ---------------------------------------------------------------------------
+
+def _generate_world(job, seed: Optional[int], num_systems: Optional[int]) -> Game:
+    job.report(0.05, "Generating galaxy")
+    return Game(seed=seed, num_systems=num_systems, background_thread=False)
+
+
+def _resolve_turn(job, g: Game, cm: ColonyManager, colony_rp: int) -> dict:
+    return g.resolve_end_turn(
+        colony_rp=colony_rp,
+        colony_advance_fn=cm.advance_turn,
+        progress=job.report,
+    )
+
+
+def _write_save(job, g: Game, slot_name: str) -> bool:
+    job.report(0.1, "Writing save file")
+    return save_game_module.save_game(g, slot_name)
+
+
+def _read_save(job, g: Optional[Game], save_path: str):
+    """Load save_path into g (a fresh engine if None); return (engine, ok)."""
+    if g is None:
+        job.report(0.05, "Preparing engine")
+        g = Game(background_thread=False)
+    job.report(0.5, "Reading save file")
+    return g, save_game_module.load_game(g, save_path)
+
+
 @app.post("/api/game/turn/end")
 async def end_turn():
     """End the current turn and advance to the next."""
     if not game or not game.character_created:
         raise HTTPException(status_code=400, detail="No game in progress.")
 
-    result = game.resolve_end_turn(
-        colony_rp=_colony_research_output(),
-        colony_advance_fn=lambda events: colony_manager.advance_turn(events),
-    )
+    # Resolve on a worker thread; progress goes out as "progress" notices.
+    result = await _offload("end_turn", "Ending turn", _resolve_turn,
+                            game, colony_manager, _colony_research_output())
 
     # Accumulate events and financial data across turns for a 3-turn GNN window.
     acc = _gnn_accumulator
@@ -1170,6 +1344,8 @@ async def end_turn():
             acc["credits_before"],
             acc["credits_after"],
         )
+        # Other open tabs learn about the broadcast over the push channel
+        push_hub.notify("gnn", {"turn": game.current_turn, "summary": gnn})
         # Reset accumulator for the next window
         _gnn_accumulator["events"]            = []
         _gnn_accumulator["financial_summary"] = {}
@@ -1203,9 +1379,9 @@ async def save_game(request: SaveRequest):
     game.colony_state            = colony_manager.serialize()
     game.deep_space_state        = deep_space_manager.serialize() if deep_space_manager else {}
     # Persist fog-of-war discovery sets so all detected objects survive reload.
-    game.discovered_systems_state  = list(_discovered_systems)
-    game.discovered_stations_state = dict(_discovered_stations)
-    game.discovered_dsos_state     = dict(_discovered_dsos)
+    (game.discovered_systems_state,
+     game.discovered_stations_state,
+     game.discovered_dsos_state) = game.discovery.snapshot()
     # Ensure character_backstory attribute exists before saving (graceful for old saves).
     game.character_backstory = getattr(game, "character_backstory", "")
 
@@ -1216,7 +1392,7 @@ async def save_game(request: SaveRequest):
             if not hasattr(_bot, "coordinates") and _bot.ship:
                 _bot.coordinates = _bot.ship.coordinates
 
-    ok = save_game_module.save_game(game, request.slot_name)
+    ok = await _offload("save", "Saving game", _write_save, game, request.slot_name)
     return {"success": ok, "slot_name": request.slot_name}
 
 
@@ -1235,32 +1411,28 @@ async def load_game(request: LoadRequest):
     The global game instance is mutated in-place by save_game_module.load_game().
     After loading, colony state (Phase 3) will be restored from game.colony_state.
     """
-    if not game:
-        raise HTTPException(status_code=500, detail="Game engine not ready.")
-
-    ok, message = save_game_module.load_game(game, request.save_path)
+    # A fresh session loads into a pooled world (the save replaces its state)
+    engine = game if game is not None else world_pool.take()
+    loaded, ok = await _offload("load", "Loading save", _read_save, engine, request.save_path)
+    _ensure_engine(loaded)
     if not ok:
-        raise HTTPException(status_code=400, detail=message)
+        raise HTTPException(status_code=400, detail="Failed to load save file.")
+    message = "Game loaded."
 
     # Restore colony manager state from the loaded save (or empty if none saved yet).
     colony_manager.deserialize(getattr(game, "colony_state", {}))
 
-    # Restore fog-of-war discovery sets.  If the save pre-dates this feature,
-    # fall back to seeding systems from visited flags via _seed_discovery().
-    global _discovered_systems, _discovery_seeded, _discovered_stations, _discovered_dsos
+    # Restore fog-of-war discovery sets.  If the save pre-dates this feature
+    # (no systems list), the engine re-seeds from visited flags on next observe.
     _gnn_accumulator["events"]            = []
     _gnn_accumulator["financial_summary"] = {}
     _gnn_accumulator["credits_before"]    = None
     _gnn_accumulator["credits_after"]     = 0
-    _saved_discovery = getattr(game, "discovered_systems_state", None)
-    if _saved_discovery is not None:
-        _discovered_systems = set(_saved_discovery)
-        _discovery_seeded   = True   # skip the visited-only fallback seed
-    else:
-        _discovered_systems = set()
-        _discovery_seeded   = False  # let _seed_discovery() run on next map fetch
-    _discovered_stations = dict(getattr(game, "discovered_stations_state", {}))
-    _discovered_dsos     = dict(getattr(game, "discovered_dsos_state",     {}))
+    game.discovery.restore(
+        getattr(game, "discovered_systems_state", None),
+        getattr(game, "discovered_stations_state", {}),
+        getattr(game, "discovered_dsos_state", {}),
+    )
 
     # Recreate NPC infrastructure — bots and station managers are not serialised
     # in save files, so they must be rebuilt every time a game is loaded.
@@ -1271,6 +1443,9 @@ async def load_game(request: LoadRequest):
     _ds_saved = getattr(game, "deep_space_state", {})
     if _ds_saved:
         deep_space_manager.deserialize(_ds_saved)
+        # Same manager object, new DSO instances — make discovery re-index them
+        game.discovery.dso_manager = deep_space_manager
+        game.discovery.invalidate()
     else:
         _init_deep_space(game)
 
@@ -1411,48 +1586,50 @@ async def get_galaxy_layers():
     }
 
 
-@app.get("/api/galaxy/map")
-async def get_galaxy_map():
-    """
-    Return all star systems projected onto a 2D axial hex grid.
+# Record fields of /api/galaxy/map systems, plus the two top-level lists that
+# ?fields= can also switch off.
+_MAP_SYSTEM_FIELDS = (
+    "name", "x", "y", "z", "hex_q", "hex_r", "type", "population", "threat_level",
+    "resources", "description", "controlling_faction", "visited", "in_scan_range",
+    "planet_count", "has_player_colony",
+)
+_MAP_TOP_LEVEL_FIELDS = ("stations", "deep_space_objects")
 
-    The galaxy stores systems with 3D (x, y, z) coordinates.  This endpoint
-    projects them to (hex_q, hex_r) using hex_utils.resolve_hex_collisions(),
-    resolving any two systems that would land on the same hex by nudging the
-    later one to the nearest free neighbour.
+# Pages with at least this many systems are built on a worker thread.
+_OFFLOAD_MAP_SYSTEMS = 2000
 
-    Response shape:
-      { systems: [ { name, hex_q, hex_r, x, y, z, type, population,
-                     threat_level, controlling_faction, visited, planet_count } ] }
-    """
-    if not game or not game.character_created:
-        raise HTTPException(status_code=400, detail="No game in progress.")
 
-    # Seed discovery set from visited systems on first call after a load
-    _seed_discovery()
+def _projection(fields: Optional[str], allowed, cursor: Optional[str], limit: Optional[int]):
+    """FieldSelection + Pager for a read endpoint; bad input is a 400."""
+    try:
+        return FieldSelection(fields, allowed), Pager(cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    galaxy      = game.navigation.galaxy
-    ship_coords = _ship_coords()   # (sx, sy, sz) or None
-    scan_range  = _effective_scan_range()
-    raw_systems = []
 
-    for coords, data in galaxy.systems.items():
-        x, y, z = coords
-        name = data.get("name", "Unknown")
+def _page(pager: Pager, items, key) -> list:
+    """pager.select(), with a cursor that no longer matches anything as a 400."""
+    try:
+        return pager.select(items, key)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        # Compute distance from player's ship to this system
-        if ship_coords:
-            sx, sy, sz = ship_coords
-            dist = math.sqrt((x - sx) ** 2 + (y - sy) ** 2 + (z - sz) ** 2)
-        else:
-            dist = float("inf")
 
-        in_range = dist <= scan_range
+def _map_system_records(job, page, hexes, colonized_systems, selection) -> list:
+    """
+    One /api/galaxy/map record per (coords, data, in_range) in page.  Reads
+    only its arguments, so very large maps can be built on a worker thread.
+    """
+    projected = []
+    for i, (coords, data, in_range) in enumerate(page):
+        if i and i % 1000 == 0:
+            job.report(i / len(page), f"{i} of {len(page)} systems")
+        x, y, z = coords
+        name = data.get("name", "Unknown")
 
         if in_range:
-            # Currently in scanner range — full data, mark as discovered
-            _discovered_systems.add(name)
-            raw_systems.append({
+            # Currently in scanner range — full data
+            sys = {
                 "name":                name,
                 "x": x, "y": y, "z": z,
                 "type":                data.get("type", "Unknown"),
@@ -1463,14 +1640,15 @@ async def get_galaxy_map():
                 "controlling_faction": data.get("controlling_faction"),
                 "visited":             data.get("visited", False),
                 "in_scan_range":       True,
-                "planet_count": len([
+            }
+            if "planet_count" in selection:
+                sys["planet_count"] = len([
                     b for b in data.get("celestial_bodies", [])
                     if b.get("object_type") == "Planet"
-                ]),
-            })
-        elif name in _discovered_systems:
+                ])
+        else:
             # Previously scanned — partial data only (no live intel)
-            raw_systems.append({
+            sys = {
                 "name":                name,
                 "x": x, "y": y, "z": z,
                 "type":                data.get("type", "Unknown"),
@@ -1482,82 +1660,153 @@ async def get_galaxy_map():
                 "visited":             data.get("visited", False),
                 "in_scan_range":       False,
                 "planet_count":        None,
-            })
-        # else: never scanned — omit entirely (true fog of war)
+            }
+        if hexes is not None:
+            h = hexes.hex_of[coords]
+            sys["hex_q"], sys["hex_r"] = h.q, h.r
+        if colonized_systems is not None:
+            sys["has_player_colony"] = name in colonized_systems
+        projected.append(selection.project(sys))
+
+    return projected
 
-    # Project 3D→2D and resolve hex collisions
-    projected = resolve_hex_collisions(raw_systems)
+
+@app.get("/api/galaxy/map")
+async def get_galaxy_map(
+    layout: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit:  Optional[int] = Query(None),
+):
+    """
+    Return all star systems projected onto a 2D axial hex grid.
+
+    The galaxy stores systems with 3D (x, y, z) coordinates.  Their (hex_q,
+    hex_r) come from the galaxy's cached hex projection (_galaxy_hexes), in
+    which any two systems that would land on the same hex are resolved by
+    nudging the later one to the nearest free neighbour.
+
+    Response shape:
+      { systems: [ { name, hex_q, hex_r, x, y, z, type, population,
+                     threat_level, controlling_faction, visited, planet_count } ] }
+
+    With ?layout=columnar each list is sent as one array per field (see
+    backend/encoding.py) — roughly half the JSON for a large galaxy.
+
+    ?fields=name,x,y,z,visited trims each system to those keys (stations and
+    deep_space_objects are only sent if named too) and skips computing the
+    rest; ?limit=&cursor= pages through systems (backend/projection.py).
+    """
+    if not game or not game.character_created:
+        raise HTTPException(status_code=400, detail="No game in progress.")
+    selection, pager = _projection(
+        fields, _MAP_SYSTEM_FIELDS + _MAP_TOP_LEVEL_FIELDS, cursor, limit)
+
+    galaxy    = game.navigation.galaxy
+    discovery = game.discovery
+    hexes     = _galaxy_hexes(galaxy) if ("hex_q" in selection or "hex_r" in selection) else None
+    # No-op unless the ship moved / scan range changed by a path that did not
+    # already refresh it (jump, layer shift and bonus re-application all do).
+    discovery.observe(game)
 
     # Mark systems that have at least one player colony so the renderer can
     # draw territory overlays without a separate API call.
-    colonized_systems = {
-        c["system_name"] for c in colony_manager.list_colonies()
-    }
-    for sys in projected:
-        sys["has_player_colony"] = sys["name"] in colonized_systems
+    colonized_systems = None
+    if "has_player_colony" in selection:
+        colonized_systems = {
+            c["system_name"] for c in colony_manager.list_colonies()
+        }
 
-    # Include deep-space stations in scan range fully; ghost-render previously
-    # discovered stations that are now out of range.
-    deep_space_stations = []
-    station_mgr = getattr(game, "station_manager", None)
-    if station_mgr:
-        seen_station_names: set[str] = set()
-        for st in station_mgr.get_deep_space_stations():
-            sc = st.get("coordinates")
-            name = st["name"]
-            in_range = True
-            if sc and ship_coords:
-                sx, sy, sz = ship_coords
-                dist = math.sqrt((sc[0]-sx)**2 + (sc[1]-sy)**2 + (sc[2]-sz)**2)
-                in_range = dist <= scan_range
-
-            entry = {
-                "name":         name,
-                "type":         st["type"],
-                "hex_q":        st["hex_q"],
-                "hex_r":        st["hex_r"],
-                "coordinates":  list(sc) if sc else [],
-                "services":     st.get("services", []),
-                "description":  st.get("description", ""),
-                "in_scan_range": in_range,
+    # Only discovered systems are visited here; never-scanned ones are omitted
+    # entirely (true fog of war), so the cost tracks what the player has seen.
+    page = _page(pager, discovery.iter_systems(galaxy),
+                 key=lambda item: item[1].get("name", "Unknown"))
+    if len(page) >= _OFFLOAD_MAP_SYSTEMS:
+        projected = await _offload("galaxy_map", "Building galaxy map", _map_system_records,
+                                   page, hexes, colonized_systems, selection)
+    else:
+        projected = _map_system_records(_InlineJob(), page, hexes, colonized_systems, selection)
+
+    result = {"systems": projected}
+    # Deep-space stations and DSOs: full entries in scan range, ghosts for
+    # ones discovered earlier (built once when they left range).
+    if "stations" in selection:
+        result["stations"] = discovery.station_entries()
+    if "deep_space_objects" in selection:
+        result["deep_space_objects"] = discovery.dso_entries()
+    result.update(pager.envelope())
+
+    return columnarize(result, ("systems", "stations", "deep_space_objects"), layout)
+
+
+@app.get("/api/route")
+async def plan_route(
+    to: str,
+    from_: Optional[str] = Query(None, alias="from"),
+):
+    """
+    Plan the cheapest-fuel chain of jumps between two systems.
+
+    `from` defaults to the ship's current position (which may be deep space).
+    Edge costs use the same calculate_fuel_consumption() as a real jump, so
+    ether friction, dangerous regions and the interlayer surcharge are all
+    priced in.  Legs are limited to the active ship's jump range.
+
+    Response shape:
+      { found, from, to, jumps, total_fuel, total_distance, affordable,
+        legs: [ { from, to, from_coords, to_coords, distance, fuel } ] }
+    """
+    if not game or not game.character_created:
+        raise HTTPException(status_code=400, detail="No game in progress.")
+
+    ship = game.navigation.current_ship
+    if not ship:
+        raise HTTPException(status_code=400, detail="No active ship.")
+
+    galaxy = game.navigation.galaxy
+
+    def _coords_for(name: str):
+        for coords, data in galaxy.systems.items():
+            if data.get("name", "").lower() == name.lower():
+                return coords
+        raise HTTPException(status_code=404, detail=f"System '{name}' not found.")
+
+    goal = _coords_for(to)
+    start = _coords_for(from_) if from_ else tuple(ship.coordinates)
+
+    plan = galaxy.get_route_planner().plan_route(ship, start, goal, game)
+    if plan is None:
+        return {
+            "found": False,
+            "from": from_ or _current_system_name(),
+            "to": galaxy.systems[goal].get("name"),
+            "message": "No chain of jumps within range connects these systems.",
+        }
+
+    def _name_at(coords):
+        data = galaxy.systems.get(tuple(coords))
+        return data.get("name") if data else None
+
+    return {
+        "found":          True,
+        "from":           _name_at(start),
+        "to":             _name_at(goal),
+        "jumps":          plan["jumps"],
+        "total_fuel":     plan["total_fuel"],
+        "total_distance": round(plan["total_distance"], 2),
+        "affordable":     plan["total_fuel"] <= ship.fuel,
+        "legs": [
+            {
+                "from":        _name_at(leg["from"]),
+                "to":          _name_at(leg["to"]),
+                "from_coords": list(leg["from"]),
+                "to_coords":   list(leg["to"]),
+                "distance":    round(leg["distance"], 2),
+                "fuel":        leg["fuel"],
             }
-            if in_range:
-                # Remember this station for future ghost rendering
-                _discovered_stations[name] = entry
-                deep_space_stations.append(entry)
-            elif name in _discovered_stations:
-                # Previously discovered — include as ghost (no live services/description)
-                ghost = dict(_discovered_stations[name])
-                ghost["in_scan_range"] = False
-                ghost["services"]      = []
-                ghost["description"]   = ""
-                deep_space_stations.append(ghost)
-            seen_station_names.add(name)
-
-    # Include DSOs in scan range fully; ghost-render previously discovered ones
-    # that are now outside sensor range.
-    dso_list = []
-    if deep_space_manager and ship_coords:
-        sx, sy, sz = ship_coords
-        for dso in deep_space_manager.list_all():
-            dso_dist = math.sqrt(
-                (dso.x - sx) ** 2 + (dso.y - sy) ** 2 + (dso.z - sz) ** 2
-            )
-            key = f"{dso.hex_q},{dso.hex_r}"
-            if dso_dist <= scan_range:
-                if not dso.discovered:
-                    deep_space_manager.discover(dso.hex_q, dso.hex_r)
-                entry = dso.to_dict()
-                entry["in_scan_range"] = True
-                _discovered_dsos[key] = entry     # cache for ghost rendering
-                dso_list.append(entry)
-            elif key in _discovered_dsos:
-                # Previously discovered — include as ghost
-                ghost = dict(_discovered_dsos[key])
-                ghost["in_scan_range"] = False
-                dso_list.append(ghost)
-
-    return {"systems": projected, "stations": deep_space_stations, "deep_space_objects": dso_list}
+            for leg in plan["legs"]
+        ],
+    }
 
 
 @app.get("/api/system/{system_name}")
@@ -1584,7 +1833,7 @@ async def get_system(system_name: str):
         raise HTTPException(status_code=404, detail=f"System '{system_name}' not found.")
 
     # Mark as visited
-    system_data["visited"] = True
+    galaxy.mark_visited(system_coords)
 
     # Build planet list
     planets = []
@@ -1621,7 +1870,7 @@ async def get_system(system_name: str):
         pass
 
     x, y, z = system_coords
-    hex_coord = galaxy_coords_to_hex(x, y)
+    hex_coord = _galaxy_hexes(galaxy).hex_of[system_coords]
 
     return {
         "name":                system_data.get("name"),
@@ -2182,6 +2431,50 @@ def _colony_system_affinity_for_faction(faction_name: str) -> int:
     return round(sum(scores) / len(scores))
 
 
+@app.get("/api/ship/reachable")
+async def ship_reachable():
+    """
+    Every system within the player's jump range, with the fuel each jump
+    would cost (including ether friction, danger and layer surcharges) and
+    whether the ship can currently afford it.
+
+    Backed by Ship.get_reachable_systems, which prices all targets in one
+    pass and caches the result until the ship moves or its stats change.
+    """
+    if not game or not game.character_created:
+        raise HTTPException(status_code=400, detail="No game in progress.")
+
+    nav = game.navigation
+    ship = nav.current_ship
+    if not ship:
+        raise HTTPException(status_code=400, detail="No active ship.")
+
+    hexes = _galaxy_hexes(nav.galaxy)
+    systems = []
+    for entry in ship.get_reachable_systems(nav.galaxy, game):
+        coords = entry["coordinates"]
+        h = hexes.hex_of.get(coords)
+        systems.append({
+            "name":           entry["system"].get("name", ""),
+            "coordinates":    list(coords),
+            "hex_q":          h.q if h else None,
+            "hex_r":          h.r if h else None,
+            "distance":       round(entry["distance"], 2),
+            "fuel":           entry["fuel"],
+            "friction":       round(entry["friction"], 3),
+            "dangerous":      entry["dangerous"],
+            "layers_crossed": entry["layers_crossed"],
+            "affordable":     entry["affordable"],
+        })
+
+    return {
+        "coordinates": list(ship.coordinates),
+        "jump_range":  ship.jump_range,
+        "fuel":        ship.fuel,
+        "systems":     systems,
+    }
+
+
 class JumpRequest(BaseModel):
     """Request body for jumping the player's ship."""
     target_x: float
@@ -2220,9 +2513,9 @@ async def ship_jump(request: JumpRequest):
 
     # 10% chance of minor hull stress from jump radiation / micro-debris.
     # Applies on every successful jump; harder jumps to distant stars feel riskier.
-    import random as _rnd_jump
-    if _rnd_jump.random() < 0.10:
-        _jump_wear = round(_rnd_jump.uniform(1.0, 3.0), 1)
+    _jump_rng = game.rng.stream("jump")
+    if _jump_rng.random() < 0.10:
+        _jump_wear = round(_jump_rng.uniform(1.0, 3.0), 1)
         game.ship_hull_damage = round(getattr(game, "ship_hull_damage", 0.0) + _jump_wear, 2)
         apply_all_bonuses_to_ship(ship, game)
         message += f"  [Hull stress: −{_jump_wear:.1f} integrity]"
@@ -2298,6 +2591,7 @@ async def ship_layer_shift(body: dict):
 
     ship.coordinates = new_coords
     ship.fuel        = max(0, ship.fuel - INTERLAYER_FUEL_COST)
+    game.discovery.observe(game)
 
     return {
         "success":        True,
@@ -2375,7 +2669,11 @@ async def deep_space_encounter():
     coords = ship.coordinates
     dest_hex = galaxy_coords_to_hex(coords[0], coords[1])
     try:
-        result = deep_space_manager.encounter(dest_hex.q, dest_hex.r)
+        registry = getattr(game, "rng", None)
+        result = deep_space_manager.encounter(
+            dest_hex.q, dest_hex.r,
+            rng=registry.stream("encounters") if registry is not None else None,
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -2958,14 +3256,13 @@ async def build_improvement(planet_name: str, request: BuildImprovementRequest):
         if colony and hasattr(game, "economy") and game.economy:
             sys_name = colony.system_name
             if not game.economy.get_market_info(sys_name):
-                import random as _rnd
                 _RICHNESS = ["Poor", "Moderate", "Moderate", "Rich", "Abundant"]
                 try:
                     game.economy.create_market({
                         "name":       sys_name,
                         "type":       "colony",
                         "population": colony.population,
-                        "resources":  _rnd.choice(_RICHNESS),
+                        "resources":  game.rng.stream("colony_markets").choice(_RICHNESS),
                     })
                     message += f" Interstellar market opened at {sys_name}."
                 except Exception as _me:
@@ -3185,6 +3482,7 @@ async def set_colony_system(planet_name: str, request: SetColonySystemRequest):
     # Apply the change
     setattr(colony, f"{category}_system",   system_id)
     setattr(colony, last_changed_attr,       current_turn)
+    colony_manager.mark_changed()
 
     # Build updated affinity table
     affinity_table = {}
@@ -3216,8 +3514,24 @@ class StartResearchRequest(BaseModel):
     research_name: str
 
 
+_RESEARCH_NODE_FIELDS = (
+    "name", "category", "description", "difficulty", "research_cost", "research_time",
+    "rp_cost", "prerequisites", "unlocks", "extended_unlocks", "related_energy",
+    "completed", "active", "available", "turns_to_complete", "in_research_path",
+)
+_RESEARCH_TOP_LEVEL_FIELDS = (
+    "active_research", "research_progress", "active_research_time",
+    "completed_count", "rp_per_turn", "rp_breakdown",
+)
+
+
 @app.get("/api/research/tree")
-async def get_research_tree():
+async def get_research_tree(
+    layout: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit:  Optional[int] = Query(None),
+):
     """
     Return the full research tree with each node's status for the current player.
 
@@ -3228,38 +3542,46 @@ async def get_research_tree():
 
     The frontend uses these flags to render the tech tree with correct colouring
     and to show the Start Research button only on available nodes.
+
+    ?layout=columnar sends nodes as one array per field (backend/encoding.py).
+    ?fields=name,completed,available keeps only those node keys and summary
+    keys; the RP projection behind turns_to_complete / rp_per_turn is only
+    run if one of them is asked for.  ?limit=&cursor= pages through nodes.
     """
     if not game or not game.character_created:
         raise HTTPException(status_code=400, detail="No game in progress.")
+    selection, pager = _projection(
+        fields, _RESEARCH_NODE_FIELDS + _RESEARCH_TOP_LEVEL_FIELDS, cursor, limit)
 
     # get_available_research_projects() returns a dict of researchable (not yet
     # completed, prerequisites met) projects.
-    available_dict = game.get_available_research_projects()
-    available_names = set(available_dict.keys()) if available_dict else set()
+    available_names = set()
+    if "available" in selection:
+        available_dict = game.get_available_research_projects()
+        available_names = set(available_dict.keys()) if available_dict else set()
 
     # Determine progress percentage for the active research node
     active_time = None
     if game.active_research and game.active_research in all_research:
         active_time = all_research[game.active_research].get("research_time", 1)
 
-    rp_data     = game.calculate_rp_per_turn(colony_rp=_colony_research_output())
-    rp_per_turn = rp_data["total"]
+    rp_data = None
+    if any(k in selection for k in ("turns_to_complete", "rp_per_turn", "rp_breakdown")):
+        rp_data = game.calculate_rp_per_turn(colony_rp=_colony_research_output())
+    rp_per_turn = rp_data["total"] if rp_data else 0
 
     paths     = getattr(game, "character_research_paths", []) or []
     path_cats = {RESEARCH_PATH_CATEGORIES.get(p, p) for p in paths}
 
     nodes = []
-    for name, data in all_research.items():
+    for name, data in _page(pager, all_research.items(), key=lambda item: item[0]):
         completed  = name in game.completed_research
         active     = (name == game.active_research)
         available  = (name in available_names) and not completed
         rp_cost    = data.get("research_time", 0)
-        progress   = game.research_progress if active else 0
-        remaining  = max(0, rp_cost - progress)
-        turns_est  = math.ceil(remaining / max(1, rp_per_turn)) if remaining > 0 else 0
         in_path    = data.get("category", "") in path_cats
 
-        nodes.append({
+        node = {
             "name":             name,
             "category":         data.get("category", ""),
             "description":      data.get("description", ""),
@@ -3274,19 +3596,28 @@ async def get_research_tree():
             "completed":        completed,
             "active":           active,
             "available":        available,
-            "turns_to_complete": turns_est,
             "in_research_path": in_path,
-        })
+        }
+        if rp_data is not None:
+            progress  = game.research_progress if active else 0
+            remaining = max(0, rp_cost - progress)
+            node["turns_to_complete"] = (
+                math.ceil(remaining / max(1, rp_per_turn)) if remaining > 0 else 0
+            )
+        nodes.append(selection.project(node))
 
-    return {
-        "nodes":                nodes,
+    summary = {
         "active_research":      game.active_research,
         "research_progress":    game.research_progress,
         "active_research_time": active_time,
         "completed_count":      len(game.completed_research),
         "rp_per_turn":          rp_per_turn,
-        "rp_breakdown":         rp_data["breakdown"],
+        "rp_breakdown":         rp_data["breakdown"] if rp_data else None,
     }
+    result = {"nodes": nodes}
+    result.update(selection.project(summary))
+    result.update(pager.envelope())
+    return columnarize(result, ("nodes",), layout)
 
 
 @app.get("/api/research/status")
@@ -3615,6 +3946,19 @@ class TradeRequest(BaseModel):
     quantity:    int
 
 
+class TradeOrder(BaseModel):
+    """One line of an order basket."""
+    side:      str                 # "buy" or "sell"
+    commodity: str
+    quantity:  int
+
+
+class TradeBasketRequest(BaseModel):
+    """Buys and sells to fill together at one market."""
+    system_name: str
+    orders:      list[TradeOrder]
+
+
 @app.get("/api/market/{system_name}")
 async def get_market(system_name: str):
     """
@@ -3739,7 +4083,7 @@ async def trade_buy(request: TradeRequest):
         "message":        message,
         "credits_remaining": game.credits,
         "inventory":      dict(game.inventory),
-        "market_prices":  info["market"]["prices"] if info else {},
+        "market_prices":  dict(info["market"]["prices"]) if info else {},
     }
 
 
@@ -3809,19 +4153,90 @@ async def trade_sell(request: TradeRequest):
         "message":          message,
         "credits_remaining": game.credits,
         "inventory":        dict(game.inventory),
-        "market_prices":    info["market"]["prices"] if info else {},
+        "market_prices":    dict(info["market"]["prices"]) if info else {},
         "shortfall_filled": shortfall_filled,
         "shortfall_bonus":  shortfall_bonus,
         "shortfall_commodity": request.commodity if shortfall_filled else None,
     }
 
 
+@app.post("/api/trade/basket")
+async def trade_basket(request: TradeBasketRequest):
+    """
+    Fill a basket of buys and sells at the current system's market at once.
+
+    Delegates to game.perform_trade_basket() which:
+      * Checks credits and cargo space for the whole basket (sales count
+        towards both) before anything changes - all orders fill or none.
+      * Fills every order at the prices quoted before the basket.
+      * Recomputes each affected commodity's price once.
+
+    Loading a mixed cargo is one request and one market update instead of
+    a /api/trade/buy or /api/trade/sell call per commodity.
+    """
+    if not game or not game.character_created:
+        raise HTTPException(status_code=400, detail="No game in progress.")
+
+    if not _player_is_at_market(request.system_name):
+        raise HTTPException(
+            status_code=403,
+            detail=f"You must be at {request.system_name} to trade there."
+        )
+
+    # Shortfalls are judged before the basket moves supply/demand, as in
+    # trade_sell.
+    pre_info = game.economy.get_market_info(request.system_name)
+    shortfalls = {s[0] for s in pre_info.get("best_sells", [])} if pre_info else set()
+
+    success, message, fills = game.perform_trade_basket(
+        request.system_name, [
+            {"side": o.side, "commodity": o.commodity, "quantity": o.quantity}
+            for o in request.orders
+        ]
+    )
+    if not success:
+        raise HTTPException(status_code=400, detail=message)
+
+    # ── Shortfall fill bonus (see trade_sell) ────────────────────────────────
+    shortfall_fills = [f for f in fills
+                       if f["side"] == "sell" and f["commodity"] in shortfalls]
+    filled = [f["commodity"] for f in shortfall_fills]
+    shortfall_bonus = sum(max(1, int(f["total"] * 0.10)) for f in shortfall_fills)
+    if filled:
+        game.credits += shortfall_bonus
+        try:
+            system_data = next(
+                (v for v in game.navigation.galaxy.systems.values()
+                 if v.get("name") == request.system_name),
+                None,
+            )
+            faction_name = system_data.get("controlling_faction") if system_data else None
+            if faction_name and hasattr(game, "faction_relations"):
+                game.faction_relations[faction_name] = (
+                    game.faction_relations.get(faction_name, 0) + 3 * len(filled)
+                )
+        except Exception:
+            pass  # faction rep boost is cosmetic; never fail the trade
+
+    info = game.economy.get_market_info(request.system_name)
+    return {
+        "success":           True,
+        "message":           message,
+        "fills":             fills,
+        "credits_remaining": game.credits,
+        "inventory":         dict(game.inventory),
+        "market_prices":     dict(info["market"]["prices"]) if info else {},
+        "shortfalls_filled": filled,
+        "shortfall_bonus":   shortfall_bonus,
+    }
+
+
 # ===========================================================================
 # NPC ship positions endpoint
 # ===========================================================================
 
 @app.get("/api/npc_ships")
-async def get_npc_ships():
+async def get_npc_ships(layout: Optional[str] = Query(None)):
     """
     Return every NPC bot's position pre-projected to 2D axial hex coordinates.
 
@@ -3838,6 +4253,8 @@ async def get_npc_ships():
 
     hex_q / hex_r are the collision-free axial positions the frontend must
     use; the raw coordinates are included for reference only.
+
+    ?layout=columnar sends ships as one array per field (backend/encoding.py).
     """
     if not game or not game.character_created:
         raise HTTPException(status_code=400, detail="No game in progress.")
@@ -3849,21 +4266,17 @@ async def get_npc_ships():
     # Build the set of hexes already occupied by star systems and deep-space
     # stations so NPC ships are never placed on top of either.
     #
-    # IMPORTANT: we must use resolve_hex_collisions() — not the raw
-    # galaxy_coords_to_hex() projection — because the galaxy-map endpoint
-    # nudges colliding systems to neighbouring hexes.  The raw projection
-    # would give the wrong hex for any system that was nudged, so we'd miss
-    # those hexes and still land NPC ships on top of them.
+    # IMPORTANT: we must use the collision-resolved hexes — not the raw
+    # galaxy_coords_to_hex() projection — because the galaxy map nudges
+    # colliding systems to neighbouring hexes.  The raw projection would give
+    # the wrong hex for any system that was nudged, so we'd miss those hexes
+    # and still land NPC ships on top of them.
     occupied: set = set()
 
     galaxy = getattr(game.navigation, "galaxy", None) if hasattr(game, "navigation") else None
     if galaxy and hasattr(galaxy, "systems"):
-        # Re-run the same minimal projection that /api/galaxy/map uses so we get
-        # the collision-resolved hex positions, not the raw projections.
-        raw = [{"name": d.get("name", ""), "x": c[0], "y": c[1], "z": c[2]}
-               for c, d in galaxy.systems.items()]
-        for s in resolve_hex_collisions(raw):
-            occupied.add(HexCoord(s["hex_q"], s["hex_r"]))
+        # Same cached projection the galaxy map uses
+        occupied = _galaxy_hexes(galaxy).occupied()
 
     # Deep-space station hexes (already pre-projected and stored on each dict)
     station_mgr = getattr(game, "station_manager", None)
@@ -3913,7 +4326,7 @@ async def get_npc_ships():
             "hex_r":       placed.r,
         })
 
-    return {"ships": ships}
+    return columnarize({"ships": ships}, ("ships",), layout)
 
 
 # ===========================================================================
@@ -4180,6 +4593,104 @@ async def editor_validate():
     return {"issues": issues, "valid": len(issues) == 0}
 
 
+# ===========================================================================
+# Batch endpoint — several reads in one round trip
+# ===========================================================================
+
+# Read endpoints callable through /api/batch, by operation name.  Only
+# handlers that take plain path/query parameters (no Request) belong here.
+_BATCH_OPS = {
+    "galaxy_map":       get_galaxy_map,
+    "galaxy_layers":    get_galaxy_layers,
+    "npc_ships":        get_npc_ships,
+    "system":           get_system,
+    "system_presence":  get_system_presence,
+    "system_interior":  get_system_interior,
+    "market":           get_market,
+    "ship_status":      get_ship_status,
+    "ship_attributes":  get_ship_attributes,
+    "research_tree":    get_research_tree,
+    "research_status":  get_research_status,
+    "colony_overview":  get_colony_overview,
+    "character_sheet":  get_character_sheet,
+    "factions":         get_all_factions,
+}
+_BATCH_MAX_OPS = 32
+
+
+def _batch_kwargs(handler, args: dict) -> dict:
+    """
+    Map an op's args onto the handler's parameters the way FastAPI would,
+    filling omitted Query(...) parameters with their declared default.
+    """
+    params = inspect.signature(handler).parameters
+    unknown = set(args) - set(params)
+    if unknown:
+        raise HTTPException(status_code=400,
+                            detail=f"Unknown argument(s): {', '.join(sorted(unknown))}.")
+    kwargs = {}
+    for name, param in params.items():
+        if name in args:
+            kwargs[name] = args[name]
+        elif param.default is inspect.Parameter.empty:
+            raise HTTPException(status_code=400, detail=f"Missing argument: {name}.")
+        elif isinstance(param.default, fastapi_params.Param):
+            kwargs[name] = param.default.default
+        else:
+            kwargs[name] = param.default
+    return kwargs
+
+
+@app.post("/api/batch")
+async def run_batch(req: BatchRequest):
+    """
+    Run several read endpoints in one request and return every result.
+
+    View initialisation used to cost one round trip per panel (map, layers,
+    NPC ships, system, presence, market ...), each re-checking the game and
+    re-deriving ship position, scan range and the hex projection.  Here all
+    operations run back-to-back without yielding to the event loop (long
+    calls run inline), so they see one consistent snapshot, and those shared
+    values are computed once (_batch_memo).
+
+    Request:   { ops: [ { op: "system", args: { system_name: "Sol" }, id? }, ... ] }
+    Response:  { results: [ { id, op, ok: true,  data }
+                          | { id, op, ok: false, status, detail }, ... ],
+                 world_version }
+
+    A failing operation (e.g. 400 "No game in progress.") only fails its own
+    entry.  Batches are read-only and do not bump world_version.
+    """
+    global _batch_memo
+    if not req.ops:
+        raise HTTPException(status_code=400, detail="No operations given.")
+    if len(req.ops) > _BATCH_MAX_OPS:
+        raise HTTPException(status_code=400,
+                            detail=f"At most {_BATCH_MAX_OPS} operations per batch.")
+
+    results = []
+    _batch_memo = {}
+    try:
+        for item in req.ops:
+            entry = {"id": item.id, "op": item.op}
+            handler = _BATCH_OPS.get(item.op)
+            try:
+                if handler is None:
+                    raise HTTPException(status_code=400, detail=f"Unknown operation: {item.op}.")
+                entry["data"] = await handler(**_batch_kwargs(handler, item.args))
+                entry["ok"] = True
+            except HTTPException as e:
+                entry.update(ok=False, status=e.status_code, detail=e.detail)
+            except Exception as _e:
+                print(f"[4X] Warning: batch op {item.op} failed: {_e}")
+                entry.update(ok=False, status=500, detail=str(_e))
+            results.append(entry)
+    finally:
+        _batch_memo = None
+
+    return {"results": results, "world_version": getattr(game, "world_version", 0)}
+
+
 # ===========================================================================
 # Static files — mounted LAST so /api/* routes always win
 # ===========================================================================
@@ -4189,6 +4700,46 @@ LORE_DIR     = os.path.join(PROJECT_ROOT, "lore")
 
 app.mount("/lore", StaticFiles(directory=LORE_DIR), name="lore")
 
+# index.html and everything under /js and /css go through AssetVersioner: the
+# HTML and JS module imports are rewritten to carry ?v=<build id>, and a URL
+# with the current build id is cached for a year (it can never change).
+# Anything else — index.html itself, stale or missing ids — is no-cache with
+# an ETag, so an unchanged file costs one 304 round trip.
+_assets = AssetVersioner(FRONTEND_DIR)
+_IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+
+def _serve_asset(request: Request, rel_path: str):
+    try:
+        body, media_type, etag = _assets.render(rel_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Not found.")
+    versioned = request.query_params.get("v") == _assets.build_id()
+    headers = {
+        "Cache-Control": _IMMUTABLE_CACHE if versioned else "no-cache",
+        "ETag": etag,
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+@app.get("/", include_in_schema=False)
+@app.get("/index.html", include_in_schema=False)
+async def serve_index(request: Request):
+    return _serve_asset(request, "index.html")
+
+
+@app.get("/js/{asset_path:path}", include_in_schema=False)
+async def serve_js(request: Request, asset_path: str):
+    return _serve_asset(request, f"js/{asset_path}")
+
+
+@app.get("/css/{asset_path:path}", include_in_schema=False)
+async def serve_css(request: Request, asset_path: str):
+    return _serve_asset(request, f"css/{asset_path}")
+
+
 # html=True makes StaticFiles serve index.html for any path that doesn't
 # match a real file — the standard pattern for single-page apps.
 app.mount(
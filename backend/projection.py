@@ -0,0 +1,128 @@
+"""
+backend/projection.py — Sparse field selection and cursor pagination.
+
+Heavy read endpoints (/api/research/tree, /api/galaxy/map) build one record
+per node/system.  Two query parameters let a caller ask for less:
+
+  fields=name,x,y,z,visited
+      Only these keys appear in each record (the record's key field, "name",
+      is always kept).  Endpoints check `"planet_count" in selection` before
+      computing anything expensive, so unrequested fields cost nothing.
+      Top-level summary keys (e.g. the research tree's rp_per_turn) are
+      selected the same way; the record list itself is always present.
+
+  limit=200&cursor=<opaque>
+      At most `limit` records, starting after the record named by `cursor`.
+      The response gains "next_cursor" (None on the last page) and "total".
+      Cursors name the last record returned rather than an offset, so a
+      page boundary stays put if earlier records are added or removed.
+
+Without either parameter responses are unchanged.  Plain Python — no web
+framework imports; main.py turns ValueError into a 400.
+"""
+
+import base64
+from typing import Callable, Iterable, List, Optional
+
+
+#: Largest page a caller may request.
+MAX_PAGE_SIZE = 5000
+
+
+class FieldSelection:
+    """The set of fields a caller asked for (None = all of them)."""
+
+    __slots__ = ("names",)
+
+    def __init__(self, fields: Optional[str], allowed: Iterable[str],
+                 always: Iterable[str] = ("name",)):
+        if fields is None or not fields.strip():
+            self.names = None
+            return
+        requested = {f.strip() for f in fields.split(",") if f.strip()}
+        unknown = requested - set(allowed)
+        if unknown:
+            raise ValueError(
+                f"Unknown field(s): {', '.join(sorted(unknown))}. "
+                f"Valid fields: {', '.join(sorted(allowed))}."
+            )
+        self.names = frozenset(requested) | frozenset(always)
+
+    @property
+    def everything(self) -> bool:
+        return self.names is None
+
+    def __contains__(self, name: str) -> bool:
+        return self.names is None or name in self.names
+
+    def project(self, record: dict) -> dict:
+        if self.names is None:
+            return record
+        return {k: v for k, v in record.items() if k in self.names}
+
+
+# ---------------------------------------------------------------------------
+# Cursors
+# ---------------------------------------------------------------------------
+
+def encode_cursor(key: str) -> str:
+    return base64.urlsafe_b64encode(key.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.b64decode(padded.encode("ascii"), altchars=b"-_", validate=True)
+        return raw.decode("utf-8")
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor.")
+
+
+class Pager:
+    """
+    Picks one page out of an ordered stream of items.
+
+    select() walks the stream once: it counts every item (for "total") but
+    hands back only the page, so callers build records for the page alone.
+    """
+
+    def __init__(self, cursor: Optional[str] = None, limit: Optional[int] = None):
+        if limit is not None and not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}.")
+        self.after = decode_cursor(cursor) if cursor else None
+        self.limit = limit
+        self.total = 0
+        self.next_cursor: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        return self.limit is not None or self.after is not None
+
+    def select(self, items: Iterable, key: Callable) -> List:
+        if not self.active:
+            page = list(items)
+            self.total = len(page)
+            return page
+        page = []
+        started = self.after is None
+        last_key = None
+        for item in items:
+            self.total += 1
+            if not started:
+                if key(item) == self.after:
+                    started = True
+                continue
+            if self.limit is None or len(page) < self.limit:
+                page.append(item)
+                last_key = key(item)
+            elif self.next_cursor is None:
+                self.next_cursor = encode_cursor(last_key)
+        if not started:
+            raise ValueError("Invalid cursor.")
+        return page
+
+    def envelope(self) -> dict:
+        """Pagination keys to merge into the response (empty if unpaged)."""
+        if not self.active:
+            return {}
+        return {"next_cursor": self.next_cursor, "total": self.total}
@@ -0,0 +1,146 @@
+"""
+backend/push.py — Server push hub for live HUD updates (Server-Sent Events).
+
+The browser used to poll /api/game/state every second: constant load while
+idle, and up to a second of lag after a turn resolved.  Instead each tab now
+holds one SSE connection (GET /api/events/stream) and the server pushes only
+when something changes.
+
+Two kinds of message feed a subscriber:
+
+  state deltas — latest value of a HUD section ("credits", "turn", "research",
+                 "ship", "indices").  Newer values overwrite older ones that
+                 haven't been sent yet, so a burst of changes (or a slow
+                 client) collapses into one message carrying the final values.
+  notices      — one-off announcements ("research_complete", "gnn").  Queued
+                 in order, bounded so a stalled tab can't grow memory.
+
+Each subscriber sends at most one message at a time: the stream awaits the
+previous send before draining again, which is the backpressure — while a send
+is in flight new changes just coalesce into the pending batch.  Nothing is
+sent while nothing changes (no heartbeats), so an idle tab costs nothing.
+
+publish()/notify() are plain functions and safe to call from any thread; they
+never block on a client.
+"""
+
+import asyncio
+import json
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+
+#: Seconds to wait after the first change before sending, so the rest of the
+#: burst (e.g. every section touched by one end-turn) rides in the same message.
+COALESCE_DELAY = 0.05
+
+#: Notices kept per subscriber; the oldest are dropped beyond this.
+MAX_PENDING_NOTICES = 32
+
+
+class Subscription:
+    """One connected client: a pending batch plus a wake-up event."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_notices: int = MAX_PENDING_NOTICES):
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._wake = asyncio.Event()
+        self.deltas: Dict[str, Any] = {}
+        self.notices = deque(maxlen=max_notices)
+        self.dropped_notices = 0
+        self.closed = False
+
+    def _signal(self):
+        # asyncio.Event isn't thread-safe; always set it on the owning loop
+        try:
+            if _running_loop() is self._loop:
+                self._wake.set()
+            else:
+                self._loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            self.closed = True  # loop gone — the client is gone too
+
+    def offer_delta(self, kind: str, value: Any):
+        with self._lock:
+            self.deltas[kind] = value
+        self._signal()
+
+    def offer_notice(self, kind: str, payload: Any):
+        with self._lock:
+            if len(self.notices) == self.notices.maxlen:
+                self.dropped_notices += 1
+            self.notices.append({"type": kind, **(payload if isinstance(payload, dict) else {"data": payload})})
+        self._signal()
+
+    def take(self) -> Optional[dict]:
+        """Remove and return everything pending as one batch (None if empty)."""
+        with self._lock:
+            if not self.deltas and not self.notices:
+                self._wake.clear()
+                return None
+            batch = {"deltas": self.deltas, "notices": list(self.notices)}
+            self.deltas = {}
+            self.notices.clear()
+            self._wake.clear()
+            return batch
+
+    async def next_batch(self, coalesce_delay: float = COALESCE_DELAY) -> dict:
+        """Wait for the next change, let the burst settle, return the batch."""
+        while True:
+            await self._wake.wait()
+            if coalesce_delay:
+                await asyncio.sleep(coalesce_delay)
+            batch = self.take()
+            if batch is not None:
+                return batch
+
+
+class PushHub:
+    """Fan-out of HUD deltas and notices to every connected subscriber."""
+
+    def __init__(self, max_notices: int = MAX_PENDING_NOTICES):
+        self._subscribers: List[Subscription] = []
+        self._lock = threading.Lock()
+        self.max_notices = max_notices
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> Subscription:
+        """Register a client.  Must be called from the event loop."""
+        sub = Subscription(asyncio.get_running_loop(), self.max_notices)
+        with self._lock:
+            self._subscribers = self._subscribers + [sub]
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        sub.closed = True
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s is not sub]
+
+    def publish(self, kind: str, value: Any):
+        """Set the latest value of a HUD section for every subscriber."""
+        for sub in self._subscribers:
+            if not sub.closed:
+                sub.offer_delta(kind, value)
+
+    def notify(self, kind: str, payload: Any):
+        """Queue a one-off notice for every subscriber."""
+        for sub in self._subscribers:
+            if not sub.closed:
+                sub.offer_notice(kind, payload)
+
+
+def format_sse(batch: dict, event: str = "delta") -> str:
+    """Serialise a batch as one Server-Sent Events message."""
+    data = json.dumps(batch, separators=(",", ":"), default=str)
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def _running_loop():
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
@@ -0,0 +1,204 @@
+"""
+backend/sessions.py — Per-player session registry with LRU eviction to disk.
+
+One server process used to host exactly one game: backend/main.py kept a
+single module-global Game (plus colony manager, deep-space manager, caches),
+so a second browser calling /api/game/new wiped out the first player.
+
+SessionRegistry owns one isolated *bundle* per player — a plain dict of
+name -> object (the Game, its managers, per-player caches) — keyed by an
+opaque id carried in the SESSION_COOKIE cookie.  main.py binds the bundle of
+the requesting session onto its module globals while each API call's endpoint
+runs, so the endpoint code itself is unchanged.
+
+Memory is capped: at most max_live bundles stay in RAM.  When a new or
+rehydrated session would exceed that, the least recently used idle session
+is pickled to <directory>/<id>.pickle and dropped; its next request loads it
+back transparently.  Keys listed as transient (push channels, derived caches)
+are not written — the factory rebuilds them on rehydrate.
+
+The registry is not thread-safe; main.py only touches it from the event
+loop, never from worker threads.
+"""
+
+import os
+import pickle
+import re
+import secrets
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
+
+
+SESSION_COOKIE = "4x_session"
+
+#: Bundles kept in memory before the least recently used idle one is evicted.
+DEFAULT_MAX_LIVE_SESSIONS = 8
+
+#: Evicted sessions untouched for this long are deleted by prune().
+DEFAULT_STORED_TTL_SECONDS = 14 * 24 * 3600
+
+# Ids are generated by new_id(); anything else in a cookie is ignored, which
+# also keeps cookie values from naming files outside the session directory.
+_SESSION_ID_RE = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+
+
+class Session:
+    """One player's bundle plus bookkeeping."""
+
+    __slots__ = ("id", "state", "last_used", "is_new")
+
+    def __init__(self, session_id: str, state: dict, is_new: bool = False):
+        self.id = session_id
+        self.state = state
+        self.last_used = time.monotonic()
+        self.is_new = is_new        # True until the cookie has been sent
+
+
+class SessionRegistry:
+    """Session id -> bundle, with LRU eviction of idle bundles to disk."""
+
+    def __init__(self, factory: Callable[[], dict], directory,
+                 max_live: int = DEFAULT_MAX_LIVE_SESSIONS,
+                 transient: Iterable[str] = (),
+                 can_evict: Optional[Callable[[Session], bool]] = None):
+        self.factory = factory
+        self.directory = Path(directory)
+        self.max_live = max(1, int(max_live))
+        self.transient = frozenset(transient)
+        self.can_evict = can_evict
+        self._live: "OrderedDict[str, Session]" = OrderedDict()
+        self.evictions = 0
+        self.restores = 0
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def new_id() -> str:
+        return secrets.token_urlsafe(24)
+
+    @staticmethod
+    def valid_id(session_id: Optional[str]) -> bool:
+        return bool(session_id) and bool(_SESSION_ID_RE.match(session_id))
+
+    def get(self, session_id: Optional[str]) -> Session:
+        """
+        Return the live session for session_id, loading it from disk if it
+        was evicted, or a brand-new session (with a fresh id) if the id is
+        missing, malformed or unknown.
+        """
+        session = None
+        if self.valid_id(session_id):
+            session = self._live.get(session_id)
+            if session is not None:
+                self._live.move_to_end(session_id)
+            else:
+                session = self._restore(session_id)
+        if session is None:
+            session = Session(self.new_id(), self.factory(), is_new=True)
+            self._live[session.id] = session
+        session.last_used = time.monotonic()
+        self._enforce_cap(keep=session.id)
+        return session
+
+    def live(self) -> List[Session]:
+        """Live sessions, least recently used first."""
+        return list(self._live.values())
+
+    @property
+    def live_count(self) -> int:
+        return len(self._live)
+
+    def stored_ids(self) -> List[str]:
+        if not self.directory.exists():
+            return []
+        return [p.stem for p in self.directory.glob("*.pickle")]
+
+    # ------------------------------------------------------------------
+    # Eviction / rehydration
+    # ------------------------------------------------------------------
+
+    def _path(self, session_id: str) -> Path:
+        return self.directory / f"{session_id}.pickle"
+
+    def _enforce_cap(self, keep: Optional[str] = None):
+        if len(self._live) <= self.max_live:
+            return
+        for session_id in list(self._live):
+            if len(self._live) <= self.max_live:
+                break
+            if session_id == keep:
+                continue
+            session = self._live[session_id]
+            if self.can_evict is not None and not self.can_evict(session):
+                continue
+            self.evict(session_id)
+
+    def evict(self, session_id: str) -> bool:
+        """Write a live session to disk and drop it from memory."""
+        session = self._live.get(session_id)
+        if session is None:
+            return False
+        payload = {k: v for k, v in session.state.items() if k not in self.transient}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(session_id)
+        tmp = path.with_suffix(".tmp")
+        try:
+            with open(tmp, "wb") as fh:
+                pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception as _e:
+            print(f"[4X] Warning: could not evict session {session_id[:8]}…: {_e}")
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return False
+        del self._live[session_id]
+        self.evictions += 1
+        return True
+
+    def evict_all(self):
+        """Write every live session to disk (server shutdown)."""
+        for session_id in list(self._live):
+            self.evict(session_id)
+
+    def _restore(self, session_id: str) -> Optional[Session]:
+        path = self._path(session_id)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as fh:
+                payload = pickle.load(fh)
+        except Exception as _e:
+            print(f"[4X] Warning: could not restore session {session_id[:8]}…: {_e}")
+            return None
+        state = self.factory()
+        state.update(payload)
+        session = Session(session_id, state)
+        self._live[session_id] = session
+        path.unlink(missing_ok=True)
+        self.restores += 1
+        return session
+
+    def drop(self, session_id: str):
+        """Forget a session entirely (memory and disk)."""
+        self._live.pop(session_id, None)
+        self._path(session_id).unlink(missing_ok=True)
+
+    def prune(self, max_age_seconds: float = DEFAULT_STORED_TTL_SECONDS) -> int:
+        """Delete evicted sessions whose file is older than max_age_seconds."""
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for session_id in self.stored_ids():
+            path = self._path(session_id)
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                pass
+        return removed
@@ -0,0 +1,199 @@
+"""
+backend/workers.py — Worker threads for long-running engine calls.
+
+Every backend handler is `async def`, but the heavy ones are plain CPU and
+file work: Game() galaxy generation, save/load, very large map builds.  Run
+inline, each one stalls the event loop — every other tab's requests, the SSE
+streams and static files all wait for it.
+
+WorkerPool runs such a call on a worker thread and awaits it, so the loop
+keeps serving while it runs.  Each call is a Job that can report progress:
+
+    def build(job, seed):
+        job.report(0.1, "Generating galaxy")
+        g = Game(seed=seed, background_thread=False)
+        job.report(0.9, "Placing stations")
+        ...
+        return g
+
+    job = workers.new_job(session_id, "new_game", "Starting new game")
+    g = await workers.run(job, build, seed)
+
+Jobs are keyed (main.py uses the session id): busy(key) / wait_idle(key)
+let the caller keep other requests away from state a job is still working
+on.  Progress reports go to the optional on_progress callback, which may be
+called from the worker thread.
+
+Threads rather than processes: a job works on the live Game object in
+place, and a process pool would have to pickle the whole engine bundle
+(~1.5 MB, tens of ms) across and back for every call.  Pure-Python work on
+a thread still shares the GIL, but the interpreter switches threads every
+few milliseconds, so the loop stays responsive instead of freezing for the
+whole call.
+
+Code running inside a job can call current_job() to find its Job — e.g. to
+defer a callback that must run on the event loop (Job.defer); the owner
+replays those with run_deferred() once the job is finished.
+"""
+
+import asyncio
+import contextvars
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+
+DEFAULT_MAX_WORKERS = 4
+
+_current_job: contextvars.ContextVar = contextvars.ContextVar("current_job", default=None)
+_job_ids = itertools.count(1)
+
+
+def current_job() -> Optional["Job"]:
+    """The Job whose worker thread is running this code, or None."""
+    return _current_job.get()
+
+
+class Job:
+    """One offloaded call: label, progress and its deferred loop callbacks."""
+
+    def __init__(self, key: str, kind: str, label: str,
+                 on_progress: Optional[Callable[[dict], None]] = None):
+        self.id = next(_job_ids)
+        self.key = key
+        self.kind = kind
+        self.label = label
+        self.progress = 0.0
+        self.stage = label
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+        self.error: Optional[str] = None
+        self._on_progress = on_progress
+        self._lock = threading.Lock()
+        self._deferred: List[tuple] = []
+
+    def report(self, fraction: float, stage: Optional[str] = None):
+        """Record progress (0.0–1.0) and an optional stage label; thread-safe."""
+        with self._lock:
+            self.progress = max(self.progress, min(1.0, float(fraction)))
+            if stage:
+                self.stage = stage
+        if self._on_progress is not None:
+            try:
+                self._on_progress(self.snapshot())
+            except Exception as _e:
+                print(f"[4X] Warning: progress callback failed: {_e}")
+
+    def defer(self, fn: Callable, *args):
+        """Queue fn(*args) to run on the event loop once the job is done."""
+        with self._lock:
+            self._deferred.append((fn, args))
+
+    def run_deferred(self):
+        """Run (and clear) the deferred callbacks — call from the event loop."""
+        with self._lock:
+            deferred, self._deferred = self._deferred, []
+        for fn, args in deferred:
+            try:
+                fn(*args)
+            except Exception as _e:
+                print(f"[4X] Warning: deferred callback {getattr(fn, '__name__', fn)} failed: {_e}")
+
+    @property
+    def done(self) -> bool:
+        return self.finished is not None
+
+    def snapshot(self) -> dict:
+        end = self.finished if self.finished is not None else time.monotonic()
+        return {
+            "id":       self.id,
+            "kind":     self.kind,
+            "label":    self.label,
+            "stage":    self.stage,
+            "progress": round(self.progress, 3),
+            "elapsed":  round(end - self.started, 3),
+            "done":     self.done,
+            "error":    self.error,
+        }
+
+
+class WorkerPool:
+    """Thread pool plus the set of jobs currently running, by key."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._active: Dict[str, Job] = {}
+        self._idle: Dict[str, asyncio.Event] = {}
+        self.completed = 0
+        self.failed = 0
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="4x-worker")
+        return self._executor
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    def busy(self, key: str) -> bool:
+        return key in self._active
+
+    def active(self, key: str) -> Optional[Job]:
+        return self._active.get(key)
+
+    async def wait_idle(self, key: str):
+        """Return once no job is running for key."""
+        while key in self._active:
+            await self._idle[key].wait()
+
+    def new_job(self, key: str, kind: str, label: str,
+                on_progress: Optional[Callable[[dict], None]] = None) -> Job:
+        return Job(key, kind, label, on_progress)
+
+    async def run(self, job: Job, fn: Callable, *args) -> Any:
+        """
+        Run fn(job, *args) on a worker thread and return its result.
+        One job per key at a time; must be awaited from the event loop.
+        """
+        key = job.key
+        if key in self._active:
+            raise RuntimeError(f"a job is already running for {key!r}")
+        self._active[key] = job
+        self._idle[key] = asyncio.Event()
+        job.report(0.0)
+
+        ctx = contextvars.copy_context()
+        ctx.run(_current_job.set, job)
+        future = asyncio.get_running_loop().run_in_executor(self._pool(), ctx.run, fn, job, *args)
+        try:
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # A thread can't be stopped: keep the key busy until it ends
+                await asyncio.wait([future])
+                raise
+        except BaseException as exc:
+            job.error = str(exc) or type(exc).__name__
+            self.failed += 1
+            raise
+        else:
+            self.completed += 1
+            return result
+        finally:
+            job.finished = time.monotonic()
+            if job.error is None:
+                job.report(1.0, "Done")
+            else:
+                job.report(job.progress, "Failed")
+            del self._active[key]
+            self._idle.pop(key).set()
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
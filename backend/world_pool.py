@@ -0,0 +1,125 @@
+"""
+backend/world_pool.py — Pre-generated worlds, ready before anyone asks.
+
+Building a Game() (galaxy, markets, factions, history, events) is the slow
+part of /api/game/new: ~0.6 s for the default 300 systems, seconds for
+large galaxies.  Nothing about it depends on the player's character
+choices, so WorldPool builds a few default worlds ahead of time on a
+background thread and hands one over the moment a New Game arrives:
+
+    world_pool = WorldPool(lambda: Game(background_thread=False), size=2)
+    world_pool.start()          # from the lifespan hook — returns at once
+    ...
+    g = world_pool.take()       # a ready Game, or None if the pool is dry
+    if g is None:
+        g = ...build one now...
+
+Every take() (hit or miss) schedules a refill, so the pool climbs back to
+`size` between games.  Worlds are built one at a time on a single thread
+of their own: generation is pure Python, so more threads would only fight
+each other (and the event loop) for the GIL, and a dedicated thread keeps
+refills out of the way of the request-driven WorkerPool jobs.
+
+Nothing is built at import or construction time — start() schedules the
+first fill and returns, so the server is ready immediately.  size=0
+disables the pool (take() always misses).
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Optional
+
+
+DEFAULT_POOL_SIZE = 2
+
+
+class WorldPool:
+    """A small queue of pre-built engines, refilled in the background."""
+
+    def __init__(self, factory: Callable[[], Any], size: int = DEFAULT_POOL_SIZE):
+        self._factory = factory
+        self.size = max(0, int(size))
+        self._ready: Deque[Any] = deque()
+        self._pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped = False
+        self.hits = 0
+        self.misses = 0
+        self.built = 0
+        self.failed = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Begin filling the pool; must be called from the event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._stopped = False
+        self._refill()
+
+    def stop(self):
+        """Drop ready worlds and abandon queued builds (a running one finishes)."""
+        self._stopped = True
+        self._ready.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # ------------------------------------------------------------------
+    # Worlds
+    # ------------------------------------------------------------------
+
+    @property
+    def ready(self) -> int:
+        return len(self._ready)
+
+    def take(self) -> Optional[Any]:
+        """Hand over a ready world (or None) and schedule a replacement."""
+        world = self._ready.popleft() if self._ready else None
+        if world is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        self._refill()
+        return world
+
+    def stats(self) -> dict:
+        return {
+            "size":    self.size,
+            "ready":   len(self._ready),
+            "pending": self._pending,
+            "hits":    self.hits,
+            "misses":  self.misses,
+            "built":   self.built,
+            "failed":  self.failed,
+        }
+
+    def _refill(self):
+        if self._loop is None or self._stopped:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="4x-worldgen")
+        while len(self._ready) + self._pending < self.size:
+            self._pending += 1
+            future = self._loop.run_in_executor(self._executor, self._factory)
+            future.add_done_callback(self._landed)
+
+    def _landed(self, future: "asyncio.Future"):
+        # Done-callbacks run on the event loop, so no locking is needed here.
+        self._pending -= 1
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            # Don't retry straight away — a broken factory would spin.  The
+            # next take() schedules another attempt.
+            self.failed += 1
+            print(f"[4X] Warning: pre-generating a world failed: {exc}")
+            return
+        if self._stopped:
+            return
+        self._ready.append(future.result())
+        self.built += 1
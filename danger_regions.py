@@ -0,0 +1,193 @@
+"""
+Dangerous Regions - Indexed, Expiring Hazard Zones
+
+Travel events (pirate activity, space storms, ...) mark spheres of space as
+dangerous.  Every fuel calculation and every jump asks "is this point inside
+one of them?", and reachability previews ask it for every system in range.
+Checked by looping over all regions, that gets slower with every event over a
+long campaign - and regions used to be permanent, so they only piled up.
+
+DangerRegions is a drop-in replacement for the old
+    {center: {'threat_level', 'radius', 'description', ...}}
+dict (EventSystem.dangerous_regions) that additionally:
+
+  * buckets each region into the voxels its bounding box overlaps, so a point
+    check is one dict lookup plus an exact test against the handful of
+    regions sharing that voxel;
+  * records an optional 'expires_turn' per region and drops expired regions
+    in expire(current_turn), called once per turn by EventSystem;
+  * answers many points at once (flag_many) for route planning and the
+    reachable-systems overlay;
+  * keeps a version counter so callers can cache danger-dependent results.
+
+Plain dict writes (regions[center] = {...}, del regions[center]) keep the
+index in step, so existing callers need no changes.
+"""
+
+import heapq
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from spatial_index import DEFAULT_CELL_SIZE
+
+
+Coords = Tuple[float, float, float]
+
+
+class DangerRegions(dict):
+    """center -> region dict, with a voxel index and turn-based expiry."""
+
+    def __init__(self, regions: Optional[dict] = None, cell_size: float = DEFAULT_CELL_SIZE):
+        super().__init__()
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int, int], Dict[Coords, Tuple[float, float, float, float]]] = {}
+        self._cells_of: Dict[Coords, List[Tuple[int, int, int]]] = {}
+        self._expiry: List[Tuple[int, Coords]] = []  # min-heap, lazily pruned
+        # Bumped on every add/remove; lets callers cache danger-dependent data.
+        self.version = 0
+        if regions:
+            self.update(regions)
+
+    # ------------------------------------------------------------------
+    # Maintenance (dict interface)
+    # ------------------------------------------------------------------
+
+    def __setitem__(self, center, region):
+        center = tuple(center)
+        if dict.__contains__(self, center):
+            self._unindex(center)
+        dict.__setitem__(self, center, region)
+        self._index(center, region)
+        expires = region.get('expires_turn')
+        if expires is not None:
+            heapq.heappush(self._expiry, (expires, center))
+        self.version += 1
+
+    def __delitem__(self, center):
+        center = tuple(center)
+        dict.__delitem__(self, center)
+        self._unindex(center)
+        self.version += 1
+
+    def pop(self, center, *default):
+        center = tuple(center)
+        if dict.__contains__(self, center):
+            region = dict.pop(self, center)
+            self._unindex(center)
+            self.version += 1
+            return region
+        if default:
+            return default[0]
+        raise KeyError(center)
+
+    def popitem(self):
+        center, region = dict.popitem(self)
+        self._unindex(center)
+        self.version += 1
+        return center, region
+
+    def setdefault(self, center, region=None):
+        center = tuple(center)
+        if not dict.__contains__(self, center):
+            self[center] = region
+        return dict.__getitem__(self, center)
+
+    def update(self, *args, **kwargs):
+        for center, region in dict(*args, **kwargs).items():
+            self[center] = region
+
+    def clear(self):
+        dict.clear(self)
+        self._cells.clear()
+        self._cells_of.clear()
+        self._expiry = []
+        self.version += 1
+
+    def copy(self) -> dict:
+        """Plain-dict snapshot (as the old dict's copy() returned)."""
+        return dict(self)
+
+    def __reduce__(self):
+        # Pickle/deepcopy would otherwise replay the items through
+        # __setitem__ before cell_size and the index exist; rebuild via
+        # __init__ instead (the index and expiry heap are derived data).
+        return (self.__class__, (dict(self), self.cell_size), {"version": self.version})
+
+    def _cell(self, x, y, z):
+        s = self.cell_size
+        return (math.floor(x / s), math.floor(y / s), math.floor(z / s))
+
+    def _index(self, center, region):
+        radius = float(region.get('radius', 0))
+        entry = (float(center[0]), float(center[1]), float(center[2]), radius * radius)
+        lo = self._cell(center[0] - radius, center[1] - radius, center[2] - radius)
+        hi = self._cell(center[0] + radius, center[1] + radius, center[2] + radius)
+        cells = []
+        for i in range(lo[0], hi[0] + 1):
+            for j in range(lo[1], hi[1] + 1):
+                for k in range(lo[2], hi[2] + 1):
+                    self._cells.setdefault((i, j, k), {})[center] = entry
+                    cells.append((i, j, k))
+        self._cells_of[center] = cells
+
+    def _unindex(self, center):
+        for cell in self._cells_of.pop(center, ()):
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.pop(center, None)
+                if not bucket:
+                    del self._cells[cell]
+
+    # ------------------------------------------------------------------
+    # Expiry
+    # ------------------------------------------------------------------
+
+    def expire(self, current_turn: int) -> List[Coords]:
+        """Remove every region whose 'expires_turn' is <= current_turn.
+        Returns the centers removed."""
+        removed = []
+        heap = self._expiry
+        while heap and heap[0][0] <= current_turn:
+            expires, center = heapq.heappop(heap)
+            region = dict.get(self, center)
+            # Skip stale heap entries (region removed or re-added since)
+            if region is None or region.get('expires_turn') != expires:
+                continue
+            del self[center]
+            removed.append(center)
+        return removed
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def is_dangerous(self, coordinates) -> bool:
+        """True if the point lies inside (or on the edge of) any region."""
+        x, y, z = coordinates[0], coordinates[1], coordinates[2]
+        bucket = self._cells.get(self._cell(x, y, z))
+        if not bucket:
+            return False
+        for cx, cy, cz, r_sq in bucket.values():
+            if (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2 <= r_sq:
+                return True
+        return False
+
+    def flag_many(self, coordinates: Iterable) -> List[bool]:
+        """is_dangerous() for many points, in order."""
+        if not self._cells:
+            return [False for _c in coordinates]
+        cells = self._cells
+        s = self.cell_size
+        floor = math.floor
+        flags = []
+        for c in coordinates:
+            x, y, z = c[0], c[1], c[2]
+            bucket = cells.get((floor(x / s), floor(y / s), floor(z / s)))
+            hit = False
+            if bucket:
+                for cx, cy, cz, r_sq in bucket.values():
+                    if (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2 <= r_sq:
+                        hit = True
+                        break
+            flags.append(hit)
+        return flags
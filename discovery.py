@@ -0,0 +1,304 @@
+"""
+Discovery Engine - Incremental Fog of War
+
+The galaxy map only shows what the player's sensors have ever picked up:
+objects inside scan range get full, live data; objects seen before but now
+out of range are drawn as "ghosts"; everything else stays hidden.
+
+Working that out means a distance check against every system, deep-space
+station and deep-space object (DSO).  The answer only changes when the ship
+moves or its scan range changes, so this module does the work at those
+moments (Ship.jump_to, the layer-shift endpoint, apply_all_bonuses_to_ship)
+and keeps the result as sets.  The map endpoint then reads the sets, so an
+unchanged view costs the same however large the galaxy is.
+
+observe() is also safe to call defensively: it compares a cheap observer key
+(ship position, scan range, galaxy/station/DSO versions) and returns at once
+when nothing relevant has changed.
+"""
+
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from spatial_index import SpatialIndex
+
+
+Coords = Tuple[float, float, float]
+
+#: Scan range used when there is no active ship (matches the default-attribute
+#: result of get_effective_scan_range in game.py).
+DEFAULT_SCAN_RANGE = 40.0
+
+
+class DiscoveryEngine:
+    """Discovered / in-range sets for systems, deep-space stations and DSOs."""
+
+    def __init__(self):
+        # Systems are persisted by name (the save format); the coords dict is
+        # the working form and doubles as an ordered set (discovery order).
+        self.discovered_systems: Set[str] = set()
+        self._discovered_coords: Dict[Coords, None] = {}
+        self._unresolved_names = False
+        self.in_range_systems: Set[Coords] = set()
+
+        # Deep-space stations: full entries while in range, ghosts after.
+        self.discovered_stations: Dict[str, dict] = {}
+        self.in_range_stations: Set[str] = set()
+        self._station_ghosts: Dict[str, dict] = {}
+
+        # DSOs keyed by "hex_q,hex_r"; in-range ones are re-serialised on read
+        # because harvesting/encounters change them without the ship moving.
+        self.discovered_dsos: Dict[str, dict] = {}
+        self.in_range_dsos: Dict[str, object] = {}
+        self._dso_ghosts: Dict[str, dict] = {}
+        self.dso_manager = None
+
+        self._seeded = False
+        self._observer = None
+        self._station_index: Optional[SpatialIndex] = None
+        self._station_index_key = None
+        self._station_lookup: Dict[str, dict] = {}
+        self._stations_without_coords: List[str] = []
+        self._dso_index: Optional[SpatialIndex] = None
+        self._dso_index_key = None
+        self._dso_lookup: Dict[str, object] = {}
+
+        # Bumped on every rescan; lets callers cache anything derived from the sets.
+        self.version = 0
+
+    # ------------------------------------------------------------------
+    # Updating
+    # ------------------------------------------------------------------
+
+    def observe(self, game, force: bool = False) -> bool:
+        """Rescan around the player's ship if its view has changed.
+
+        Returns True when a rescan happened.
+        """
+        nav = getattr(game, 'navigation', None)
+        galaxy = getattr(nav, 'galaxy', None)
+        if galaxy is None:
+            return False
+
+        if not self._seeded:
+            self.seed_from_visited(galaxy)
+
+        ship = getattr(nav, 'current_ship', None)
+        coords = tuple(ship.coordinates) if ship is not None else None
+        scan_range = _scan_range(game)
+        station_mgr = getattr(game, 'station_manager', None)
+        dso_mgr = self.dso_manager
+
+        key = (
+            id(galaxy), galaxy.systems_version, coords, scan_range,
+            id(station_mgr), len(getattr(station_mgr, 'stations', ()) or ()),
+            id(dso_mgr), dso_mgr.count() if dso_mgr is not None else 0,
+        )
+        if not force and key == self._observer:
+            return False
+        self._observer = key
+
+        self._resolve_names(galaxy)
+        if coords is not None:
+            self._scan_systems(galaxy, coords, scan_range)
+        else:
+            self.in_range_systems = set()
+        self._scan_stations(station_mgr, coords, scan_range)
+        self._scan_dsos(dso_mgr, coords, scan_range)
+        self.version += 1
+        return True
+
+    def invalidate(self):
+        """Force the next observe() to rescan, re-reading stations and DSOs
+        (e.g. after a load replaced them in place)."""
+        self._observer = None
+        self._station_index_key = None
+        self._dso_index_key = None
+
+    def seed_from_visited(self, galaxy):
+        """Mark every visited system as discovered (first use / pre-fog saves)."""
+        for coords, data in galaxy.systems.items():
+            if data.get('visited', False):
+                self._discover_system(coords, data)
+        self._seeded = True
+
+    def _discover_system(self, coords, data):
+        self._discovered_coords[coords] = None
+        self.discovered_systems.add(data.get('name', ''))
+
+    def _resolve_names(self, galaxy):
+        """Map names restored from a save back to coordinates (one pass)."""
+        if not self._unresolved_names:
+            return
+        names = self.discovered_systems
+        for coords, data in galaxy.systems.items():
+            if data.get('name', '') in names:
+                self._discovered_coords[coords] = None
+        self._unresolved_names = False
+
+    def _scan_systems(self, galaxy, coords, scan_range):
+        in_range = set()
+        for c, data, _dist in galaxy.get_systems_in_radius(*coords, scan_range):
+            in_range.add(c)
+            if c not in self._discovered_coords:
+                self._discover_system(c, data)
+        self.in_range_systems = in_range
+
+    def _scan_stations(self, station_mgr, coords, scan_range):
+        previous = self.in_range_stations
+        in_range = set()
+        if station_mgr is not None:
+            key = (id(station_mgr), len(getattr(station_mgr, 'stations', ()) or ()))
+            if key != self._station_index_key:
+                self._station_index = SpatialIndex()
+                self._stations_without_coords = []
+                for st in station_mgr.get_deep_space_stations():
+                    sc = st.get('coordinates')
+                    if sc:
+                        self._station_index.insert(st['name'], tuple(sc))
+                    else:
+                        # No position: always visible, as before
+                        self._stations_without_coords.append(st['name'])
+                self._station_lookup = {s['name']: s for s in station_mgr.get_deep_space_stations()}
+                self._station_index_key = key
+
+            hits = list(self._stations_without_coords)
+            if coords is not None:
+                hits.extend(name for name, _d in self._station_index.query_radius(coords, scan_range))
+            else:
+                hits.extend(self._station_lookup)
+            for name in hits:
+                st = self._station_lookup.get(name)
+                if st is None:
+                    continue
+                sc = st.get('coordinates')
+                entry = {
+                    "name":          name,
+                    "type":          st["type"],
+                    "hex_q":         st["hex_q"],
+                    "hex_r":         st["hex_r"],
+                    "coordinates":   list(sc) if sc else [],
+                    "services":      st.get("services", []),
+                    "description":   st.get("description", ""),
+                    "in_scan_range": True,
+                }
+                self.discovered_stations[name] = entry
+                self._station_ghosts.pop(name, None)
+                in_range.add(name)
+
+        # Stations that just left range become ghosts (built once, not per read)
+        for name in previous - in_range:
+            self._station_ghosts[name] = _station_ghost(self.discovered_stations.get(name, {}))
+        self.in_range_stations = in_range
+
+    def _scan_dsos(self, dso_mgr, coords, scan_range):
+        previous = set(self.in_range_dsos)
+        in_range: Dict[str, object] = {}
+        if dso_mgr is not None and coords is not None:
+            key = (id(dso_mgr), dso_mgr.count())
+            if key != self._dso_index_key:
+                # DeepSpaceObject is an unhashable dataclass: index the
+                # "q,r" key and look the object up from it
+                self._dso_index = SpatialIndex()
+                self._dso_lookup = {}
+                for dso in dso_mgr.list_all():
+                    dso_key = f"{dso.hex_q},{dso.hex_r}"
+                    self._dso_lookup[dso_key] = dso
+                    self._dso_index.insert(dso_key, (dso.x, dso.y, dso.z))
+                self._dso_index_key = key
+            for dso_key, _d in self._dso_index.query_radius(coords, scan_range):
+                dso = self._dso_lookup[dso_key]
+                if not dso.discovered:
+                    dso_mgr.discover(dso.hex_q, dso.hex_r)
+                in_range[dso_key] = dso
+                self._dso_ghosts.pop(dso_key, None)
+
+        for dso_key, dso in in_range.items():
+            entry = dso.to_dict()
+            entry["in_scan_range"] = True
+            self.discovered_dsos[dso_key] = entry
+        for dso_key in previous - set(in_range):
+            ghost = dict(self.discovered_dsos.get(dso_key, {}))
+            ghost["in_scan_range"] = False
+            self._dso_ghosts[dso_key] = ghost
+        self.in_range_dsos = in_range
+
+    # ------------------------------------------------------------------
+    # Reading (map endpoint)
+    # ------------------------------------------------------------------
+
+    def iter_systems(self, galaxy) -> Iterator[Tuple[Coords, dict, bool]]:
+        """Yield (coords, system, in_scan_range) for every discovered system,
+        in discovery order.  Systems removed from the galaxy are skipped."""
+        self._resolve_names(galaxy)
+        systems = galaxy.systems
+        in_range = self.in_range_systems
+        for coords in self._discovered_coords:
+            data = systems.get(coords)
+            if data is not None:
+                yield coords, data, coords in in_range
+
+    def station_entries(self) -> List[dict]:
+        """In-range station entries followed by ghosts of previously seen ones."""
+        entries = [self.discovered_stations[n] for n in self.in_range_stations
+                   if n in self.discovered_stations]
+        for name in self.discovered_stations:
+            if name not in self.in_range_stations:
+                ghost = self._station_ghosts.get(name)
+                if ghost is None:
+                    ghost = self._station_ghosts[name] = _station_ghost(self.discovered_stations[name])
+                entries.append(ghost)
+        return entries
+
+    def dso_entries(self) -> List[dict]:
+        """Live entries for in-range DSOs followed by ghosts of seen ones."""
+        entries = []
+        for dso_key, dso in self.in_range_dsos.items():
+            entry = dso.to_dict()
+            entry["in_scan_range"] = True
+            entries.append(entry)
+        for dso_key in self.discovered_dsos:
+            if dso_key not in self.in_range_dsos:
+                ghost = self._dso_ghosts.get(dso_key)
+                if ghost is None:
+                    ghost = dict(self.discovered_dsos[dso_key])
+                    ghost["in_scan_range"] = False
+                    self._dso_ghosts[dso_key] = ghost
+                entries.append(ghost)
+        return entries
+
+    # ------------------------------------------------------------------
+    # Persistence (game.discovered_*_state)
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Tuple[List[str], Dict[str, dict], Dict[str, dict]]:
+        """Return (systems, stations, dsos) in the save-file shape."""
+        return list(self.discovered_systems), dict(self.discovered_stations), dict(self.discovered_dsos)
+
+    def restore(self, systems=None, stations=None, dsos=None):
+        """Replace all state from a save.  systems=None means the save predates
+        fog of war: discovery is re-seeded from visited flags on next observe."""
+        dso_manager = self.dso_manager
+        DiscoveryEngine.__init__(self)
+        self.dso_manager = dso_manager
+        if systems is not None:
+            self.discovered_systems = set(systems)
+            self._unresolved_names = bool(self.discovered_systems)
+            self._seeded = True
+        self.discovered_stations = dict(stations or {})
+        self.discovered_dsos = dict(dsos or {})
+
+
+def _station_ghost(entry: dict) -> dict:
+    ghost = dict(entry)
+    ghost["in_scan_range"] = False
+    ghost["services"] = []
+    ghost["description"] = ""
+    return ghost
+
+
+def _scan_range(game) -> float:
+    try:
+        from game import get_effective_scan_range
+        return float(get_effective_scan_range(game))
+    except Exception:
+        return DEFAULT_SCAN_RANGE
@@ -10,34 +10,83 @@ into `EconomicSystem` for:
 
 The `Game.advance_turn()` method expects an `EconomicSystem.tick_global_state()`
 method that advances the economy and returns a list of human-readable messages.
+
+Markets live in a columnar MarketTable (market_table.py); `markets` still
+reads and writes like the old dict of market dicts.  Trade opportunities
+come from a TradeIndex (trade_index.py) kept sorted over that table, and
+price history is kept in fixed-size rings (price_history.py).
 """
 
 from __future__ import annotations
 
 import math
 import random
-from collections import defaultdict
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from market_table import (
+    MarketTable,
+    MarketView,
+    PRICE_MULTIPLIER_MAX,
+    PRICE_MULTIPLIER_MIN,
+    cell_price,
+)
+from price_history import PriceHistory
+from trade_index import TradeIndex
 
 
 class EconomicSystem:
     """Supply/demand economy with per-system markets."""
 
     HISTORY_LIMIT = 100
-    PRICE_MULTIPLIER_MIN = 0.2
-    PRICE_MULTIPLIER_MAX = 3.0
+    PRICE_MULTIPLIER_MIN = PRICE_MULTIPLIER_MIN
+    PRICE_MULTIPLIER_MAX = PRICE_MULTIPLIER_MAX
 
-    def __init__(self):
-        self.markets: Dict[str, Dict[str, Any]] = {}  # system_name -> market dict
+    def __init__(self, rng: Optional[random.Random] = None):
+        # All of the economy's randomness (base prices, new markets, events,
+        # the turn tick) comes from this stream; Game passes a seeded one
+        self.rng = rng if rng is not None else random.Random()
+        self._commodity_names_cache: Optional[List[str]] = None
+        self._markets = MarketTable(self.get_all_commodity_names())  # system_name -> market
         self.base_prices: Dict[str, int] = {}  # commodity_name -> base price
         self.global_events: List[Dict[str, Any]] = []  # recent economy events
         self.trade_routes: Dict[str, Any] = {}  # reserved for future expansion
-        # Price history: key is "{system}_{commodity}" -> list[int]
-        self.market_history: MutableMapping[str, List[int]] = defaultdict(list)
+        # Price history: key is "{system}_{commodity}" -> recent prices
+        self.market_history = PriceHistory(self.HISTORY_LIMIT)
 
-        self._commodity_names_cache: Optional[List[str]] = None
         self.initialize_base_prices()
-    
+
+    @property
+    def markets(self) -> MarketTable:
+        """system_name -> market (a dict-shaped view over the columns)."""
+        return self._markets
+
+    @markets.setter
+    def markets(self, markets: Mapping[str, Any]):
+        # Save loading assigns a plain {name: market dict} here
+        if not isinstance(markets, MarketTable):
+            markets = MarketTable.from_dict(markets or {}, self.get_all_commodity_names())
+        self._markets = markets
+
+    @property
+    def trade_index(self) -> TradeIndex:
+        """Per-commodity cheapest sources / richest sinks over `markets`."""
+        index = getattr(self, '_trade_index', None)
+        if index is None or index.table is not self._markets:
+            index = self._trade_index = TradeIndex(self._markets)
+        return index
+
+    @property
+    def market_history(self) -> PriceHistory:
+        """"{system}_{commodity}" -> recent prices, plus OHLC candles."""
+        return self._market_history
+
+    @market_history.setter
+    def market_history(self, history: Any):
+        # Save loading assigns the saved dump (or an old {key: [prices]} dict)
+        if not isinstance(history, PriceHistory):
+            history = PriceHistory.from_state(history, self.HISTORY_LIMIT)
+        self._market_history = history
+
     def initialize_base_prices(self):
         """Set base prices for all commodities"""
         from goods import commodities
@@ -46,7 +95,7 @@ class EconomicSystem:
             for item in items:
                 # Base price with some variation
                 base = item['value']
-                variation = random.uniform(0.8, 1.2)
+                variation = self.rng.uniform(0.8, 1.2)
                 self.base_prices[item['name']] = int(base * variation)
 
         # Reset cache
@@ -72,7 +121,7 @@ class EconomicSystem:
         self._commodity_names_cache = names
         return list(names)
 
-    def _expand_commodity_selector(self, selector: Any, market: Dict[str, Any]) -> List[str]:
+    def _expand_commodity_selector(self, selector: Any, market: Mapping[str, Any]) -> List[str]:
         """Expand selectors like 'all'/'luxury'/[names] into concrete commodity names."""
         if selector == 'all':
             return list(market.get('supply', {}).keys())
@@ -96,22 +145,14 @@ class EconomicSystem:
 
         return []
 
-    def _get_history_bucket(self, key: str) -> List[int]:
-        """Return the history list for a key, even if market_history was loaded as a plain dict."""
-        mh = self.market_history
-        if isinstance(mh, dict):
-            if key not in mh or not isinstance(mh.get(key), list):
-                mh[key] = []
-            return mh[key]
-        # defaultdict path
-        return mh[key]
-
     # ------------------------------------------------------------------
     # Market creation / normalization
     # ------------------------------------------------------------------
 
     def _normalize_market(self, market: Dict[str, Any]) -> Dict[str, Any]:
         """Ensure older/saved market dicts have required keys and sane values."""
+        if isinstance(market, MarketView):
+            return market  # the table keeps its columns normalised on write
         market.setdefault('supply', {})
         market.setdefault('demand', {})
         market.setdefault('prices', {})
@@ -164,7 +205,7 @@ class EconomicSystem:
         
         self.generate_market_profile(market)
         self.markets[system_name] = self._normalize_market(market)
-        return market
+        return self.markets[system_name]
     
     def generate_market_profile(self, market):
         """Generate production and consumption patterns based on system type"""
@@ -205,20 +246,20 @@ class EconomicSystem:
             base_price = self.base_prices.get(commodity, 5)
             
             # Default supply and demand
-            supply = random.randint(50, 200)
-            demand = random.randint(50, 200)
+            supply = self.rng.randint(50, 200)
+            demand = self.rng.randint(50, 200)
             
             # Modify based on system type and characteristics
             produces = commodity in production_bonuses.get(system_type, [])
             consumes = commodity in consumption_bonuses.get(system_type, []) or 'Everything' in consumption_bonuses.get(system_type, [])
             
             if produces:
-                supply = int(supply * resource_factor * random.uniform(1.5, 3.0))
-                market['production'][commodity] = random.randint(10, 50)
+                supply = int(supply * resource_factor * self.rng.uniform(1.5, 3.0))
+                market['production'][commodity] = self.rng.randint(10, 50)
             
             if consumes:
-                demand = int(demand * population_factor * random.uniform(1.2, 2.5))
-                market['consumption'][commodity] = random.randint(5, 30)
+                demand = int(demand * population_factor * self.rng.uniform(1.2, 2.5))
+                market['consumption'][commodity] = self.rng.randint(5, 30)
             
             # Calculate price based on supply/demand ratio
             if supply > 0:
@@ -238,72 +279,7 @@ class EconomicSystem:
         """Update market prices based on supply, demand, and production"""
         if market_name not in self.markets:
             return
-
-        market = self._normalize_market(self.markets[market_name])
-
-        # Let transient shocks decay toward 1.0
-        shocks = market.get('price_shocks', {})
-        if isinstance(shocks, dict) and shocks:
-            for commodity in list(shocks.keys()):
-                current = float(shocks.get(commodity, 1.0) or 1.0)
-                # decay 15% per tick toward 1.0
-                shocks[commodity] = 1.0 + (current - 1.0) * 0.85
-                if abs(shocks[commodity] - 1.0) < 0.02:
-                    shocks[commodity] = 1.0
-
-        # Precompute some mean-reversion targets
-        population_factor = float(market.get('population', 1_000_000)) / 1_000_000.0
-        resources = market.get('resources', 'Moderate')
-        resource_factor = {'Poor': 0.5, 'Moderate': 1.0, 'Rich': 1.5, 'Abundant': 2.0, 'Depleted': 0.2}.get(resources, 1.0)
-        
-        # Simulate production and consumption
-        for commodity in list(market['supply'].keys()):
-            # Production adds to supply
-            if commodity in market['production']:
-                production = market['production'][commodity]
-                variation = random.uniform(0.8, 1.2)
-                market['supply'][commodity] += int(production * variation)
-            
-            # Consumption reduces supply
-            if commodity in market['consumption']:
-                consumption = market['consumption'][commodity]
-                variation = random.uniform(0.8, 1.2)
-                consumed = min(market['supply'][commodity], int(consumption * variation))
-                market['supply'][commodity] -= consumed
-                
-                # If we can't meet demand, increase demand (creates scarcity)
-                if consumed < consumption:
-                    market['demand'][commodity] += int((consumption - consumed) * 0.75)
-
-            # Mean-revert demand slowly (prevents runaway values)
-            current_demand = int(market['demand'].get(commodity, 0))
-            baseline = 50 + int(population_factor * 25)
-            if commodity in market.get('consumption', {}):
-                baseline += int(market['consumption'].get(commodity, 0)) * 2
-            # Reversion step
-            market['demand'][commodity] = max(10, int(current_demand + (baseline - current_demand) * 0.08))
-
-            # Mean-revert supply a bit to keep markets stocked (esp. Frontier/Trading Hub)
-            current_supply = int(market['supply'].get(commodity, 0))
-            supply_baseline = 60 + int(resource_factor * 40)
-            if commodity in market.get('production', {}):
-                supply_baseline += int(market['production'].get(commodity, 0)) * 2
-            # if supply is very low, add some restock
-            if current_supply < max(10, int(supply_baseline * 0.2)):
-                market['supply'][commodity] += random.randint(0, 10) + int(resource_factor * 3)
-            
-            # Random market fluctuations
-            if random.random() < 0.1:  # 10% chance of fluctuation
-                supply_change = random.randint(-20, 20)
-                demand_change = random.randint(-15, 15)
-                
-                market['supply'][commodity] = max(0, market['supply'][commodity] + supply_change)
-                market['demand'][commodity] = max(10, market['demand'][commodity] + demand_change)
-
-            # Recalculate price from supply/demand (+ shock multiplier)
-            self.update_single_commodity_price(market, commodity, market_name=market_name)
-        
-        market['last_updated'] += 1
+        self._markets.tick(self.base_prices, names=[market_name], rng=self.rng)
     
     def get_market_info(self, system_name):
         """Get market information for a system"""
@@ -362,10 +338,7 @@ class EconomicSystem:
             return False, f"Insufficient credits. Need {total_cost:,}, have {player_credits:,}"
         
         # Execute trade: remove inventory from market.
-        market['supply'][commodity] -= quantity
-
-        # Buying tends to increase scarcity pressure slightly.
-        market['demand'][commodity] = max(10, int(market['demand'][commodity] + math.ceil(quantity * 0.05)))
+        self._fill_order(market, 'buy', commodity, quantity)
         
         # Update price due to reduced supply
         self.update_single_commodity_price(market, commodity, market_name=system_name)
@@ -401,14 +374,105 @@ class EconomicSystem:
         total_value = price_per_unit * quantity
         
         # Execute trade
-        market['supply'][commodity] += quantity
-        market['demand'][commodity] = max(0, int(market['demand'][commodity]) - quantity)
+        self._fill_order(market, 'sell', commodity, quantity)
         
         # Update price due to increased supply
         self.update_single_commodity_price(market, commodity, market_name=system_name)
         
         return True, f"Sold {quantity} {commodity} for {total_value:,} credits", total_value
 
+    @staticmethod
+    def _fill_order(market, side, commodity, quantity):
+        """Move supply and demand for one filled order (no repricing)."""
+        if side == 'buy':
+            market['supply'][commodity] -= quantity
+            # Buying tends to increase scarcity pressure slightly.
+            market['demand'][commodity] = max(10, int(market['demand'][commodity] + math.ceil(quantity * 0.05)))
+        else:
+            market['supply'][commodity] += quantity
+            market['demand'][commodity] = max(0, int(market['demand'][commodity]) - quantity)
+
+    def execute_orders(self, system_name, orders, player_credits, player_inventory,
+                       cargo_space: Optional[int] = None,
+                       cargo: Optional[Mapping[str, int]] = None):
+        """
+        Fill a basket of buys and sells at one market, all or nothing.
+
+        orders is a list of {'commodity', 'quantity', 'side': 'buy'|'sell'}.
+        Every order fills at the price quoted before the basket; the whole
+        basket is checked first - supply, demand, inventory, credits (sales
+        pay for purchases) and, if cargo_space is given, the net units
+        loaded - and nothing is touched unless all of it passes.  A sale
+        frees hold space only for units actually aboard, per `cargo`
+        (defaults to player_inventory).  Each affected commodity is then
+        repriced once.
+
+        Returns (success, message, fills) where fills is a list of
+        {'commodity', 'side', 'quantity', 'price_each', 'total'}.
+        """
+        if system_name not in self.markets:
+            return False, "No market at this location", []
+        if not orders:
+            return False, "No orders given", []
+
+        market = self._normalize_market(self.markets[system_name])
+
+        # Merge repeated lines so each commodity is checked against its total
+        totals: Dict[Tuple[str, str], int] = {}
+        for order in orders:
+            commodity = order.get('commodity')
+            side = order.get('side')
+            try:
+                quantity = int(order.get('quantity', 0))
+            except (TypeError, ValueError):
+                return False, f"Bad quantity for {commodity}", []
+            if side not in ('buy', 'sell'):
+                return False, f"Order side must be 'buy' or 'sell', not {side!r}", []
+            if quantity <= 0:
+                return False, "Quantity must be greater than zero", []
+            if commodity not in market['prices']:
+                return False, f"{commodity} not traded here", []
+            totals[(side, commodity)] = totals.get((side, commodity), 0) + quantity
+
+        cost = proceeds = loaded = 0
+        fills = []
+        for (side, commodity), quantity in totals.items():
+            price = market['prices'][commodity]
+            if side == 'buy':
+                if ('sell', commodity) in totals:
+                    return False, f"Cannot both buy and sell {commodity} in one order", []
+                available = market['supply'].get(commodity, 0)
+                if quantity > available:
+                    return False, f"Only {available} {commodity} available", []
+                cost += price * quantity
+                loaded += quantity
+            else:
+                held = player_inventory.get(commodity, 0)
+                if quantity > held:
+                    return False, f"You only have {held} {commodity}", []
+                demand = market['demand'].get(commodity, 0)
+                if demand < quantity:
+                    return False, f"Market only wants {demand} {commodity}, you're trying to sell {quantity}", []
+                proceeds += price * quantity
+                loaded -= min(quantity, (player_inventory if cargo is None else cargo).get(commodity, 0))
+            fills.append({'commodity': commodity, 'side': side, 'quantity': quantity,
+                          'price_each': price, 'total': price * quantity})
+
+        if cost > player_credits + proceeds:
+            return False, f"Insufficient credits. Need {cost - proceeds:,}, have {player_credits:,}", []
+        if cargo_space is not None and loaded > cargo_space:
+            return False, f"Insufficient cargo space. Need {loaded}, have {cargo_space} units", []
+
+        # Apply every fill, then reprice each commodity once
+        for fill in fills:
+            self._fill_order(market, fill['side'], fill['commodity'], fill['quantity'])
+        for fill in fills:
+            self.update_single_commodity_price(market, fill['commodity'], market_name=system_name)
+
+        net = proceeds - cost
+        return True, (f"Filled {len(fills)} orders at {system_name}: "
+                      f"{'+' if net >= 0 else '-'}{abs(net):,} credits"), fills
+
     def update_single_commodity_price(self, market, commodity, market_name: Optional[str] = None):
         """Update price for a single commodity based on supply/demand and any price shocks."""
         try:
@@ -417,25 +481,20 @@ class EconomicSystem:
         except Exception:
             return
 
-        ratio = demand / supply
         base_price = int(self.base_prices.get(commodity, 5))
-        price_multiplier = 0.5 + (ratio * 0.5)
-        price_multiplier = max(self.PRICE_MULTIPLIER_MIN, min(self.PRICE_MULTIPLIER_MAX, price_multiplier))
 
         shock = 1.0
         shocks = market.get('price_shocks', {})
-        if isinstance(shocks, dict):
+        if isinstance(shocks, Mapping):
             shock = float(shocks.get(commodity, 1.0) or 1.0)
 
-        new_price = max(1, int(base_price * price_multiplier * shock))
+        # Same rule the table's tick applies to every market.  The write is
+        # noted by the table; trade_index refiles just this cell on its next query.
+        new_price = cell_price(base_price, supply, demand, shock)
         market['prices'][commodity] = new_price
 
         if market_name:
-            key = f"{market_name}_{commodity}"
-            bucket = self._get_history_bucket(key)
-            bucket.append(new_price)
-            if len(bucket) > self.HISTORY_LIMIT:
-                del bucket[:-self.HISTORY_LIMIT]
+            self.market_history.record(market_name, commodity, new_price)
     
     def create_economic_event(self):
         """Create random economic events that affect markets"""
@@ -467,33 +526,24 @@ class EconomicSystem:
             }
         ]
         
-        return random.choice(events)
+        return self.rng.choice(events)
     
     def apply_economic_event(self, event):
         """Apply an economic event to all markets"""
         effect = event['effects']
+        # Selectors resolve against the whole commodity axis; each market
+        # is only touched for the goods it lists.
+        goods = self._expand_commodity_selector(
+            effect.get('commodities'), {'supply': dict.fromkeys(self._markets.commodities)}
+        )
+        mult = float(effect.get('multiplier', 1.0))
+
+        if effect['type'] in ('supply_increase', 'supply_decrease'):
+            self._markets.scale('supply', goods, mult, self.base_prices)
 
-        for market_name, market in self.markets.items():
-            market = self._normalize_market(market)
-            commodities = self._expand_commodity_selector(effect.get('commodities'), market)
-
-            if effect['type'] in ('supply_increase', 'supply_decrease'):
-                for commodity in commodities:
-                    market['supply'][commodity] = max(0, int(market['supply'].get(commodity, 0) * float(effect.get('multiplier', 1.0))))
-                    self.update_single_commodity_price(market, commodity, market_name=market_name)
-
-            elif effect['type'] in ('price_increase', 'price_decrease'):
-                # Price changes are modeled as a temporary shock multiplier that decays over time.
-                mult = float(effect.get('multiplier', 1.0))
-                shocks = market.get('price_shocks', {})
-                if not isinstance(shocks, dict):
-                    market['price_shocks'] = {}
-                    shocks = market['price_shocks']
-
-                for commodity in commodities:
-                    shocks[commodity] = float(shocks.get(commodity, 1.0) or 1.0) * mult
-                    shocks[commodity] = max(0.1, min(10.0, shocks[commodity]))
-                    self.update_single_commodity_price(market, commodity, market_name=market_name)
+        elif effect['type'] in ('price_increase', 'price_decrease'):
+            # Price changes are modeled as a temporary shock multiplier that decays over time.
+            self._markets.scale('price_shocks', goods, mult, self.base_prices)
         
         self.global_events.append(event)
         if len(self.global_events) > 5:
@@ -503,7 +553,7 @@ class EconomicSystem:
     # Turn/global tick integration
     # ------------------------------------------------------------------
 
-    def tick_global_state(self, markets_per_tick: int = 12) -> List[str]:
+    def tick_global_state(self) -> List[str]:
         """Advance the economy by one global tick.
 
         Called from `Game.advance_turn()`. Returns human-readable messages
@@ -515,7 +565,7 @@ class EconomicSystem:
             return messages
 
         # Occasionally generate a macro event and apply it.
-        if random.random() < 0.18:
+        if self.rng.random() < 0.18:
             event = self.create_economic_event()
             try:
                 self.apply_economic_event(event)
@@ -523,55 +573,25 @@ class EconomicSystem:
             except Exception as exc:
                 messages.append(f"Economic event failed: {exc}")
 
-        # Update a subset of markets each tick (keeps turn time reasonable).
-        market_names = list(self.markets.keys())
-        if markets_per_tick >= len(market_names):
-            chosen = market_names
-        else:
-            chosen = random.sample(market_names, max(1, markets_per_tick))
+        # Every market advances every tick, in one pass over the columns.
+        self._markets.tick(self.base_prices, rng=self.rng)
 
-        for name in chosen:
-            try:
-                self.update_market(name)
-            except Exception:
-                # Keep ticking other markets even if one fails.
-                continue
+        # Close the turn on every price series being tracked
+        markets = self._markets
+        self.market_history.record_closes(
+            lambda name: markets[name]['prices'] if name in markets else None)
+        self.market_history.advance()
 
         return messages
     
-    def get_trade_opportunities(self):
-        """Find profitable trade routes between markets"""
-        opportunities = []
-        
-        market_names = list(self.markets.keys())
-        
-        for i, source_name in enumerate(market_names):
-            for j, dest_name in enumerate(market_names):
-                if i >= j:  # Avoid duplicates and self-trading
-                    continue
-                
-                source = self.markets[source_name]
-                dest = self.markets[dest_name]
-                
-                # Find commodities that are cheap at source and expensive at destination
-                for commodity in source['supply']:
-                    if commodity in dest['prices'] and source['supply'][commodity] > 50:
-                        source_price = source['prices'][commodity]
-                        dest_price = dest['prices'][commodity]
-                        
-                        if dest_price > source_price * 1.3:  # At least 30% profit margin
-                            profit_margin = ((dest_price - source_price) / source_price) * 100
-                            
-                            opportunities.append({
-                                'commodity': commodity,
-                                'source': source_name,
-                                'destination': dest_name,
-                                'buy_price': source_price,
-                                'sell_price': dest_price,
-                                'profit_margin': profit_margin,
-                                'available_supply': source['supply'][commodity]
-                            })
-        
-        # Sort by profit margin
-        opportunities.sort(key=lambda x: x['profit_margin'], reverse=True)
-        return opportunities[:10]  # Return top 10 opportunities
+    def get_trade_opportunities(self, limit: int = 10, near=None, positions=None,
+                                max_distance: Optional[float] = None):
+        """Find profitable trade routes between markets.
+
+        Buys where a good is in stock and cheap, sells where it fetches at
+        least 30% more; best margin first.  near/positions/max_distance
+        limit both ends to markets within max_distance of `near`
+        (positions maps system name -> coordinates).
+        """
+        return self.trade_index.opportunities(limit, near=near, positions=positions,
+                                              max_distance=max_distance)
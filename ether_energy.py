@@ -8,7 +8,19 @@ or enhances fuel efficiency during travel.
 
 import random
 import math
-from typing import Tuple, Optional, Dict, List
+from array import array
+from typing import Tuple, Optional, Dict, List, Sequence
+
+
+# Combined friction is clamped to this range.  Anything that needs a bound on
+# fuel cost (e.g. the route planner's A* heuristic) should use these.
+FRICTION_MIN = 0.3
+FRICTION_MAX = 1.8
+
+# Lattice spacing (galaxy units) of the precomputed friction field.  Zone
+# radii are 20-80 units with a linear falloff, so a 10-unit lattice with
+# trilinear interpolation tracks the exact value closely.
+DEFAULT_FIELD_RESOLUTION = 10.0
 
 
 class EtherEnergyZone:
@@ -92,6 +104,11 @@ class EtherEnergySystem:
         self.galaxy_size_z = galaxy_size_z
         self.zones: List[EtherEnergyZone] = []
         self.drift_counter = 0
+        self.field_resolution = DEFAULT_FIELD_RESOLUTION
+        self._field: Optional["EtherFrictionField"] = None  # built on first path query
+        # Bumped whenever zone geometry changes, so caches of path costs
+        # (e.g. Ship.get_reachable_systems) know to recompute.
+        self.zones_version = 0
         self._generate_zones()
     
     def _generate_zones(self):
@@ -155,9 +172,14 @@ class EtherEnergySystem:
             - 1.0 = neutral
             - > 1.0 = reduces fuel efficiency
         """
+        return self._combine_frictions(x, y, z, self.zones)
+    
+    @staticmethod
+    def _combine_frictions(x, y, z, zones) -> float:
+        """Average the frictions of every zone in `zones` containing (x, y, z)."""
         # Check all zones and combine their effects
         frictions = []
-        for zone in self.zones:
+        for zone in zones:
             friction = zone.get_friction_at(x, y, z)
             if friction is not None:
                 frictions.append(friction)
@@ -169,7 +191,7 @@ class EtherEnergySystem:
         combined_friction = sum(frictions) / len(frictions)
         
         # Clamp to reasonable range
-        return max(0.3, min(1.8, combined_friction))
+        return max(FRICTION_MIN, min(FRICTION_MAX, combined_friction))
     
     def get_zone_at(self, x: int, y: int, z: int) -> Optional[EtherEnergyZone]:
         """Get the primary zone at given coordinates (strongest effect)"""
@@ -215,7 +237,45 @@ class EtherEnergySystem:
         # Drift zones every 10 updates (keeps them relatively stable)
         if self.drift_counter % 10 == 0:
             for zone in self.zones:
+                before = (zone.center, zone.radius)
                 zone.drift(max_drift=2.0)
+                # Only the lattice under the zone's old and new footprint changes.
+                if (zone.center, zone.radius) != before:
+                    self.zones_version += 1
+                    if self._field is not None:
+                        self._field.invalidate_sphere(*before)
+                        self._field.invalidate_sphere(zone.center, zone.radius)
+    
+    # ------------------------------------------------------------------
+    # Precomputed friction field — path queries
+    # ------------------------------------------------------------------
+    
+    def get_field(self) -> "EtherFrictionField":
+        """Return the friction field, building it on first use."""
+        if self._field is None or self._field.resolution != self.field_resolution:
+            self._field = EtherFrictionField(self, self.field_resolution)
+        return self._field
+    
+    def set_field_resolution(self, resolution: float):
+        """Change the lattice spacing; the field is rebuilt lazily."""
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        self.field_resolution = float(resolution)
+        self.zones_version += 1
+    
+    def get_path_friction(self, start: Sequence[float], end: Sequence[float]) -> float:
+        """Mean friction along the straight segment start→end.
+
+        This is the line integral of the friction field divided by the path
+        length, so a jump that clips the edge of a Void Rift pays for exactly
+        the stretch it spends inside it.
+        """
+        return self.get_field().path_mean(start, end)
+    
+    def get_path_frictions(self, start: Sequence[float],
+                           targets: Sequence[Sequence[float]]) -> List[float]:
+        """Mean friction from one start to many targets in a single call."""
+        return self.get_field().path_means(start, targets)
     
     def get_zones_in_region(self, min_x: int, min_y: int, min_z: int,
                             max_x: int, max_y: int, max_z: int) -> List[EtherEnergyZone]:
@@ -233,3 +293,222 @@ class EtherEnergySystem:
                 result.append(zone)
         return result
 
+
+
+class EtherFrictionField:
+    """Friction sampled on a regular 3D lattice over the galaxy.
+
+    Values are stored in one flat array (x-major) and read back with
+    trilinear interpolation, so a lookup costs a handful of array reads no
+    matter how many zones exist.  Drifting zones mark the lattice under their
+    old and new footprint dirty; dirty boxes are recomputed lazily on the
+    next query, leaving the rest of the field untouched.
+
+    Most of the galaxy is neutral (exactly 1.0), and a path that only
+    crosses neutral cells has a mean of exactly 1.0 - a summed-area table
+    of non-neutral cells answers that in constant time, so path_means()
+    only integrates paths that touch a zone.  Integrated means are memoised
+    per (start, end) until the lattice next changes.
+    """
+    
+    def __init__(self, system: EtherEnergySystem, resolution: float = DEFAULT_FIELD_RESOLUTION):
+        self.system = system
+        self.resolution = float(resolution)
+        self.nx = int(math.ceil(system.galaxy_size_x / self.resolution)) + 1
+        self.ny = int(math.ceil(system.galaxy_size_y / self.resolution)) + 1
+        self.nz = int(math.ceil(system.galaxy_size_z / self.resolution)) + 1
+        self.values = array('d', [1.0]) * (self.nx * self.ny * self.nz)
+        self._dirty: List[Tuple[int, int, int, int, int, int]] = []
+        self._hot_table: Optional[array] = None   # built lazily, see _hot_cells()
+        self._means: Dict[Tuple[Tuple[float, ...], Tuple[float, ...]], float] = {}
+        for zone in system.zones:
+            self.invalidate_sphere(zone.center, zone.radius)
+        self._flush()
+    
+    # -- maintenance ----------------------------------------------------
+    
+    def invalidate_sphere(self, center: Sequence[float], radius: float):
+        """Mark the lattice points inside a sphere's bounding box for recompute."""
+        r = self.resolution
+        lo = [max(0, int(math.floor((c - radius) / r))) for c in center]
+        hi = [int(math.ceil((c + radius) / r)) for c in center]
+        hi = [min(hi[0], self.nx - 1), min(hi[1], self.ny - 1), min(hi[2], self.nz - 1)]
+        if lo[0] <= hi[0] and lo[1] <= hi[1] and lo[2] <= hi[2]:
+            self._dirty.append((lo[0], lo[1], lo[2], hi[0], hi[1], hi[2]))
+    
+    def _flush(self):
+        """Recompute every dirty box from the exact zone formula."""
+        if not self._dirty:
+            return
+        r = self.resolution
+        nyz = self.ny * self.nz
+        values = self.values
+        combine = EtherEnergySystem._combine_frictions
+        for i0, j0, k0, i1, j1, k1 in self._dirty:
+            zones = self.system.get_zones_in_region(i0 * r, j0 * r, k0 * r,
+                                                    i1 * r, j1 * r, k1 * r)
+            for i in range(i0, i1 + 1):
+                x = i * r
+                for j in range(j0, j1 + 1):
+                    y = j * r
+                    base = i * nyz + j * self.nz
+                    for k in range(k0, k1 + 1):
+                        values[base + k] = combine(x, y, k * r, zones) if zones else 1.0
+        self._dirty = []
+        self._hot_table = None
+        self._means.clear()
+    
+    def _hot_cells(self) -> array:
+        """Summed-area table counting cells with any non-neutral corner.
+
+        Entry (i, j, k) of the (nx x ny x nz) table holds the count over
+        cells [0, i) x [0, j) x [0, k); cell (i, j, k) spans lattice points
+        i..i+1, j..j+1, k..k+1, exactly what _sample() reads.
+        """
+        if self._hot_table is not None:
+            return self._hot_table
+        nx, ny, nz = self.nx, self.ny, self.nz
+        nyz = ny * nz
+        table = array('l', [0]) * (nx * nyz)
+        # Mark the up to eight cells around every non-neutral lattice point
+        # (shifted by one into the table's zero border).
+        for idx, value in enumerate(self.values):
+            if value != 1.0:
+                i, rem = divmod(idx, nyz)
+                j, k = divmod(rem, nz)
+                for ci in (i, i + 1):
+                    if 1 <= ci < nx:
+                        for cj in (j, j + 1):
+                            if 1 <= cj < ny:
+                                row = ci * nyz + cj * nz
+                                for ck in (k, k + 1):
+                                    if 1 <= ck < nz:
+                                        table[row + ck] = 1
+        # Prefix sums along z, then y, then x.
+        for row in range(0, nx * nyz, nz):
+            for k in range(row + 1, row + nz):
+                table[k] += table[k - 1]
+        for i in range(nx):
+            for j in range(1, ny):
+                a = i * nyz + j * nz
+                for k in range(nz):
+                    table[a + k] += table[a - nz + k]
+        for a in range(nyz, nx * nyz):
+            table[a] += table[a - nyz]
+        self._hot_table = table
+        return table
+    
+    # -- queries --------------------------------------------------------
+    
+    def sample(self, x: float, y: float, z: float) -> float:
+        """Trilinearly interpolated friction at (x, y, z)."""
+        if self._dirty:
+            self._flush()
+        return self._sample(x, y, z)
+    
+    def _sample(self, x: float, y: float, z: float) -> float:
+        r = self.resolution
+        fx = min(max(x / r, 0.0), self.nx - 1.000001)
+        fy = min(max(y / r, 0.0), self.ny - 1.000001)
+        fz = min(max(z / r, 0.0), self.nz - 1.000001)
+        i, j, k = int(fx), int(fy), int(fz)
+        tx, ty, tz = fx - i, fy - j, fz - k
+        nz = self.nz
+        nyz = self.ny * nz
+        v = self.values
+        a = i * nyz + j * nz + k
+        b = a + nyz          # i + 1
+        c00 = v[a] + (v[a + 1] - v[a]) * tz
+        c01 = v[a + nz] + (v[a + nz + 1] - v[a + nz]) * tz
+        c10 = v[b] + (v[b + 1] - v[b]) * tz
+        c11 = v[b + nz] + (v[b + nz + 1] - v[b + nz]) * tz
+        c0 = c00 + (c01 - c00) * ty
+        c1 = c10 + (c11 - c10) * ty
+        return c0 + (c1 - c0) * tx
+    
+    def path_mean(self, start: Sequence[float], end: Sequence[float]) -> float:
+        """Mean friction along start→end (trapezoid rule, half-cell steps)."""
+        return self.path_means(start, (end,))[0]
+    
+    def path_means(self, start: Sequence[float], targets: Sequence[Sequence[float]]) -> List[float]:
+        """path_mean() from one start to every target.
+
+        The trilinear sample is inlined here (same arithmetic as _sample());
+        route planning prices every edge of each node it expands through
+        this loop.
+        """
+        if self._dirty:
+            self._flush()
+        r = self.resolution
+        half = r * 0.5
+        nz = self.nz
+        nyz = self.ny * nz
+        v = self.values
+        hx, hy, hz = self.nx - 1.000001, self.ny - 1.000001, self.nz - 1.000001
+        hot = self._hot_cells()
+        memo = self._means
+        sx, sy, sz = start[0], start[1], start[2]
+        start = (sx, sy, sz)
+        fsx, fsy, fsz = sx / r, sy / r, sz / r
+        sqrt, ceil = math.sqrt, math.ceil
+        s0 = None
+        means = []
+        for end in targets:
+            ex, ey, ez = end[0], end[1], end[2]
+            # Every sample lies in the box of cells spanned by the endpoints
+            # (padded against rounding); if none is hot the mean is exactly 1.0.
+            fex, fey, fez = ex / r, ey / r, ez / r
+            lo, hi = (fsx, fex) if fsx <= fex else (fex, fsx)
+            lo -= 1e-9
+            hi += 1e-9
+            a0 = int(0.0 if lo < 0.0 else hx if lo > hx else lo) * nyz
+            a1 = (int(0.0 if hi < 0.0 else hx if hi > hx else hi) + 1) * nyz
+            lo, hi = (fsy, fey) if fsy <= fey else (fey, fsy)
+            lo -= 1e-9
+            hi += 1e-9
+            b0 = int(0.0 if lo < 0.0 else hy if lo > hy else lo) * nz
+            b1 = (int(0.0 if hi < 0.0 else hy if hi > hy else hi) + 1) * nz
+            lo, hi = (fsz, fez) if fsz <= fez else (fez, fsz)
+            lo -= 1e-9
+            hi += 1e-9
+            k0 = int(0.0 if lo < 0.0 else hz if lo > hz else lo)
+            k1 = int(0.0 if hi < 0.0 else hz if hi > hz else hi) + 1
+            if not (hot[a1 + b1 + k1] - hot[a0 + b1 + k1] - hot[a1 + b0 + k1]
+                    - hot[a1 + b1 + k0] + hot[a0 + b0 + k1] + hot[a0 + b1 + k0]
+                    + hot[a1 + b0 + k0] - hot[a0 + b0 + k0]):
+                means.append(1.0)
+                continue
+            key = (start, (ex, ey, ez))
+            mean = memo.get(key)
+            if mean is not None:
+                means.append(mean)
+                continue
+            if s0 is None:
+                s0 = self._sample(sx, sy, sz)
+            dx, dy, dz = ex - sx, ey - sy, ez - sz
+            steps = max(1, int(ceil(sqrt(dx * dx + dy * dy + dz * dz) / half)))
+            total = 0.5 * (s0 + self._sample(ex, ey, ez))
+            for n in range(1, steps):
+                t = n / steps
+                fx = (sx + dx * t) / r
+                fx = 0.0 if fx < 0.0 else hx if fx > hx else fx
+                fy = (sy + dy * t) / r
+                fy = 0.0 if fy < 0.0 else hy if fy > hy else fy
+                fz = (sz + dz * t) / r
+                fz = 0.0 if fz < 0.0 else hz if fz > hz else fz
+                i, j, k = int(fx), int(fy), int(fz)
+                tx, ty, tz = fx - i, fy - j, fz - k
+                a = i * nyz + j * nz + k
+                b = a + nyz
+                va, va1, vc, vc1 = v[a], v[a + 1], v[a + nz], v[a + nz + 1]
+                vb, vb1, vd, vd1 = v[b], v[b + 1], v[b + nz], v[b + nz + 1]
+                c00 = va + (va1 - va) * tz
+                c01 = vc + (vc1 - vc) * tz
+                c10 = vb + (vb1 - vb) * tz
+                c11 = vd + (vd1 - vd) * tz
+                c0 = c00 + (c01 - c00) * ty
+                c1 = c10 + (c11 - c10) * ty
+                total += c0 + (c1 - c0) * tx
+            mean = memo[key] = total / steps
+            means.append(mean)
+        return means
@@ -6,7 +6,13 @@ Generates random events that affect the game world
 import random
 import math
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+
+from danger_regions import DangerRegions
+
+# How many turns a dangerous region created by an event lasts, unless the
+# event's effects specify 'ttl_turns'.
+DANGER_REGION_TTL_TURNS = 12
 
 class EventType:
     """Event type categories"""
@@ -25,7 +31,8 @@ class Event:
     
     def __init__(self, event_type: str, name: str, description: str, 
                  effects: Dict[str, Any], duration: int = 0, 
-                 affected_systems: List[str] = None, severity: int = 1):
+                 affected_systems: List[str] = None, severity: int = 1,
+                 rng: Optional[random.Random] = None):
         self.event_type = event_type
         self.name = name
         self.description = description
@@ -34,7 +41,7 @@ class Event:
         self.affected_systems = affected_systems or []
         self.severity = severity  # 1-10 scale
         self.timestamp = datetime.now()
-        self.id = f"{event_type}_{random.randint(1000, 9999)}"
+        self.id = f"{event_type}_{(rng or random).randint(1000, 9999)}"
         
     def is_active(self, current_time: datetime) -> bool:
         """Check if event is still active"""
@@ -46,12 +53,15 @@ class Event:
 class EventSystem:
     """Main event system that generates and manages galactic events"""
     
-    def __init__(self, game):
+    def __init__(self, game, rng: Optional[random.Random] = None):
         self.game = game
+        # Event rolls draw from this stream; Game passes a seeded one
+        self.rng = rng if rng is not None else random.Random()
         self.active_events: List[Event] = []
         self.event_history: List[Event] = []
         self.news_feed: List[Dict[str, Any]] = []
-        self.dangerous_regions: Dict[Tuple[int, int, int], Dict[str, Any]] = {}
+        # Spatially indexed, expiring {center: region} mapping (see danger_regions.py)
+        self.dangerous_regions: DangerRegions = DangerRegions()
         
         # Event generation probabilities
         self.event_chances = {
@@ -67,10 +77,11 @@ class EventSystem:
         
         # Initialize with some starting events
         self.generate_initial_events()
+
     
     def generate_initial_events(self):
         """Generate some initial events when the game starts"""
-        for _ in range(random.randint(2, 5)):
+        for _ in range(self.rng.randint(2, 5)):
             event = self.generate_random_event()
             if event:
                 self.add_event(event)
@@ -102,7 +113,7 @@ class EventSystem:
     
     def choose_event_type(self) -> str:
         """Choose event type based on probabilities"""
-        rand = random.random()
+        rand = self.rng.random()
         cumulative = 0
         
         for event_type, probability in self.event_chances.items():
@@ -121,10 +132,10 @@ class EventSystem:
                 'effects': {
                     'type': 'supply_increase',
                     'commodities': ['Zerite Crystals', 'Crythium Ore', 'Gravossils', 'Carboxite Slabs'],
-                    'multiplier': random.uniform(1.5, 2.5),
+                    'multiplier': self.rng.uniform(1.5, 2.5),
                     'systems': self.get_random_systems(3, 5)
                 },
-                'severity': random.randint(2, 4)
+                'severity': self.rng.randint(2, 4)
             },
             {
                 'name': 'Agricultural Crisis',
@@ -132,10 +143,10 @@ class EventSystem:
                 'effects': {
                     'type': 'supply_decrease',
                     'commodities': ['Ethergrain', 'Sporemilk', 'Glowfruit', 'Synthmeat Matrix'],
-                    'multiplier': random.uniform(0.3, 0.7),
+                    'multiplier': self.rng.uniform(0.3, 0.7),
                     'systems': self.get_random_systems(2, 4)
                 },
-                'severity': random.randint(3, 6)
+                'severity': self.rng.randint(3, 6)
             },
             {
                 'name': 'Trade War',
@@ -143,10 +154,10 @@ class EventSystem:
                 'effects': {
                     'type': 'price_increase',
                     'commodities': 'all',
-                    'multiplier': random.uniform(1.2, 1.8),
+                    'multiplier': self.rng.uniform(1.2, 1.8),
                     'systems': self.get_random_systems(4, 8)
                 },
-                'severity': random.randint(4, 7)
+                'severity': self.rng.randint(4, 7)
             },
             {
                 'name': 'Technology Breakthrough',
@@ -154,10 +165,10 @@ class EventSystem:
                 'effects': {
                     'type': 'supply_increase',
                     'commodities': ['Quantum Sand', 'Phasemetal', 'Voidglass Shards', 'Neural Threadwire'],
-                    'multiplier': random.uniform(1.3, 2.0),
+                    'multiplier': self.rng.uniform(1.3, 2.0),
                     'systems': self.get_random_systems(2, 4)
                 },
-                'severity': random.randint(2, 4)
+                'severity': self.rng.randint(2, 4)
             },
             {
                 'name': 'Pirate Raids',
@@ -165,10 +176,10 @@ class EventSystem:
                 'effects': {
                     'type': 'supply_decrease',
                     'commodities': ['Aetherwine', 'Starweave Fabric', 'Chrono-music Scrolls', 'Solar Glass Jewelry'],
-                    'multiplier': random.uniform(0.4, 0.8),
+                    'multiplier': self.rng.uniform(0.4, 0.8),
                     'systems': self.get_random_systems(3, 6)
                 },
-                'severity': random.randint(3, 5)
+                'severity': self.rng.randint(3, 5)
             },
             {
                 'name': 'Market Crash',
@@ -176,22 +187,23 @@ class EventSystem:
                 'effects': {
                     'type': 'price_decrease',
                     'commodities': 'all',
-                    'multiplier': random.uniform(0.6, 0.9),
+                    'multiplier': self.rng.uniform(0.6, 0.9),
                     'systems': self.get_random_systems(5, 10)
                 },
-                'severity': random.randint(5, 8)
+                'severity': self.rng.randint(5, 8)
             }
         ]
         
-        event_data = random.choice(events)
+        event_data = self.rng.choice(events)
         return Event(
             event_type=EventType.ECONOMIC,
             name=event_data['name'],
             description=event_data['description'],
             effects=event_data['effects'],
-            duration=random.randint(24, 168),  # 1-7 days
+            duration=self.rng.randint(24, 168),  # 1-7 days
             affected_systems=event_data['effects'].get('systems', []),
-            severity=event_data['severity']
+            severity=event_data['severity'],
+            rng=self.rng,
         )
     
     def generate_political_event(self) -> Event:
@@ -202,30 +214,30 @@ class EventSystem:
                 'description': 'Major factions convene for peace talks, potentially ending long-standing conflicts.',
                 'effects': {
                     'type': 'faction_relations',
-                    'change': random.uniform(5, 15),
+                    'change': self.rng.uniform(5, 15),
                     'factions': self.get_random_factions(2, 4)
                 },
-                'severity': random.randint(3, 6)
+                'severity': self.rng.randint(3, 6)
             },
             {
                 'name': 'Government Overthrow',
                 'description': 'Revolutionary forces seize control of a major system, creating political instability.',
                 'effects': {
                     'type': 'system_instability',
-                    'threat_increase': random.randint(2, 5),
+                    'threat_increase': self.rng.randint(2, 5),
                     'systems': self.get_random_systems(1, 2)
                 },
-                'severity': random.randint(4, 7)
+                'severity': self.rng.randint(4, 7)
             },
             {
                 'name': 'Trade Agreement',
                 'description': 'New interstellar trade pacts reduce tariffs and boost commerce.',
                 'effects': {
                     'type': 'trade_boost',
-                    'multiplier': random.uniform(1.1, 1.3),
+                    'multiplier': self.rng.uniform(1.1, 1.3),
                     'systems': self.get_random_systems(3, 6)
                 },
-                'severity': random.randint(2, 4)
+                'severity': self.rng.randint(2, 4)
             },
             {
                 'name': 'Embargo Declaration',
@@ -234,19 +246,20 @@ class EventSystem:
                     'type': 'trade_disruption',
                     'systems': self.get_random_systems(2, 4)
                 },
-                'severity': random.randint(5, 8)
+                'severity': self.rng.randint(5, 8)
             }
         ]
         
-        event_data = random.choice(events)
+        event_data = self.rng.choice(events)
         return Event(
             event_type=EventType.POLITICAL,
             name=event_data['name'],
             description=event_data['description'],
             effects=event_data['effects'],
-            duration=random.randint(48, 336),  # 2-14 days
+            duration=self.rng.randint(48, 336),  # 2-14 days
             affected_systems=event_data['effects'].get('systems', []),
-            severity=event_data['severity']
+            severity=event_data['severity'],
+            rng=self.rng,
         )
     
     def generate_scientific_event(self) -> Event:
@@ -259,7 +272,7 @@ class EventSystem:
                     'type': 'technology_boost',
                     'systems': self.get_random_systems(1, 2)
                 },
-                'severity': random.randint(3, 6)
+                'severity': self.rng.randint(3, 6)
             },
             {
                 'name': 'Quantum Anomaly',
@@ -268,29 +281,30 @@ class EventSystem:
                     'type': 'space_anomaly',
                     'systems': self.get_random_systems(1, 3)
                 },
-                'severity': random.randint(4, 7)
+                'severity': self.rng.randint(4, 7)
             },
             {
                 'name': 'Medical Breakthrough',
                 'description': 'New medical treatments extend lifespans and improve quality of life.',
                 'effects': {
                     'type': 'population_boost',
-                    'multiplier': random.uniform(1.1, 1.2),
+                    'multiplier': self.rng.uniform(1.1, 1.2),
                     'systems': self.get_random_systems(2, 4)
                 },
-                'severity': random.randint(2, 4)
+                'severity': self.rng.randint(2, 4)
             }
         ]
         
-        event_data = random.choice(events)
+        event_data = self.rng.choice(events)
         return Event(
             event_type=EventType.SCIENTIFIC,
             name=event_data['name'],
             description=event_data['description'],
             effects=event_data['effects'],
-            duration=random.randint(72, 720),  # 3-30 days
+            duration=self.rng.randint(72, 720),  # 3-30 days
             affected_systems=event_data['effects'].get('systems', []),
-            severity=event_data['severity']
+            severity=event_data['severity'],
+            rng=self.rng,
         )
     
     def generate_military_event(self) -> Event:
@@ -301,42 +315,43 @@ class EventSystem:
                 'description': 'Minor military conflict erupts between rival factions.',
                 'effects': {
                     'type': 'military_conflict',
-                    'threat_increase': random.randint(1, 3),
+                    'threat_increase': self.rng.randint(1, 3),
                     'systems': self.get_random_systems(2, 4)
                 },
-                'severity': random.randint(3, 5)
+                'severity': self.rng.randint(3, 5)
             },
             {
                 'name': 'Fleet Mobilization',
                 'description': 'Major military buildup detected, raising tensions across the sector.',
                 'effects': {
                     'type': 'military_buildup',
-                    'threat_increase': random.randint(2, 4),
+                    'threat_increase': self.rng.randint(2, 4),
                     'systems': self.get_random_systems(3, 6)
                 },
-                'severity': random.randint(4, 7)
+                'severity': self.rng.randint(4, 7)
             },
             {
                 'name': 'Peace Treaty',
                 'description': 'Warring factions sign peace agreement, reducing military tensions.',
                 'effects': {
                     'type': 'military_reduction',
-                    'threat_decrease': random.randint(1, 3),
+                    'threat_decrease': self.rng.randint(1, 3),
                     'systems': self.get_random_systems(2, 5)
                 },
-                'severity': random.randint(2, 4)
+                'severity': self.rng.randint(2, 4)
             }
         ]
         
-        event_data = random.choice(events)
+        event_data = self.rng.choice(events)
         return Event(
             event_type=EventType.MILITARY,
             name=event_data['name'],
             description=event_data['description'],
             effects=event_data['effects'],
-            duration=random.randint(24, 168),  # 1-7 days
+            duration=self.rng.randint(24, 168),  # 1-7 days
             affected_systems=event_data['effects'].get('systems', []),
-            severity=event_data['severity']
+            severity=event_data['severity'],
+            rng=self.rng,
         )
     
     def generate_natural_event(self) -> Event:
@@ -349,7 +364,7 @@ class EventSystem:
                     'type': 'communication_disruption',
                     'systems': self.get_random_systems(2, 4)
                 },
-                'severity': random.randint(3, 6)
+                'severity': self.rng.randint(3, 6)
             },
             {
                 'name': 'Asteroid Impact',
@@ -358,7 +373,7 @@ class EventSystem:
                     'type': 'infrastructure_damage',
                     'systems': self.get_random_systems(1, 2)
                 },
-                'severity': random.randint(5, 8)
+                'severity': self.rng.randint(5, 8)
             },
             {
                 'name': 'Nebula Formation',
@@ -367,19 +382,20 @@ class EventSystem:
                     'type': 'navigation_hazard',
                     'systems': self.get_random_systems(1, 3)
                 },
-                'severity': random.randint(2, 5)
+                'severity': self.rng.randint(2, 5)
             }
         ]
         
-        event_data = random.choice(events)
+        event_data = self.rng.choice(events)
         return Event(
             event_type=EventType.NATURAL,
             name=event_data['name'],
             description=event_data['description'],
             effects=event_data['effects'],
-            duration=random.randint(48, 336),  # 2-14 days
+            duration=self.rng.randint(48, 336),  # 2-14 days
             affected_systems=event_data['effects'].get('systems', []),
-            severity=event_data['severity']
+            severity=event_data['severity'],
+            rng=self.rng,
         )
     
     def generate_social_event(self) -> Event:
@@ -392,7 +408,7 @@ class EventSystem:
                     'type': 'morale_boost',
                     'systems': self.get_random_systems(3, 6)
                 },
-                'severity': random.randint(1, 3)
+                'severity': self.rng.randint(1, 3)
             },
             {
                 'name': 'Labor Strike',
@@ -401,7 +417,7 @@ class EventSystem:
                     'type': 'production_disruption',
                     'systems': self.get_random_systems(2, 4)
                 },
-                'severity': random.randint(3, 6)
+                'severity': self.rng.randint(3, 6)
             },
             {
                 'name': 'Celebrity Scandal',
@@ -410,19 +426,20 @@ class EventSystem:
                     'type': 'media_frenzy',
                     'systems': self.get_random_systems(1, 3)
                 },
-                'severity': random.randint(2, 4)
+                'severity': self.rng.randint(2, 4)
             }
         ]
         
-        event_data = random.choice(events)
+        event_data = self.rng.choice(events)
         return Event(
             event_type=EventType.SOCIAL,
             name=event_data['name'],
             description=event_data['description'],
             effects=event_data['effects'],
-            duration=random.randint(24, 168),  # 1-7 days
+            duration=self.rng.randint(24, 168),  # 1-7 days
             affected_systems=event_data['effects'].get('systems', []),
-            severity=event_data['severity']
+            severity=event_data['severity'],
+            rng=self.rng,
         )
     
     def generate_travel_event(self) -> Event:
@@ -433,54 +450,55 @@ class EventSystem:
                 'description': 'Increased pirate activity makes certain regions dangerous for travel.',
                 'effects': {
                     'type': 'dangerous_region',
-                    'threat_level': random.randint(6, 9),
-                    'radius': random.randint(3, 8),
+                    'threat_level': self.rng.randint(6, 9),
+                    'radius': self.rng.randint(3, 8),
                     'center': self.get_random_coordinates()
                 },
-                'severity': random.randint(4, 7)
+                'severity': self.rng.randint(4, 7)
             },
             {
                 'name': 'Navigation Beacon Failure',
                 'description': 'Critical navigation beacons malfunction, making travel more difficult.',
                 'effects': {
                     'type': 'navigation_difficulty',
-                    'fuel_cost_multiplier': random.uniform(1.2, 1.5),
+                    'fuel_cost_multiplier': self.rng.uniform(1.2, 1.5),
                     'systems': self.get_random_systems(2, 4)
                 },
-                'severity': random.randint(3, 5)
+                'severity': self.rng.randint(3, 5)
             },
             {
                 'name': 'Wormhole Discovery',
                 'description': 'New stable wormhole provides faster travel between distant systems.',
                 'effects': {
                     'type': 'travel_boost',
-                    'fuel_cost_multiplier': random.uniform(0.7, 0.9),
+                    'fuel_cost_multiplier': self.rng.uniform(0.7, 0.9),
                     'systems': self.get_random_systems(2, 3)
                 },
-                'severity': random.randint(2, 4)
+                'severity': self.rng.randint(2, 4)
             },
             {
                 'name': 'Space Storm',
                 'description': 'Massive space storm creates dangerous conditions for travel.',
                 'effects': {
                     'type': 'dangerous_region',
-                    'threat_level': random.randint(7, 10),
-                    'radius': random.randint(5, 12),
+                    'threat_level': self.rng.randint(7, 10),
+                    'radius': self.rng.randint(5, 12),
                     'center': self.get_random_coordinates()
                 },
-                'severity': random.randint(6, 9)
+                'severity': self.rng.randint(6, 9)
             }
         ]
         
-        event_data = random.choice(events)
+        event_data = self.rng.choice(events)
         return Event(
             event_type=EventType.TRAVEL,
             name=event_data['name'],
             description=event_data['description'],
             effects=event_data['effects'],
-            duration=random.randint(12, 72),  # 12 hours to 3 days
+            duration=self.rng.randint(12, 72),  # 12 hours to 3 days
             affected_systems=event_data['effects'].get('systems', []),
-            severity=event_data['severity']
+            severity=event_data['severity'],
+            rng=self.rng,
         )
     
     def generate_tabloid_event(self) -> Event:
@@ -493,7 +511,7 @@ class EventSystem:
                     'type': 'entertainment',
                     'systems': self.get_random_systems(1, 3)
                 },
-                'severity': random.randint(1, 3)
+                'severity': self.rng.randint(1, 3)
             },
             {
                 'name': 'Space Whale Sighting',
@@ -502,7 +520,7 @@ class EventSystem:
                     'type': 'tourism_boost',
                     'systems': self.get_random_systems(1, 2)
                 },
-                'severity': random.randint(1, 2)
+                'severity': self.rng.randint(1, 2)
             },
             {
                 'name': 'Celebrity Wedding',
@@ -511,7 +529,7 @@ class EventSystem:
                     'type': 'media_event',
                     'systems': self.get_random_systems(1, 2)
                 },
-                'severity': random.randint(1, 2)
+                'severity': self.rng.randint(1, 2)
             },
             {
                 'name': 'Mysterious Crop Circles',
@@ -520,19 +538,20 @@ class EventSystem:
                     'type': 'mystery_event',
                     'systems': self.get_random_systems(1, 2)
                 },
-                'severity': random.randint(2, 4)
+                'severity': self.rng.randint(2, 4)
             }
         ]
         
-        event_data = random.choice(events)
+        event_data = self.rng.choice(events)
         return Event(
             event_type=EventType.TABLOID,
             name=event_data['name'],
             description=event_data['description'],
             effects=event_data['effects'],
-            duration=random.randint(24, 168),  # 1-7 days
+            duration=self.rng.randint(24, 168),  # 1-7 days
             affected_systems=event_data['effects'].get('systems', []),
-            severity=event_data['severity']
+            severity=event_data['severity'],
+            rng=self.rng,
         )
     
     def generate_scandal_event(self) -> Event:
@@ -546,7 +565,7 @@ class EventSystem:
                     'faction_relations': -10,
                     'systems': self.get_random_systems(2, 4)
                 },
-                'severity': random.randint(3, 6)
+                'severity': self.rng.randint(3, 6)
             },
             {
                 'name': 'Senator\'s Secret Hobby',
@@ -556,7 +575,7 @@ class EventSystem:
                     'faction_relations': -15,
                     'systems': self.get_random_systems(1, 3)
                 },
-                'severity': random.randint(4, 7)
+                'severity': self.rng.randint(4, 7)
             },
             {
                 'name': 'Ambassador\'s Dating App Debacle',
@@ -566,7 +585,7 @@ class EventSystem:
                     'faction_relations': -5,
                     'systems': self.get_random_systems(1, 2)
                 },
-                'severity': random.randint(2, 4)
+                'severity': self.rng.randint(2, 4)
             },
             {
                 'name': 'Space Station Karaoke Scandal',
@@ -576,7 +595,7 @@ class EventSystem:
                     'faction_relations': -8,
                     'systems': self.get_random_systems(1, 2)
                 },
-                'severity': random.randint(3, 5)
+                'severity': self.rng.randint(3, 5)
             },
             {
                 'name': 'Trade Minister\'s Crypto Scheme',
@@ -586,7 +605,7 @@ class EventSystem:
                     'faction_relations': -20,
                     'systems': self.get_random_systems(3, 6)
                 },
-                'severity': random.randint(6, 8)
+                'severity': self.rng.randint(6, 8)
             },
             {
                 'name': 'Fleet Admiral\'s Collectible Obsession',
@@ -596,7 +615,7 @@ class EventSystem:
                     'faction_relations': -12,
                     'systems': self.get_random_systems(2, 4)
                 },
-                'severity': random.randint(4, 6)
+                'severity': self.rng.randint(4, 6)
             },
             {
                 'name': 'Diplomat\'s Food Delivery Addiction',
@@ -606,7 +625,7 @@ class EventSystem:
                     'faction_relations': -7,
                     'systems': self.get_random_systems(1, 2)
                 },
-                'severity': random.randint(2, 4)
+                'severity': self.rng.randint(2, 4)
             },
             {
                 'name': 'Senator\'s Secret Fan Fiction',
@@ -616,7 +635,7 @@ class EventSystem:
                     'faction_relations': -10,
                     'systems': self.get_random_systems(2, 3)
                 },
-                'severity': random.randint(4, 6)
+                'severity': self.rng.randint(4, 6)
             },
             {
                 'name': 'Ambassador\'s Gaming Addiction',
@@ -626,7 +645,7 @@ class EventSystem:
                     'faction_relations': -15,
                     'systems': self.get_random_systems(2, 4)
                 },
-                'severity': random.randint(5, 7)
+                'severity': self.rng.randint(5, 7)
             },
             {
                 'name': 'Council Member\'s Social Media Meltdown',
@@ -636,7 +655,7 @@ class EventSystem:
                     'faction_relations': -8,
                     'systems': self.get_random_systems(1, 3)
                 },
-                'severity': random.randint(3, 5)
+                'severity': self.rng.randint(3, 5)
             },
             {
                 'name': 'Trade Representative\'s Side Hustle',
@@ -646,7 +665,7 @@ class EventSystem:
                     'faction_relations': -12,
                     'systems': self.get_random_systems(2, 3)
                 },
-                'severity': random.randint(4, 6)
+                'severity': self.rng.randint(4, 6)
             },
             {
                 'name': 'Fleet Commander\'s Pet Project',
@@ -656,7 +675,7 @@ class EventSystem:
                     'faction_relations': -10,
                     'systems': self.get_random_systems(1, 2)
                 },
-                'severity': random.randint(3, 5)
+                'severity': self.rng.randint(3, 5)
             },
             {
                 'name': 'Diplomat\'s Secret Identity',
@@ -666,7 +685,7 @@ class EventSystem:
                     'faction_relations': -18,
                     'systems': self.get_random_systems(3, 5)
                 },
-                'severity': random.randint(6, 8)
+                'severity': self.rng.randint(6, 8)
             },
             {
                 'name': 'Senator\'s Holographic Therapy Sessions',
@@ -676,7 +695,7 @@ class EventSystem:
                     'faction_relations': -6,
                     'systems': self.get_random_systems(1, 2)
                 },
-                'severity': random.randint(2, 4)
+                'severity': self.rng.randint(2, 4)
             },
             {
                 'name': 'Ambassador\'s Competitive Eating Career',
@@ -686,19 +705,20 @@ class EventSystem:
                     'faction_relations': -5,
                     'systems': self.get_random_systems(1, 2)
                 },
-                'severity': random.randint(2, 3)
+                'severity': self.rng.randint(2, 3)
             }
         ]
         
-        scandal_data = random.choice(scandals)
+        scandal_data = self.rng.choice(scandals)
         return Event(
             event_type=EventType.SCANDAL,
             name=scandal_data['name'],
             description=scandal_data['description'],
             effects=scandal_data['effects'],
-            duration=random.randint(48, 336),  # 2-14 days
+            duration=self.rng.randint(48, 336),  # 2-14 days
             affected_systems=scandal_data['effects'].get('systems', []),
-            severity=scandal_data['severity']
+            severity=scandal_data['severity'],
+            rng=self.rng,
         )
     
     def get_random_systems(self, min_count: int, max_count: int) -> List[str]:
@@ -707,8 +727,8 @@ class EventSystem:
             return []
         
         systems = list(self.game.navigation.galaxy.systems.keys())
-        count = random.randint(min_count, max_count)
-        selected = random.sample(systems, min(count, len(systems)))
+        count = self.rng.randint(min_count, max_count)
+        selected = self.rng.sample(systems, min(count, len(systems)))
         
         # Convert coordinates to system names
         system_names = []
@@ -724,8 +744,8 @@ class EventSystem:
             return []
         
         factions = list(self.game.faction_system.player_relations.keys())
-        count = random.randint(min_count, max_count)
-        return random.sample(factions, min(count, len(factions)))
+        count = self.rng.randint(min_count, max_count)
+        return self.rng.sample(factions, min(count, len(factions)))
     
     def get_random_coordinates(self) -> Tuple[int, int, int]:
         """Get random coordinates within galaxy bounds"""
@@ -733,9 +753,9 @@ class EventSystem:
             return (50, 50, 25)  # Default center
         
         galaxy = self.game.navigation.galaxy
-        x = random.randint(10, galaxy.size_x - 10)
-        y = random.randint(10, galaxy.size_y - 10)
-        z = random.randint(5, galaxy.size_z - 5)
+        x = self.rng.randint(10, galaxy.size_x - 10)
+        y = self.rng.randint(10, galaxy.size_y - 10)
+        z = self.rng.randint(5, galaxy.size_z - 5)
         return (x, y, z)
     
     def add_event(self, event: Event):
@@ -825,12 +845,16 @@ class EventSystem:
         center = effects['center']
         radius = effects['radius']
         threat_level = effects['threat_level']
+        ttl = effects.get('ttl_turns', DANGER_REGION_TTL_TURNS)
+        turn = getattr(self.game, 'current_turn', None)
         
         self.dangerous_regions[center] = {
             'threat_level': threat_level,
             'radius': radius,
             'description': f"Dangerous region with threat level {threat_level}",
-            'created_by': 'event'
+            'created_by': 'event',
+            'created_turn': turn,
+            'expires_turn': turn + ttl if isinstance(turn, int) and ttl else None,
         }
     
     def apply_navigation_effects(self, effects: Dict[str, Any]):
@@ -921,9 +945,14 @@ class EventSystem:
         for event in expired_events:
             self.active_events.remove(event)
             self.event_history.append(event)
+
+        # Dangerous regions expire by turn
+        turn = getattr(self.game, 'current_turn', None)
+        if isinstance(turn, int):
+            self.dangerous_regions.expire(turn)
         
         # Generate new events occasionally
-        if random.random() < 0.1:  # 10% chance per update
+        if self.rng.random() < 0.1:  # 10% chance per update
             new_event = self.generate_random_event()
             if new_event:
                 self.add_event(new_event)
@@ -938,15 +967,18 @@ class EventSystem:
     
     def is_location_dangerous(self, coordinates: Tuple[int, int, int]) -> bool:
         """Check if a location is in a dangerous region"""
-        for center, region_data in self.dangerous_regions.items():
-            distance = math.sqrt(
-                (coordinates[0] - center[0])**2 +
-                (coordinates[1] - center[1])**2 +
-                (coordinates[2] - center[2])**2
-            )
-            if distance <= region_data['radius']:
-                return True
-        return False
+        return self._regions().is_dangerous(coordinates)
+
+    def are_locations_dangerous(self, coordinates: Iterable[Tuple[int, int, int]]) -> List[bool]:
+        """is_location_dangerous() for many locations at once, in order
+        (route planning, reachability previews)."""
+        return self._regions().flag_many(coordinates)
+
+    def _regions(self) -> DangerRegions:
+        # Older code / saves may have swapped in a plain dict
+        if not isinstance(self.dangerous_regions, DangerRegions):
+            self.dangerous_regions = DangerRegions(self.dangerous_regions)
+        return self.dangerous_regions
     
     def get_dangerous_regions(self) -> Dict[Tuple[int, int, int], Dict[str, Any]]:
         """Get all dangerous regions"""
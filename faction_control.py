@@ -0,0 +1,157 @@
+"""
+Faction Control Index - O(1) "who controls this spot?" lookups
+
+Faction space comes in two flavours:
+
+  * zones    - spheres (center + radius) loaded from lore; a location belongs
+               to the zone whose center is nearest, among the zones that
+               contain it.  Asked once per procedural system at galaxy build
+               time and whenever the UI wants to colour a point.
+  * territories - explicit lists of system coordinates per faction
+               (FactionSystem.faction_territories), asked per system by the
+               economy, bots and station generation.
+
+Looping over every zone (with a sqrt each) or every territory list per query
+makes each answer cost O(factions) or O(territory size).  Territories are
+handled by a coordinates -> faction dict kept alongside the lists in
+FactionSystem; zones by the voxel ownership map in this module.
+
+Every cell a zone touches records that zone.  Cells covered by exactly one
+zone (and touched by no other) store the owner outright; boundary and overlap
+cells keep their short candidate list and settle the query exactly, so
+answers are identical to the old linear scan - including ties, which go to
+the zone added first.  Changing one zone re-rasterises only the cells that
+zone touches.
+"""
+
+import math
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from spatial_index import DEFAULT_CELL_SIZE
+
+
+Coords = Tuple[float, float, float]
+
+
+class FactionControlIndex:
+    """Voxel ownership map for spherical faction zones."""
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        # name -> (center, radius); dict order is the tie-break order
+        self._zones: Dict[str, Tuple[Coords, float]] = {}
+        self._rank: Dict[str, int] = {}
+        self._next_rank = 0
+        # cell -> names of every zone touching it (maintenance form)
+        self._touching: Dict[Tuple[int, int, int], List[str]] = {}
+        # cell -> owner name (fully covered, uncontested) or a tuple of
+        # (name, center, radius_sq) candidates to check exactly
+        self._cells: Dict[Tuple[int, int, int], object] = {}
+        self._cells_of: Dict[str, List[Tuple[int, int, int]]] = {}
+        # Bumped whenever any zone changes; lets callers cache derived data.
+        self.version = 0
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def set_zone(self, name: str, center, radius: float):
+        """Add a zone, or move/resize an existing one (keeps its tie-break rank)."""
+        if name in self._zones:
+            self._unrasterise(name)
+        else:
+            self._rank[name] = self._next_rank
+            self._next_rank += 1
+        center = (float(center[0]), float(center[1]), float(center[2]))
+        radius = float(radius)
+        self._zones[name] = (center, radius)
+        self._rasterise(name, center, radius)
+        self.version += 1
+
+    def _cell(self, x: float, y: float, z: float) -> Tuple[int, int, int]:
+        s = self.cell_size
+        return (math.floor(x / s), math.floor(y / s), math.floor(z / s))
+
+    def _rasterise(self, name, center, radius):
+        s = self.cell_size
+        cx, cy, cz = center
+        r_sq = radius * radius
+        lo = self._cell(cx - radius, cy - radius, cz - radius)
+        hi = self._cell(cx + radius, cy + radius, cz + radius)
+        touched = []
+        for i in range(lo[0], hi[0] + 1):
+            x0, x1 = i * s, (i + 1) * s
+            # Nearest / farthest offsets along each axis from the center to the cell
+            near_x = max(x0 - cx, 0.0, cx - x1)
+            far_x = max(abs(cx - x0), abs(cx - x1))
+            for j in range(lo[1], hi[1] + 1):
+                y0, y1 = j * s, (j + 1) * s
+                near_y = max(y0 - cy, 0.0, cy - y1)
+                far_y = max(abs(cy - y0), abs(cy - y1))
+                near_xy = near_x * near_x + near_y * near_y
+                if near_xy > r_sq:
+                    continue
+                far_xy = far_x * far_x + far_y * far_y
+                for k in range(lo[2], hi[2] + 1):
+                    z0, z1 = k * s, (k + 1) * s
+                    near_z = max(z0 - cz, 0.0, cz - z1)
+                    if near_xy + near_z * near_z > r_sq:
+                        continue
+                    far_z = max(abs(cz - z0), abs(cz - z1))
+                    cell = (i, j, k)
+                    touched.append(cell)
+                    names = self._touching.setdefault(cell, [])
+                    names.append(name)
+                    names.sort(key=self._rank.__getitem__)
+                    full = far_xy + far_z * far_z <= r_sq
+                    self._settle(cell, names, name if full else None)
+        self._cells_of[name] = touched
+
+    def _unrasterise(self, name):
+        for cell in self._cells_of.pop(name, ()):
+            names = self._touching.get(cell)
+            if not names:
+                continue
+            names.remove(name)
+            if names:
+                self._settle(cell, names, None)
+            else:
+                del self._touching[cell]
+                self._cells.pop(cell, None)
+
+    def _settle(self, cell, names, covering):
+        """Store the owner outright when one zone fully covers an otherwise
+        uncontested cell; otherwise keep the candidates for an exact check."""
+        if covering is not None and len(names) == 1:
+            self._cells[cell] = covering
+            return
+        zones = self._zones
+        self._cells[cell] = tuple(
+            (n, zones[n][0], zones[n][1] * zones[n][1]) for n in names
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def zone_owner(self, x: float, y: float, z: float) -> Optional[str]:
+        """The faction whose zone contains (x, y, z) with the nearest center,
+        or None outside all zones."""
+        entry = self._cells.get(self._cell(x, y, z))
+        if entry is None or isinstance(entry, str):
+            return entry
+        best, best_d = None, math.inf
+        for name, (cx, cy, cz), r_sq in entry:
+            d = (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2
+            if d <= r_sq and d < best_d:
+                best, best_d = name, d
+        return best
+
+    def zones(self) -> Dict[str, Tuple[Coords, float]]:
+        """name -> (center, radius) for every indexed zone."""
+        return dict(self._zones)
+
+    def __contains__(self, name: Hashable) -> bool:
+        return name in self._zones
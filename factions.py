@@ -11,6 +11,8 @@ import json
 import pathlib
 import random
 
+from seeding import derive_rng
+
 # ── Load raw data from lore/factions.json ─────────────────────────────────────
 _LORE_PATH = pathlib.Path(__file__).parent / "lore" / "factions.json"
 
@@ -28,10 +30,20 @@ FACTION_RESEARCH_BONUSES: dict = _data["faction_research_bonuses"]
 # ── FactionSystem class ────────────────────────────────────────────────────────
 
 class FactionSystem:
-    def __init__(self):
+    def __init__(self, seed=None):
+        # Seeded stream for starting relations, activities and territories;
+        # unseeded (fresh entropy) when no world seed is supplied.
+        self.rng = derive_rng(seed, "factions") if seed is not None else random.Random()
         self.player_relations = {}     # faction_name: reputation_value
         self.faction_relations = {}    # faction_name: {other_faction: relationship}
         self.faction_territories = {}  # faction_name: [system_coordinates]
+        # Reverse of faction_territories (system_coordinates: faction_name) so
+        # get_system_faction is a dict lookup.  claim_system() keeps it in step;
+        # code that edits or replaces faction_territories directly must bump
+        # territories_version so it is rebuilt.
+        self.territories_version = 0
+        self._territory_owner = {}
+        self._territory_owner_version = None
         self.faction_activities = {}   # faction_name: current_activity
 
         self.initialize_factions()
@@ -40,7 +52,7 @@ class FactionSystem:
     def initialize_factions(self):
         """Initialize all faction data and player relations"""
         for faction_name in factions.keys():
-            self.player_relations[faction_name] = random.randint(-10, 10)  # Neutral start
+            self.player_relations[faction_name] = self.rng.randint(-10, 10)  # Neutral start
             self.faction_activities[faction_name] = self.get_random_activity(faction_name)
 
     def initialize_relationships(self):
@@ -61,7 +73,7 @@ class FactionSystem:
 
         # Similar philosophies create better relationships
         if faction1_data['philosophy'] == faction2_data['philosophy']:
-            return random.randint(20, 50)
+            return self.rng.randint(20, 50)
 
         # Compatible focuses
         compatible_focuses = {
@@ -79,17 +91,17 @@ class FactionSystem:
         faction2_focus = faction2_data['primary_focus']
 
         if faction2_focus in compatible_focuses.get(faction1_focus, []):
-            return random.randint(10, 30)
+            return self.rng.randint(10, 30)
         elif faction1_focus == faction2_focus:
-            return random.randint(-10, 20)  # Competition but understanding
+            return self.rng.randint(-10, 20)  # Competition but understanding
         else:
-            return random.randint(-20, 10)  # Neutral to mild dislike
+            return self.rng.randint(-20, 10)  # Neutral to mild dislike
 
     def get_random_activity(self, faction_name):
         """Get a random activity for a faction based on their focus"""
         faction_data = factions[faction_name]
         activities = faction_data['typical_activities']
-        return random.choice(activities)
+        return self.rng.choice(activities)
 
     def get_faction_info(self, faction_name):
         """Get complete information about a faction"""
@@ -221,35 +233,59 @@ class FactionSystem:
 
     def assign_faction_territories(self, galaxy):
         """Assign territories to factions across the galaxy"""
-        systems = list(galaxy.systems.values())
         faction_names = list(factions.keys())
 
         # Clear existing territories
         self.faction_territories = {name: [] for name in faction_names}
-
-        # Assign 1-3 systems to each faction randomly
+        self.territories_version += 1
+        self._territory_owner = {}
+        self._territory_owner_version = self.territories_version
+
+        # Assign 1-3 systems to each faction randomly.  The pool of unclaimed
+        # systems is kept in galaxy order and shrunk as systems are assigned,
+        # rather than re-checked against every territory for each faction.
+        available_systems = list(galaxy.systems.values())
         for faction_name in faction_names:
-            num_systems = random.randint(1, 3)
-            available_systems = [
-                s for s in systems
-                if not any(s['coordinates'] in territories
-                           for territories in self.faction_territories.values())
-            ]
+            num_systems = self.rng.randint(1, 3)
             if available_systems:
-                assigned = random.sample(available_systems, min(num_systems, len(available_systems)))
-                self.faction_territories[faction_name] = [s['coordinates'] for s in assigned]
+                assigned = self.rng.sample(available_systems, min(num_systems, len(available_systems)))
+                for s in assigned:
+                    self.claim_system(s['coordinates'], faction_name)
+                owner = self._territory_owner
+                available_systems = [s for s in available_systems if s['coordinates'] not in owner]
+
+    def claim_system(self, coordinates, faction_name):
+        """Give a system to a faction, taking it from any previous owner."""
+        owner = self._owner_map()
+        coordinates = tuple(coordinates)
+        previous = owner.get(coordinates)
+        if previous == faction_name:
+            return
+        if previous is not None:
+            self.faction_territories.get(previous, []).remove(coordinates)
+        self.faction_territories.setdefault(faction_name, []).append(coordinates)
+        owner[coordinates] = faction_name
+        self.territories_version += 1
+        self._territory_owner_version = self.territories_version
 
     def get_system_faction(self, coordinates):
         """Get the faction that controls a system"""
-        for faction_name, territories in self.faction_territories.items():
-            if coordinates in territories:
-                return faction_name
-        return None
+        return self._owner_map().get(tuple(coordinates))
+
+    def _owner_map(self):
+        if self._territory_owner_version != self.territories_version:
+            self._territory_owner = {}
+            for faction_name, territories in self.faction_territories.items():
+                for coords in territories:
+                    # First listing wins, as the old linear scan did
+                    self._territory_owner.setdefault(tuple(coords), faction_name)
+            self._territory_owner_version = self.territories_version
+        return self._territory_owner
 
     def update_faction_activities(self):
         """Update faction activities periodically"""
         for faction_name in factions.keys():
-            if random.random() < 0.1:  # 10% chance to change activity
+            if self.rng.random() < 0.1:  # 10% chance to change activity
                 self.faction_activities[faction_name] = self.get_random_activity(faction_name)
 
     def set_player_home_faction(self, faction_name, reputation=80):
@@ -55,6 +55,45 @@ const get  = (path)         => request(path, { method: "GET" });
 const post = (path, data)   => request(path, { method: "POST", body: JSON.stringify(data ?? {}) });
 const del  = (path, data)   => request(path, { method: "DELETE", body: JSON.stringify(data ?? {}) });
 
+/**
+ * Expand columnar tables (?layout=columnar responses) back into records.
+ * The server sends a list of same-shaped records as
+ *   { $columns: { field: [v0, v1, ...], ... }, $count: n }
+ * (backend/encoding.py); callers always see the ordinary array of objects.
+ */
+function expandColumnar(body) {
+  if (!body || typeof body !== "object") return body;
+  for (const [key, value] of Object.entries(body)) {
+    if (value && typeof value === "object" && value.$columns) {
+      const fields = Object.keys(value.$columns);
+      const rows = new Array(value.$count);
+      for (let i = 0; i < value.$count; i++) {
+        const row = {};
+        for (const f of fields) row[f] = value.$columns[f][i];
+        rows[i] = row;
+      }
+      body[key] = rows;
+    }
+  }
+  return body;
+}
+
+/**
+ * Build "?fields=a,b&limit=n&cursor=c" from the optional read options the
+ * heavy endpoints accept (see backend/projection.py).  Unset options are
+ * left out, so the server sends every field and every record.
+ */
+function readQuery({ fields, limit, cursor } = {}) {
+  const params = new URLSearchParams();
+  if (fields) params.set("fields", Array.isArray(fields) ? fields.join(",") : fields);
+  if (limit)  params.set("limit", String(limit));
+  if (cursor) params.set("cursor", cursor);
+  const qs = params.toString();
+  return qs ? `?${qs}` : "";
+}
+
+const getColumnar = (path) => get(path + (path.includes("?") ? "&" : "?") + "layout=columnar").then(expandColumnar);
+
 
 // ===========================================================================
 // Game lifecycle
@@ -68,12 +107,61 @@ export function newGame(characterData) {
   return post("/api/game/new", characterData);
 }
 
+// Last /api/game/state response and its ETag.  The server answers 304 when
+// the world version hasn't moved, so an idle poll transfers (and the server
+// computes) nothing.
+let _stateEtag = null;
+let _stateBody = null;
+
 /**
  * Fetch the current game state (credits, turn, ship, research, etc.).
- * Called by the polling loop every second.
+ * Called when the push channel (re)connects and at boot.
+ *
+ * Revalidates with If-None-Match; on 304 resolves to the *same object* as
+ * the previous call, so callers can skip work with an identity check.
  */
-export function getGameState() {
-  return get("/api/game/state");
+export async function getGameState() {
+  const headers = _stateEtag && _stateBody ? { "If-None-Match": _stateEtag } : {};
+  const response = await fetch(BASE + "/api/game/state", { method: "GET", headers });
+
+  if (response.status === 304 && _stateBody) {
+    return _stateBody;
+  }
+  if (!response.ok) {
+    const apiErr = new Error(`HTTP ${response.status}`);
+    apiErr.status = response.status;
+    throw apiErr;
+  }
+
+  _stateBody = await response.json();
+  _stateEtag = response.headers.get("ETag");
+  return _stateBody;
+}
+
+/**
+ * Open the server push channel (Server-Sent Events).
+ * Emits "delta" events whose data is
+ *   { version, deltas: { credits, turn, research, ship, indices, player, initialized },
+ *     notices: [ { type: "research_complete" | "gnn", turn, ... } ] }
+ * with only the changed sections present.  The browser reconnects on its own.
+ * @returns {EventSource}
+ */
+export function openEventStream() {
+  return new EventSource(BASE + "/api/events/stream");
+}
+
+/**
+ * Run several read operations in one round trip, against one game snapshot.
+ * @param {Array<{ op: string, args?: object }>} ops
+ *   op is one of the server's batch operations ("galaxy_map", "system",
+ *   "system_presence", "market", "ship_status", ...); args are the
+ *   endpoint's path/query parameters, e.g. { system_name: "Sol" }.
+ * @returns {Promise<Array<{ ok: boolean, data?: any, status?: number, detail?: string }>>}
+ *   One entry per op, in order.  A failed op does not fail the batch.
+ */
+export async function batch(ops) {
+  const body = await post("/api/batch", { ops });
+  return body.results.map(r => (r.ok ? { ...r, data: expandColumnar(r.data) } : r));
 }
 
 /**
@@ -132,9 +220,12 @@ export function getCharacterSheet() {
 /**
  * Fetch all star systems projected onto the 2D hex grid.
  * Returns { systems: [ { name, hex_q, hex_r, x, y, z, type, ... } ] }.
+ * @param {{ fields?: string[], limit?: number, cursor?: string }} [options]
+ *   fields limits each system to those keys (and skips stations / DSOs unless
+ *   named); limit + cursor page through systems ({ next_cursor, total }).
  */
-export function getGalaxyMap() {
-  return get("/api/galaxy/map");
+export function getGalaxyMap(options) {
+  return getColumnar("/api/galaxy/map" + readQuery(options));
 }
 
 export function getGalaxyLayers() {
@@ -333,9 +424,10 @@ export function setColonySystem(planetName, category, systemId) {
 /**
  * Fetch the full tech tree with each node's completion status.
  * Returns { categories, nodes: [...], active }.
+ * @param {{ fields?: string[], limit?: number, cursor?: string }} [options]
  */
-export function getResearchTree() {
-  return get("/api/research/tree");
+export function getResearchTree(options) {
+  return getColumnar("/api/research/tree" + readQuery(options));
 }
 
 /**
@@ -426,6 +518,15 @@ export function sellGoods(systemName, commodity, quantity) {
   return post("/api/trade/sell", { system_name: systemName, commodity, quantity });
 }
 
+/**
+ * Fill a basket of buys and sells at a system in one request (all or nothing).
+ * @param {string} systemName
+ * @param {Array<{side: "buy"|"sell", commodity: string, quantity: number}>} orders
+ */
+export function tradeBasket(systemName, orders) {
+  return post("/api/trade/basket", { system_name: systemName, orders });
+}
+
 
 // ===========================================================================
 // Space Stations
@@ -492,7 +593,7 @@ export function getLoreSpecies() {
  * Returns { ships: [{ name, bot_type, coordinates: [x,y,z] }, ...] }
  */
 export function getNpcShips() {
-  return get("/api/npc_ships");
+  return getColumnar("/api/npc_ships");
 }
 
 // ===========================================================================
@@ -6,13 +6,13 @@
  *   2. Load character-creation options from the API.
  *   3. Check if a game is already in progress; route to the correct view.
  *   4. Expose a global switchView() function used by all view modules.
- *   5. Start a 1-second polling loop that refreshes HUD data.
+ *   5. Keep the HUD live from the server push channel (SSE deltas).
  *   6. Wire up global keyboard shortcuts and the end-turn button.
  */
 
 import { state }        from "./state.js";
 import { renderIndices } from "./ui/hud.js";
-import { getGameState, getGameOptions, endTurn, saveGame, listSaves, loadGame } from "./api.js";
+import { getGameState, getGameOptions, endTurn, saveGame, listSaves, loadGame, openEventStream } from "./api.js";
 import { titleView }    from "./views/title.js";
 import { setupView }    from "./views/setup.js";
 import { notify }       from "./ui/notifications.js";
@@ -110,31 +110,96 @@ export async function switchView(viewName, context = {}) {
 
 
 // ---------------------------------------------------------------------------
-// Polling loop — refreshes live game state every second
+// Live updates — server push channel (one EventSource per tab)
 // ---------------------------------------------------------------------------
+// The server sends a message only when something changed, so an idle tab
+// makes no requests at all.  On every (re)connect the full state is fetched
+// once (a 304 if nothing moved); after that, deltas are applied in place.
 
-let pollingInterval = null;
+let eventStream = null;
 
-function startPolling() {
-  if (pollingInterval) return;  // Already running
-  pollingInterval = setInterval(async () => {
-    try {
-      const fresh = await getGameState();
-      state.gameState = fresh;
+// Turn numbers this tab ended itself: its end-turn handler already shows the
+// research / GNN modals, so the pushed copies of those notices are skipped.
+const turnsEndedHere = new Set();
 
-      if (fresh.initialized) {
-        updateHud(fresh);
-      }
+function startLiveUpdates() {
+  if (eventStream) return;  // Already connected
+  eventStream = openEventStream();
+  eventStream.addEventListener("open", refreshGameState);
+  eventStream.addEventListener("delta", (e) => {
+    try {
+      applyPush(JSON.parse(e.data));
     } catch (err) {
-      // Silently ignore poll failures — the server might briefly be busy
-      console.warn("[poll]", err.message);
+      console.warn("[push]", err.message);
     }
-  }, 1000);
+  });
 }
 
-function stopPolling() {
-  clearInterval(pollingInterval);
-  pollingInterval = null;
+function stopLiveUpdates() {
+  if (eventStream) eventStream.close();
+  eventStream = null;
+}
+
+async function refreshGameState() {
+  try {
+    const fresh = await getGameState();
+    // Unchanged world (304) — the HUD is already up to date
+    if (fresh === state.gameState) return;
+    state.gameState = fresh;
+
+    if (fresh.initialized) {
+      updateHud(fresh);
+    }
+  } catch (err) {
+    // Silently ignore failures — the server might briefly be busy
+    console.warn("[state]", err.message);
+  }
+}
+
+/**
+ * Apply one pushed batch: patch the changed HUD sections, then show any
+ * notices that came from another tab's end-turn.
+ * @param {{ deltas?: object, notices?: Array }} batch
+ */
+function applyPush({ deltas = {}, notices = [] }) {
+  const gs = state.gameState;
+  if ("initialized" in deltas || "player" in deltas || !gs?.initialized) {
+    // New / loaded game (or no baseline yet) — take a fresh full snapshot
+    refreshGameState();
+  } else if (Object.keys(deltas).length) {
+    if ("credits"  in deltas) gs.player.credits = deltas.credits;
+    if ("turn"     in deltas) gs.turn     = deltas.turn;
+    if ("research" in deltas) gs.research = deltas.research;
+    if ("ship"     in deltas) gs.ship     = deltas.ship;
+    if ("indices"  in deltas) gs.indices  = deltas.indices;
+    updateHud(gs);
+  }
+
+  const progress = notices.filter(n => n.type === "progress").pop();
+  if (progress) showJobProgress(progress);
+
+  const remote   = notices.filter(n => !turnsEndedHere.has(n.turn));
+  const research = remote.find(n => n.type === "research_complete");
+  const gnn      = remote.find(n => n.type === "gnn");
+  if (research) {
+    _showResearchCompleteModal(research, gnn ? () => _showGnnModal(gnn.summary) : null);
+  } else if (gnn) {
+    _showGnnModal(gnn.summary);
+  }
+}
+
+
+/**
+ * Reflect a long server operation's progress ({ kind, stage, progress, done })
+ * on the control that started it — currently the END TURN button.
+ */
+function showJobProgress(job) {
+  if (job.kind !== "end_turn" || job.done) return;
+  const btn = document.getElementById("btn-end-turn");
+  if (btn && btn.disabled) {
+    btn.textContent = `PROCESSING ${Math.round(job.progress * 100)}%`;
+    btn.title = job.stage || "";
+  }
 }
 
 
@@ -255,10 +320,13 @@ export async function handleEndTurn() {
     btn.textContent = "PROCESSING...";
   }
 
+  const endingTurn = state.gameState?.turn?.current_turn;
+  if (endingTurn != null) turnsEndedHere.add(endingTurn + 1);
+
   try {
     const result = await endTurn();
 
-    // Refresh HUD immediately without waiting for next poll
+    // Refresh HUD immediately without waiting for the pushed deltas
     if (result.state) {
       state.gameState = result.state;
       updateHud(result.state);
@@ -283,6 +351,7 @@ export async function handleEndTurn() {
     if (btn) {
       btn.disabled = false;
       btn.textContent = "END TURN";
+      btn.title = "";
     }
   }
 }
@@ -560,7 +629,7 @@ function showGameMenu() {
       // Return to title
       document.getElementById("gmenu-title")?.addEventListener("click", () => {
         closeModal();
-        stopPolling();
+        stopLiveUpdates();
         hideHud();
         state.gameInitialized = false;
         switchView("title", { hasGame: true });
@@ -632,7 +701,7 @@ export function onGameStarted(gameState) {
 
   showHud();
   updateHud(gameState);
-  startPolling();
+  startLiveUpdates();
   switchView("galaxy");
 }
 
@@ -3,8 +3,8 @@
  *
  * This is a plain JavaScript object — no framework, no proxy magic.
  * Views read from it when mounting and update specific keys after API calls.
- * The polling loop in main.js refreshes the "live" fields (credits, turn,
- * research progress) every second, then calls hud.refresh() to re-render.
+ * The live-update channel in main.js patches the "live" fields (credits, turn,
+ * research progress) as the server pushes changes, then re-renders the HUD.
  *
  * DESIGN RULE: state is the only mutable singleton in the frontend.
  * All other modules receive state as a parameter or import it directly.
@@ -22,7 +22,7 @@ export const state = {
   currentView: "setup",
 
   // -----------------------------------------------------------------
-  // Data refreshed every second by the polling loop (main.js)
+  // Data kept current by the server push channel (main.js)
   // -----------------------------------------------------------------
 
   /** Full response from GET /api/game/state */
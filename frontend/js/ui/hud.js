@@ -2,7 +2,7 @@
  * ui/hud.js — HUD (Heads-Up Display) helper functions.
  *
  * The HUD bar is rendered in HTML (not Canvas) for accessibility and easy
- * DOM updates.  main.js drives HUD updates via the polling loop.
+ * DOM updates.  main.js drives HUD updates from the server push channel.
  * This module provides reusable helpers that other views can also call.
  */
 
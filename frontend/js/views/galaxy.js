@@ -14,11 +14,11 @@
  */
 
 import { state }              from "../state.js";
-import { getGalaxyMap, getSystem, jumpToCoords, layerShift,
+import { getGalaxyMap, jumpToCoords, layerShift,
          getMarket, buyGoods, sellGoods,
          getSystemPresence,
          getStation, getStationUpgrades, buyStationUpgrade, repairShipAtStation,
-         getNpcShips,
+         getNpcShips, batch,
          harvestDeepSpace, foundDeepSpaceOutpost, encounterDerelict } from "../api.js";
 import { notify }             from "../ui/notifications.js";
 import { showModal, closeModal } from "../ui/modal.js";
@@ -530,12 +530,18 @@ async function handleHexClick({ q, r }) {
     handleJump(sys);  // fire-and-forget; panel loads in parallel
   }
 
-  // Fetch detailed system data (planets, market, etc.) and show panel
+  // Fetch detailed system data, NPC presence and market in one round trip
+  // and show the panel
   try {
-    const detail = await getSystem(sys.name);
+    const [detail, presence, market] = await batch([
+      { op: "system",          args: { system_name: sys.name } },
+      { op: "system_presence", args: { system_name: sys.name } },
+      { op: "market",          args: { system_name: sys.name } },
+    ]);
+    if (!detail.ok) throw new Error(detail.detail);
     // Mark as visited in our local cache too
     sys.visited = true;
-    showSystemPanel(detail);
+    showSystemPanel(detail.data, { presence, market });
   } catch (err) {
     notify("ERROR", `Could not load system data: ${err.message}`);
   }
@@ -595,7 +601,12 @@ function showOutOfRangePanel(sys) {
   `;
 }
 
-async function showSystemPanel(system) {
+/**
+ * @param {object} system - /api/system/{name} payload
+ * @param {{ presence, market }} [prefetched] - batch() results for the
+ *   presence and market ops; fetched here when omitted.
+ */
+async function showSystemPanel(system, prefetched = null) {
   const panel = document.getElementById("panel-right");
   const content = document.getElementById("panel-right-content");
   if (!panel || !content) return;
@@ -632,11 +643,15 @@ async function showSystemPanel(system) {
     });
   });
 
-  // Fetch presence and market data concurrently
-  const [presenceResult, marketResult] = await Promise.allSettled([
-    getSystemPresence(system.name),
-    getMarket(system.name),
-  ]);
+  // Fetch presence and market data concurrently (unless already batched)
+  const settled = r => (r.ok ? { status: "fulfilled", value: r.data }
+                             : { status: "rejected",  reason: new Error(r.detail) });
+  const [presenceResult, marketResult] = prefetched
+    ? [settled(prefetched.presence), settled(prefetched.market)]
+    : await Promise.allSettled([
+        getSystemPresence(system.name),
+        getMarket(system.name),
+      ]);
 
   // Check if the player is physically at this system
   const atThisSystem = _playerIsAt(system.coordinates);
@@ -15,8 +15,8 @@
  *   and are within BORDER_DIST_THRESHOLD normalised units of one another.
  */
 
-import { getGalaxyMap, getGalaxyLayers, getShipStatus } from "../api.js";
-import { notify }                                       from "../ui/notifications.js";
+import { batch }  from "../api.js";
+import { notify } from "../ui/notifications.js";
 
 // ---------------------------------------------------------------------------
 // Public view object
@@ -60,6 +60,12 @@ let _normCx = 0, _normCy = 0, _normCz = 0, _normMax = 1;
 /** Perspective projection — eye distance multiplier; larger = less distortion */
 const PERSPECTIVE_DEPTH = 2.0;
 
+/** The only system fields _processData reads — the server skips the rest. */
+const MAP_FIELDS_3D = [
+  "name", "x", "y", "z", "type", "visited",
+  "controlling_faction", "population", "in_scan_range",
+];
+
 // ---------------------------------------------------------------------------
 // Galactic layer state (loaded once from /api/galaxy/layers)
 // ---------------------------------------------------------------------------
@@ -180,11 +186,17 @@ async function mount() {
   // Start render loop immediately (shows loading message)
   _startRenderLoop();
 
-  // Fetch galaxy data, layer definitions, and ship position in parallel
+  // Fetch galaxy data, layer definitions, and ship position in one round trip
   try {
-    const [mapData, layerData, shipData] = await Promise.all([
-      getGalaxyMap(), getGalaxyLayers(), getShipStatus(),
+    const [mapRes, layerRes, shipRes] = await batch([
+      { op: "galaxy_map", args: { fields: MAP_FIELDS_3D.join(",") } },
+      { op: "galaxy_layers" },
+      { op: "ship_status" },
     ]);
+    if (!mapRes.ok) throw new Error(mapRes.detail);
+    const mapData   = mapRes.data;
+    const layerData = layerRes.ok ? layerRes.data : null;
+    const shipData  = shipRes.ok ? shipRes.data : null;
     _processData(mapData.systems || []);
 
     if (layerData) {
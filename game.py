@@ -36,11 +36,28 @@ from professions import ProfessionSystem
 from galactic_history import GalacticHistory
 from events import EventSystem
 from news_system import NewsSystem
+from seeding import RngRegistry, new_world_seed
+from discovery import DiscoveryEngine
 import threading
 import time
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed=None, num_systems=None, background_thread=True):
+        # Bots and events tick on a daemon thread (start_bot_update_thread) in
+        # the terminal game.  The web backend passes False and drives
+        # run_background_tick() from its own single-writer queue instead, so
+        # nothing mutates the world behind a request handler's back.
+        self.background_thread_enabled = background_thread
+        # World seed: galaxy layout, stations, bots and factions all derive
+        # their random streams from it (see seeding.py), and saves record it
+        # so the world can be regenerated instead of stored.
+        self.world_seed = seed if seed is not None else new_world_seed()
+        # Per-turn simulation streams (economy, events, NPC ships, bots, hull
+        # wear, GNN), derived from the world seed and saved with the game so
+        # a loaded game replays exactly (see seeding.RngRegistry).
+        self.rng = RngRegistry(self.world_seed)
+        # Procedural system count (None = the galaxy default of 300)
+        self.num_systems = num_systems
         self.player_name = ""
         self.character_class = ""
         self.character_background = ""
@@ -66,17 +83,27 @@ class Game:
         # each turn.  Ore Processors boost shipyard output (minerals → refined ore
         # → fleet points chain).  Spent on operations in a future system.
         self.fleet_pool = 0
-        self.economy = EconomicSystem()
+        self.economy = EconomicSystem(rng=self.rng.stream("economy"))
+        # Fog of war: refreshed whenever the player's ship moves or its scan
+        # range changes (see discovery.py), read by the galaxy map.
+        self.discovery = DiscoveryEngine()
         self.navigation = NavigationSystem(self)
         self.upgrade_system = ShipUpgradeSystem()
         self.station_manager = None  # Will be initialized after navigation
         self.bot_manager = None  # Will be initialized after navigation
         self.bot_update_thread = None
         self.game_running = True
-        self.faction_system = FactionSystem()
+        # Monotonic counter of state changes the HUD can see; bumped by
+        # resolve_end_turn() and by every mutating API request, so readers
+        # (e.g. /api/game/state's ETag) can skip work when nothing changed.
+        self.world_version = 0
+        # Callables (kind, payload) told about state changes — e.g. the web
+        # backend's push channel.  Not saved; re-attached by whoever owns them.
+        self.change_listeners = []
+        self.faction_system = FactionSystem(seed=self.world_seed)
         self.profession_system = ProfessionSystem()
         self.galactic_history = GalacticHistory()
-        self.event_system = EventSystem(self)
+        self.event_system = EventSystem(self, rng=self.rng.stream("events"))
         self.news_system = NewsSystem(self.event_system)
         
         # Turn-based game system
@@ -651,6 +678,7 @@ class Game:
         self,
         colony_rp: int = 0,
         colony_advance_fn=None,
+        progress=None,
     ) -> dict:
         """Run a complete end-of-turn cycle and return a structured result dict.
 
@@ -670,6 +698,10 @@ class Game:
             ticks colony production and population tax, appends colony-related
             events to the *events* list, and returns a ``financial_summary``
             dict.  When ``None``, colony production is skipped.
+        progress : callable | None
+            ``progress(fraction, stage)`` — optional callback told which of
+            the phases below is starting (fraction 0.0–1.0), so a caller
+            running the turn in the background can show how far it got.
 
         Returns
         -------
@@ -685,7 +717,12 @@ class Game:
             credits_before           – int: credits before colony income
             credits_after            – int: credits after colony income
         """
+        def _report(fraction, stage):
+            if progress is not None:
+                progress(fraction, stage)
+
         # ── 1. Increment turn counter, reset action points ─────────────────
+        _report(0.0, "Advancing turn counter")
         success, message = self.end_turn()
         if not success:
             return {
@@ -701,9 +738,11 @@ class Game:
             }
 
         # ── 2. Subsystem tick (economy, events, NPC ships, +1 research) ────
+        _report(0.05, "Economy and events")
         events: list[dict] = self.advance_turn()
 
         # ── 3. Research progression ─────────────────────────────────────────
+        _report(0.4, "Research")
         # advance_turn() already added +1; add the remaining (rp - 1) so the
         # total increment equals the full rp value this turn.
         newly_completed_research = None
@@ -744,6 +783,7 @@ class Game:
                     })
 
         # ── 4. Re-apply ship bonus stack (research just completed may change stats) ─
+        _report(0.5, "Ship systems")
         ship = getattr(self.navigation, "current_ship", None) if self.navigation else None
         if ship and getattr(ship, "attribute_profile", None):
             apply_all_bonuses_to_ship(ship, self)
@@ -753,8 +793,9 @@ class Game:
         hull_dmg = hull_dmg_before
 
         # 5% chance of space-hazard wear: 0.5–2.0 integrity points
-        if random.random() < 0.05:
-            wear = round(random.uniform(0.5, 2.0), 1)
+        hull_rng = self.rng.stream("hull")
+        if hull_rng.random() < 0.05:
+            wear = round(hull_rng.uniform(0.5, 2.0), 1)
             hull_dmg = round(hull_dmg + wear, 2)
             events.append({
                 "channel": "HULL",
@@ -793,6 +834,7 @@ class Game:
             self.ship_last_position = current_pos
 
         # ── 7. Colony production ────────────────────────────────────────────
+        _report(0.6, "Colony production")
         credits_before   = self.credits
         financial_summary: dict = {}
         if colony_advance_fn is not None:
@@ -806,6 +848,7 @@ class Game:
         credits_after = self.credits
 
         # ── 8. NPC bot tick ──────────────────────────────────────────────────
+        _report(0.8, "NPC ships")
         # Bot movement is gameplay simulation, not a presentation concern.
         # Running it here ensures bots tick regardless of which caller
         # (REST endpoint, CLI, test, or future autoplay mode) triggers
@@ -820,6 +863,11 @@ class Game:
                     "message": f"Bot tick failed: {_exc}",
                 })
 
+        self.bump_world_version()
+        if newly_completed_research:
+            self.emit_change("research_complete",
+                             dict(newly_completed_research, turn=self.current_turn))
+
         return {
             "success":                   success,
             "message":                   message,
@@ -832,6 +880,26 @@ class Game:
             "credits_after":             credits_after,
         }
 
+    def bump_world_version(self):
+        """Record that world state changed (see world_version)."""
+        self.world_version = getattr(self, "world_version", 0) + 1
+        self.emit_change("world_version", self.world_version)
+        return self.world_version
+
+    def add_change_listener(self, listener):
+        """Register listener(kind, payload) for emit_change() notifications."""
+        if listener not in self.change_listeners:
+            self.change_listeners.append(listener)
+
+    def emit_change(self, kind, payload=None):
+        """Tell every change listener about a state change.  A failing
+        listener never breaks the game loop."""
+        for listener in list(getattr(self, "change_listeners", ())):
+            try:
+                listener(kind, payload)
+            except Exception as exc:  # pragma: no cover - defensive
+                print(f"[Game] Warning: change listener failed: {exc}")
+
     # Player Log Management Methods
     def add_log_entry(self, entry_type, message, details=None):
         """Add an entry to the player log"""
@@ -1706,59 +1774,82 @@ class Game:
             if total_cost > self.credits:
                 # Shouldn't happen if economy check passed, but guard anyway
                 return False, "Insufficient credits after market update"
-            self.credits -= total_cost
+            self._apply_trade_fill(system_name, 'buy', commodity, quantity, price, total_cost)
+            self._award_trade_volume(quantity)
+
+            return True, message
+        except Exception as e:
+            return False, f"Trade error: {e}"
+
+    def _apply_trade_fill(self, system_name: str, side: str, commodity: str, quantity: int,
+                          price_each: int, total: int):
+        """Apply the player's side of one filled order - credits, inventory,
+        ship cargo and the trade log.  Shared by the single-order and basket
+        paths; the market side has already been settled by the economy."""
+        if side == 'buy':
+            self.credits -= total
             self.inventory[commodity] = self.inventory.get(commodity, 0) + quantity
+        else:
+            self.credits += total
+            self.inventory[commodity] -= quantity
+            if self.inventory[commodity] <= 0:
+                del self.inventory[commodity]
 
-            # Update ship cargo if ship exists
-            try:
-                if self.navigation and self.navigation.current_ship:
-                    ship = self.navigation.current_ship
+        # Update ship cargo if ship exists
+        try:
+            if self.navigation and self.navigation.current_ship:
+                ship = self.navigation.current_ship
+                if side == 'buy':
                     if not ship.cargo:
                         ship.cargo = {}
                     ship.cargo[commodity] = ship.cargo.get(commodity, 0) + quantity
-            except Exception:
-                pass
-
-            # Reputation bonus at controlling faction (if any)
-            try:
-                if self.navigation and self.navigation.current_ship and hasattr(self, 'faction_system') and self.faction_system:
-                    coords = self.navigation.current_ship.coordinates
-                    faction = self.faction_system.get_system_faction(coords)
-                    if faction:
-                        rep_change = max(1, quantity // 10)  # small rep for trade volume
-                        self.faction_system.modify_reputation(faction, rep_change, "trade")
-            except Exception:
-                pass
+                elif ship.cargo and commodity in ship.cargo:
+                    ship.cargo[commodity] -= quantity
+                    if ship.cargo[commodity] <= 0:
+                        del ship.cargo[commodity]
+        except Exception:
+            pass
 
-            # Profession XP for trading
-            try:
-                trade_xp = max(5, quantity // 5)
-                prof = getattr(self.profession_system, 'character_profession', None)
-                if prof == "Interstellar Trade Broker":
-                    self.profession_system.gain_experience("Interstellar Trade Broker", trade_xp * 2, "major trade")
-                elif prof == "Intergalactic Trader":
-                    self.profession_system.gain_experience("Intergalactic Trader", trade_xp * 2, "trade transaction")
-                elif prof:
-                    self.profession_system.gain_experience(prof, trade_xp, "trade activity")
-            except Exception:
-                pass
+        # Log
+        try:
+            verb, total_key = ("Bought", 'total_cost') if side == 'buy' else ("Sold", 'total_value')
+            self.add_log_entry('trade', f"{verb} {quantity} {commodity} at {system_name}", {
+                'commodity': commodity,
+                'quantity': quantity,
+                'price_each': price_each,
+                total_key: total,
+                'system': system_name,
+                'direction': side
+            })
+        except Exception:
+            pass
 
-            # Log
-            try:
-                self.add_log_entry('trade', f"Bought {quantity} {commodity} at {system_name}", {
-                    'commodity': commodity,
-                    'quantity': quantity,
-                    'price_each': price,
-                    'total_cost': total_cost,
-                    'system': system_name,
-                    'direction': 'buy'
-                })
-            except Exception:
-                pass
+    def _award_trade_volume(self, quantity: int):
+        """Reputation at the controlling faction and profession XP for buying
+        `quantity` units."""
+        # Reputation bonus at controlling faction (if any)
+        try:
+            if self.navigation and self.navigation.current_ship and hasattr(self, 'faction_system') and self.faction_system:
+                coords = self.navigation.current_ship.coordinates
+                faction = self.faction_system.get_system_faction(coords)
+                if faction:
+                    rep_change = max(1, quantity // 10)  # small rep for trade volume
+                    self.faction_system.modify_reputation(faction, rep_change, "trade")
+        except Exception:
+            pass
 
-            return True, message
-        except Exception as e:
-            return False, f"Trade error: {e}"
+        # Profession XP for trading
+        try:
+            trade_xp = max(5, quantity // 5)
+            prof = getattr(self.profession_system, 'character_profession', None)
+            if prof == "Interstellar Trade Broker":
+                self.profession_system.gain_experience("Interstellar Trade Broker", trade_xp * 2, "major trade")
+            elif prof == "Intergalactic Trader":
+                self.profession_system.gain_experience("Intergalactic Trader", trade_xp * 2, "trade transaction")
+            elif prof:
+                self.profession_system.gain_experience(prof, trade_xp, "trade activity")
+        except Exception:
+            pass
 
     def check_cargo_capacity(self, additional_units: int):
         """Check if current ship has capacity for additional cargo units.
@@ -1827,17 +1918,30 @@ class Game:
         except Exception:
             return {'best_buys': [], 'best_sells': []}
 
-    def get_trade_routes(self):
+    def get_trade_routes(self, max_distance=None):
         """Get profitable trade routes across the galaxy.
         
+        Each route carries its 'distance' from the ship to the source
+        market; max_distance keeps only routes whose two markets both lie
+        within that range of the ship.
+
         Returns list of trade opportunities
         """
         try:
             if not hasattr(self, 'economy') or not self.economy:
                 return []
-            
-            opportunities = self.economy.get_trade_opportunities()
-            return opportunities[:10]  # Top 10 routes
+
+            near = positions = None
+            ship = self.navigation.current_ship if self.navigation else None
+            if ship is not None and getattr(ship, 'coordinates', None):
+                near = tuple(ship.coordinates)
+                positions = {
+                    sys_data.get('name'): sys_coords
+                    for sys_coords, sys_data in self.navigation.galaxy.systems.items()
+                }
+
+            return self.economy.get_trade_opportunities(
+                10, near=near, positions=positions, max_distance=max_distance)  # Top 10 routes
         except Exception:
             return []
 
@@ -1860,41 +1964,51 @@ class Game:
             if not success:
                 return False, message
 
-            self.credits += credits_earned
-            self.inventory[commodity] -= quantity
-            if self.inventory[commodity] <= 0:
-                del self.inventory[commodity]
-
-            # Update ship cargo if ship exists
-            try:
-                if self.navigation and self.navigation.current_ship:
-                    ship = self.navigation.current_ship
-                    if ship.cargo and commodity in ship.cargo:
-                        ship.cargo[commodity] -= quantity
-                        if ship.cargo[commodity] <= 0:
-                            del ship.cargo[commodity]
-            except Exception:
-                pass
-
-            # Log
-            try:
-                market_info = self.economy.get_market_info(system_name)
-                price_each = market_info['market']['prices'].get(commodity, 0) if market_info else 0
-                self.add_log_entry('trade', f"Sold {quantity} {commodity} at {system_name}", {
-                    'commodity': commodity,
-                    'quantity': quantity,
-                    'price_each': price_each,
-                    'total_value': credits_earned,
-                    'system': system_name,
-                    'direction': 'sell'
-                })
-            except Exception:
-                pass
+            self._apply_trade_fill(system_name, 'sell', commodity, quantity,
+                                   credits_earned // quantity, credits_earned)
 
             return True, message
         except Exception as e:
             return False, f"Trade error: {e}"
 
+    def perform_trade_basket(self, system_name: str, orders):
+        """Execute a basket of buys and sells in one market update.
+
+        orders is a list of {'commodity', 'quantity', 'side': 'buy'|'sell'}.
+        Credits and cargo space are checked for the basket as a whole (sales
+        count towards both), nothing changes unless every order fills, and
+        each affected price is recomputed once rather than per order.
+
+        Returns (success: bool, message: str, fills: list)
+        """
+        try:
+            if not hasattr(self, 'economy') or not self.economy:
+                return False, "Economic system unavailable", []
+
+            ship = self.navigation.current_ship if self.navigation else None
+            cargo_space = cargo = None
+            if ship is not None:
+                cargo = ship.cargo or {}
+                cargo_space = getattr(ship, 'max_cargo', 100) - sum(cargo.values())
+
+            success, message, fills = self.economy.execute_orders(
+                system_name, orders, self.credits, self.inventory, cargo_space, cargo
+            )
+            if not success:
+                return False, message, []
+
+            for fill in fills:
+                self._apply_trade_fill(system_name, fill['side'], fill['commodity'],
+                                       fill['quantity'], fill['price_each'], fill['total'])
+            # One reputation/XP award for everything bought in the basket
+            bought = sum(f['quantity'] for f in fills if f['side'] == 'buy')
+            if bought:
+                self._award_trade_volume(bought)
+
+            return True, message, fills
+        except Exception as e:
+            return False, f"Trade error: {e}", []
+
     def market_analysis(self, system_name):
         """Show detailed market analysis"""
         print("\n" + "="*60)
@@ -4560,21 +4674,32 @@ class Game:
         print("Note: Faction activities change periodically based on their goals and circumstances.")
         input("\nPress Enter to continue...")
 
+    def run_background_tick(self):
+        """One step of background simulation: move bots, advance events."""
+        # getattr: the thread can start before __init__ has built event_system
+        if getattr(self, 'bot_manager', None):
+            self.bot_manager.update_all_bots()
+        if getattr(self, 'event_system', None):
+            self.event_system.update_events()
+
     def start_bot_update_thread(self):
         """Start the background thread for bot updates and event system"""
+        if not self.background_thread_enabled:
+            return
+        thread = getattr(self, 'bot_update_thread', None)
+        if thread is not None and thread.is_alive():
+            return
+
         def bot_update_loop():
             while self.game_running:
-                if self.bot_manager:
-                    self.bot_manager.update_all_bots()
-                if self.event_system:
-                    self.event_system.update_events()
+                self.run_background_tick()
                 time.sleep(5)  # Update every 5 seconds
         
         self.bot_update_thread = threading.Thread(target=bot_update_loop, daemon=True)
         self.bot_update_thread.start()
     
     def stop_bot_updates(self):
-        """Stop bot updates"""
+        """Stop bot updates (the thread exits after its current sleep)"""
         self.game_running = False
     
     def ai_bots_menu(self):
@@ -4849,6 +4974,12 @@ def apply_all_bonuses_to_ship(ship, g) -> None:
     #   scan_range = 20 + detection_range * 0.5 + etheric_sensitivity * 0.25
     ship.scan_range = max(5.0, 20.0 + detection_range * 0.5 + etheric_sensitivity * 0.25)
 
+    # Scan range may have changed — refresh fog of war for the player's ship
+    discovery = getattr(g, "discovery", None)
+    nav = getattr(g, "navigation", None)
+    if discovery is not None and nav is not None and getattr(nav, "current_ship", None) is ship:
+        discovery.observe(g)
+
 
 def get_effective_scan_range(g) -> float:
     """Return the ship's effective scan range in galaxy units.
@@ -0,0 +1,653 @@
+"""
+Market Table - Columnar Market Storage and a Whole-Economy Tick
+
+EconomicSystem kept every market as a dict of per-commodity dicts
+({'supply': {...}, 'demand': {...}, 'prices': {...}, ...}) and advanced one
+market at a time in update_market(): a Python loop over ~240 commodities
+with several random draws each.  That was too slow to run for every market,
+so tick_global_state() only refreshed a random dozen of them per turn.
+
+MarketTable stores the same numbers as market × commodity columns - flat,
+row-major arrays with one row per market:
+
+    supply, demand, prices      int    (a 'present' flag marks listed goods)
+    production, consumption     int    (0 = not produced / consumed)
+    price_shocks                float  (1.0 = no shock)
+
+tick() advances every market at once under the old update_market() rules:
+vectorised with NumPy when it is installed (pip install numpy), as
+whole-column list comprehensions otherwise.  Both kernels take their
+randomness from the caller's rng in the same order - production,
+consumption and restock each draw once per affected good in cell order,
+then the random jolts (_jolts()) - so a seed yields the same economy
+either way.
+
+The dict-shaped API survives as a view.  table[name] is a MarketView and
+market['supply'] a CommodityView; both read and write the columns, so
+trades, events, bots and the CLI keep working unchanged:
+
+    market = economy.markets["Sol"]
+    market['supply']['Ethergrain'] -= 10      # writes the supply column
+
+to_dict() / from_dict() convert to and from plain nested dicts (JSON saves).
+"""
+
+import math
+import operator
+import random
+from array import array
+from collections.abc import Mapping, MutableMapping
+from itertools import compress
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import numpy as np   # optional: pip install numpy
+except ImportError:
+    np = None
+
+
+RESOURCE_FACTORS = {'Poor': 0.5, 'Moderate': 1.0, 'Rich': 1.5, 'Abundant': 2.0, 'Depleted': 0.2}
+
+PRICE_MULTIPLIER_MIN = 0.2
+PRICE_MULTIPLIER_MAX = 3.0
+SHOCK_MIN = 0.1
+SHOCK_MAX = 10.0
+# A shock keeps 85% of its distance from 1.0 each tick (decays 15%)
+SHOCK_RETAIN = 0.85
+# Chance per good per tick of a random supply/demand jolt
+FLUCTUATION_CHANCE = 0.1
+
+# Per-commodity fields of a market, in MarketView key order
+COLUMNS = ('supply', 'demand', 'prices', 'production', 'consumption', 'price_shocks')
+# These list the market's goods: a key exists where the 'present' flag is set
+_LISTED = frozenset(('supply', 'demand', 'prices'))
+# These list only non-default entries
+_DEFAULTS = {'production': 0, 'consumption': 0, 'price_shocks': 1.0}
+
+# Storage arrays: name -> (typecode, default).  'target' (demand reverts
+# toward it) and 'floor' (supply below it restocks) are derived per cell
+# from the market's population/resources and its production/consumption.
+_ARRAYS = {
+    'supply':       ('q', 0),
+    'demand':       ('q', 0),
+    'prices':       ('q', 0),
+    'production':   ('q', 0),
+    'consumption':  ('q', 0),
+    'price_shocks': ('d', 1.0),
+    'present':      ('b', 0),
+    'target':       ('q', 0),
+    'floor':        ('q', 0),
+}
+
+
+def cell_price(base: int, supply: int, demand: int, shock: float = 1.0) -> int:
+    """Price of one good: base × clamp(0.5 + demand/supply × 0.5) × shock."""
+    ratio = demand / (supply if supply > 1 else 1)
+    multiplier = 0.5 + (ratio * 0.5)
+    if multiplier < PRICE_MULTIPLIER_MIN:
+        multiplier = PRICE_MULTIPLIER_MIN
+    elif multiplier > PRICE_MULTIPLIER_MAX:
+        multiplier = PRICE_MULTIPLIER_MAX
+    price = int(base * multiplier * shock)
+    return price if price > 1 else 1
+
+
+def _jolts(lo: int, hi: int, present, rnd) -> tuple:
+    """Random supply/demand jolts for the listed goods in cells [lo, hi).
+
+    Returns (cells, supply_draws, demand_draws): a jolted good's supply moves
+    by int(draw * 41) - 20 and its demand by int(draw * 31) - 15.  Jumps
+    straight to the next jolted good (geometric gaps) rather than rolling
+    once per good; all the gaps are drawn first, then the steps, so both
+    kernels make the same draws.
+    """
+    cells: List[int] = []
+    if not 0.0 < FLUCTUATION_CHANCE < 1.0:
+        return cells, [], []
+    log, log_miss = math.log, math.log(1.0 - FLUCTUATION_CHANCE)
+    i = lo + int(log(1.0 - rnd()) / log_miss)
+    while i < hi:
+        if present[i]:
+            cells.append(i)
+        i += 1 + int(log(1.0 - rnd()) / log_miss)
+    return cells, [rnd() for _ in cells], [rnd() for _ in cells]
+
+
+def _coerce(field: str, value):
+    """A value as the column stores it (the old _normalize_market() rules)."""
+    if field == 'price_shocks':
+        try:
+            return max(SHOCK_MIN, min(SHOCK_MAX, float(value)))
+        except (TypeError, ValueError):
+            return 1.0
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return 0
+    return max(0, value) if field in ('supply', 'demand') else value
+
+
+def _row_factors(meta: Mapping) -> tuple:
+    """(population factor, resource factor) for a market's own fields."""
+    try:
+        population_factor = float(meta.get('population', 1_000_000)) / 1_000_000.0
+    except (TypeError, ValueError):
+        population_factor = 1.0
+    return population_factor, RESOURCE_FACTORS.get(meta.get('resources', 'Moderate'), 1.0)
+
+
+class _Row:
+    """One market: its row number, own fields and off-axis entries."""
+
+    __slots__ = ("name", "index", "meta", "extra")
+
+    def __init__(self, name: str, index: int):
+        self.name = name
+        self.index: Optional[int] = index   # None once removed
+        self.meta: Dict[str, Any] = {}
+        # field -> {commodity: value} for production/consumption/shock
+        # entries naming goods that are not on the commodity axis
+        self.extra: Dict[str, Dict[str, Any]] = {}
+
+
+class MarketTable(MutableMapping):
+    """market name -> MarketView, backed by market × commodity columns."""
+
+    def __init__(self, commodities: Iterable[str] = ()):
+        self.commodities: List[str] = []
+        self._col: Dict[str, int] = {}
+        self._rows: Dict[str, _Row] = {}
+        self._order: List[_Row] = []
+        self._a: Dict[str, array] = {name: array(code) for name, (code, _d) in _ARRAYS.items()}
+        # Change tracking for derived indexes (trade_index.py): `version`
+        # moves on every bulk change (tick, event, layout); single-cell
+        # writes to listed fields only note the flat cell in _touched.
+        self.version = 0
+        self._touched: set = set()
+        for commodity in commodities:
+            self._add_commodity(commodity)
+
+    @classmethod
+    def from_dict(cls, markets: Mapping, commodities: Iterable[str] = ()) -> "MarketTable":
+        table = cls(commodities)
+        for name, market in markets.items():
+            table[name] = market
+        return table
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Plain nested dicts, as EconomicSystem.markets used to be."""
+        return {row.name: MarketView(self, row).to_dict() for row in self._order}
+
+    @property
+    def width(self) -> int:
+        return len(self.commodities)
+
+    def column(self, field: str, col: int) -> array:
+        """One commodity's cells of `field` (or 'present'), in row order."""
+        return self._a[field][col::self.width]
+
+    def row_names(self) -> List[str]:
+        return [row.name for row in self._order]
+
+    def drain_touched(self) -> set:
+        """Flat cells written one at a time since the last call (or bulk change)."""
+        touched, self._touched = self._touched, set()
+        return touched
+
+    def _bulk_change(self):
+        self.version += 1
+        self._touched.clear()
+
+    # ------------------------------------------------------------------
+    # Mapping interface (market name -> MarketView)
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, name: str) -> "MarketView":
+        return MarketView(self, self._rows[name])
+
+    def __setitem__(self, name: str, market: Mapping):
+        row = self._rows.get(name)
+        if row is None:
+            row = self._new_row(name)
+        elif isinstance(market, MarketView) and market._row is row:
+            return
+        self._load_row(row, market)
+
+    def __delitem__(self, name: str):
+        row = self._rows.pop(name)
+        w = self.width
+        lo = row.index * w
+        for arr in self._a.values():
+            del arr[lo:lo + w]
+        del self._order[row.index]
+        for later in self._order[row.index:]:
+            later.index -= 1
+        row.index = None
+        self._bulk_change()
+
+    def __contains__(self, name) -> bool:
+        return name in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._rows))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"<MarketTable {len(self._rows)} markets × {self.width} commodities>"
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+
+    def _add_commodity(self, commodity: str) -> int:
+        col = self._col.get(commodity)
+        if col is not None:
+            return col
+        old_width = self.width
+        self.commodities.append(commodity)
+        col = self._col[commodity] = old_width
+        if self._order:
+            # Re-stride every array: one new cell at the end of each row
+            for name, (code, default) in _ARRAYS.items():
+                old = self._a[name]
+                grown = array(code)
+                for r in range(len(self._order)):
+                    grown.extend(old[r * old_width:(r + 1) * old_width])
+                    grown.append(default)
+                self._a[name] = grown
+            for row in self._order:
+                self._derive_cell(row, col)
+        self._bulk_change()
+        return col
+
+    def _new_row(self, name: str) -> _Row:
+        row = _Row(name, len(self._order))
+        w = self.width
+        for name_, (code, default) in _ARRAYS.items():
+            self._a[name_].extend(array(code, [default]) * w)
+        self._rows[name] = row
+        self._order.append(row)
+        return row
+
+    def _load_row(self, row: _Row, market: Mapping):
+        market = market.to_dict() if isinstance(market, MarketView) else market
+        row.meta = {k: v for k, v in market.items() if k not in COLUMNS}
+        row.extra = {}
+        # Put goods new to the axis on it first, so the row layout is final
+        for field in _LISTED:
+            values = market.get(field)
+            if isinstance(values, Mapping):
+                for commodity in values:
+                    self._add_commodity(commodity)
+        w, lo = self.width, row.index * self.width
+        cells = {name: array(code, [default]) * w for name, (code, default) in _ARRAYS.items()}
+        present = cells['present']
+        for field in COLUMNS:
+            values = market.get(field)
+            if not isinstance(values, Mapping):
+                continue
+            out = cells[field]
+            for commodity, value in values.items():
+                col = self._col.get(commodity)
+                if col is None:
+                    row.extra.setdefault(field, {})[commodity] = value
+                    continue
+                out[col] = _coerce(field, value)
+                if field in _LISTED:
+                    present[col] = 1
+        for name, values in cells.items():
+            self._a[name][lo:lo + w] = values
+        self._derive_row(row)
+        self._bulk_change()
+
+    def _derive_row(self, row: _Row):
+        population_factor, resource_factor = _row_factors(row.meta)
+        demand_baseline = 50 + int(population_factor * 25)
+        supply_baseline = 60 + int(resource_factor * 40)
+        w = self.width
+        lo = row.index * w
+        a = self._a
+        a['target'][lo:lo + w] = array('q', [demand_baseline + c * 2 for c in a['consumption'][lo:lo + w]])
+        a['floor'][lo:lo + w] = array('q', [max(10, int((supply_baseline + p * 2) * 0.2))
+                                            for p in a['production'][lo:lo + w]])
+
+    def _derive_cell(self, row: _Row, col: int):
+        population_factor, resource_factor = _row_factors(row.meta)
+        i = row.index * self.width + col
+        a = self._a
+        a['target'][i] = 50 + int(population_factor * 25) + a['consumption'][i] * 2
+        a['floor'][i] = max(10, int((60 + int(resource_factor * 40) + a['production'][i] * 2) * 0.2))
+
+    # ------------------------------------------------------------------
+    # Cell access (used by the views)
+    # ------------------------------------------------------------------
+
+    def _cell(self, row: _Row, commodity: str) -> Optional[int]:
+        if row.index is None:
+            raise KeyError(commodity)
+        col = self._col.get(commodity)
+        return None if col is None else row.index * self.width + col
+
+    def _get(self, field: str, row: _Row, commodity: str):
+        i = self._cell(row, commodity)
+        if i is None:
+            try:
+                return row.extra[field][commodity]
+            except KeyError:
+                raise KeyError(commodity) from None
+        if field in _LISTED:
+            if not self._a['present'][i]:
+                raise KeyError(commodity)
+        elif self._a[field][i] == _DEFAULTS[field]:
+            raise KeyError(commodity)
+        return self._a[field][i]
+
+    def _set(self, field: str, row: _Row, commodity: str, value):
+        i = self._cell(row, commodity)
+        if i is None:
+            if field not in _LISTED:
+                row.extra.setdefault(field, {})[commodity] = value
+                return
+            self._add_commodity(commodity)
+            i = self._cell(row, commodity)
+        a = self._a
+        a[field][i] = _coerce(field, value)
+        if field in _LISTED:
+            a['present'][i] = 1
+            self._touched.add(i)
+        elif field != 'price_shocks':
+            self._derive_cell(row, i - row.index * self.width)
+
+    def _del(self, field: str, row: _Row, commodity: str):
+        self._get(field, row, commodity)          # KeyError if absent
+        i = self._cell(row, commodity)
+        if i is None:
+            del row.extra[field][commodity]
+        elif field in _LISTED:
+            self._a['present'][i] = 0
+            self._touched.add(i)
+        else:
+            self._a[field][i] = _DEFAULTS[field]
+            if field != 'price_shocks':
+                self._derive_cell(row, i - row.index * self.width)
+
+    def _keys(self, field: str, row: _Row) -> List[str]:
+        if row.index is None:
+            return []
+        w = self.width
+        lo = row.index * w
+        if field in _LISTED:
+            return list(compress(self.commodities, self._a['present'][lo:lo + w]))
+        default = _DEFAULTS[field]
+        keys = list(compress(self.commodities, map(default.__ne__, self._a[field][lo:lo + w])))
+        keys.extend(row.extra.get(field, ()))
+        return keys
+
+    # ------------------------------------------------------------------
+    # Whole-economy tick
+    # ------------------------------------------------------------------
+
+    def tick(self, base_prices: Mapping[str, int], names: Optional[Iterable[str]] = None,
+             rng=None):
+        """
+        Advance markets by one tick: every market, or just those in `names`.
+
+        Per good, in order: shocks decay toward 1.0; production adds supply;
+        consumption draws it down (a shortfall raises demand); demand reverts
+        8% toward its target; low supply restocks; ~10% of goods take a
+        random jolt; the price is recomputed.  rng supplies the randomness
+        (the random module by default).
+        """
+        rng = rng if rng is not None else random
+        if names is None:
+            spans = [(0, len(self._order))]
+        else:
+            spans = [(self._rows[n].index, self._rows[n].index + 1) for n in names if n in self._rows]
+        base = [int(base_prices.get(c, 5)) for c in self.commodities]
+        kernel = self._tick_numpy if np is not None else self._tick_python
+        for r0, r1 in spans:
+            if r1 <= r0:
+                continue
+            if self.width:
+                kernel(r0, r1, base, rng)
+            for row in self._order[r0:r1]:
+                try:
+                    row.meta['last_updated'] = int(row.meta.get('last_updated', 0)) + 1
+                except (TypeError, ValueError):
+                    row.meta['last_updated'] = 1
+        self._bulk_change()
+
+    def _restock_bonus(self, r0: int, r1: int) -> List[int]:
+        return [int(_row_factors(row.meta)[1] * 3) for row in self._order[r0:r1]]
+
+    def _tick_python(self, r0: int, r1: int, base: List[int], rng):
+        w = self.width
+        lo, hi = r0 * w, r1 * w
+        a = self._a
+        S, D, P, K = a['supply'], a['demand'], a['prices'], a['price_shocks']
+        production, consumption, present = a['production'], a['consumption'], a['present']
+        rnd = rng.random
+        cells = range(lo, hi)
+
+        for i in compress(cells, map((1.0).__ne__, K[lo:hi])):
+            shock = 1.0 + (K[i] - 1.0) * SHOCK_RETAIN
+            K[i] = 1.0 if abs(shock - 1.0) < 0.02 else shock
+
+        for i in compress(cells, map(operator.mul, present[lo:hi], production[lo:hi])):
+            S[i] += int(production[i] * (0.8 + 0.4 * rnd()))
+        # Whole-span passes: trading hubs consume every good they list
+        rates = list(map(operator.mul, present[lo:hi], consumption[lo:hi]))
+        if any(rates):
+            supply = S[lo:hi]
+            consumed = [min(s, int(r * (0.8 + 0.4 * rnd()))) if r else 0 for s, r in zip(supply, rates)]
+            S[lo:hi] = array('q', map(operator.sub, supply, consumed))
+            D[lo:hi] = array('q', [d + int((r - c) * 0.75) if c < r else d
+                                   for d, r, c in zip(D[lo:hi], rates, consumed)])
+
+        # int(d + (target - d) * 0.08), in integer arithmetic, floored at 10.
+        # int() truncates the whole (positive) sum, not the step, so the step
+        # is floored - for demand above target too - hence // rather than a
+        # truncating division.
+        D[lo:hi] = array('q', [v if (v := d + (t - d) * 2 // 25) > 10 else 10
+                               for d, t in zip(D[lo:hi], a['target'][lo:hi])])
+
+        floor = a['floor']
+        for start, bonus in zip(range(lo, hi, w), self._restock_bonus(r0, r1)):
+            end = start + w
+            S[start:end] = array('q', [s + int(rnd() * 11) + bonus if s < f and p else s
+                                       for s, f, p in zip(S[start:end], floor[start:end], present[start:end])])
+
+        for i, us, ud in zip(*_jolts(lo, hi, present, rnd)):
+            s = S[i] + int(us * 41) - 20
+            S[i] = s if s > 0 else 0
+            d = D[i] + int(ud * 31) - 15
+            D[i] = d if d > 10 else 10
+
+        # cell_price(), inlined
+        low_m, high_m = PRICE_MULTIPLIER_MIN, PRICE_MULTIPLIER_MAX
+        P[lo:hi] = array('q', [
+            p if (p := int(b * (low_m if (m := 0.5 + (d / (s if s > 1 else 1)) * 0.5) < low_m
+                                else high_m if m > high_m else m) * k)) > 1 else 1
+            for b, s, d, k in zip(base * (r1 - r0), S[lo:hi], D[lo:hi], K[lo:hi])
+        ])
+
+    def _tick_numpy(self, r0: int, r1: int, base: List[int], rng):
+        """_tick_python() as whole-array NumPy operations, same draws."""
+        w = self.width
+        lo, hi = r0 * w, r1 * w
+        a = self._a
+        rnd = rng.random
+
+        def view(name, dtype=np.int64):
+            return np.frombuffer(a[name], dtype=dtype)[lo:hi]
+
+        def draws(n):
+            return np.array([rnd() for _ in range(n)], dtype=np.float64)
+
+        S, D, P = view('supply'), view('demand'), view('prices')
+        K = view('price_shocks', np.float64)
+        listed = view('present', np.int8) != 0
+
+        shocked = K != 1.0
+        if shocked.any():
+            shock = 1.0 + (K[shocked] - 1.0) * SHOCK_RETAIN
+            shock[np.abs(shock - 1.0) < 0.02] = 1.0
+            K[shocked] = shock
+
+        mask = listed & (view('production') != 0)
+        n = int(mask.sum())
+        if n:
+            S[mask] += (view('production')[mask] * (0.8 + 0.4 * draws(n))).astype(np.int64)
+        mask = listed & (view('consumption') != 0)
+        n = int(mask.sum())
+        if n:
+            rate = view('consumption')[mask]
+            consumed = np.minimum(S[mask], (rate * (0.8 + 0.4 * draws(n))).astype(np.int64))
+            S[mask] -= consumed
+            D[mask] += np.where(consumed < rate, ((rate - consumed) * 0.75).astype(np.int64), 0)
+
+        np.maximum(D + (view('target') - D) * 2 // 25, 10, out=D)
+
+        mask = listed & (S < view('floor'))
+        n = int(mask.sum())
+        if n:
+            bonus = np.repeat(np.array(self._restock_bonus(r0, r1), dtype=np.int64), w)
+            S[mask] += (draws(n) * 11).astype(np.int64) + bonus[mask]
+
+        cells, supply_draws, demand_draws = _jolts(lo, hi, a['present'], rnd)
+        if cells:
+            cells = np.array(cells, dtype=np.int64) - lo
+            steps = (np.array(supply_draws) * 41).astype(np.int64) - 20
+            S[cells] = np.maximum(S[cells] + steps, 0)
+            steps = (np.array(demand_draws) * 31).astype(np.int64) - 15
+            D[cells] = np.maximum(D[cells] + steps, 10)
+
+        ratio = D / np.maximum(S, 1)
+        multiplier = np.clip(0.5 + (ratio * 0.5), PRICE_MULTIPLIER_MIN, PRICE_MULTIPLIER_MAX)
+        bases = np.tile(np.array(base, dtype=np.float64), r1 - r0)
+        P[:] = np.maximum((bases * multiplier * K).astype(np.int64), 1)
+
+    # ------------------------------------------------------------------
+    # Economy-wide events
+    # ------------------------------------------------------------------
+
+    def scale(self, field: str, commodities: Iterable[str], multiplier: float,
+              base_prices: Mapping[str, int]):
+        """
+        Multiply `field` ('supply' or 'price_shocks') of the given goods in
+        every market that lists them, then reprice those goods.
+        """
+        cols = sorted({self._col[c] for c in commodities if c in self._col})
+        if not cols or not self._order:
+            return
+        w = self.width
+        a = self._a
+        self._bulk_change()
+        S, D, K, P, present = a['supply'], a['demand'], a['price_shocks'], a['prices'], a['present']
+        bases = [(c, int(base_prices.get(self.commodities[c], 5))) for c in cols]
+        for r in range(len(self._order)):
+            lo = r * w
+            for c, base in bases:
+                i = lo + c
+                if not present[i]:
+                    continue
+                if field == 'supply':
+                    S[i] = max(0, int(S[i] * multiplier))
+                else:
+                    K[i] = max(SHOCK_MIN, min(SHOCK_MAX, K[i] * multiplier))
+                P[i] = cell_price(base, S[i], D[i], K[i])
+
+
+# ---------------------------------------------------------------------------
+# Views
+# ---------------------------------------------------------------------------
+
+class MarketView(MutableMapping):
+    """One market, dict-shaped: its own fields plus per-commodity views."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: MarketTable, row: _Row):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, key: str):
+        if key in COLUMNS:
+            return CommodityView(self._table, self._row, key)
+        return self._row.meta[key]
+
+    def __setitem__(self, key: str, value):
+        if key in COLUMNS:
+            values = dict(value)
+            for commodity in self._table._keys(key, self._row):
+                self._table._del(key, self._row, commodity)
+            for commodity, v in values.items():
+                self._table._set(key, self._row, commodity, v)
+            return
+        self._row.meta[key] = value
+        if key in ('population', 'resources') and self._row.index is not None:
+            self._table._derive_row(self._row)
+
+    def __delitem__(self, key: str):
+        if key in COLUMNS:
+            self[key] = {}
+            return
+        del self._row.meta[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._row.meta)
+        yield from COLUMNS
+
+    def __len__(self) -> int:
+        return len(self._row.meta) + len(COLUMNS)
+
+    def __repr__(self) -> str:
+        return f"<MarketView {self._row.name!r}>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        market = dict(self._row.meta)
+        for field in COLUMNS:
+            market[field] = dict(self[field].items())
+        return market
+
+
+class CommodityView(MutableMapping):
+    """One per-commodity field of one market (e.g. market['supply'])."""
+
+    __slots__ = ("_table", "_row", "_field")
+
+    def __init__(self, table: MarketTable, row: _Row, field: str):
+        self._table = table
+        self._row = row
+        self._field = field
+
+    def __getitem__(self, commodity: str):
+        return self._table._get(self._field, self._row, commodity)
+
+    def __setitem__(self, commodity: str, value):
+        self._table._set(self._field, self._row, commodity, value)
+
+    def __delitem__(self, commodity: str):
+        self._table._del(self._field, self._row, commodity)
+
+    def __contains__(self, commodity) -> bool:
+        try:
+            self._table._get(self._field, self._row, commodity)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table._keys(self._field, self._row))
+
+    def __len__(self) -> int:
+        return len(self._table._keys(self._field, self._row))
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def copy(self) -> dict:
+        """Plain-dict snapshot."""
+        return dict(self.items())
@@ -3,16 +3,21 @@ Space Navigation and Galaxy Map System
 
 SYSTEM GENERATION:
 - Loads 10 predefined star systems from systems.py with rich lore, history, and faction control
-- Generates additional procedural systems to fill galaxy to 80-120 total systems
+- Generates additional procedural systems to fill the galaxy (300 by default, see
+  Galaxy(num_systems=...)), placed layer by layer with grid-hash spacing checks
 - Predefined systems include: Alpha Centauri, Vega Prime, Rigel Station, Betelgeuse Sector,
   Sirius Gate, Tau Ceti, Kepler-442b, Ross 128, Proxima b, and TRAPPIST-1
 - Each predefined system has detailed planets, resources, history, trade routes, and special features
 - Faction zones are built around predefined systems, then expanded with additional zones
 """
 
+import copy
 import random
 import math
 from systems import system_registry, SYSTEM_TYPES, FACTION_ZONES
+from spatial_index import SpatialIndex
+from faction_control import FactionControlIndex
+from seeding import new_world_seed, derive_rng
 
 
 # ---------------------------------------------------------------------------
@@ -56,6 +61,60 @@ GALAXY_LAYERS = {
 INTERLAYER_FUEL_COST = 15
 
 
+# ---------------------------------------------------------------------------
+# Procedural generation tables
+# ---------------------------------------------------------------------------
+
+#: Procedural systems generated when Galaxy() is not given num_systems.
+DEFAULT_PROCEDURAL_SYSTEMS = 300
+
+#: Minimum distance between procedurally placed systems (galaxy units).
+MIN_SYSTEM_SPACING = 15
+
+#: Candidate positions tried per system before spacing is given up on.
+PLACEMENT_ATTEMPTS = 50
+
+# The 27 cells around (and including) a grid-hash cell.
+_NEIGHBOUR_CELLS = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)]
+
+PROCEDURAL_SYSTEM_TYPES = [
+    "Core World", "Frontier", "Industrial", "Military",
+    "Research", "Trading Hub", "Mining", "Agricultural",
+]
+
+#: System types drawn instead when a system falls in a faction's zone.
+FACTION_FOCUS_SYSTEM_TYPES = {
+    'Trade':       ["Trading Hub", "Core World", "Industrial"],
+    'Research':    ["Research", "Core World", "Frontier"],
+    'Technology':  ["Industrial", "Research", "Core World"],
+    'Industry':    ["Industrial", "Mining", "Core World"],
+    'Exploration': ["Frontier", "Research", "Trading Hub"],
+    'Mysticism':   ["Research", "Frontier", "Core World"],
+    'Cultural':    ["Core World", "Trading Hub", "Agricultural"],
+}
+
+PLANET_TYPES = [
+    "Terrestrial Planet", "Gas Giant", "Ice Giant", "Lava World",
+    "Ocean World", "Desert Planet", "Jungle World", "Frozen World",
+    "Toxic Planet", "Crystal World", "Garden World", "Barren Rock"
+]
+
+HABITABLE_PLANET_TYPES = frozenset(["Garden World", "Terrestrial Planet", "Ocean World", "Jungle World"])
+
+SYSTEM_DESCRIPTIONS = [
+    "A bustling hub of interstellar commerce and trade.",
+    "Ancient ruins dot the surfaces of several planets here.",
+    "Rich asteroid fields provide abundant mining opportunities.", 
+    "Home to advanced research facilities and universities.",
+    "A heavily fortified military stronghold guards this sector.",
+    "Lush agricultural worlds supply food across the galaxy.",
+    "Mysterious energy readings emanate from this system.",
+    "Pirates and smugglers are known to frequent this area.",
+    "A peaceful system with beautiful nebula formations.",
+    "Industrial megafactories operate around the clock here."
+]
+
+
 def get_layer(z: float) -> int:
     """Return layer index (1–5) for a given Z coordinate.
 
@@ -68,23 +127,13 @@ def get_layer(z: float) -> int:
     return 3
 
 
-def calculate_fuel_consumption(ship, distance, target_coords=None, game=None):
-    """
-    Calculate fuel consumption for a jump based on distance, engine efficiency,
-    crew efficiency, engine type, and environmental factors.
-    
-    Args:
-        ship: Ship object with components and attributes
-        distance: Distance to travel in units
-        target_coords: Target coordinates (for future ether energy system)
-        game: Game object (for future ether energy system)
-    
-    Returns:
-        int: Fuel units needed for the jump
+def ship_fuel_multipliers(ship):
+    """Return the ship-dependent fuel multipliers
+    (efficiency_multiplier, crew_multiplier, output_multiplier).
+
+    They depend only on the ship's attribute profile, so bulk callers compute
+    them once and reuse them for every target.
     """
-    # Base fuel consumption: 2 fuel per unit distance
-    base_fuel = distance * 2.0
-    
     # Get engine efficiency from ship attributes
     engine_efficiency = 30.0  # Default baseline
     engine_output = 30.0  # Default baseline
@@ -122,61 +171,81 @@ def calculate_fuel_consumption(ship, distance, target_coords=None, game=None):
     elif engine_output < 10:
         output_multiplier = 0.9  # Low output = 10% fuel bonus
     
+    return efficiency_multiplier, crew_multiplier, output_multiplier
+
+
+def calculate_fuel_consumption(ship, distance, target_coords=None, game=None, source_coords=None,
+                               ether_coefficient=None, dangerous=None, multipliers=None):
+    """
+    Calculate fuel consumption for a jump based on distance, engine efficiency,
+    crew efficiency, engine type, and environmental factors.
+    
+    Args:
+        ship: Ship object with components and attributes
+        distance: Distance to travel in units
+        target_coords: Target coordinates (for future ether energy system)
+        game: Game object (for future ether energy system)
+        source_coords: Where the jump starts.  Defaults to the ship's current
+            coordinates; the route planner passes intermediate hops here so
+            every leg of a multi-jump route is priced with the same formula.
+        ether_coefficient: Pre-computed mean path friction.  preview_jumps()
+            looks frictions up for all its targets in one pass and passes
+            each in here; normally left as None.
+        dangerous: Pre-computed danger flag for target_coords, passed by
+            preview_jumps() for the same reason; normally left as None.
+        multipliers: Pre-computed ship_fuel_multipliers(ship); bulk callers
+            (preview_jumps(), the route planner) compute them once.
+    
+    Returns:
+        int: Fuel units needed for the jump
+    """
+    # Base fuel consumption: 2 fuel per unit distance
+    base_fuel = distance * 2.0
+    
+    if multipliers is None:
+        multipliers = ship_fuel_multipliers(ship)
+    efficiency_multiplier, crew_multiplier, output_multiplier = multipliers
+    
     # Apply all multipliers
     fuel_needed = base_fuel * efficiency_multiplier * crew_multiplier * output_multiplier
     
+    if source_coords is None:
+        source_coords = getattr(ship, 'coordinates', None)
+
     # Ether energy coefficient (friction)
     # Acts as a coefficient/drag factor based on etheric conditions at location
     # Higher drag zones require more fuel to traverse
-    ether_coefficient = 1.0  # Default neutral
-    if target_coords and hasattr(ship, 'coordinates'):
-        # Try to get ether energy from galaxy
-        try:
-            # Get galaxy from ship's context if available
-            galaxy = None
-            if game and hasattr(game, 'navigation') and hasattr(game.navigation, 'galaxy'):
-                galaxy = game.navigation.galaxy
-            
-            if galaxy and hasattr(galaxy, 'ether_energy') and galaxy.ether_energy:
-                # Calculate average friction along the path for more accurate fuel calculation
-                start_coords = ship.coordinates
-                end_coords = target_coords
+    if ether_coefficient is None:
+        ether_coefficient = 1.0  # Default neutral
+        if target_coords and source_coords:
+            try:
+                # Get galaxy from ship's context if available
+                galaxy = None
+                if game and hasattr(game, 'navigation') and hasattr(game.navigation, 'galaxy'):
+                    galaxy = game.navigation.galaxy
                 
-                # Sample points along the path (start, middle, end)
-                samples = [
-                    start_coords,
-                    (
-                        (start_coords[0] + end_coords[0]) // 2,
-                        (start_coords[1] + end_coords[1]) // 2,
-                        (start_coords[2] + end_coords[2]) // 2,
-                    ),
-                    end_coords
-                ]
-                
-                # Get friction at each sample point and average
-                frictions = []
-                for sample_coords in samples:
-                    friction = galaxy.ether_energy.get_friction_at(
-                        sample_coords[0], sample_coords[1], sample_coords[2]
+                if galaxy and hasattr(galaxy, 'ether_energy') and galaxy.ether_energy:
+                    # Mean friction along the whole path (line integral over
+                    # the precomputed friction field), not just a few points.
+                    ether_coefficient = float(
+                        galaxy.ether_energy.get_path_friction(source_coords, target_coords)
                     )
-                    frictions.append(friction)
-                
-                if frictions:
-                    ether_coefficient = sum(frictions) / len(frictions)
-        except Exception:
-            pass  # Fallback to neutral if any error
+            except Exception:
+                pass  # Fallback to neutral if any error
     
     fuel_needed *= ether_coefficient
     
     # Check for dangerous regions (existing system)
-    if game and hasattr(game, 'event_system'):
-        if game.event_system.is_location_dangerous(target_coords):
-            fuel_needed *= 1.5  # 50% fuel penalty in dangerous regions
+    if dangerous is None:
+        dangerous = bool(game and hasattr(game, 'event_system')
+                         and game.event_system.is_location_dangerous(target_coords))
+    if dangerous:
+        fuel_needed *= 1.5  # 50% fuel penalty in dangerous regions
 
     # Interlayer surcharge — flat cost per layer boundary crossed.
     # Applies whenever source and destination sit in different galactic strata.
-    if target_coords and hasattr(ship, 'coordinates'):
-        src_layer = get_layer(ship.coordinates[2])
+    if target_coords and source_coords:
+        src_layer = get_layer(source_coords[2])
         dst_layer = get_layer(target_coords[2])
         layers_crossed = abs(dst_layer - src_layer)
         if layers_crossed > 0:
@@ -185,20 +254,88 @@ def calculate_fuel_consumption(ship, distance, target_coords=None, game=None):
     # Round to nearest integer
     return max(1, int(round(fuel_needed)))
 
+
+def preview_jumps(ship, targets, game=None, source_coords=None, multipliers=None):
+    """
+    Price jumps from one origin to many targets in a single pass — e.g. every
+    system in jump range for a range/fuel overlay.
+
+    Path frictions are looked up in one batch against the ether field and
+    danger flags in one batch against the event system; each target is then
+    priced by calculate_fuel_consumption() itself, so previews always match
+    what a real jump charges.  The ship multipliers are computed once per
+    call unless the caller passes its own.
+
+    Returns a list of dicts in the order the targets were given:
+        {'target', 'distance', 'fuel', 'friction', 'dangerous', 'layers_crossed'}
+    """
+    if source_coords is None:
+        source_coords = getattr(ship, 'coordinates', None)
+    targets = [tuple(t) for t in targets]
+
+    frictions = [1.0] * len(targets)
+    try:
+        ether = game.navigation.galaxy.ether_energy if game else None
+        if ether and source_coords:
+            batch = [float(f) for f in ether.get_path_frictions(source_coords, targets)]
+            if len(batch) == len(targets):
+                frictions = batch
+    except Exception:
+        pass  # Neutral friction if the field is unavailable
+
+    dangers = _danger_flags(getattr(game, 'event_system', None) if game else None, targets)
+    if multipliers is None:
+        multipliers = ship_fuel_multipliers(ship)
+    src_layer = get_layer(source_coords[2])
+
+    results = []
+    for target, friction, dangerous in zip(targets, frictions, dangers):
+        distance = math.dist(source_coords, target)
+        fuel = calculate_fuel_consumption(ship, distance, target, game, source_coords,
+                                          ether_coefficient=friction, dangerous=dangerous,
+                                          multipliers=multipliers)
+        results.append({
+            'target': target,
+            'distance': distance,
+            'fuel': fuel,
+            'friction': friction,
+            'dangerous': dangerous,
+            'layers_crossed': abs(get_layer(target[2]) - src_layer),
+        })
+    return results
+
+
+def _danger_flags(event_system, targets):
+    """Danger flag per target: one batch query when the event system offers
+    it, otherwise is_location_dangerous() per target."""
+    if not event_system:
+        return [False] * len(targets)
+    flags = None
+    batch = getattr(event_system, 'are_locations_dangerous', None)
+    if batch is not None:
+        try:
+            flags = [bool(f) for f in batch(targets)]
+        except Exception:
+            flags = None
+    if flags is None or len(flags) != len(targets):
+        flags = [bool(event_system.is_location_dangerous(t)) for t in targets]
+    return flags
+
+
 class NPCShip:
     """NPC ship that moves around the galaxy"""
-    def __init__(self, name, ship_class, start_coords, galaxy):
+    def __init__(self, name, ship_class, start_coords, galaxy, rng=random):
         self.name = name
         self.ship_class = ship_class
         self.coordinates = start_coords
         self.destination = None
         self.galaxy = galaxy
-        self.personality = random.choice(["Friendly", "Cautious", "Greedy", "Chatty", "Mysterious", "Suspicious"])
-        self.trade_goods = self._generate_trade_goods()
-        self.credits = random.randint(5000, 50000)
+        self.personality = rng.choice(["Friendly", "Cautious", "Greedy", "Chatty", "Mysterious", "Suspicious"])
+        self.trade_goods = self._generate_trade_goods(rng)
+        self.credits = rng.randint(5000, 50000)
         self.rumors = []
         
-    def _generate_trade_goods(self):
+    def _generate_trade_goods(self, rng=random):
         """Generate random trade goods for this NPC"""
         from goods import commodities
         goods = {}
@@ -212,20 +349,20 @@ class NPCShip:
             return goods
         
         # NPC has 2-5 different commodity types
-        num_types = random.randint(2, 5)
-        available = random.sample(all_items, min(num_types, len(all_items)))
+        num_types = rng.randint(2, 5)
+        available = rng.sample(all_items, min(num_types, len(all_items)))
         for commodity in available:
-            quantity = random.randint(5, 30)
+            quantity = rng.randint(5, 30)
             goods[commodity['name']] = quantity
         return goods
     
-    def move(self):
+    def move(self, rng=random):
         """Move NPC ship towards destination or pick new one"""
         if not self.destination:
             # Pick a random system as destination
             systems = list(self.galaxy.systems.values())
             if systems:
-                target_system = random.choice(systems)
+                target_system = rng.choice(systems)
                 self.destination = target_system['coordinates']
         
         if self.destination:
@@ -234,7 +371,7 @@ class NPCShip:
             tx, ty, tz = self.destination
             
             # Simple movement - move 1-3 units per step in each direction
-            step_size = random.randint(1, 3)
+            step_size = rng.randint(1, 3)
             dx = max(-step_size, min(step_size, tx - x))
             dy = max(-step_size, min(step_size, ty - y))
             dz = max(-step_size, min(step_size, tz - z))
@@ -245,8 +382,8 @@ class NPCShip:
             if self.coordinates == self.destination:
                 self.destination = None  # Pick new destination next move
     
-    def get_greeting(self):
-        """Get a greeting based on personality"""
+    def get_greeting(self, rng=random):
+        """Get a greeting based on personality (pass NavigationSystem._npc_rng() to replay)"""
         greetings = {
             "Friendly": [
                 "Greetings, fellow traveler! Safe journeys to you!",
@@ -280,10 +417,10 @@ class NPCShip:
             ]
         }
         
-        return random.choice(greetings.get(self.personality, ["Greetings."]))
+        return rng.choice(greetings.get(self.personality, ["Greetings."]))
     
-    def generate_rumor(self):
-        """Generate a random rumor or news"""
+    def generate_rumor(self, rng=random):
+        """Generate a random rumor or news (pass NavigationSystem._npc_rng() to replay)"""
         rumor_types = [
             # Location rumors
             "I heard there's a mineral-rich asteroid field near {} - might be worth checking out.",
@@ -307,7 +444,7 @@ class NPCShip:
         
         from goods import commodities
         
-        rumor_template = random.choice(rumor_types)
+        rumor_template = rng.choice(rumor_types)
         
         # Fill in placeholders
         if '{}' in rumor_template:
@@ -316,7 +453,7 @@ class NPCShip:
                 # System name
                 systems = list(self.galaxy.systems.values())
                 if systems:
-                    system = random.choice(systems)
+                    system = rng.choice(systems)
                     rumor = rumor_template.format(system['name'])
                 else:
                     rumor = rumor_template.replace(' near {}', '')
@@ -327,7 +464,7 @@ class NPCShip:
                     all_items.extend(items)
                 
                 if all_items:
-                    commodity = random.choice(all_items)
+                    commodity = rng.choice(all_items)
                     rumor = rumor_template.format(commodity['name'])
                 else:
                     rumor = rumor_template.replace(' {}', ' rare goods')
@@ -338,12 +475,40 @@ class NPCShip:
 
 
 class Galaxy:
-    def __init__(self):
+    # System fields that change during play.  Everything else about a system
+    # is a pure function of the galaxy seed, so saves store only these.
+    MUTABLE_SYSTEM_FIELDS = ("visited", "threat_level", "controlling_faction")
+
+    def __init__(self, seed=None, num_systems=None):
+        # Every generator below draws from a stream derived from this seed, so
+        # Galaxy(seed) always produces the same systems in the same order.
+        self.seed = seed if seed is not None else new_world_seed()
+        self.num_systems = DEFAULT_PROCEDURAL_SYSTEMS if num_systems is None else int(num_systems)
+        self.rng = derive_rng(self.seed, "galaxy.systems")
+        self.body_rng = derive_rng(self.seed, "galaxy.bodies")
         self.size_x = 500  # Galaxy width - substantially increased
         self.size_y = 500  # Galaxy height - substantially increased
         self.size_z = 200  # Galaxy depth - substantially increased
         self.systems = {}
         self.faction_zones = {}  # {faction_name: [(center_x, center_y, center_z), radius]}
+        # Voxel ownership map over faction_zones; keep the two in step via
+        # set_faction_zone().
+        self.faction_control = FactionControlIndex()
+
+        # Voxel grid over system coordinates.  Keep it in step with self.systems
+        # by going through add_system()/remove_system(); every proximity query
+        # below goes through it instead of scanning the whole systems dict.
+        self.spatial_index = SpatialIndex()
+        # Bumped whenever the set of systems changes so derived caches (jump
+        # graph adjacency, the spatial and hex indexes, etc.) know to rebuild.
+        # Code that edits self.systems directly must bump it as well.
+        self.systems_version = 0
+        self._spatial_index_version = 0
+        # Coordinates of systems flagged 'visited'.  mark_visited() keeps it in
+        # step so visited_count() needn't scan every system.
+        self.visited_systems = set()
+        self._route_planner = None
+        self._hex_index = None
         
         # Initialize ether energy system
         try:
@@ -360,11 +525,19 @@ class Galaxy:
         
         # Generate additional procedural systems to fill the galaxy
         self.generate_procedural_systems()
+
+        # Snapshot of the mutable fields as generated; get_system_delta()
+        # diffs against this so a save only records what play has changed.
+        self._baseline = self._snapshot_mutable_fields()
+        self._recount_visited()
     
     def load_predefined_systems(self):
         """Load all predefined systems from systems.py"""
         predefined = system_registry.get_all_systems()
-        self.systems.update(predefined)
+        for coords, system in predefined.items():
+            # Copy: the registry is module-global, so without this every Galaxy
+            # in the process would share (and mutate) the same system dicts.
+            self.add_system(coords, copy.deepcopy(system))
         print(f"Loaded {len(predefined)} predefined star systems")
     
     def generate_faction_zones(self):
@@ -378,12 +551,28 @@ class Galaxy:
                 if system.get('controlling_faction') == faction_name:
                     faction_systems.append(coords)
             
-            self.faction_zones[faction_name] = {
-                'center': zone_data['center'],
-                'radius': zone_data['radius'],
-                'systems': faction_systems,
-                'description': zone_data.get('description', '')
+            self.set_faction_zone(faction_name, zone_data['center'], zone_data['radius'],
+                                  zone_data.get('description', ''), faction_systems)
+
+    def set_faction_zone(self, faction_name, center, radius, description=None, systems=None):
+        """Add a faction zone or move/resize an existing one.
+
+        Only the voxels the zone touches (before and after) are recomputed.
+        Existing systems keep their recorded controlling_faction.
+        """
+        zone = self.faction_zones.get(faction_name)
+        if zone is None:
+            zone = self.faction_zones[faction_name] = {
+                'center': center, 'radius': radius, 'systems': [], 'description': ''
             }
+        zone['center'] = center
+        zone['radius'] = radius
+        if description is not None:
+            zone['description'] = description
+        if systems is not None:
+            zone['systems'] = systems
+        self.faction_control.set_zone(faction_name, center, radius)
+
     
     def get_faction_for_location(self, x, y, z):
         """Get the controlling faction for a given location, if any"""
@@ -395,31 +584,20 @@ class Galaxy:
             if controlling_faction is not None:
                 return controlling_faction
         
-        # Check faction zones by radius - find the closest zone if multiple overlap
-        closest_faction = None
-        closest_distance = float('inf')
-        
-        for faction_name, zone_data in self.faction_zones.items():
-            center = zone_data['center']
-            radius = zone_data['radius']
-            
-            # Calculate distance from zone center
-            distance = ((x - center[0])**2 + (y - center[1])**2 + (z - center[2])**2) ** 0.5
-            
-            if distance <= radius and distance < closest_distance:
-                closest_faction = faction_name
-                closest_distance = distance
-        
-        return closest_faction  # Returns None if no zones contain this location
+        # Otherwise the zone with the closest center among those containing
+        # this location (voxel lookup); None if no zones contain it
+        return self.faction_control.zone_owner(x, y, z)
     
-    def generate_procedural_systems(self):
+    def generate_procedural_systems(self, num_systems=None):
         """Generate additional procedural systems to fill the galaxy (supplements predefined systems)"""
         from space_stations import space_stations
         
         # Calculate how many systems we already have
         existing_count = len(self.systems)
-        # Generate 300 additional procedural systems scattered across the galaxy
-        num_to_generate = 300
+        # Generate procedural systems scattered across the galaxy (300 by default)
+        if num_systems is None:
+            num_systems = self.num_systems
+        num_to_generate = max(0, int(num_systems))
         
         print(f"Generating {num_to_generate} additional procedural systems...")
         
@@ -500,97 +678,65 @@ class Galaxy:
         ]
         
         # Remove names already used by predefined systems
-        for system in self.systems.values():
-            if system['name'] in system_names:
-                system_names.remove(system['name'])
+        used_names = {system['name'] for system in self.systems.values()}
+        system_names = [n for n in system_names if n not in used_names]
         
+        rng = self.rng
+
         # Available space stations
         available_stations = list(space_stations.keys())
-        random.shuffle(available_stations)
-        
-        for i in range(num_to_generate):
-            # Generate unique name
-            if system_names:
-                name = random.choice(system_names)
-                system_names.remove(name)  # Avoid duplicates
-            else:
-                name = f"System-{existing_count + i + 1}"  # Fallback if we run out of names
-            
-            # Random coordinates within galaxy bounds, avoiding predefined system locations.
-            # Z is chosen by first picking a layer weighted by its system_density, then
-            # placing the star inside that layer's Z range.  This gives layer 3 the most
-            # systems and layers 1/5 the fewest, creating the intended strategic topology.
-            _layer_weights = [GALAXY_LAYERS[i]["system_density"] for i in range(1, 6)]
-            _chosen_layer  = random.choices(range(1, 6), weights=_layer_weights)[0]
-            _ldata         = GALAXY_LAYERS[_chosen_layer]
-
-            max_attempts = 50
-            for attempt in range(max_attempts):
-                x = random.randint(10, self.size_x - 10)
-                y = random.randint(10, self.size_y - 10)
-                z = random.randint(_ldata["z_min"] + 2, _ldata["z_max"] - 2)
-                
-                # Check if too close to existing systems (minimum 15 units apart)
-                too_close = False
-                for existing_coords in self.systems.keys():
-                    distance = ((x - existing_coords[0])**2 + 
-                               (y - existing_coords[1])**2 + 
-                               (z - existing_coords[2])**2) ** 0.5
-                    if distance < 15:
-                        too_close = True
-                        break
-                
-                if not too_close:
-                    break
-            else:
-                # If we couldn't find a good spot, just use the last attempt
-                pass
-            
-            # Determine which faction controls this location
-            controlling_faction = self.get_faction_for_location(x, y, z)
-            
-            # Determine system type first
-            system_type = random.choice(["Core World", "Frontier", "Industrial", "Military", "Research", "Trading Hub", "Mining", "Agricultural"])
-            
-            # If in faction space, bias system type and stations based on faction focus
-            if controlling_faction:
-                from factions import factions
-                faction_data = factions.get(controlling_faction, {})
-                faction_focus = faction_data.get('primary_focus', '')
-                
-                # Bias system type based on faction focus
-                if faction_focus == 'Trade':
-                    system_type = random.choice(["Trading Hub", "Core World", "Industrial"])
-                elif faction_focus == 'Research':
-                    system_type = random.choice(["Research", "Core World", "Frontier"])
-                elif faction_focus == 'Technology':
-                    system_type = random.choice(["Industrial", "Research", "Core World"])
-                elif faction_focus == 'Industry':
-                    system_type = random.choice(["Industrial", "Mining", "Core World"])
-                elif faction_focus == 'Exploration':
-                    system_type = random.choice(["Frontier", "Research", "Trading Hub"])
-                elif faction_focus == 'Mysticism':
-                    system_type = random.choice(["Research", "Frontier", "Core World"])
-                elif faction_focus == 'Cultural':
-                    system_type = random.choice(["Core World", "Trading Hub", "Agricultural"])
-            
-            # Assign space stations to some systems
-            # Increase station count in faction space
-            if controlling_faction:
-                system_station_count = random.choices([1, 2, 3, 4], weights=[30, 35, 25, 10])[0]
-            else:
-                system_station_count = random.choices([0, 1, 2, 3], weights=[40, 35, 20, 5])[0]
-            
+        rng.shuffle(available_stations)
+
+        # Positions first, for the whole batch; every per-system attribute
+        # below is then drawn in bulk over the placed coordinates.
+        placed = self._place_procedural_coordinates(rng, num_to_generate)
+        count = len(placed)
+
+        # Unique names (fallback once the pool runs out)
+        rng.shuffle(system_names)
+        names = system_names[:count] + [
+            f"System-{existing_count + i + 1}" for i in range(len(system_names), count)
+        ]
+
+        # Determine which faction controls each location
+        controlling = [self.get_faction_for_location(x, y, z) for x, y, z in placed]
+
+        # Determine system types; in faction space, bias toward the faction's focus
+        from factions import factions
+        system_types = rng.choices(PROCEDURAL_SYSTEM_TYPES, k=count)
+        for i, faction_name in enumerate(controlling):
+            if faction_name:
+                focus = factions.get(faction_name, {}).get('primary_focus', '')
+                biased = FACTION_FOCUS_SYSTEM_TYPES.get(focus)
+                if biased:
+                    system_types[i] = rng.choice(biased)
+
+        # Station counts (more stations in faction space)
+        faction_station_counts = rng.choices([1, 2, 3, 4], weights=[30, 35, 25, 10], k=count)
+        open_station_counts = rng.choices([0, 1, 2, 3], weights=[40, 35, 20, 5], k=count)
+
+        populations = [rng.randint(100000, 50000000) for _ in range(count)]
+        threat_levels = [rng.randint(1, 10) for _ in range(count)]
+        resources = rng.choices(["Rich", "Moderate", "Poor", "Abundant", "Depleted"], k=count)
+        descriptions = rng.choices(SYSTEM_DESCRIPTIONS, k=count)
+
+        for i, coords in enumerate(placed):
+            controlling_faction = controlling[i]
+            system_type = system_types[i]
+
+            system_station_count = (faction_station_counts[i] if controlling_faction
+                                    else open_station_counts[i])
             system_stations = []
             for _ in range(system_station_count):
-                if available_stations:
-                    station_name = available_stations.pop()
-                    station_data = space_stations[station_name].copy()
-                    station_data['name'] = station_name
-                    # Mark station as faction-controlled
-                    if controlling_faction:
-                        station_data['controlling_faction'] = controlling_faction
-                    system_stations.append(station_data)
+                if not available_stations:
+                    break
+                station_name = available_stations.pop()
+                station_data = space_stations[station_name].copy()
+                station_data['name'] = station_name
+                # Mark station as faction-controlled
+                if controlling_faction:
+                    station_data['controlling_faction'] = controlling_faction
+                system_stations.append(station_data)
             
             # Generate celestial bodies for the system
             celestial_bodies = self.generate_celestial_bodies(system_type)
@@ -603,125 +749,340 @@ class Galaxy:
             
             # Generate system properties
             system = {
-                "name": name,
-                "coordinates": (x, y, z),
+                "name": names[i],
+                "coordinates": coords,
                 "type": system_type,
-                "population": random.randint(100000, 50000000),
-                "threat_level": random.randint(1, 10),
-                "resources": random.choice(["Rich", "Moderate", "Poor", "Abundant", "Depleted"]),
+                "population": populations[i],
+                "threat_level": threat_levels[i],
+                "resources": resources[i],
                 "stations": system_stations,  # Now holds actual station data
                 "celestial_bodies": celestial_bodies,  # Planets, moons, asteroids, etc.
                 "visited": False,
-                "description": self.generate_system_description(),
+                "description": descriptions[i],
                 "controlling_faction": controlling_faction  # NEW: Track faction control
             }
             
             # Add system to faction zone's system list
             if controlling_faction and controlling_faction in self.faction_zones:
-                self.faction_zones[controlling_faction]['systems'].append((x, y, z))
+                self.faction_zones[controlling_faction]['systems'].append(coords)
             
-            self.systems[(x, y, z)] = system
+            self.add_system(coords, system)
+
+        print(f"[Galaxy] Total systems after generation: {len(self.systems)} ({existing_count} predefined + {count} procedural)")
+
+    def _place_procedural_coordinates(self, rng, num_systems):
+        """Pick integer coordinates for num_systems new systems.
+
+        Systems are split across the galactic layers in one weighted draw
+        (layer 3 gets the most, layers 1/5 the fewest), then each layer is
+        filled from batches of random candidates.  Minimum spacing is enforced
+        with a grid hash of MIN_SYSTEM_SPACING-sized cells, so a candidate is
+        only compared against the handful of systems in its 27 neighbouring
+        cells rather than the whole galaxy.
+
+        A very dense request cannot fit at 15 units apart, so a layer's spacing
+        shrinks with its share of the volume.  Candidates that still fail after
+        PLACEMENT_ATTEMPTS tries per system are placed anyway (the historical
+        behaviour), but never on top of an existing system.
+        """
+        cell = float(MIN_SYSTEM_SPACING)
+        grid = {}
+        taken = set()
+
+        def cell_of(x, y, z):
+            return (int(x // cell), int(y // cell), int(z // cell))
+
+        def is_clear(x, y, z, cx, cy, cz, spacing_sq):
+            for dx, dy, dz in _NEIGHBOUR_CELLS:
+                for px, py, pz in grid_get((cx + dx, cy + dy, cz + dz), ()):
+                    if (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2 < spacing_sq:
+                        return False
+            return True
+
+        grid_get = grid.get
+        for coords in self.systems:
+            grid.setdefault(cell_of(*coords), []).append(coords)
+            taken.add(coords)
 
-        print(f"[Galaxy] Total systems after generation: {len(self.systems)} ({existing_count} predefined + {num_to_generate} procedural)")
+        x_lo, x_hi = 10, self.size_x - 10
+        y_lo, y_hi = 10, self.size_y - 10
+        x_span, y_span = x_hi - x_lo + 1, y_hi - y_lo + 1
+        rand = rng.random
+        layer_ids = list(range(1, 6))
+        layer_weights = [GALAXY_LAYERS[i]["system_density"] for i in layer_ids]
+        per_layer = [0] * 6
+        for layer in rng.choices(layer_ids, weights=layer_weights, k=num_systems):
+            per_layer[layer] += 1
 
-    def generate_celestial_bodies(self, system_type):
+        placed = []
+        for layer in layer_ids:
+            wanted = per_layer[layer]
+            if not wanted:
+                continue
+            ldata = GALAXY_LAYERS[layer]
+            z_lo, z_hi = ldata["z_min"] + 2, ldata["z_max"] - 2
+            volume = (x_hi - x_lo) * (y_hi - y_lo) * (z_hi - z_lo)
+            spacing = min(MIN_SYSTEM_SPACING, 0.7 * (volume / wanted) ** (1.0 / 3.0))
+            spacing_sq = spacing * spacing
+
+            accepted = 0
+            budget = wanted * PLACEMENT_ATTEMPTS
+            while accepted < wanted and budget > 0:
+                batch = min(budget, 2 * (wanted - accepted) + 16)
+                budget -= batch
+                # int(lo + random() * span) is uniform over [lo, hi] like
+                # randint(), at a fraction of the per-call cost.
+                xs = [int(x_lo + rand() * x_span) for _ in range(batch)]
+                ys = [int(y_lo + rand() * y_span) for _ in range(batch)]
+                zs = [int(z_lo + rand() * (z_hi - z_lo + 1)) for _ in range(batch)]
+                for x, y, z in zip(xs, ys, zs):
+                    if (x, y, z) in taken:
+                        continue
+                    cx, cy, cz = cell_of(x, y, z)
+                    if not is_clear(x, y, z, cx, cy, cz, spacing_sq):
+                        continue
+                    grid.setdefault((cx, cy, cz), []).append((x, y, z))
+                    taken.add((x, y, z))
+                    placed.append((x, y, z))
+                    accepted += 1
+                    if accepted == wanted:
+                        break
+
+            # Out of attempts: place the remainder without the spacing check
+            while accepted < wanted:
+                coords = (rng.randint(x_lo, x_hi), rng.randint(y_lo, y_hi), rng.randint(z_lo, z_hi))
+                if coords in taken:
+                    continue
+                grid.setdefault(cell_of(*coords), []).append(coords)
+                taken.add(coords)
+                placed.append(coords)
+                accepted += 1
+
+        return placed
+
+    def generate_celestial_bodies(self, system_type, rng=None):
         """Generate planets, moons, asteroid belts, and other celestial bodies"""
+        # Called once per system, so coin flips use rng.random() rather than
+        # rng.choice([True, False]) — it matters at thousands of systems.
+        rng = rng or self.body_rng
         bodies = []
         
         # Number of major bodies (planets)
-        num_planets = random.randint(1, 8)
-        
-        planet_types = [
-            "Terrestrial Planet", "Gas Giant", "Ice Giant", "Lava World",
-            "Ocean World", "Desert Planet", "Jungle World", "Frozen World",
-            "Toxic Planet", "Crystal World", "Garden World", "Barren Rock"
-        ]
+        num_planets = rng.randint(1, 8)
         
         for i in range(num_planets):
-            planet_type = random.choice(planet_types)
+            planet_type = rng.choice(PLANET_TYPES)
             planet = {
                 "object_type": "Planet",
                 "name": f"Planet {i+1}",
                 "subtype": planet_type,
-                "has_atmosphere": random.choice([True, False]),
-                "habitable": planet_type in ["Garden World", "Terrestrial Planet", "Ocean World", "Jungle World"],
+                "has_atmosphere": rng.random() < 0.5,
+                "habitable": planet_type in HABITABLE_PLANET_TYPES,
                 "shipyard": True  # Every planet has a shipyard
             }
             bodies.append(planet)
             
             # Some planets have moons
-            if random.random() < 0.5:
-                num_moons = random.randint(1, 4)
+            if rng.random() < 0.5:
+                num_moons = rng.randint(1, 4)
                 for j in range(num_moons):
                     moon = {
                         "object_type": "Moon",
                         "name": f"Moon {chr(65+j)}",  # Moon A, B, C, etc.
                         "orbits": f"Planet {i+1}",
-                        "has_resources": random.choice([True, False])
+                        "has_resources": rng.random() < 0.5
                     }
                     bodies.append(moon)
         
         # Asteroid belts
-        if random.random() < 0.6:
+        if rng.random() < 0.6:
             asteroid_belt = {
                 "object_type": "Asteroid Belt",
                 "name": "Asteroid Belt",
-                "mineral_rich": random.choice([True, False]),
-                "density": random.choice(["Sparse", "Moderate", "Dense"])
+                "mineral_rich": rng.random() < 0.5,
+                "density": rng.choice(["Sparse", "Moderate", "Dense"])
             }
             bodies.append(asteroid_belt)
         
         # Nebula clouds (rare)
-        if random.random() < 0.2:
+        if rng.random() < 0.2:
             nebula = {
                 "object_type": "Nebula",
-                "name": random.choice(["Stellar Nursery", "Emission Nebula", "Dark Nebula"]),
-                "hazardous": random.choice([True, False])
+                "name": rng.choice(["Stellar Nursery", "Emission Nebula", "Dark Nebula"]),
+                "hazardous": rng.random() < 0.5
             }
             bodies.append(nebula)
         
         # Comets (very rare)
-        if random.random() < 0.1:
+        if rng.random() < 0.1:
             comet = {
                 "object_type": "Comet",
                 "name": "Rogue Comet",
-                "active": random.choice([True, False])
+                "active": rng.random() < 0.5
             }
             bodies.append(comet)
         
         return bodies
     
-    def generate_system_description(self):
+    def generate_system_description(self, rng=None):
         """Generate random description for star systems"""
-        descriptions = [
-            "A bustling hub of interstellar commerce and trade.",
-            "Ancient ruins dot the surfaces of several planets here.",
-            "Rich asteroid fields provide abundant mining opportunities.", 
-            "Home to advanced research facilities and universities.",
-            "A heavily fortified military stronghold guards this sector.",
-            "Lush agricultural worlds supply food across the galaxy.",
-            "Mysterious energy readings emanate from this system.",
-            "Pirates and smugglers are known to frequent this area.",
-            "A peaceful system with beautiful nebula formations.",
-            "Industrial megafactories operate around the clock here."
-        ]
-        return random.choice(descriptions)
+        rng = rng or self.rng
+        return rng.choice(SYSTEM_DESCRIPTIONS)
     
     def get_system_at(self, x, y, z):
         """Get star system at specific coordinates"""
         return self.systems.get((x, y, z))
     
+    # ------------------------------------------------------------------
+    # System registry + spatial queries
+    # ------------------------------------------------------------------
+
+    def add_system(self, coords, system):
+        """Register a system at coords and index it for proximity queries."""
+        in_step = self._spatial_index_version == self.systems_version
+        self.systems[coords] = system
+        self.spatial_index.insert(coords)
+        self.systems_version += 1
+        if in_step:
+            self._spatial_index_version = self.systems_version
+        if system.get('visited'):
+            self.visited_systems.add(coords)
+        else:
+            self.visited_systems.discard(coords)
+
+    def remove_system(self, coords):
+        """Remove the system at coords (if any) and drop it from the index."""
+        in_step = self._spatial_index_version == self.systems_version
+        self.spatial_index.remove(coords)
+        self.systems_version += 1
+        if in_step:
+            self._spatial_index_version = self.systems_version
+        self.visited_systems.discard(coords)
+        return self.systems.pop(coords, None)
+
+    def mark_visited(self, coords):
+        """Flag the system at coords as visited.  Returns the system (or None)."""
+        coords = tuple(coords)
+        system = self.systems.get(coords)
+        if system is not None:
+            system['visited'] = True
+            self.visited_systems.add(coords)
+        return system
+
+    def visited_count(self):
+        """Number of visited systems, without scanning the galaxy."""
+        return len(self.visited_systems)
+
+    def _recount_visited(self):
+        self.visited_systems = {c for c, s in self.systems.items() if s.get('visited')}
+
+    def get_spatial_index(self):
+        """Return the spatial index, rebuilding it first if self.systems was
+        edited behind add_system()/remove_system().  Such edits are expected to
+        bump systems_version; a change in the system count (older code paths
+        that assign into the dict without bumping) is treated the same way."""
+        if len(self.spatial_index) != len(self.systems):
+            self.systems_version += 1
+        if self._spatial_index_version != self.systems_version:
+            self.spatial_index.rebuild((c, c) for c in self.systems)
+            self._spatial_index_version = self.systems_version
+        return self.spatial_index
+
+    # ------------------------------------------------------------------
+    # Seed + delta persistence
+    # ------------------------------------------------------------------
+
+    def _snapshot_mutable_fields(self):
+        return {
+            coords: tuple(system.get(f) for f in self.MUTABLE_SYSTEM_FIELDS)
+            for coords, system in self.systems.items()
+        }
+
+    def get_system_delta(self):
+        """Describe how this galaxy differs from a fresh Galaxy(self.seed).
+
+        Returns {'seed', 'num_systems', 'removed': [coords],
+        'changed': [{coords, field: value}]}.
+        Only systems whose mutable fields differ from generation are listed.
+        """
+        baseline = getattr(self, '_baseline', {})
+        changed = []
+        for coords, system in self.systems.items():
+            current = tuple(system.get(f) for f in self.MUTABLE_SYSTEM_FIELDS)
+            if baseline.get(coords) != current:
+                entry = {'coordinates': list(coords)}
+                entry.update(zip(self.MUTABLE_SYSTEM_FIELDS, current))
+                changed.append(entry)
+        removed = [list(c) for c in baseline if c not in self.systems]
+        return {'seed': self.seed, 'num_systems': self.num_systems,
+                'removed': removed, 'changed': changed}
+
+    def apply_system_delta(self, delta):
+        """Replay a delta from get_system_delta() onto a freshly generated galaxy."""
+        for coords in delta.get('removed', []):
+            self.remove_system(tuple(coords))
+        for entry in delta.get('changed', []):
+            system = self.systems.get(tuple(entry.get('coordinates', ())))
+            if system is None:
+                continue
+            for field in self.MUTABLE_SYSTEM_FIELDS:
+                if field in entry:
+                    system[field] = entry[field]
+        self._recount_visited()
+
+    def get_route_planner(self):
+        """Return this galaxy's multi-jump RoutePlanner (created on first use)."""
+        if self._route_planner is None:
+            from route_planner import RoutePlanner
+            self._route_planner = RoutePlanner(self)
+        return self._route_planner
+
+    def get_hex_index(self):
+        """Return this galaxy's collision-resolved hex projection (a
+        backend.hex_utils.GalaxyHexIndex), re-synced when systems_version
+        moves so every map consumer sees the same layout."""
+        if self._hex_index is None:
+            from backend.hex_utils import GalaxyHexIndex
+            self._hex_index = GalaxyHexIndex()
+        self._hex_index.sync(self.systems, self.systems_version)
+        return self._hex_index
+
+    def get_systems_in_radius(self, x, y, z, radius, include_origin=True):
+        """Return [(coords, system, distance)] within radius, nearest first."""
+        hits = self.get_spatial_index().query_radius((x, y, z), radius, sort=True)
+        return [
+            (coords, self.systems[coords], distance)
+            for coords, distance in hits
+            if coords in self.systems and (include_origin or distance > 0)
+        ]
+
+    def get_systems_in_plane_radius(self, x, y, radius):
+        """Return [(coords, system, xy_distance)] ignoring depth, nearest first."""
+        hits = self.get_spatial_index().query_cylinder((x, y, 0), radius, sort=True)
+        return [(coords, self.systems[coords], distance)
+                for coords, distance in hits if coords in self.systems]
+
+    def get_nearest_systems(self, x, y, z, k=1, max_distance=None, include_origin=False):
+        """Return the k closest systems as [(coords, system, distance)]."""
+        hits = self.get_spatial_index().nearest(
+            (x, y, z), k, max_distance=max_distance, exclude_center=not include_origin
+        )
+        return [(coords, self.systems[coords], distance)
+                for coords, distance in hits if coords in self.systems]
+
+    def get_systems_in_box(self, min_corner, max_corner):
+        """Return [(coords, system)] inside an axis-aligned box (inclusive)."""
+        keys = self.get_spatial_index().query_box(min_corner, max_corner)
+        return [(coords, self.systems[coords]) for coords in keys if coords in self.systems]
+
     def get_nearby_systems(self, x, y, z, range_limit=10):
         """Get all star systems within range"""
-        nearby = []
-        for coords, system in self.systems.items():
-            distance = self.calculate_distance((x, y, z), coords)
-            if distance <= range_limit and distance > 0:
-                nearby.append((system, distance))
-        
-        # Sort by distance
-        nearby.sort(key=lambda x: x[1])
-        return nearby
+        # Sorted by distance; the system the caller is sitting on is excluded.
+        return [
+            (system, distance)
+            for _coords, system, distance in self.get_systems_in_radius(
+                x, y, z, range_limit, include_origin=False)
+        ]
     
     def calculate_distance(self, pos1, pos2):
         """Calculate 3D distance between two points"""
@@ -845,19 +1206,24 @@ class Ship:
             # Fallback if ship_builder not available
             pass
     
-    def can_jump_to(self, target_coords, galaxy, game=None):
-        """Check if ship can jump to target coordinates"""
+    def _check_jump(self, target_coords, galaxy, game=None):
+        """Return (ok, distance, fuel_needed).  Out-of-range targets are
+        rejected before the (comparatively expensive) fuel calculation, and
+        fuel_needed is None for them."""
         distance = galaxy.calculate_distance(self.coordinates, target_coords)
+        if distance > self.jump_range:
+            return False, distance, None
         fuel_needed = calculate_fuel_consumption(self, distance, target_coords, game)
-        
-        return distance <= self.jump_range and fuel_needed <= self.fuel
+        return fuel_needed <= self.fuel, distance, fuel_needed
+
+    def can_jump_to(self, target_coords, galaxy, game=None):
+        """Check if ship can jump to target coordinates"""
+        return self._check_jump(target_coords, galaxy, game)[0]
     
     def jump_to(self, target_coords, galaxy, game=None):
         """Jump to target coordinates"""
-        if self.can_jump_to(target_coords, galaxy, game):
-            distance = galaxy.calculate_distance(self.coordinates, target_coords)
-            fuel_needed = calculate_fuel_consumption(self, distance, target_coords, game)
-            
+        ok, distance, fuel_needed = self._check_jump(target_coords, galaxy, game)
+        if ok:
             # Check for dangerous regions (warning message)
             danger_warning = ""
             if game and hasattr(game, 'event_system'):
@@ -868,17 +1234,72 @@ class Ship:
             self.fuel -= fuel_needed
             
             # Mark system as visited if there's one here
-            system = galaxy.get_system_at(*target_coords)
+            system = galaxy.mark_visited(target_coords)
             if system:
-                system["visited"] = True
                 # Update market when visiting (if game reference provided)
                 if game and hasattr(game, 'economy') and system["name"] in game.economy.markets:
                     game.economy.update_market(system["name"])
+
+            # Refresh fog of war — player ship only (bots jump through here too)
+            discovery = getattr(game, 'discovery', None) if game else None
+            if discovery is not None and getattr(game.navigation, 'current_ship', None) is self:
+                discovery.observe(game)
             
             return True, f"Jumped to {target_coords}. Used {fuel_needed} fuel.{danger_warning}"
         else:
             return False, "Cannot reach target coordinates."
     
+    def get_reachable_systems(self, galaxy, game=None):
+        """Every system within jump range, priced in one pass.
+
+        Returns a list of dicts sorted by distance:
+            {'coordinates', 'system', 'distance', 'fuel', 'friction',
+             'dangerous', 'layers_crossed', 'affordable'}
+
+        The costs are cached until something they depend on changes: the
+        ship's position, jump range or engine/crew attributes, the galaxy's
+        systems, ether zone drift, or the set of dangerous regions.  Current
+        fuel only decides 'affordable', which is re-evaluated on every call,
+        so refuelling doesn't invalidate the cache.
+        """
+        key = self._reachable_key(galaxy, game)
+        cache = getattr(self, '_reachable_cache', None)
+        if cache is None or cache[0] != key:
+            origin = tuple(self.coordinates)
+            in_range = galaxy.get_systems_in_radius(*origin, self.jump_range, include_origin=False)
+            previews = preview_jumps(self, [c for c, _s, _d in in_range], game, origin)
+            entries = []
+            for (coords, system, _d), preview in zip(in_range, previews):
+                entries.append({
+                    'coordinates': coords,
+                    'system': system,
+                    'distance': preview['distance'],
+                    'fuel': preview['fuel'],
+                    'friction': preview['friction'],
+                    'dangerous': preview['dangerous'],
+                    'layers_crossed': preview['layers_crossed'],
+                })
+            cache = self._reachable_cache = (key, entries)
+
+        fuel = self.fuel
+        return [dict(entry, affordable=entry['fuel'] <= fuel) for entry in cache[1]]
+
+    def _reachable_key(self, galaxy, game):
+        ether = getattr(galaxy, 'ether_energy', None)
+        event_system = getattr(game, 'event_system', None) if game else None
+        regions = getattr(event_system, 'dangerous_regions', None)
+        if hasattr(regions, 'version'):
+            regions = (id(regions), regions.version)
+        elif isinstance(regions, dict):
+            regions = frozenset((c, r.get('radius')) for c, r in regions.items())
+        else:
+            regions = None
+        return (
+            tuple(self.coordinates), self.jump_range, ship_fuel_multipliers(self),
+            id(galaxy), galaxy.systems_version, getattr(ether, 'zones_version', None),
+            id(game), regions,
+        )
+
     def refuel(self):
         """Refuel ship to maximum capacity"""
         fuel_needed = self.max_fuel - self.fuel
@@ -891,14 +1312,12 @@ class Ship:
         where object_type is 'system', 'planet', 'station', etc.
         """
         results = []
-        ship_x, ship_y, ship_z = self.coordinates
         
-        for coords, system in galaxy.systems.items():
-            sys_x, sys_y, sys_z = coords
-            # Calculate 2D distance (ignoring Z for now, since map is 2D)
-            distance = math.sqrt((sys_x - ship_x)**2 + (sys_y - ship_y)**2)
-            
-            if distance <= self.scan_range and distance > 0:
+        # 2D distance (ignoring Z for now, since map is 2D) — a cylinder query
+        # against the galaxy's spatial index rather than a pass over every system.
+        for _coords, system, distance in galaxy.get_systems_in_plane_radius(
+                self.coordinates[0], self.coordinates[1], self.scan_range):
+            if distance > 0:
                 # System is in scan range
                 results.append(('system', system, distance))
                 
@@ -919,7 +1338,8 @@ class Ship:
 class NavigationSystem:
     def __init__(self, game):
         self.game = game
-        self.galaxy = Galaxy()
+        self.galaxy = Galaxy(seed=getattr(game, 'world_seed', None),
+                             num_systems=getattr(game, 'num_systems', None))
         self.current_ship = None
         self.selected_ship_index = 0
         self.npc_ships = []  # List of NPC ships in the galaxy
@@ -945,7 +1365,8 @@ class NavigationSystem:
         ]
         
         # Spawn 3-6 NPC ships
-        num_npcs = random.randint(3, 6)
+        rng = self._npc_rng()
+        num_npcs = rng.randint(3, 6)
         
         systems = list(self.galaxy.systems.values())
         if not systems:
@@ -953,18 +1374,24 @@ class NavigationSystem:
         
         for i in range(min(num_npcs, len(npc_names))):
             name = npc_names[i]
-            ship_class = random.choice(npc_ship_classes)
+            ship_class = rng.choice(npc_ship_classes)
             # Start at random system
-            start_system = random.choice(systems)
+            start_system = rng.choice(systems)
             start_coords = start_system['coordinates']
             
-            npc = NPCShip(name, ship_class, start_coords, self.galaxy)
+            npc = NPCShip(name, ship_class, start_coords, self.galaxy, rng=rng)
             self.npc_ships.append(npc)
     
     def update_npc_ships(self):
         """Move all NPC ships"""
+        rng = self._npc_rng()
         for npc in self.npc_ships:
-            npc.move()
+            npc.move(rng)
+
+    def _npc_rng(self):
+        """The game's seeded NPC-ship stream, or the random module without one."""
+        registry = getattr(self.game, 'rng', None)
+        return registry.stream("npc_ships") if registry is not None else random
     
     def get_npc_at_location(self, coords):
         """Check if there's an NPC ship at the given coordinates"""
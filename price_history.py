@@ -0,0 +1,264 @@
+"""
+Price History - Fixed-Size Rings with Candle Roll-Ups
+
+EconomicSystem.market_history was a defaultdict(list) keyed
+"{system}_{commodity}": every trade appended a Python int, each list was
+trimmed to HISTORY_LIMIT as it grew, and the save code sliced them all
+again before writing them out.
+
+PriceHistory keeps the same keys but stores every series in one flat,
+preallocated array - `limit` slots per series, written round-robin - so a
+series never grows past its ring and never needs trimming.  Alongside the
+raw prices each series rolls up into OHLC candles over 10 and 100 turns
+(ROLLUPS), each in its own ring of `candle_limit` candles, for long-range
+charts:
+
+    history.record("Sol", "Ethergrain", 42)      # a trade or reprice
+    history["Sol_Ethergrain"]                    # [.., 42] oldest first
+    history.candles("Sol_Ethergrain", 10)        # [{'turn': 0, 'open': ..}, ..]
+    history.advance()                            # end of turn
+
+to_state() dumps the arrays whole (base64 of their bytes), so saving the
+history is one contiguous copy per array; from_state() also accepts the
+old {key: [prices]} dicts.
+"""
+
+import base64
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+HISTORY_LIMIT = 100
+# Candles kept per series and roll-up (500 / 5000 turns of 10- / 100-turn candles)
+CANDLE_LIMIT = 50
+ROLLUPS = (10, 100)
+
+# Candle layout in its ring: period number, then open/high/low/close
+_CANDLE = 5
+_PERIOD, _OPEN, _HIGH, _LOW, _CLOSE = range(_CANDLE)
+
+
+class PriceHistory(Mapping):
+    """"{system}_{commodity}" -> recent prices, oldest first."""
+
+    def __init__(self, limit: int = HISTORY_LIMIT, candle_limit: int = CANDLE_LIMIT):
+        self.limit = max(1, int(limit))
+        self.candle_limit = max(1, int(candle_limit))
+        self.turn = 0
+        self._keys: List[str] = []
+        self._pairs: List[Tuple[str, str]] = []
+        self._index: Dict[str, int] = {}
+        self._raw = array('q')
+        self._written = array('q')          # samples ever written, per series
+        self._candles = {span: array('q') for span in ROLLUPS}
+        self._opened = {span: array('q') for span in ROLLUPS}   # candles ever opened
+
+    # ------------------------------------------------------------------
+    # Mapping interface (key -> list of prices)
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, key: str) -> List[int]:
+        return self.series(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._keys))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __repr__(self) -> str:
+        return f"<PriceHistory {len(self._keys)} series × {self.limit} turn {self.turn}>"
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(self, market: str, commodity: str, price: int):
+        """Append one price to the market × commodity series."""
+        key = f"{market}_{commodity}"
+        s = self._index.get(key)
+        if s is None:
+            s = self._add_series(key, market, commodity)
+        self._append(s, int(price))
+
+    def record_closes(self, prices_for) -> int:
+        """
+        Append the current price to every existing series.  prices_for(market)
+        returns that market's price mapping (or None if it has gone).
+        Returns the number of samples written.
+        """
+        by_market: Dict[str, List[Tuple[int, str]]] = {}
+        for s, (market, commodity) in enumerate(self._pairs):
+            by_market.setdefault(market, []).append((s, commodity))
+        written = 0
+        for market, series in by_market.items():
+            prices = prices_for(market)
+            if prices is None:
+                continue
+            for s, commodity in series:
+                price = prices.get(commodity)
+                if price is not None:
+                    self._append(s, int(price))
+                    written += 1
+        return written
+
+    def advance(self):
+        """Move to the next turn (samples after this open new candles as due)."""
+        self.turn += 1
+
+    def _add_series(self, key: str, market: str, commodity: str) -> int:
+        s = len(self._keys)
+        self._keys.append(key)
+        self._pairs.append((market, commodity))
+        self._index[key] = s
+        self._raw.extend(array('q', [0]) * self.limit)
+        self._written.append(0)
+        for span in ROLLUPS:
+            self._candles[span].extend(array('q', [0]) * (self.candle_limit * _CANDLE))
+            self._opened[span].append(0)
+        return s
+
+    def _append(self, s: int, price: int):
+        n = self._written[s]
+        self._raw[s * self.limit + n % self.limit] = price
+        self._written[s] = n + 1
+        for span in ROLLUPS:
+            period = self.turn // span
+            candles, opened = self._candles[span], self._opened[span]
+            count = opened[s]
+            base = s * self.candle_limit * _CANDLE
+            if count:
+                at = base + (count - 1) % self.candle_limit * _CANDLE
+                if candles[at + _PERIOD] == period:
+                    if price > candles[at + _HIGH]:
+                        candles[at + _HIGH] = price
+                    if price < candles[at + _LOW]:
+                        candles[at + _LOW] = price
+                    candles[at + _CLOSE] = price
+                    continue
+            at = base + count % self.candle_limit * _CANDLE
+            candles[at:at + _CANDLE] = array('q', (period, price, price, price, price))
+            opened[s] = count + 1
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def series(self, key: str) -> List[int]:
+        """The last `limit` prices for key, oldest first (KeyError if none)."""
+        s = self._index[key]
+        n, limit = self._written[s], self.limit
+        lo = s * limit
+        ring = self._raw[lo:lo + limit]
+        if n <= limit:
+            return ring[:n].tolist()
+        cut = n % limit
+        return (ring[cut:] + ring[:cut]).tolist()
+
+    def candles(self, key: str, span: int = ROLLUPS[0]) -> List[Dict[str, int]]:
+        """OHLC candles for key over `span` turns, oldest first; the last may be open."""
+        if span not in self._candles:
+            raise ValueError(f"span must be one of {ROLLUPS}")
+        s = self._index.get(key)
+        if s is None:
+            return []
+        count, size = self._opened[span][s], self.candle_limit
+        base = s * size * _CANDLE
+        ring = self._candles[span]
+        out = []
+        for k in range(max(0, count - size), count):
+            at = base + k % size * _CANDLE
+            period, o, h, l, c = ring[at:at + _CANDLE]
+            out.append({'turn': period * span, 'open': o, 'high': h, 'low': l, 'close': c})
+        return out
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-ready dump: each array as one base64 block (little-endian)."""
+        state = {
+            'format': 'rings-1',
+            'limit': self.limit,
+            'candle_limit': self.candle_limit,
+            'turn': self.turn,
+            'keys': list(self._keys),
+            'raw': _pack(self._raw),
+            'written': _pack(self._written),
+        }
+        for span in ROLLUPS:
+            state[f'candles_{span}'] = _pack(self._candles[span])
+            state[f'opened_{span}'] = _pack(self._opened[span])
+        return state
+
+    @classmethod
+    def from_state(cls, state: Optional[Mapping], limit: int = HISTORY_LIMIT) -> "PriceHistory":
+        """Rebuild from to_state(), or from an old {key: [prices]} dict."""
+        if isinstance(state, Mapping) and state.get('format') == 'rings-1':
+            try:
+                history = cls(state.get('limit', limit), state.get('candle_limit', CANDLE_LIMIT))
+                history.turn = int(state.get('turn', 0))
+                keys = [str(k) for k in state.get('keys', [])]
+                history._raw = _unpack(state['raw'])
+                history._written = _unpack(state['written'])
+                for span in ROLLUPS:
+                    history._candles[span] = _unpack(state[f'candles_{span}'])
+                    history._opened[span] = _unpack(state[f'opened_{span}'])
+                n = len(keys)
+                if (len(history._raw) != n * history.limit or len(history._written) != n
+                        or any(len(history._candles[span]) != n * history.candle_limit * _CANDLE
+                               or len(history._opened[span]) != n for span in ROLLUPS)):
+                    raise ValueError("array sizes do not match the series count")
+                for key in keys:
+                    history._index[key] = len(history._keys)
+                    history._keys.append(key)
+                    history._pairs.append(_split_key(key))
+                return history
+            except (KeyError, TypeError, ValueError) as exc:
+                print(f"[4X] Warning: discarding unreadable price history: {exc}")
+                return cls(limit)
+        history = cls(limit)
+        if isinstance(state, Mapping):
+            for key, prices in state.items():
+                if not isinstance(prices, list):
+                    continue
+                market, commodity = _split_key(str(key))
+                if not market:
+                    continue
+                for price in prices[-history.limit:]:
+                    try:
+                        history.record(market, commodity, int(price))
+                    except (TypeError, ValueError):
+                        continue
+        return history
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _split_key(key: str) -> Tuple[str, str]:
+    # Commodity names carry no underscores; system names might
+    market, _sep, commodity = key.rpartition('_')
+    return market, commodity
+
+
+def _pack(values: array) -> str:
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode('ascii')
+
+
+def _unpack(blob: str) -> array:
+    values = array('q')
+    values.frombytes(base64.b64decode(blob))
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
@@ -0,0 +1,203 @@
+"""
+Route Planner - Multi-Jump Pathfinding Over the Jump Graph
+
+A ship can only jump to systems within its jump range.  Getting anywhere
+further means chaining jumps, and the cheapest chain is not necessarily the
+one that heads straight for the goal: ether friction, dangerous regions and
+the interlayer surcharge all change what each leg costs.
+
+This module treats the galaxy as a graph:
+  - nodes are star systems
+  - an edge joins two systems no further apart than the jump range
+  - an edge's cost is the fuel calculate_fuel_consumption() charges for it
+
+Adjacency is pure geometry, so it is built once per jump range (via the
+galaxy's spatial index) and cached until systems are added or removed.
+Edge *costs* depend on the ship and on live world state (friction drift,
+new danger zones), so they are evaluated lazily during each search: each
+expanded node prices its open outgoing edges in one preview_jumps() batch.
+"""
+
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple
+
+from navigation import (
+    get_layer,
+    INTERLAYER_FUEL_COST,
+    preview_jumps,
+    ship_fuel_multipliers,
+)
+
+try:
+    from ether_energy import FRICTION_MIN
+except ImportError:
+    FRICTION_MIN = 1.0
+
+
+Coords = Tuple[float, float, float]
+
+
+class RoutePlanner:
+    """A* over the galaxy's jump graph, with adjacency cached per jump range."""
+
+    def __init__(self, galaxy):
+        self.galaxy = galaxy
+        # {jump_range: {coords: [(neighbour_coords, distance), ...]}}
+        self._adjacency: Dict[float, Dict[Coords, List[Tuple[Coords, float]]]] = {}
+        self._adjacency_version = None
+
+    # ------------------------------------------------------------------
+    # Jump graph
+    # ------------------------------------------------------------------
+
+    def invalidate(self):
+        """Drop every cached adjacency table."""
+        self._adjacency.clear()
+        self._adjacency_version = None
+
+    def get_adjacency(self, jump_range: float) -> Dict[Coords, List[Tuple[Coords, float]]]:
+        """Return {system_coords: [(neighbour_coords, distance)]} for jump_range.
+
+        Built on first request for a given range and reused until the galaxy's
+        system set changes.
+        """
+        galaxy = self.galaxy
+        index = galaxy.get_spatial_index()
+        if self._adjacency_version != galaxy.systems_version:
+            self._adjacency.clear()
+            self._adjacency_version = galaxy.systems_version
+
+        key = round(float(jump_range), 3)
+        table = self._adjacency.get(key)
+        if table is None:
+            table = {}
+            for coords in galaxy.systems:
+                table[coords] = [
+                    (other, dist)
+                    for other, dist in index.query_radius(coords, key)
+                    if dist > 0 and other in galaxy.systems
+                ]
+            self._adjacency[key] = table
+        return table
+
+    def _neighbours(self, node, adjacency, jump_range):
+        """Neighbours of node; off-graph nodes (deep space) are looked up live."""
+        edges = adjacency.get(node)
+        if edges is not None:
+            return edges
+        return [
+            (other, dist)
+            for other, _system, dist in self.galaxy.get_systems_in_radius(*node, jump_range)
+            if dist > 0
+        ]
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def plan_route(self, ship, start: Coords, goal: Coords, game=None,
+                   jump_range: Optional[float] = None) -> Optional[Dict]:
+        """Find the cheapest-fuel chain of jumps from start to goal.
+
+        start may be any coordinates (the ship can sit in deep space); goal
+        may be a system or any coordinates reachable from one.  Returns None
+        if no chain of jumps connects them.  Otherwise returns:
+
+            {
+              'path':           [coords, ...]   # start .. goal inclusive
+              'legs':           [{'from', 'to', 'distance', 'fuel'}, ...]
+              'total_fuel':     int
+              'total_distance': float
+              'jumps':          int
+            }
+        """
+        start = tuple(start)
+        goal = tuple(goal)
+        if jump_range is None:
+            jump_range = getattr(ship, 'jump_range', 15)
+
+        if start == goal:
+            return {'path': [start], 'legs': [], 'total_fuel': 0,
+                    'total_distance': 0.0, 'jumps': 0}
+
+        adjacency = self.get_adjacency(jump_range)
+        distance = self.galaxy.calculate_distance
+
+        # Systems that can jump straight onto a goal that isn't itself a node.
+        goal_feeders = set()
+        if goal not in adjacency:
+            goal_feeders = {
+                c for c, _s, _d in self.galaxy.get_systems_in_radius(*goal, jump_range)
+            }
+            if distance(start, goal) <= jump_range:
+                goal_feeders.add(start)
+
+        # Heuristic: a lower bound on the fuel left.  Unrounded, a leg costs
+        # at least x = its distance at the cheapest per-unit rate (lowest
+        # friction, no danger) plus its layer surcharge.  Each leg is rounded,
+        # so it is charged max(1, round(x)) >= max(1, x - 0.5) >= 2x/3 - and
+        # summed over however many legs remain, the fuel left is at least 2/3
+        # of x for the straight line to the goal.  Being linear in distance
+        # the bound is also consistent, which A* with a closed set needs.
+        multipliers = ship_fuel_multipliers(ship)
+        efficiency, crew, output = multipliers
+        per_unit = 2.0 * efficiency * crew * output * FRICTION_MIN   # base 2 fuel per unit
+        goal_layer = get_layer(goal[2])
+
+        def heuristic(node):
+            return (distance(node, goal) * per_unit
+                    + INTERLAYER_FUEL_COST * abs(get_layer(node[2]) - goal_layer)) * (2.0 / 3.0)
+
+        best = {start: 0}
+        came_from: Dict[Coords, Tuple[Coords, float, int]] = {}
+        counter = 0
+        frontier = [(heuristic(start), counter, start)]
+        closed = set()
+
+        while frontier:
+            _f, _n, node = heapq.heappop(frontier)
+            if node == goal:
+                return self._build_route(start, goal, came_from)
+            if node in closed:
+                continue
+            closed.add(node)
+            g_node = best[node]
+
+            edges = self._neighbours(node, adjacency, jump_range)
+            if node in goal_feeders:
+                edges = list(edges) + [(goal, distance(node, goal))]
+
+            edges = [(nxt, dist) for nxt, dist in edges if nxt not in closed]
+            if not edges:
+                continue
+            # One friction batch and one danger batch for the whole fan-out.
+            previews = preview_jumps(ship, [nxt for nxt, _d in edges], game,
+                                     source_coords=node, multipliers=multipliers)
+            for (nxt, dist), preview in zip(edges, previews):
+                fuel = preview['fuel']
+                g_next = g_node + fuel
+                if g_next < best.get(nxt, math.inf):
+                    best[nxt] = g_next
+                    came_from[nxt] = (node, dist, fuel)
+                    counter += 1
+                    heapq.heappush(frontier, (g_next + heuristic(nxt), counter, nxt))
+
+        return None
+
+    @staticmethod
+    def _build_route(start, goal, came_from) -> Dict:
+        legs = []
+        node = goal
+        while node != start:
+            prev, dist, fuel = came_from[node]
+            legs.append({'from': prev, 'to': node, 'distance': dist, 'fuel': fuel})
+            node = prev
+        legs.reverse()
+        return {
+            'path': [start] + [leg['to'] for leg in legs],
+            'legs': legs,
+            'total_fuel': sum(leg['fuel'] for leg in legs),
+            'total_distance': sum(leg['distance'] for leg in legs),
+            'jumps': len(legs),
+        }
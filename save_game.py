@@ -165,6 +165,14 @@ def save_game(game, save_name: Optional[str] = None) -> bool:
             'owned_stations': getattr(game, 'owned_stations', []),
             'owned_platforms': getattr(game, 'owned_platforms', []),
             
+            # World seed + galaxy delta.  The galaxy is regenerated from the
+            # seed on load, so only fields changed by play are stored.
+            'world_seed': getattr(game, 'world_seed', None),
+            'galaxy_state': _save_galaxy(getattr(game, 'navigation', None)),
+
+            # Where each simulation random stream stands (see seeding.RngRegistry)
+            'rng_state': _save_rng(game),
+            
             # Navigation state
             'navigation_state': _save_navigation(getattr(game, 'navigation', None)),
             
@@ -288,6 +296,11 @@ def load_game(game, save_path: str) -> bool:
         game.owned_stations = save_data.get('owned_stations', [])
         game.owned_platforms = save_data.get('owned_platforms', [])
 
+        # Regenerate the galaxy from its seed (must precede navigation state,
+        # which rebuilds NPC ships against nav.galaxy)
+        if save_data.get('galaxy_state') and game.navigation:
+            _load_galaxy(game, save_data['galaxy_state'])
+        
         # Load navigation state
         if 'navigation_state' in save_data and game.navigation:
             _load_navigation(game.navigation, save_data['navigation_state'])
@@ -317,6 +330,9 @@ def load_game(game, save_path: str) -> bool:
         # Load bot manager state
         if 'bot_manager_state' in save_data:
             _load_bot_manager(game.bot_manager, save_data['bot_manager_state'])
+
+        # Resume the random streams last, once every subsystem that owns one exists
+        _load_rng(game, save_data.get('rng_state'))
         
         # Load player log
         game.player_log = save_data.get('player_log', [])
@@ -462,6 +478,47 @@ def _load_navigation(nav, state: Dict[str, Any]):
     # Restore current ship (will be set when game initializes)
 
 
+def _save_rng(game) -> Dict[str, Any]:
+    """Save the simulation's random stream states"""
+    registry = getattr(game, 'rng', None)
+    return registry.get_state() if registry is not None else {}
+
+
+def _load_rng(game, state: Optional[Dict[str, Any]]):
+    """Resume the simulation's random streams"""
+    registry = getattr(game, 'rng', None)
+    if registry is None:
+        return
+    # Restart every stream from the (possibly regenerated) world seed first,
+    # so streams an older save didn't record still start from a known state
+    registry.reseed(getattr(game, 'world_seed', None))
+    registry.set_state(state)
+
+
+def _save_galaxy(nav) -> Dict[str, Any]:
+    """Save the galaxy as its seed plus the fields play has changed"""
+    galaxy = getattr(nav, 'galaxy', None) if nav else None
+    if not galaxy or not hasattr(galaxy, 'get_system_delta'):
+        return {}
+    return galaxy.get_system_delta()
+
+
+def _load_galaxy(game, state: Dict[str, Any]):
+    """Rebuild the galaxy from its seed and replay the saved delta"""
+    if not state or state.get('seed') is None:
+        return
+    
+    from navigation import Galaxy
+    seed = state['seed']
+    galaxy = Galaxy(seed=seed, num_systems=state.get('num_systems'))
+    galaxy.apply_system_delta(state)
+    game.world_seed = seed
+    game.num_systems = galaxy.num_systems
+    game.navigation.galaxy = galaxy
+    _debug_log(f"Regenerated galaxy from seed {seed}: "
+               f"{len(state.get('changed', []))} changed, {len(state.get('removed', []))} removed")
+
+
 def _save_factions(faction_system) -> Dict[str, Any]:
     """Save faction system state"""
     if not faction_system:
@@ -530,9 +587,18 @@ def _save_events(event_system) -> Dict[str, Any]:
             # Already a dict or string, save as-is
             event_history_data.append(event)
     
+    # The headline feed lives on the event system (NewsSystem reads it from
+    # there); its items carry datetime stamps
+    news_feed_data = []
+    for item in getattr(event_system, 'news_feed', [])[-50:]:
+        if isinstance(item, dict) and hasattr(item.get('timestamp'), 'isoformat'):
+            item = dict(item, timestamp=item['timestamp'].isoformat())
+        news_feed_data.append(item)
+    
     return {
         'active_events': active_events_data,
         'event_history': event_history_data,
+        'news_feed': news_feed_data,
     }
 
 
@@ -609,6 +675,18 @@ def _load_events(event_system, state: Dict[str, Any]):
             event_system.active_events = active_events
         if hasattr(event_system, 'event_history'):
             event_system.event_history = event_history
+
+        if 'news_feed' in state and hasattr(event_system, 'news_feed'):
+            news_feed = []
+            for item in state['news_feed']:
+                if not isinstance(item, dict):
+                    continue
+                try:
+                    timestamp = datetime.fromisoformat(item.get('timestamp', ''))
+                except (TypeError, ValueError):
+                    timestamp = datetime.now()
+                news_feed.append(dict(item, timestamp=timestamp))
+            event_system.news_feed = news_feed
     except ImportError:
         # If events module not available, skip loading events
         pass
@@ -661,8 +739,11 @@ def _save_economy(economy) -> Dict[str, Any]:
         return {}
     
     market_history = getattr(economy, 'market_history', {})
+    if hasattr(market_history, 'to_state'):
+        # Fixed-size rings (price_history.py): already bounded, dumped whole
+        market_history = market_history.to_state()
     # If market_history is a dict, limit each market's history to last 100 entries
-    if isinstance(market_history, dict):
+    elif isinstance(market_history, dict):
         limited_history = {}
         for market_name, history_list in market_history.items():
             if isinstance(history_list, list):
@@ -674,9 +755,14 @@ def _save_economy(economy) -> Dict[str, Any]:
         # If it's a list, just take last 100
         market_history = market_history[-100:]
     
+    markets = getattr(economy, 'markets', {})
+    if hasattr(markets, 'to_dict'):
+        markets = markets.to_dict()  # columnar MarketTable -> plain dicts for JSON
+
     return {
-        'markets': getattr(economy, 'markets', {}),
+        'markets': markets,
         'market_history': market_history,
+        'base_prices': dict(getattr(economy, 'base_prices', {})),
     }
 
 
@@ -689,6 +775,8 @@ def _load_economy(economy, state: Dict[str, Any]):
         economy.markets = state.get('markets', {})
     if hasattr(economy, 'market_history'):
         economy.market_history = state.get('market_history', {})
+    if state.get('base_prices'):
+        economy.base_prices = {name: int(price) for name, price in state['base_prices'].items()}
 
 
 def _save_station_manager(station_manager) -> Dict[str, Any]:
@@ -0,0 +1,108 @@
+"""
+World Seeding - Reproducible Random Streams for World Generation
+
+Every generator that shapes the world (galaxy layout, celestial bodies,
+station placement, bots, factions) draws from its own random.Random stream
+derived from a single world seed.  Two worlds built from the same seed are
+identical, which means a save only needs to record the seed plus whatever
+the player has changed since — not the hundreds of generated systems.
+
+Streams are derived by name, so adding a new generator (or drawing more
+numbers in one) never shifts the numbers another generator sees.
+
+The same goes for play.  Per-turn simulation (economy ticks, galactic
+events, NPC ships and their chatter, bots, hull wear and jump stress,
+derelict encounters, colony market openings, the GNN broadcast) draws from
+streams
+held in the game's RngRegistry rather than the shared `random` module, and
+saves record where each stream stands - so a loaded game plays out the
+next N turns exactly as the original would have.
+"""
+
+import random
+from typing import Any, Dict, Optional
+
+
+def new_world_seed() -> int:
+    """Pick a fresh 32-bit world seed from OS entropy."""
+    return random.SystemRandom().randrange(2 ** 32)
+
+
+def derive_rng(seed, stream: str) -> random.Random:
+    """Return an independent random.Random for `stream` under `seed`.
+
+    random.Random hashes str seeds with SHA-512, so the result is stable
+    across processes and Python runs (unlike hash()).
+    """
+    return random.Random(f"{seed}:{stream}")
+
+
+class RngRegistry:
+    """Named random.Random streams under one seed, with saveable state.
+
+        rng = game.rng.stream("economy")         # derive_rng(seed, "economy")
+        game.rng.adopt("bots.Vex", bot.rng)       # track a stream made elsewhere
+        save["rng_state"] = game.rng.get_state()
+        ...
+        game.rng.set_state(save["rng_state"])    # every stream resumes in place
+    """
+
+    def __init__(self, seed):
+        self.seed = seed
+        self._streams: Dict[str, random.Random] = {}
+        # Saved states for streams nobody has asked for yet
+        self._pending: Dict[str, Any] = {}
+
+    def stream(self, name: str) -> random.Random:
+        """The stream called `name`, derived from the seed on first use."""
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = self.adopt(name, derive_rng(self.seed, name))
+        return rng
+
+    def adopt(self, name: str, rng: random.Random) -> random.Random:
+        """Track `rng` under `name` (restoring a saved state if one is waiting)."""
+        pending = self._pending.pop(name, None)
+        if pending is not None:
+            _restore(name, rng, pending)
+        self._streams[name] = rng
+        return rng
+
+    def names(self):
+        return list(self._streams)
+
+    def reseed(self, seed):
+        """Restart every stream from `seed`, as derive_rng would build it."""
+        self.seed = seed
+        self._pending.clear()
+        for name, rng in self._streams.items():
+            rng.seed(f"{seed}:{name}")
+
+    def get_state(self) -> Dict[str, list]:
+        """JSON-ready {name: [version, internal state, gauss_next]}."""
+        state = {}
+        for name, rng in self._streams.items():
+            version, internal, gauss_next = rng.getstate()
+            state[name] = [version, list(internal), gauss_next]
+        return state
+
+    def set_state(self, state: Optional[Dict[str, Any]]):
+        """Resume streams from get_state().
+
+        Saved states also wait for adopt(): a stream created after loading
+        (the backend rebuilds its bots on load) resumes where the saved one
+        stood, whether or not an older stream of that name existed.
+        """
+        for name, saved in (state or {}).items():
+            rng = self._streams.get(name)
+            if rng is not None:
+                _restore(name, rng, saved)
+            self._pending[name] = saved
+
+
+def _restore(name: str, rng: random.Random, saved):
+    try:
+        version, internal, gauss_next = saved
+        rng.setstate((int(version), tuple(int(x) for x in internal), gauss_next))
+    except (TypeError, ValueError) as exc:
+        print(f"[4X] Warning: could not restore random stream {name!r}: {exc}")
@@ -0,0 +1,276 @@
+"""
+Spatial Index - Uniform Voxel Grid for Galaxy Coordinates
+
+The galaxy is a 500 × 500 × 200 unit box with a few hundred (and eventually
+several thousand) star systems in it.  Most gameplay questions are spatial:
+"what is within my scan range?", "what can I jump to?", "is this spot too
+close to an existing star?".  Answering those by looping over every system
+costs O(N) per question, and several callers ask inside loops.
+
+This module buckets points into cubic cells ("voxels") keyed by integer
+cell coordinates.  A query only visits the cells its search shape overlaps,
+so its cost depends on how many systems are *near* the query — not on how
+many systems exist in the galaxy.
+
+The grid is sparse (a dict of occupied cells), so coordinates outside the
+nominal galaxy bounds are handled without any special casing.
+"""
+
+import heapq
+import math
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+# Default cell edge length in galaxy units.  Jump ranges are ~15-40 units and
+# scan ranges ~20-60, so a 16-unit cell keeps typical radius queries to a
+# small block of cells while staying coarse enough that cells aren't empty.
+DEFAULT_CELL_SIZE = 16.0
+
+
+class SpatialIndex:
+    """Sparse voxel grid mapping 3D points to keys.
+
+    Every entry is stored as ``key -> (x, y, z)``.  For galaxy systems the key
+    *is* the coordinate tuple, which is also how ``Galaxy.systems`` is keyed,
+    but any hashable key works (station names, DSO ids, ...).
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int, int], Dict[Hashable, Tuple[float, float, float]]] = {}
+        self._points: Dict[Hashable, Tuple[float, float, float]] = {}
+        self._cell_of: Dict[Hashable, Tuple[int, int, int]] = {}
+        # Bounding box of occupied cells as (min_cell, max_cell); None = stale.
+        self._bounds: Optional[Tuple[Tuple[int, int, int], Tuple[int, int, int]]] = None
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _cell(self, x: float, y: float, z: float) -> Tuple[int, int, int]:
+        s = self.cell_size
+        return (math.floor(x / s), math.floor(y / s), math.floor(z / s))
+
+    def insert(self, key: Hashable, coords: Optional[Tuple[float, float, float]] = None):
+        """Add (or move) an entry.  When ``coords`` is omitted the key itself
+        must be an (x, y, z) tuple."""
+        if coords is None:
+            coords = key
+        x, y, z = coords[0], coords[1], coords[2]
+        if key in self._points:
+            self.remove(key)
+        cell = self._cell(x, y, z)
+        self._cells.setdefault(cell, {})[key] = (x, y, z)
+        self._points[key] = (x, y, z)
+        self._cell_of[key] = cell
+        if self._bounds is not None:
+            lo, hi = self._bounds
+            self._bounds = (tuple(min(a, b) for a, b in zip(lo, cell)),
+                            tuple(max(a, b) for a, b in zip(hi, cell)))
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove an entry.  Returns False if the key was not indexed."""
+        cell = self._cell_of.pop(key, None)
+        if cell is None:
+            return False
+        del self._points[key]
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._cells[cell]
+                self._bounds = None
+        return True
+
+    def clear(self):
+        self._cells.clear()
+        self._points.clear()
+        self._cell_of.clear()
+        self._bounds = None
+
+    def _cell_bounds(self):
+        """(min_cell, max_cell) over occupied cells, recomputed only after a
+        removal emptied a cell.  Returns None when the index is empty."""
+        if not self._cells:
+            return None
+        if self._bounds is None:
+            cells = list(self._cells)
+            self._bounds = (tuple(min(c[i] for c in cells) for i in range(3)),
+                            tuple(max(c[i] for c in cells) for i in range(3)))
+        return self._bounds
+
+    def rebuild(self, items: Iterable):
+        """Replace the index contents with ``(key, coords)`` pairs."""
+        self.clear()
+        for key, coords in items:
+            self.insert(key, coords)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._points
+
+    def get(self, key: Hashable) -> Optional[Tuple[float, float, float]]:
+        return self._points.get(key)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _cells_in_box(self, lo: Tuple[float, float, float], hi: Tuple[float, float, float]):
+        """Yield the occupied buckets whose cells overlap the box [lo, hi]."""
+        cx0, cy0, cz0 = self._cell(*lo)
+        cx1, cy1, cz1 = self._cell(*hi)
+        cells = self._cells
+        # When the box is larger than the populated area it is cheaper to walk
+        # the occupied cells than every (mostly empty) cell in the box.
+        box_cells = (cx1 - cx0 + 1) * (cy1 - cy0 + 1) * (cz1 - cz0 + 1)
+        if box_cells > len(cells):
+            for (cx, cy, cz), bucket in cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1 and cz0 <= cz <= cz1:
+                    yield bucket
+            return
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                for cz in range(cz0, cz1 + 1):
+                    bucket = cells.get((cx, cy, cz))
+                    if bucket:
+                        yield bucket
+
+    def query_box(self, min_corner: Tuple[float, float, float],
+                  max_corner: Tuple[float, float, float]) -> List[Hashable]:
+        """Return keys whose points lie inside the axis-aligned box (inclusive)."""
+        x0, y0, z0 = min_corner
+        x1, y1, z1 = max_corner
+        found = []
+        for bucket in self._cells_in_box(min_corner, max_corner):
+            for key, (px, py, pz) in bucket.items():
+                if x0 <= px <= x1 and y0 <= py <= y1 and z0 <= pz <= z1:
+                    found.append(key)
+        return found
+
+    def query_radius(self, center: Tuple[float, float, float], radius: float,
+                     sort: bool = False) -> List[Tuple[Hashable, float]]:
+        """Return ``(key, distance)`` for every point within ``radius`` (3D)."""
+        cx, cy, cz = center[0], center[1], center[2]
+        r2 = radius * radius
+        found = []
+        for bucket in self._cells_in_box((cx - radius, cy - radius, cz - radius),
+                                         (cx + radius, cy + radius, cz + radius)):
+            for key, (px, py, pz) in bucket.items():
+                d2 = (px - cx) ** 2 + (py - cy) ** 2 + (pz - cz) ** 2
+                if d2 <= r2:
+                    found.append((key, math.sqrt(d2)))
+        if sort:
+            found.sort(key=lambda item: item[1])
+        return found
+
+    def query_cylinder(self, center: Tuple[float, float, float], radius: float,
+                       z_min: float = -math.inf, z_max: float = math.inf,
+                       sort: bool = False) -> List[Tuple[Hashable, float]]:
+        """Return ``(key, planar_distance)`` for points within ``radius`` in the
+        X/Y plane and between ``z_min`` and ``z_max``.
+
+        Used by callers that deliberately ignore depth (the 2D scan view).
+        """
+        cx, cy = center[0], center[1]
+        r2 = radius * radius
+        bounds = self._cell_bounds()
+        if bounds is None:
+            return []
+        # Clamp open Z bounds to the populated extent so the box walk stays finite.
+        z_min = max(z_min, bounds[0][2] * self.cell_size)
+        z_max = min(z_max, (bounds[1][2] + 1) * self.cell_size)
+        found = []
+        for bucket in self._cells_in_box((cx - radius, cy - radius, z_min),
+                                         (cx + radius, cy + radius, z_max)):
+            for key, (px, py, pz) in bucket.items():
+                if pz < z_min or pz > z_max:
+                    continue
+                d2 = (px - cx) ** 2 + (py - cy) ** 2
+                if d2 <= r2:
+                    found.append((key, math.sqrt(d2)))
+        if sort:
+            found.sort(key=lambda item: item[1])
+        return found
+
+    def any_within(self, center: Tuple[float, float, float], radius: float,
+                   strict: bool = True) -> bool:
+        """True if at least one point lies within ``radius`` of ``center``.
+
+        ``strict`` uses ``<`` (the historical spacing rule); otherwise ``<=``.
+        Returns as soon as a hit is found.
+        """
+        cx, cy, cz = center[0], center[1], center[2]
+        r2 = radius * radius
+        for bucket in self._cells_in_box((cx - radius, cy - radius, cz - radius),
+                                         (cx + radius, cy + radius, cz + radius)):
+            for px, py, pz in bucket.values():
+                d2 = (px - cx) ** 2 + (py - cy) ** 2 + (pz - cz) ** 2
+                if d2 < r2 or (not strict and d2 == r2):
+                    return True
+        return False
+
+    def nearest(self, center: Tuple[float, float, float], k: int = 1,
+                max_distance: Optional[float] = None,
+                exclude_center: bool = False) -> List[Tuple[Hashable, float]]:
+        """Return up to ``k`` ``(key, distance)`` pairs closest to ``center``.
+
+        Walks outward in shells of cells.  After finishing shell ``n`` every
+        unvisited point is at least ``n * cell_size`` away, so the search stops
+        as soon as the k-th best candidate is closer than that bound.
+        """
+        if k <= 0 or not self._points:
+            return []
+        cx, cy, cz = center[0], center[1], center[2]
+        ox, oy, oz = self._cell(cx, cy, cz)
+        # Furthest shell that could contain anything at all.
+        lo, hi = self._cell_bounds()
+        max_shell = max(ox - lo[0], hi[0] - ox,
+                        oy - lo[1], hi[1] - oy,
+                        oz - lo[2], hi[2] - oz, 0)
+        if max_distance is not None:
+            max_shell = min(max_shell, int(math.ceil(max_distance / self.cell_size)) + 1)
+
+        heap: List[Tuple[float, int, Hashable]] = []  # max-heap via negated distance
+        counter = 0
+        cells = self._cells
+        for shell in range(max_shell + 1):
+            for cell in _shell_cells(ox, oy, oz, shell):
+                bucket = cells.get(cell)
+                if not bucket:
+                    continue
+                for key, (px, py, pz) in bucket.items():
+                    d = math.sqrt((px - cx) ** 2 + (py - cy) ** 2 + (pz - cz) ** 2)
+                    if exclude_center and d == 0:
+                        continue
+                    if max_distance is not None and d > max_distance:
+                        continue
+                    counter += 1
+                    if len(heap) < k:
+                        heapq.heappush(heap, (-d, counter, key))
+                    elif d < -heap[0][0]:
+                        heapq.heapreplace(heap, (-d, counter, key))
+            if len(heap) == k and -heap[0][0] <= shell * self.cell_size:
+                break
+        result = [(key, -neg_d) for neg_d, _, key in heap]
+        result.sort(key=lambda item: item[1])
+        return result
+
+
+def _shell_cells(ox: int, oy: int, oz: int, n: int):
+    """Yield the cells at Chebyshev distance exactly ``n`` from (ox, oy, oz)."""
+    if n == 0:
+        yield (ox, oy, oz)
+        return
+    for dx in range(-n, n + 1):
+        for dy in range(-n, n + 1):
+            if abs(dx) == n or abs(dy) == n:
+                for dz in range(-n, n + 1):
+                    yield (ox + dx, oy + dy, oz + dz)
+            else:
+                yield (ox + dx, oy + dy, oz - n)
+                yield (ox + dx, oy + dy, oz + n)
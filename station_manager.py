@@ -4,6 +4,8 @@ Ship Upgrade and Space Station Management System
 
 import random
 
+from seeding import derive_rng
+
 # Must match GALAXY_SCALE in backend/hex_utils.py and frontend/js/views/galaxy.js
 GALAXY_SCALE = 12.5
 
@@ -165,8 +167,16 @@ class ShipUpgradeSystem:
 
 
 class SpaceStationManager:
-    def __init__(self, galaxy):
+    def __init__(self, galaxy, seed=None):
         self.galaxy = galaxy
+        # Placement draws from the world seed (the galaxy's, unless overridden)
+        # so the same galaxy always gets the same stations.
+        if seed is None:
+            seed = getattr(galaxy, 'seed', None)
+        self.rng = derive_rng(seed, "stations") if seed is not None else random.Random()
+        # (hex_q, hex_r) → station, see _stations_by_hex()
+        self._hex_lookup = {}
+        self._hex_lookup_key = None
         self.station_types = {
             "Trading Post": {
                 "cost": 500000,
@@ -225,12 +235,12 @@ class SpaceStationManager:
     def place_stations_in_galaxy(self):
         """Place 15-20 NPC stations in random star systems."""
         systems = list(self.galaxy.systems.values())
-        num_stations = random.randint(15, 20)
+        num_stations = self.rng.randint(15, 20)
 
         if len(systems) < num_stations:
             num_stations = len(systems)
 
-        selected_systems = random.sample(systems, num_stations)
+        selected_systems = self.rng.sample(systems, num_stations)
 
         station_names = [
             "Nexus Prime", "Starforge Alpha", "Deep Space Nine", "Babylon Station",
@@ -248,7 +258,7 @@ class SpaceStationManager:
                 name = name + " II"
             used_names.add(name)
 
-            station_type = random.choice(list(self.station_types.keys()))
+            station_type = self.rng.choice(list(self.station_types.keys()))
             coords = system["coordinates"]
 
             self.stations[name] = {
@@ -277,12 +287,18 @@ class SpaceStationManager:
             "Null Point Station", "The Drifting Spire", "Interstellar Waypoint",
             "The Abyssal Forge",
         ]
-        count = random.randint(5, min(7, len(deep_space_names)))
-        pairs = random.sample(
-            [(systems[i], systems[j])
-             for i in range(len(systems)) for j in range(i + 1, len(systems))],
-            count
-        )
+        count = self.rng.randint(5, min(7, len(deep_space_names)))
+        # Draw distinct system pairs directly rather than sampling from the
+        # full list of N*(N-1)/2 pairs, which is huge for large galaxies.
+        count = min(count, len(systems) * (len(systems) - 1) // 2)
+        chosen = []
+        seen_pairs = set()
+        while len(chosen) < count:
+            i, j = sorted(self.rng.sample(range(len(systems)), 2))
+            if (i, j) not in seen_pairs:
+                seen_pairs.add((i, j))
+                chosen.append((systems[i], systems[j]))
+        pairs = chosen
 
         used_names = set(self.stations.keys())
         for pair_idx, (sys_a, sys_b) in enumerate(pairs):
@@ -300,7 +316,7 @@ class SpaceStationManager:
                 (ca[2] + cb[2]) / 2.0,
             )
 
-            station_type = random.choice(list(self.station_types.keys()))
+            station_type = self.rng.choice(list(self.station_types.keys()))
 
             self.stations[name] = {
                 "name":         name,
@@ -337,12 +353,21 @@ class SpaceStationManager:
 
     def get_station_at_location(self, coordinates):
         """Return the first station whose coordinates match (within rounding)."""
-        target_q = round(coordinates[0] / GALAXY_SCALE)
-        target_r = round(coordinates[1] / GALAXY_SCALE)
-        for station in self.stations.values():
-            if station["hex_q"] == target_q and station["hex_r"] == target_r:
-                return station
-        return None
+        target = (self._coords_to_hex_q(coordinates), self._coords_to_hex_r(coordinates))
+        return self._stations_by_hex().get(target)
+
+    def _stations_by_hex(self):
+        """(hex_q, hex_r) → first station on that hex, rebuilt only when the
+        station set changes.  Bots and the player look stations up by
+        location every move, so this replaces a scan of every station."""
+        key = (id(self.stations), len(self.stations))
+        if self._hex_lookup_key != key:
+            lookup = {}
+            for station in self.stations.values():
+                lookup.setdefault((station["hex_q"], station["hex_r"]), station)
+            self._hex_lookup = lookup
+            self._hex_lookup_key = key
+        return self._hex_lookup
 
     def get_stations_in_system(self, system_name: str):
         """Return all stations in a given star system."""
@@ -0,0 +1,210 @@
+"""
+Tier-2 tests: single-writer game actor (backend/actor.py) and the Game
+background-tick switch it replaces the bot thread with.
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_actor.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import types
+import pytest
+from backend.actor import GameActor, SessionSlots
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+# ---------------------------------------------------------------------------
+# GameActor
+# ---------------------------------------------------------------------------
+
+class TestGameActor:
+
+    def test_exclusive_blocks_never_interleave(self):
+        log = []
+
+        async def scenario():
+            actor = GameActor()
+
+            async def writer(name):
+                async with actor.exclusive():
+                    log.append(f"{name}:start")
+                    await asyncio.sleep(0.01)   # a handler that yields mid-mutation
+                    log.append(f"{name}:end")
+
+            await asyncio.gather(*(writer(n) for n in "abc"))
+            await actor.stop()
+
+        _run(scenario())
+        assert log == ["a:start", "a:end", "b:start", "b:end", "c:start", "c:end"]
+
+    def test_submit_shares_the_queue_with_exclusive(self):
+        log = []
+
+        async def scenario():
+            actor = GameActor()
+
+            async def request():
+                async with actor.exclusive():
+                    await asyncio.sleep(0.01)
+                    log.append("request")
+
+            task = asyncio.ensure_future(request())
+            await asyncio.sleep(0)                 # request queues first
+            result = await actor.submit(lambda: log.append("tick") or 42)
+            await task
+            await actor.stop()
+            return result, actor.processed
+
+        assert _run(scenario()) == (42, 2)
+        assert log == ["request", "tick"]
+
+    def test_submit_propagates_errors(self):
+        async def scenario():
+            actor = GameActor()
+            with pytest.raises(ValueError):
+                await actor.submit(lambda: (_ for _ in ()).throw(ValueError("boom")))
+            # the queue keeps working afterwards
+            value = await actor.submit(lambda x: x * 2, 21)
+            await actor.stop()
+            return value, actor.failed
+
+        assert _run(scenario()) == (42, 1)
+
+    def test_cancelled_waiter_does_not_wedge_the_queue(self):
+        async def scenario():
+            actor = GameActor()
+
+            async def hold(seconds):
+                async with actor.exclusive():
+                    await asyncio.sleep(seconds)
+
+            first = asyncio.ensure_future(hold(0.02))
+            await asyncio.sleep(0)
+            waiting = asyncio.ensure_future(hold(10))
+            await asyncio.sleep(0)
+            waiting.cancel()
+            await first
+            value = await asyncio.wait_for(actor.submit(lambda: "ok"), timeout=1)
+            await actor.stop()
+            return value
+
+        assert _run(scenario()) == "ok"
+
+    def test_every_runs_through_the_queue(self):
+        ticks = []
+
+        async def scenario():
+            actor = GameActor()
+            actor.every(0.001, ticks.append, "tick")
+            await asyncio.sleep(0.05)
+            await actor.stop()
+
+        _run(scenario())
+        assert ticks and set(ticks) == {"tick"}
+
+
+# ---------------------------------------------------------------------------
+# SessionSlots
+# ---------------------------------------------------------------------------
+
+class TestSessionSlots:
+
+    def test_two_sessions_make_progress_concurrently(self):
+        async def scenario():
+            slots = SessionSlots()
+            b_ran = asyncio.Event()
+
+            async def player_a():
+                async with slots.exclusive("a"):
+                    # Only finishes if b's call runs while a holds its slot
+                    await asyncio.wait_for(b_ran.wait(), timeout=1)
+
+            async def player_b():
+                async with slots.exclusive("b"):
+                    b_ran.set()
+
+            a = asyncio.ensure_future(player_a())
+            await asyncio.sleep(0)
+            await asyncio.wait_for(player_b(), timeout=1)
+            await a
+            return len(slots)
+
+        assert _run(scenario()) == 0
+
+    def test_one_session_is_applied_in_order(self):
+        log = []
+
+        async def scenario():
+            slots = SessionSlots()
+
+            async def call(name):
+                async with slots.exclusive("a"):
+                    log.append(f"{name}:start")
+                    await asyncio.sleep(0.01)
+                    log.append(f"{name}:end")
+
+            await asyncio.gather(*(call(n) for n in "xyz"))
+
+        _run(scenario())
+        assert log == ["x:start", "x:end", "y:start", "y:end", "z:start", "z:end"]
+
+    def test_in_use_while_held_or_queued(self):
+        async def scenario():
+            slots = SessionSlots()
+            release = asyncio.Event()
+            seen = []
+
+            async def hold():
+                async with slots.exclusive("a"):
+                    await release.wait()
+
+            first = asyncio.ensure_future(hold())
+            await asyncio.sleep(0)
+            queued = asyncio.ensure_future(hold())
+            await asyncio.sleep(0)
+            seen.append(slots.in_use("a"))
+            first.cancel()
+            await asyncio.sleep(0)
+            seen.append(slots.in_use("a"))      # the queued call now holds it
+            release.set()
+            await queued
+            seen.append(slots.in_use("a"))
+            return seen
+
+        assert _run(scenario()) == [True, True, False]
+
+
+# ---------------------------------------------------------------------------
+# Game background tick
+# ---------------------------------------------------------------------------
+
+class TestGameBackgroundTick:
+
+    def test_thread_disabled_for_backend(self):
+        from game import Game
+        g = Game(background_thread=False)
+        g.bot_manager = types.SimpleNamespace(update_all_bots=lambda: None)
+        g.start_bot_update_thread()
+        assert g.bot_update_thread is None
+
+    def test_run_background_tick_updates_bots_and_events(self):
+        from game import Game
+        g = Game(background_thread=False)
+        calls = []
+        g.bot_manager = types.SimpleNamespace(update_all_bots=lambda: calls.append("bots"))
+        g.event_system = types.SimpleNamespace(update_events=lambda: calls.append("events"))
+        g.run_background_tick()
+        assert calls == ["bots", "events"]
@@ -0,0 +1,133 @@
+"""
+Tier-2 tests: indexed, expiring dangerous regions (danger_regions.DangerRegions
+and EventSystem's danger queries).
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_danger_regions.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import random
+import pytest
+import unittest.mock as mock
+from danger_regions import DangerRegions
+from events import EventSystem, DANGER_REGION_TTL_TURNS
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _linear(regions, coords):
+    """Reference: the original scan over every region."""
+    return any(math.dist(coords, c) <= r["radius"] for c, r in regions.items())
+
+
+def _random_regions(n=200, seed=3):
+    rng = random.Random(seed)
+    return {
+        (rng.randint(0, 500), rng.randint(0, 500), rng.randint(0, 200)):
+            {"radius": rng.randint(3, 12), "threat_level": 7}
+        for _ in range(n)
+    }
+
+
+@pytest.fixture()
+def event_system():
+    game = mock.MagicMock()
+    game.current_turn = 1
+    with mock.patch.object(EventSystem, "generate_initial_events"):
+        return EventSystem(game)
+
+
+# ---------------------------------------------------------------------------
+# DangerRegions
+# ---------------------------------------------------------------------------
+
+class TestDangerRegions:
+
+    def test_matches_linear_scan(self):
+        plain = _random_regions()
+        regions = DangerRegions(plain)
+        rng = random.Random(9)
+        points = [(rng.uniform(0, 500), rng.uniform(0, 500), rng.uniform(0, 200)) for _ in range(3000)]
+        points += list(plain)  # centers are always inside
+        expected = [_linear(plain, p) for p in points]
+        assert [regions.is_dangerous(p) for p in points] == expected
+        assert regions.flag_many(points) == expected
+
+    def test_dict_writes_keep_index_in_step(self):
+        regions = DangerRegions()
+        regions[(100, 100, 50)] = {"radius": 10}
+        assert regions.is_dangerous((105, 100, 50))
+        regions[(100, 100, 50)] = {"radius": 2}
+        assert not regions.is_dangerous((105, 100, 50))
+        del regions[(100, 100, 50)]
+        assert not regions.is_dangerous((100, 100, 50))
+        assert regions.copy() == {} and type(regions.copy()) is dict
+
+    def test_expire_by_turn(self):
+        regions = DangerRegions()
+        regions[(10, 10, 10)] = {"radius": 5, "expires_turn": 3}
+        regions[(50, 50, 50)] = {"radius": 5, "expires_turn": 6}
+        regions[(90, 90, 90)] = {"radius": 5}  # permanent
+        assert regions.expire(2) == []
+        assert regions.expire(3) == [(10, 10, 10)]
+        assert not regions.is_dangerous((10, 10, 10))
+        assert regions.expire(100) == [(50, 50, 50)]
+        assert list(regions) == [(90, 90, 90)]
+
+    def test_replaced_region_uses_new_expiry(self):
+        regions = DangerRegions()
+        regions[(10, 10, 10)] = {"radius": 5, "expires_turn": 3}
+        regions[(10, 10, 10)] = {"radius": 5, "expires_turn": 8}
+        assert regions.expire(5) == []
+        assert (10, 10, 10) in regions
+
+    def test_version_tracks_changes(self):
+        regions = DangerRegions()
+        v = regions.version
+        regions[(1, 1, 1)] = {"radius": 1}
+        regions.pop((1, 1, 1))
+        assert regions.version == v + 2
+
+    def test_pickle_round_trip_keeps_index_and_expiry(self):
+        import pickle
+        regions = DangerRegions({(10, 10, 10): {"radius": 5, "expires_turn": 3}}, cell_size=8)
+        regions[(90, 90, 90)] = {"radius": 5}
+        restored = pickle.loads(pickle.dumps(regions))
+        assert restored == regions and restored.cell_size == 8.0
+        assert restored.version == regions.version
+        assert restored.is_dangerous((12, 10, 10))
+        assert restored.expire(3) == [(10, 10, 10)]
+
+
+# ---------------------------------------------------------------------------
+# EventSystem integration
+# ---------------------------------------------------------------------------
+
+class TestEventSystemDanger:
+
+    def test_event_regions_expire_after_ttl(self, event_system):
+        event_system.create_dangerous_region({"center": (200, 200, 100), "radius": 8, "threat_level": 9})
+        assert event_system.is_location_dangerous((204, 200, 100))
+        event_system.game.current_turn = 1 + DANGER_REGION_TTL_TURNS
+        with mock.patch("events.random.random", return_value=0.99):  # no new events
+            event_system.update_events()
+        assert not event_system.is_location_dangerous((204, 200, 100))
+        assert event_system.get_dangerous_regions() == {}
+
+    def test_batch_api(self, event_system):
+        event_system.create_dangerous_region({"center": (0, 0, 0), "radius": 5, "threat_level": 6})
+        assert event_system.are_locations_dangerous([(1, 1, 1), (50, 0, 0)]) == [True, False]
+
+    def test_plain_dict_assignment_still_works(self, event_system):
+        event_system.dangerous_regions = {(30, 30, 30): {"radius": 4}}
+        assert event_system.is_location_dangerous((32, 30, 30))
+        assert isinstance(event_system.dangerous_regions, DangerRegions)
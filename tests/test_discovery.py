@@ -0,0 +1,190 @@
+"""
+Tier-2 tests: incremental fog-of-war discovery engine.
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_discovery.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import pytest
+import unittest.mock as mock
+from discovery import DiscoveryEngine
+from navigation import Galaxy, Ship
+from backend.deep_space import DeepSpaceObject
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def galaxy():
+    return Galaxy(seed=2024)
+
+
+def _dist(a, b):
+    return math.sqrt(sum((p - q) ** 2 for p, q in zip(a, b)))
+
+
+def _game_for(galaxy, coords, scan_range=60.0, station_manager=None):
+    ship = Ship("Scout")
+    ship.coordinates = coords
+    ship.scan_range = scan_range
+    g = mock.MagicMock()
+    g.navigation.galaxy = galaxy
+    g.navigation.current_ship = ship
+    g.station_manager = station_manager
+    return g
+
+
+class _FakeStations:
+    def __init__(self, stations):
+        self.stations = {s["name"]: s for s in stations}
+
+    def get_deep_space_stations(self):
+        return list(self.stations.values())
+
+
+def _dso(q, r, coords):
+    # The real (unhashable) dataclass, so the index must not key on it
+    return DeepSpaceObject(type="anomaly", hex_q=q, hex_r=r, x=coords[0], y=coords[1],
+                           z=coords[2], name=f"Anomaly {q},{r}", description="",
+                           subtype="Nebula Pocket")
+
+
+class _FakeDSOManager:
+    def __init__(self, objects):
+        self._objects = {(o.hex_q, o.hex_r): o for o in objects}
+
+    def list_all(self):
+        return list(self._objects.values())
+
+    def count(self):
+        return len(self._objects)
+
+    def discover(self, q, r):
+        self._objects[(q, r)].discovered = True
+
+
+# ---------------------------------------------------------------------------
+# Systems
+# ---------------------------------------------------------------------------
+
+class TestSystemDiscovery:
+
+    def test_in_range_matches_brute_force(self, galaxy):
+        origin = sorted(galaxy.systems)[10]
+        engine = DiscoveryEngine()
+        engine.observe(_game_for(galaxy, origin, 70))
+        expected = {c for c in galaxy.systems if _dist(c, origin) <= 70}
+        assert engine.in_range_systems == expected
+        assert {c for c, _d, in_range in engine.iter_systems(galaxy) if in_range} == expected
+
+    def test_discovered_systems_persist_as_ghosts(self, galaxy):
+        coords = sorted(galaxy.systems)
+        engine = DiscoveryEngine()
+        g = _game_for(galaxy, coords[0], 50)
+        engine.observe(g)
+        first = set(engine.in_range_systems)
+        g.navigation.current_ship.coordinates = coords[-1]
+        engine.observe(g)
+        seen = {c: in_range for c, _d, in_range in engine.iter_systems(galaxy)}
+        for c in first - engine.in_range_systems:
+            assert seen[c] is False
+
+    def test_observe_skips_when_view_unchanged(self, galaxy):
+        engine = DiscoveryEngine()
+        g = _game_for(galaxy, next(iter(galaxy.systems)))
+        assert engine.observe(g) is True
+        assert engine.observe(g) is False
+        g.navigation.current_ship.scan_range = 90.0
+        assert engine.observe(g) is True
+        g.navigation.current_ship.coordinates = (1.0, 2.0, 3.0)
+        assert engine.observe(g) is True
+
+    def test_seeds_from_visited_systems(self, galaxy):
+        coords = sorted(galaxy.systems)[-1]
+        galaxy.systems[coords]["visited"] = True
+        try:
+            engine = DiscoveryEngine()
+            engine.observe(_game_for(galaxy, (0.0, 0.0, 0.0), 1.0))
+            assert coords in {c for c, _d, _r in engine.iter_systems(galaxy)}
+        finally:
+            galaxy.systems[coords]["visited"] = False
+
+    def test_snapshot_restore_resolves_names(self, galaxy):
+        coords = sorted(galaxy.systems)[:3]
+        names = [galaxy.systems[c]["name"] for c in coords]
+        engine = DiscoveryEngine()
+        engine.restore(names, {}, {})
+        engine.observe(_game_for(galaxy, (0.0, 0.0, 0.0), 1.0))
+        assert {c for c, _d, _r in engine.iter_systems(galaxy)} >= set(coords)
+        assert set(engine.snapshot()[0]) >= set(names)
+
+
+# ---------------------------------------------------------------------------
+# Stations + DSOs
+# ---------------------------------------------------------------------------
+
+class TestStationAndDSODiscovery:
+
+    def test_station_ghost_strips_live_data(self, galaxy):
+        stations = _FakeStations([{
+            "name": "Waypoint", "type": "Relay", "hex_q": 1, "hex_r": 1,
+            "coordinates": (100, 100, 100), "services": ["fuel"], "description": "Busy",
+        }])
+        engine = DiscoveryEngine()
+        g = _game_for(galaxy, (105, 100, 100), 20, stations)
+        engine.observe(g)
+        assert engine.station_entries()[0]["in_scan_range"] is True
+        g.navigation.current_ship.coordinates = (400, 400, 100)
+        engine.observe(g)
+        ghost = engine.station_entries()[0]
+        assert ghost["in_scan_range"] is False
+        assert ghost["services"] == [] and ghost["description"] == ""
+
+    def test_dsos_discovered_in_range_only(self, galaxy):
+        near, far = _dso(1, 1, (50, 50, 50)), _dso(9, 9, (450, 450, 50))
+        engine = DiscoveryEngine()
+        engine.dso_manager = _FakeDSOManager([near, far])
+        engine.observe(_game_for(galaxy, (55, 50, 50), 20))
+        assert near.discovered and not far.discovered
+        entries = engine.dso_entries()
+        assert [(e["hex_q"], e["in_scan_range"]) for e in entries] == [(1, True)]
+
+    def test_in_range_dso_entries_are_live(self, galaxy):
+        dso = _dso(2, 2, (60, 60, 60))
+        engine = DiscoveryEngine()
+        engine.dso_manager = _FakeDSOManager([dso])
+        engine.observe(_game_for(galaxy, (60, 60, 60), 10))
+        dso.depleted = True  # harvested without the ship moving
+        assert engine.dso_entries()[0]["depleted"] is True
+
+
+# ---------------------------------------------------------------------------
+# Engine hooks
+# ---------------------------------------------------------------------------
+
+class TestMovementHooks:
+
+    def test_jump_refreshes_player_ship_only(self, galaxy):
+        coords = sorted(galaxy.systems)
+        g = _game_for(galaxy, coords[0], 40)
+        g.discovery = mock.MagicMock()
+        player = g.navigation.current_ship
+        player.jump_range = 1000
+        player.fuel = player.max_fuel = 10 ** 6
+        player.jump_to(coords[1], galaxy, g)
+        assert g.discovery.observe.call_count == 1
+
+        bot = Ship("Bot")
+        bot.jump_range = 1000
+        bot.fuel = bot.max_fuel = 10 ** 6
+        bot.jump_to(coords[2], galaxy, g)
+        assert g.discovery.observe.call_count == 1
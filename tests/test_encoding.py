@@ -0,0 +1,156 @@
+"""
+Tier-2 tests: response encodings (backend/encoding.py) and content-versioned
+static asset URLs (backend/assets.py).
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_encoding.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gzip
+import json
+import pytest
+from backend import encoding
+from backend.encoding import (
+    columnarize, compress, from_columnar, is_compressible, negotiate_encoding, to_columnar,
+)
+from backend.assets import AssetVersioner
+
+
+# ---------------------------------------------------------------------------
+# Compression negotiation
+# ---------------------------------------------------------------------------
+
+class TestNegotiation:
+
+    def test_gzip_when_brotli_unavailable(self, monkeypatch):
+        monkeypatch.setattr(encoding, "brotli", None)
+        assert negotiate_encoding("gzip, deflate, br") == "gzip"
+
+    def test_brotli_preferred_when_available(self, monkeypatch):
+        monkeypatch.setattr(encoding, "brotli", object())
+        assert negotiate_encoding("gzip, deflate, br") == "br"
+
+    def test_q_zero_refuses(self, monkeypatch):
+        monkeypatch.setattr(encoding, "brotli", None)
+        assert negotiate_encoding("gzip;q=0, identity") is None
+        assert negotiate_encoding("") is None
+        assert negotiate_encoding("*;q=0.5") == "gzip"
+
+    def test_compressible_types(self):
+        assert is_compressible("application/json")
+        assert is_compressible("text/javascript; charset=utf-8")
+        assert not is_compressible("text/event-stream")
+        assert not is_compressible("image/png")
+
+    def test_gzip_round_trip(self):
+        body = json.dumps({"systems": [{"name": f"S{i}"} for i in range(500)]}).encode()
+        packed = compress(body, "gzip")
+        assert len(packed) < len(body)
+        assert gzip.decompress(packed) == body
+
+
+# ---------------------------------------------------------------------------
+# Columnar layout
+# ---------------------------------------------------------------------------
+
+class TestColumnar:
+
+    def test_round_trip_preserves_records(self):
+        records = [
+            {"name": "Sol", "hex_q": 1, "population": None},
+            {"name": "Vega", "hex_q": 4, "population": 1200},
+        ]
+        table = to_columnar(records)
+        assert table == {
+            "$columns": {"name": ["Sol", "Vega"], "hex_q": [1, 4], "population": [None, 1200]},
+            "$count": 2,
+        }
+        assert from_columnar(table) == records
+
+    def test_mixed_shapes_are_left_alone(self):
+        records = [{"name": "Sol"}, {"name": "Vega", "extra": 1}]
+        assert to_columnar(records) is records
+        assert to_columnar([]) == []
+
+    def test_columnarize_only_on_request(self):
+        payload = {"ships": [{"name": "A"}, {"name": "B"}], "turn": 3}
+        assert columnarize(payload, ("ships",), None) is payload
+        out = columnarize(payload, ("ships",), "columnar")
+        assert out["turn"] == 3
+        assert out["ships"]["$count"] == 2
+        assert payload["ships"] == [{"name": "A"}, {"name": "B"}]
+
+    def test_columnar_is_smaller_for_large_lists(self):
+        records = [{"name": f"System {i}", "hex_q": i, "hex_r": -i, "visited": False}
+                   for i in range(300)]
+        plain = json.dumps(records)
+        packed = json.dumps(to_columnar(records))
+        assert len(packed) < len(plain) * 0.7
+
+
+# ---------------------------------------------------------------------------
+# Asset versioning
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def frontend(tmp_path):
+    (tmp_path / "js" / "views").mkdir(parents=True)
+    (tmp_path / "css").mkdir()
+    (tmp_path / "index.html").write_text(
+        '<link rel="stylesheet" href="/css/main.css">\n'
+        '<script type="module" src="/js/main.js"></script>\n'
+        '<a href="https://example.com/js/x.js">x</a>\n'
+    )
+    (tmp_path / "js" / "main.js").write_text(
+        'import { state } from "./state.js";\n'
+        'import "./side-effect.js";\n'
+    )
+    (tmp_path / "js" / "views" / "galaxy.js").write_text(
+        'import { api } from "../api.js";\n'
+        'const m = await import("../main.js");\n'
+    )
+    (tmp_path / "css" / "main.css").write_text("body { color: red; }\n")
+    return tmp_path
+
+
+class TestAssetVersioner:
+
+    def test_html_and_js_urls_carry_build_id(self, frontend):
+        assets = AssetVersioner(str(frontend))
+        build = assets.build_id()
+        html = assets.render("index.html")[0].decode()
+        assert f'href="/css/main.css?v={build}"' in html
+        assert f'src="/js/main.js?v={build}"' in html
+        assert "https://example.com/js/x.js" in html
+
+        main_js = assets.render("js/main.js")[0].decode()
+        assert f'from "./state.js?v={build}"' in main_js
+        assert f'import "./side-effect.js?v={build}"' in main_js
+        galaxy_js = assets.render("js/views/galaxy.js")[0].decode()
+        assert f'import("../main.js?v={build}")' in galaxy_js
+
+        body, media_type, _etag = assets.render("css/main.css")
+        assert body == b"body { color: red; }\n"
+        assert media_type == "text/css"
+
+    def test_edit_changes_build_id_and_etag(self, frontend, monkeypatch):
+        monkeypatch.setattr("backend.assets.RECHECK_SECONDS", 0)
+        assets = AssetVersioner(str(frontend))
+        before = assets.build_id()
+        etag_before = assets.render("index.html")[2]
+        (frontend / "js" / "main.js").write_text('import { state } from "./state2.js";\n')
+        assert assets.build_id() != before
+        assert assets.render("index.html")[2] != etag_before
+
+    def test_paths_outside_root_are_refused(self, frontend):
+        assets = AssetVersioner(str(frontend / "js"))
+        with pytest.raises(FileNotFoundError):
+            assets.render("../index.html")
+        with pytest.raises(FileNotFoundError):
+            assets.render("missing.js")
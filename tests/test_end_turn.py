@@ -286,11 +286,10 @@ class TestResolveEndTurn:
         assert any("repair" in e["message"].lower() for e in hull_events)
 
     def test_hull_damage_reduced_after_repair(self, game):
-        # Patch random so the 5% hazard roll never fires; only the repair path runs.
+        # Patch the hull stream so the 5% hazard roll never fires; only the repair path runs.
         import unittest.mock as mock
         game.ship_hull_damage = 5.0
-        with mock.patch("game.random") as mock_rnd:
-            mock_rnd.random.return_value = 1.0   # > 0.05 → no hazard
+        with mock.patch.object(game.rng.stream("hull"), "random", return_value=1.0):  # > 0.05 → no hazard
             game.resolve_end_turn()
         assert game.ship_hull_damage < 5.0
 
@@ -305,6 +304,12 @@ class TestResolveEndTurn:
         game_with_research.resolve_end_turn()
         assert game_with_research.research_progress == rp * 2
 
+    def test_bumps_world_version(self, game):
+        before = game.world_version
+        game.resolve_end_turn()
+        game.resolve_end_turn()
+        assert game.world_version == before + 2
+
 
 # ---------------------------------------------------------------------------
 # TestBotManagerTick — bots tick inside the engine (step 8)
@@ -0,0 +1,132 @@
+"""
+Tier-2 tests: faction-control lookups (faction_control.FactionControlIndex,
+Galaxy.get_faction_for_location, FactionSystem territories).
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_faction_control.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import pytest
+from faction_control import FactionControlIndex
+from factions import FactionSystem
+from navigation import Galaxy
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def galaxy():
+    return Galaxy(seed=909)
+
+
+def _linear_owner(zones, x, y, z):
+    """Reference: the original scan over every zone."""
+    closest, closest_distance = None, float("inf")
+    for name, (center, radius) in zones.items():
+        distance = ((x - center[0]) ** 2 + (y - center[1]) ** 2 + (z - center[2]) ** 2) ** 0.5
+        if distance <= radius and distance < closest_distance:
+            closest, closest_distance = name, distance
+    return closest
+
+
+def _sample_points(n=3000, seed=1):
+    rng = random.Random(seed)
+    return [(rng.randint(-10, 200), rng.randint(-10, 200), rng.randint(-10, 100)) for _ in range(n)]
+
+
+# ---------------------------------------------------------------------------
+# Zones
+# ---------------------------------------------------------------------------
+
+class TestZoneOwnership:
+
+    def test_matches_linear_scan(self, galaxy):
+        zones = galaxy.faction_control.zones()
+        assert zones
+        for x, y, z in _sample_points():
+            assert galaxy.faction_control.zone_owner(x, y, z) == _linear_owner(zones, x, y, z)
+
+    def test_ties_go_to_first_zone(self):
+        index = FactionControlIndex()
+        index.set_zone("A", (0, 0, 0), 10)
+        index.set_zone("B", (0, 0, 0), 10)
+        assert index.zone_owner(1, 1, 1) == "A"
+
+    def test_move_is_incremental(self):
+        index = FactionControlIndex()
+        index.set_zone("A", (50, 50, 50), 30)
+        index.set_zone("B", (90, 50, 50), 30)
+        index.set_zone("A", (120, 120, 50), 20)
+        assert index.zone_owner(50, 50, 50) is None
+        assert index.zone_owner(120, 125, 50) == "A"
+        assert index.zone_owner(70, 50, 50) == "B"
+
+    def test_galaxy_zone_changes_reach_the_index(self):
+        galaxy = Galaxy(seed=11)
+        galaxy.set_faction_zone("Test Faction", (400, 400, 150), 20)
+        assert galaxy.get_faction_for_location(405, 400, 150) == "Test Faction"
+        galaxy.set_faction_zone("Test Faction", (450, 450, 150), 20)
+        assert galaxy.get_faction_for_location(405, 400, 150) is None
+
+    def test_system_faction_overrides_zone(self, galaxy):
+        coords, system = next((c, s) for c, s in galaxy.systems.items() if s.get("controlling_faction"))
+        assert galaxy.get_faction_for_location(*coords) == system["controlling_faction"]
+
+
+# ---------------------------------------------------------------------------
+# Territories
+# ---------------------------------------------------------------------------
+
+class TestTerritories:
+
+    def test_assignment_is_disjoint_and_indexed(self, galaxy):
+        fs = FactionSystem(seed=5)
+        fs.assign_faction_territories(galaxy)
+        seen = set()
+        for name, territories in fs.faction_territories.items():
+            assert 1 <= len(territories) <= 3
+            for coords in territories:
+                assert coords not in seen
+                seen.add(coords)
+                assert fs.get_system_faction(coords) == name
+
+    def test_assignment_is_reproducible(self, galaxy):
+        a, b = FactionSystem(seed=5), FactionSystem(seed=5)
+        a.assign_faction_territories(galaxy)
+        b.assign_faction_territories(galaxy)
+        assert a.faction_territories == b.faction_territories
+
+    def test_claim_moves_ownership(self, galaxy):
+        fs = FactionSystem(seed=5)
+        fs.assign_faction_territories(galaxy)
+        names = list(fs.faction_territories)
+        coords = fs.faction_territories[names[0]][0]
+        fs.claim_system(coords, names[1])
+        assert fs.get_system_faction(coords) == names[1]
+        assert coords not in fs.faction_territories[names[0]]
+
+    def test_replaced_territories_are_reindexed(self):
+        fs = FactionSystem(seed=5)
+        fs.faction_territories = {"X": [(1, 2, 3)]}
+        fs.territories_version += 1
+        assert fs.get_system_faction((1, 2, 3)) == "X"
+        assert fs.get_system_faction((3, 2, 1)) is None
+
+    def test_in_place_edit_is_reindexed_on_version_bump(self, galaxy):
+        fs = FactionSystem(seed=5)
+        fs.assign_faction_territories(galaxy)
+        name = next(iter(fs.faction_territories))
+        coords = fs.faction_territories[name].pop()
+        fs.faction_territories[name].append((9, 9, 9))
+        fs.territories_version += 1
+        assert fs.get_system_faction((9, 9, 9)) == name
+        assert fs.get_system_faction(coords) is None
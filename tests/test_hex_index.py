@@ -0,0 +1,112 @@
+"""
+Tier-2 tests: cached galaxy hex projection (backend/hex_utils.GalaxyHexIndex)
+and the station-by-location lookup.
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_hex_index.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from backend.hex_utils import GalaxyHexIndex, HexCoord, resolve_hex_collisions
+from navigation import Galaxy
+from station_manager import SpaceStationManager, GALAXY_SCALE
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+@pytest.fixture()
+def galaxy():
+    return Galaxy(seed=77)
+
+
+def _synced(galaxy):
+    index = GalaxyHexIndex()
+    index.sync(galaxy.systems, galaxy.systems_version)
+    return index
+
+
+# ---------------------------------------------------------------------------
+# GalaxyHexIndex
+# ---------------------------------------------------------------------------
+
+class TestGalaxyHexIndex:
+
+    def test_matches_full_collision_resolution(self, galaxy):
+        index = _synced(galaxy)
+        raw = [{"coords": c, "x": c[0], "y": c[1], "z": c[2]} for c in galaxy.systems]
+        for entry in resolve_hex_collisions(raw):
+            assert index.hex_of[entry["coords"]] == HexCoord(entry["hex_q"], entry["hex_r"])
+
+    def test_reverse_index_and_records(self, galaxy):
+        index = _synced(galaxy)
+        assert len(index.by_hex) == len(galaxy.systems)
+        for coords, data in galaxy.systems.items():
+            h = index.hex_of[coords]
+            assert index.system_at(h.q, h.r) == coords
+            assert (data["hex_q"], data["hex_r"]) == (h.q, h.r)
+
+    def test_sync_is_noop_when_unchanged(self, galaxy):
+        index = _synced(galaxy)
+        assert index.sync(galaxy.systems, galaxy.systems_version) is False
+
+    def test_added_system_does_not_move_existing(self, galaxy):
+        index = _synced(galaxy)
+        before = dict(index.hex_of)
+        # Same hex as an existing system: the newcomer must be nudged
+        existing = next(iter(galaxy.systems))
+        coords = (existing[0] + 0.1, existing[1] + 0.1, existing[2])
+        galaxy.add_system(coords, {"name": "Newcomer", "coordinates": coords})
+        assert index.sync(galaxy.systems, galaxy.systems_version) is True
+        assert all(index.hex_of[c] == h for c, h in before.items())
+        assert index.hex_of[coords] != index.hex_of[existing]
+
+    def test_removed_system_frees_hex(self, galaxy):
+        index = _synced(galaxy)
+        coords = next(iter(galaxy.systems))
+        h = index.hex_of[coords]
+        galaxy.remove_system(coords)
+        index.sync(galaxy.systems, galaxy.systems_version)
+        assert coords not in index.hex_of
+        assert index.system_at(h.q, h.r) is None
+
+    def test_galaxy_owns_its_index(self, galaxy):
+        index = galaxy.get_hex_index()
+        assert galaxy.get_hex_index() is index
+        coords = next(iter(galaxy.systems))
+        galaxy.remove_system(coords)
+        assert coords not in galaxy.get_hex_index().hex_of
+
+
+# ---------------------------------------------------------------------------
+# Station lookup by location
+# ---------------------------------------------------------------------------
+
+class TestStationHexLookup:
+
+    def test_matches_linear_scan(self, galaxy):
+        manager = SpaceStationManager(galaxy)
+        for station in manager.stations.values():
+            coords = station["coordinates"]
+            q, r = round(coords[0] / GALAXY_SCALE), round(coords[1] / GALAXY_SCALE)
+            expected = next(s for s in manager.stations.values()
+                            if s["hex_q"] == q and s["hex_r"] == r)
+            assert manager.get_station_at_location(coords) is expected
+
+    def test_empty_location_returns_none(self, galaxy):
+        manager = SpaceStationManager(galaxy)
+        assert manager.get_station_at_location((-1000, -1000, 0)) is None
+
+    def test_new_station_visible(self, galaxy):
+        manager = SpaceStationManager(galaxy)
+        manager.get_station_at_location((0, 0, 0))  # build the lookup
+        manager.stations["Probe"] = {"name": "Probe", "hex_q": 99, "hex_r": 99,
+                                     "coordinates": (99 * GALAXY_SCALE, 99 * GALAXY_SCALE, 0)}
+        assert manager.get_station_at_location((99 * GALAXY_SCALE, 99 * GALAXY_SCALE, 0))["name"] == "Probe"
@@ -0,0 +1,149 @@
+"""
+Tier-2 tests: incrementally cached strategic indices (backend/indices.py),
+ColonyManager.cached_production() and Galaxy visited tracking.
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_indices.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import types
+import pytest
+from backend.indices import IndexEngine, COMPONENTS
+from backend.colony import ColonyManager
+from navigation import Galaxy
+from professions import ProfessionSystem
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class _Galaxy:
+    def __init__(self, visited=0):
+        self.visited = visited
+
+    def visited_count(self):
+        return self.visited
+
+
+def _game(**overrides):
+    """Just enough of a Game for the index readers."""
+    professions = ProfessionSystem()
+    professions.profession_levels["Void Cartographer"] = 5
+    g = types.SimpleNamespace(
+        character_stats={"KIN": 40, "INT": 60, "AEF": 50, "SYN": 45, "COH": 35},
+        completed_research=["a", "b", "c"],
+        credits=120_000,
+        fleet={"s1": None, "s2": None},
+        fleet_pool=30,
+        navigation=types.SimpleNamespace(galaxy=_Galaxy(visited=8)),
+        character_faction="Independent",
+        faction_system=types.SimpleNamespace(player_relations={"Independent": 60}),
+        character_profession="Void Cartographer",
+        profession_system=professions,
+        current_turn=1,
+    )
+    for key, value in overrides.items():
+        setattr(g, key, value)
+    return g
+
+
+# ---------------------------------------------------------------------------
+# IndexEngine
+# ---------------------------------------------------------------------------
+
+class TestIndexEngine:
+
+    def test_totals_are_sums_of_details(self):
+        result = IndexEngine().refresh(_game())
+        for name in ("spi", "rei", "kii", "eci"):
+            assert result[name] == sum(result["details"][name].values())
+        assert result["fleet_pool"] == 30
+        assert result["inputs"]["Systems visited"] == 8
+        assert result["inputs"]["REI Profession scale"] == "50%"
+
+    def test_known_values(self):
+        d = IndexEngine().refresh(_game())["details"]
+        assert d["spi"]["Combat Doctrine"] == 3 * 4 + 40 // 20
+        assert d["rei"]["Logistics Capacity"] == 2 * 12 + 8 * 3
+        assert d["kii"]["Knowledge Network"] == 3 * 3 + 8 // 2
+        assert d["eci"]["Financial Liquidity"] == 120_000 // 2000
+        # Void Cartographer: logistics 0.15 + prospecting 0.10 at level 5
+        logistics, prospecting = 2 * 12 + 8 * 3, 50 // 6 + 8
+        assert d["rei"]["Profession Bonus"] == int(logistics * 0.15 * 0.5 + prospecting * 0.10 * 0.5)
+
+    def test_nothing_changed_recomputes_nothing(self):
+        engine, g = IndexEngine(), _game()
+        first = engine.refresh(g)
+        assert len(engine.last_recomputed) == len(COMPONENTS)
+        assert engine.refresh(g) is first
+        assert engine.last_recomputed == ()
+
+    def test_only_dependents_recompute(self):
+        engine, g = IndexEngine(), _game()
+        engine.refresh(g)
+        g.credits += 5_000_000
+        result = engine.refresh(g)
+        assert set(engine.last_recomputed) == {"eci.trade", "eci.liquidity", "eci.profession"}
+        assert result["details"]["eci"]["Financial Liquidity"] == 500
+
+    def test_change_propagates_through_profession_bonus(self):
+        engine, g = IndexEngine(), _game()
+        engine.refresh(g)
+        g.navigation.galaxy.visited = 40
+        engine.refresh(g)
+        assert "rei.profession" in engine.last_recomputed
+        assert "kii.network" in engine.last_recomputed
+        # Knowledge Network isn't one of the KII profession-scaled parts
+        assert "kii.profession" not in engine.last_recomputed
+        assert "spi.fleet" not in engine.last_recomputed
+
+    def test_reset_when_game_replaced(self):
+        engine = IndexEngine()
+        engine.refresh(_game())
+        engine.refresh(_game(credits=0))
+        assert len(engine.last_recomputed) == len(COMPONENTS)
+
+    def test_breakdown_lists_every_component(self):
+        engine = IndexEngine()
+        engine.refresh(_game())
+        breakdown = engine.breakdown()
+        assert sum(len(parts) for parts in breakdown.values()) == len(COMPONENTS)
+        defense = next(p for p in breakdown["spi"] if p["key"] == "spi.defense")
+        assert defense["deps"] == {"defense_pts": 0, "empire_size": 0}
+        assert defense["recomputed"] == 1
+
+
+# ---------------------------------------------------------------------------
+# Incremental inputs
+# ---------------------------------------------------------------------------
+
+class TestIncrementalInputs:
+
+    def test_cached_production_follows_builds(self):
+        g = _game(credits=10 ** 9)
+        manager = ColonyManager(g)
+        manager.found_colony("Testworld", "Test System", "Terran")
+        assert manager.cached_production() == manager.calculate_all_production()
+        version = manager.version
+        q, r = next(iter(manager.colonies["Testworld"].tiles))
+        ok, _msg = manager.build_improvement("Testworld", q, r, "Mineral Extractor")
+        assert ok and manager.version > version
+        assert manager.cached_production() == manager.calculate_all_production()
+        assert manager.cached_production().get("minerals", 0) > 0
+
+    def test_galaxy_visited_count(self):
+        galaxy = Galaxy(seed=77)
+        coords = list(galaxy.systems)[:3]
+        for c in coords + coords[:1]:
+            galaxy.mark_visited(c)
+        assert galaxy.visited_count() == 3
+        galaxy.remove_system(coords[0])
+        assert galaxy.visited_count() == 2
+        assert galaxy.visited_count() == sum(1 for s in galaxy.systems.values() if s.get("visited"))
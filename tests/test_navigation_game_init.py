@@ -48,6 +48,8 @@ def _game_with_ether(friction, dangerous=False):
     """Minimal game mock: ether friction at a fixed uniform value."""
     g = mock.MagicMock()
     g.navigation.galaxy.ether_energy.get_friction_at.return_value = float(friction)
+    # A uniform field has the same mean along any path.
+    g.navigation.galaxy.ether_energy.get_path_friction.return_value = float(friction)
     g.event_system.is_location_dangerous.return_value = dangerous
     return g
 
@@ -185,6 +187,93 @@ class TestCalculateFuelConsumption:
         assert isinstance(result, int)
 
 
+# ---------------------------------------------------------------------------
+# Ether friction field — precomputed lattice + path integral
+# ---------------------------------------------------------------------------
+
+class TestEtherFrictionField:
+
+    def _system(self):
+        from ether_energy import EtherEnergySystem
+        return EtherEnergySystem(500, 500, 200)
+
+    def test_lattice_points_match_exact_friction(self):
+        ether = self._system()
+        field = ether.get_field()
+        r = field.resolution
+        for zone in ether.zones[:10]:
+            i, j, k = (int(c // r) for c in zone.center)
+            x, y, z = i * r, j * r, k * r
+            assert field.sample(x, y, z) == pytest.approx(ether.get_friction_at(x, y, z))
+
+    def test_path_mean_tracks_dense_exact_sampling(self):
+        ether = self._system()
+        start, end = (40, 60, 25), (160, 110, 30)
+        n = 400
+        exact = sum(
+            ether.get_friction_at(*(s + (e - s) * t / n for s, e in zip(start, end)))
+            for t in range(n + 1)
+        ) / (n + 1)
+        assert ether.get_path_friction(start, end) == pytest.approx(exact, abs=0.05)
+
+    def test_bulk_matches_single(self):
+        ether = self._system()
+        targets = [(100, 100, 25), (250, 250, 100), (480, 20, 190)]
+        bulk = ether.get_path_frictions((50, 50, 25), targets)
+        assert bulk == [ether.get_path_friction((50, 50, 25), t) for t in targets]
+
+    def test_drift_invalidation_matches_full_rebuild(self):
+        from ether_energy import EtherFrictionField
+        ether = self._system()
+        field = ether.get_field()
+        zone = ether.zones[0]
+        field.invalidate_sphere(zone.center, zone.radius)
+        zone.center = (zone.center[0] + 5, zone.center[1] - 5, zone.center[2] + 2)
+        field.invalidate_sphere(zone.center, zone.radius)
+        field.sample(0, 0, 0)  # flush pending boxes
+        assert list(field.values) == list(EtherFrictionField(ether, field.resolution).values)
+
+    def test_neutral_shortcut_and_memo_match_full_integration(self):
+        import random as _random
+        ether = self._system()
+        field = ether.get_field()
+
+        def integrate(start, end):
+            steps = max(1, math.ceil(math.dist(start, end) / (field.resolution * 0.5)))
+            total = 0.5 * (field._sample(*start) + field._sample(*end))
+            for n in range(1, steps):
+                total += field._sample(*(s + (e - s) * (n / steps) for s, e in zip(start, end)))
+            return total / steps
+
+        rng = _random.Random(7)
+        starts = [(rng.uniform(-10, 510), rng.uniform(-10, 510), rng.uniform(-10, 210))
+                  for _ in range(40)]
+        means = []
+        for start in starts:
+            targets = [tuple(c + rng.uniform(-80, 80) for c in start) for _ in range(25)]
+            for _ in range(2):   # second pass is served from the memo
+                assert field.path_means(start, targets) == [integrate(start, t) for t in targets]
+            means += field.path_means(start, targets)
+        assert 1.0 in means and any(m != 1.0 for m in means)
+
+        zone = ether.zones[0]
+        start, end = zone.center, (zone.center[0] + 30, zone.center[1], zone.center[2])
+        before = field.path_mean(start, end)
+        field.invalidate_sphere(zone.center, zone.radius)
+        zone.friction = 1.7
+        assert field.path_mean(start, end) == integrate(start, end) != before
+
+    def test_preview_fuel_matches_single_jump(self):
+        from navigation import preview_jumps
+        ship = _make_ship(coords=(50, 50, 25))
+        game = mock.MagicMock()
+        game.navigation.galaxy.ether_energy = self._system()
+        game.event_system.is_location_dangerous.return_value = False
+        targets = [(60, 55, 25), (80, 40, 70), (20, 90, 10)]
+        for p in preview_jumps(ship, targets, game):
+            assert p['fuel'] == calculate_fuel_consumption(ship, p['distance'], p['target'], game)
+
+
 # ---------------------------------------------------------------------------
 # Ship.can_jump_to / Ship.jump_to
 # ---------------------------------------------------------------------------
@@ -0,0 +1,120 @@
+"""
+Tier-2 tests: ring-buffer price history and OHLC roll-ups
+(price_history.py, EconomicSystem.market_history).
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_price_history.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import pickle
+from price_history import PriceHistory
+from economy import EconomicSystem
+from save_game import _load_economy, _save_economy
+
+
+# ---------------------------------------------------------------------------
+# PriceHistory
+# ---------------------------------------------------------------------------
+
+class TestPriceHistory:
+
+    def test_ring_keeps_the_last_limit_prices_in_order(self):
+        history = PriceHistory(limit=5)
+        for price in range(1, 13):
+            history.record("Sol", "Ore", price)
+        history.record("Vega", "Ore", 99)
+        assert history["Sol_Ore"] == [8, 9, 10, 11, 12]
+        assert history["Vega_Ore"] == [99]
+        assert list(history) == ["Sol_Ore", "Vega_Ore"]
+        assert len(history._raw) == 2 * 5         # preallocated, never grows
+
+    def test_candles_roll_up_by_turn(self):
+        history = PriceHistory()
+        for turn in range(25):
+            history.record("Sol", "Ore", 100 + turn)
+            history.record("Sol", "Ore", 50 + turn)    # a second sample that turn
+            history.advance()
+        tens = history.candles("Sol_Ore", 10)
+        assert [c["turn"] for c in tens] == [0, 10, 20]
+        assert tens[0] == {"turn": 0, "open": 100, "high": 109, "low": 50, "close": 59}
+        assert tens[2]["close"] == 74                 # still open
+        hundreds = history.candles("Sol_Ore", 100)
+        assert hundreds == [{"turn": 0, "open": 100, "high": 124, "low": 50, "close": 74}]
+        assert history.candles("Nowhere_Ore") == []
+
+    def test_candle_ring_drops_the_oldest(self):
+        history = PriceHistory(candle_limit=3)
+        for turn in range(0, 60, 10):
+            history.turn = turn
+            history.record("Sol", "Ore", turn)
+        assert [c["turn"] for c in history.candles("Sol_Ore", 10)] == [30, 40, 50]
+
+    def test_state_round_trips_through_json(self):
+        history = PriceHistory(limit=4)
+        for turn in range(30):
+            history.record("Sol", "Ore", turn)
+            history.record("Alpha_Centauri", "Silk", 3 * turn)
+            history.advance()
+        state = json.loads(json.dumps(history.to_state()))
+        restored = PriceHistory.from_state(state)
+        assert dict(restored) == dict(history)
+        assert restored.candles("Alpha_Centauri_Silk", 10) == history.candles("Alpha_Centauri_Silk", 10)
+        restored.record("Alpha_Centauri", "Silk", 1)
+        assert restored["Alpha_Centauri_Silk"][-1] == 1
+        assert restored.turn == 30
+
+    def test_loads_old_list_dicts_and_rejects_garbage(self, capsys):
+        legacy = {"Sol_Ore": list(range(150)), "Vega_Silk": [5, "x", 7]}
+        history = PriceHistory.from_state(legacy)
+        assert history["Sol_Ore"] == list(range(50, 150))
+        assert history["Vega_Silk"] == [5, 7]
+        broken = PriceHistory.from_state({"format": "rings-1", "keys": ["Sol_Ore"], "raw": "!!"})
+        assert len(broken) == 0
+        assert "Warning" in capsys.readouterr().out
+
+
+# ---------------------------------------------------------------------------
+# EconomicSystem integration
+# ---------------------------------------------------------------------------
+
+def _economy():
+    economy = EconomicSystem()
+    for i in range(3):
+        economy.create_market({"name": f"S{i}", "type": "Mining",
+                               "population": 1_000_000, "resources": "Rich"})
+    return economy
+
+
+class TestEconomicSystem:
+
+    def test_trades_record_and_turns_close_tracked_series(self):
+        economy = _economy()
+        good = next(iter(economy.markets["S1"]["supply"]))
+        ok, _msg = economy.buy_commodity("S1", good, 1, 10**9)
+        assert ok and list(economy.market_history) == [f"S1_{good}"]
+        for _ in range(3):
+            economy.tick_global_state()
+        series = economy.market_history[f"S1_{good}"]
+        assert len(series) == 4
+        assert series[-1] == economy.markets["S1"]["prices"][good]
+        assert economy.market_history.turn == 3
+
+    def test_save_load_and_pickle(self):
+        economy = _economy()
+        good = next(iter(economy.markets["S0"]["supply"]))
+        economy.sell_commodity("S0", good, 1, {good: 5})
+        saved = json.loads(json.dumps(_save_economy(economy), default=str))
+        loaded = EconomicSystem()
+        _load_economy(loaded, saved)
+        assert dict(loaded.market_history) == dict(economy.market_history)
+
+        restored = pickle.loads(pickle.dumps(economy)).market_history
+        assert isinstance(restored, PriceHistory)
+        assert dict(restored) == dict(economy.market_history)
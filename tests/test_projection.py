@@ -0,0 +1,99 @@
+"""
+Tier-2 tests: sparse field selection and cursor pagination
+(backend/projection.py).
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_projection.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from backend.projection import FieldSelection, Pager, MAX_PAGE_SIZE, decode_cursor, encode_cursor
+
+
+FIELDS = ("name", "x", "y", "description", "planet_count")
+RECORDS = [{"name": f"S{i:03d}", "x": i, "y": -i} for i in range(25)]
+
+
+def _key(record):
+    return record["name"]
+
+
+# ---------------------------------------------------------------------------
+# FieldSelection
+# ---------------------------------------------------------------------------
+
+class TestFieldSelection:
+
+    def test_no_fields_selects_everything(self):
+        selection = FieldSelection(None, FIELDS)
+        assert selection.everything
+        assert "planet_count" in selection
+        record = {"name": "Sol", "x": 1}
+        assert selection.project(record) is record
+
+    def test_projection_keeps_name(self):
+        selection = FieldSelection("x, y", FIELDS)
+        assert "description" not in selection
+        assert "name" in selection
+        assert selection.project({"name": "Sol", "x": 1, "y": 2, "description": "..."}) == {
+            "name": "Sol", "x": 1, "y": 2,
+        }
+
+    def test_unknown_field_is_rejected(self):
+        with pytest.raises(ValueError, match="bogus"):
+            FieldSelection("x,bogus", FIELDS)
+
+
+# ---------------------------------------------------------------------------
+# Pager
+# ---------------------------------------------------------------------------
+
+class TestPager:
+
+    def test_unpaged_returns_everything(self):
+        pager = Pager()
+        assert pager.select(RECORDS, _key) == RECORDS
+        assert pager.envelope() == {}
+
+    def test_walks_every_record_exactly_once(self):
+        seen, cursor = [], None
+        while True:
+            pager = Pager(cursor, 10)
+            seen.extend(pager.select(iter(RECORDS), _key))
+            assert pager.total == len(RECORDS)
+            cursor = pager.envelope()["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == RECORDS
+
+    def test_exact_final_page_has_no_next_cursor(self):
+        pager = Pager(encode_cursor("S014"), 10)
+        page = pager.select(RECORDS, _key)
+        assert [r["name"] for r in page] == [f"S{i:03d}" for i in range(15, 25)]
+        assert pager.next_cursor is None
+
+    def test_cursor_survives_earlier_removal(self):
+        first = Pager(None, 5)
+        first.select(RECORDS, _key)
+        remaining = [r for r in RECORDS if r["name"] != "S001"]
+        page = Pager(first.next_cursor, 5).select(remaining, _key)
+        assert page[0]["name"] == "S005"
+
+    def test_bad_cursor_and_limit(self):
+        with pytest.raises(ValueError):
+            Pager(encode_cursor("nope"), 5).select(RECORDS, _key)
+        with pytest.raises(ValueError):
+            Pager(None, 0)
+        with pytest.raises(ValueError):
+            Pager(None, MAX_PAGE_SIZE + 1)
+        with pytest.raises(ValueError):
+            decode_cursor("%%%")
+
+    def test_cursor_round_trip_unicode(self):
+        assert decode_cursor(encode_cursor("Alpha Centauri — Ω")) == "Alpha Centauri — Ω"
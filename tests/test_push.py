@@ -0,0 +1,111 @@
+"""
+Tier-2 tests: live HUD push hub (backend/push.py) and the Game change
+notifications that feed it.
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_push.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import json
+import threading
+import pytest
+from backend.push import PushHub, format_sse
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+# ---------------------------------------------------------------------------
+# PushHub
+# ---------------------------------------------------------------------------
+
+class TestPushHub:
+
+    def test_burst_coalesces_into_one_batch(self):
+        async def scenario():
+            hub = PushHub()
+            sub = hub.subscribe()
+            for credits in (100, 200, 300):
+                hub.publish("credits", credits)
+            hub.publish("turn", {"current_turn": 4})
+            batch = await sub.next_batch(coalesce_delay=0)
+            assert sub.take() is None
+            return batch
+        batch = _run(scenario())
+        assert batch["deltas"] == {"credits": 300, "turn": {"current_turn": 4}}
+        assert batch["notices"] == []
+
+    def test_notices_keep_order_and_are_bounded(self):
+        async def scenario():
+            hub = PushHub(max_notices=3)
+            sub = hub.subscribe()
+            for i in range(5):
+                hub.notify("gnn", {"turn": i})
+            return sub, await sub.next_batch(coalesce_delay=0)
+        sub, batch = _run(scenario())
+        assert [n["turn"] for n in batch["notices"]] == [2, 3, 4]
+        assert sub.dropped_notices == 2
+
+    def test_every_subscriber_gets_changes(self):
+        async def scenario():
+            hub = PushHub()
+            a, b = hub.subscribe(), hub.subscribe()
+            hub.publish("credits", 5)
+            return (await a.next_batch(0))["deltas"], (await b.next_batch(0))["deltas"]
+        assert _run(scenario()) == ({"credits": 5}, {"credits": 5})
+
+    def test_unsubscribed_client_receives_nothing(self):
+        async def scenario():
+            hub = PushHub()
+            sub = hub.subscribe()
+            hub.unsubscribe(sub)
+            hub.publish("credits", 1)
+            return hub.subscriber_count, sub.take()
+        assert _run(scenario()) == (0, None)
+
+    def test_publish_from_another_thread_wakes_subscriber(self):
+        async def scenario():
+            hub = PushHub()
+            sub = hub.subscribe()
+            threading.Thread(target=hub.publish, args=("ship", {"fuel": 7})).start()
+            return await asyncio.wait_for(sub.next_batch(0), timeout=2)
+        assert _run(scenario())["deltas"] == {"ship": {"fuel": 7}}
+
+    def test_sse_framing(self):
+        text = format_sse({"deltas": {"credits": 1}, "notices": []})
+        assert text.startswith("event: delta\ndata: ") and text.endswith("\n\n")
+        assert json.loads(text.split("data: ", 1)[1]) == {"deltas": {"credits": 1}, "notices": []}
+
+
+# ---------------------------------------------------------------------------
+# Game change notifications
+# ---------------------------------------------------------------------------
+
+class TestGameChangeListeners:
+
+    def test_resolve_end_turn_reports_version_and_research(self):
+        from game import Game
+        g = Game()
+        g.character_created = True
+        g.active_research = "Etheric Observation Protocol"
+        g.research_progress = 10 ** 6
+        seen = []
+        g.add_change_listener(lambda kind, payload: seen.append((kind, payload)))
+        g.resolve_end_turn()
+        kinds = [k for k, _p in seen]
+        assert "world_version" in kinds
+        research = dict(seen)["research_complete"]
+        assert research["name"] == "Etheric Observation Protocol"
+        assert research["turn"] == g.current_turn
@@ -0,0 +1,120 @@
+"""
+Tier-2 tests: bulk jump previews and the cached reachable-systems set
+(Ship.get_reachable_systems, backing /api/ship/reachable).
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_reachable.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import unittest.mock as mock
+import navigation
+from navigation import Galaxy, Ship, calculate_fuel_consumption, preview_jumps
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def galaxy():
+    return Galaxy(seed=808)
+
+
+def _game_for(galaxy):
+    g = mock.MagicMock()
+    g.navigation.galaxy = galaxy
+    g.event_system.dangerous_regions = {}
+    g.event_system.is_location_dangerous.return_value = False
+    return g
+
+
+def _ship(galaxy, jump_range=80):
+    ship = Ship("Pathfinder")
+    ship.coordinates = sorted(galaxy.systems)[len(galaxy.systems) // 2]
+    ship.jump_range = jump_range
+    ship.fuel = ship.max_fuel = 10 ** 6
+    return ship
+
+
+# ---------------------------------------------------------------------------
+# preview_jumps / get_reachable_systems
+# ---------------------------------------------------------------------------
+
+class TestReachableSystems:
+
+    def test_previews_match_single_jump_costs(self, galaxy):
+        ship = _ship(galaxy)
+        game = _game_for(galaxy)
+        targets = sorted(galaxy.systems)[:25]
+        for p in preview_jumps(ship, targets, game):
+            assert p["fuel"] == calculate_fuel_consumption(ship, p["distance"], p["target"], game)
+
+    def test_reachable_is_every_system_in_range(self, galaxy):
+        ship = _ship(galaxy)
+        entries = ship.get_reachable_systems(galaxy, _game_for(galaxy))
+        expected = {c for c in galaxy.systems
+                    if c != tuple(ship.coordinates)
+                    and galaxy.calculate_distance(ship.coordinates, c) <= ship.jump_range}
+        assert {e["coordinates"] for e in entries} == expected
+        assert [e["distance"] for e in entries] == sorted(e["distance"] for e in entries)
+
+    def test_cached_until_ship_moves(self, galaxy):
+        ship = _ship(galaxy)
+        game = _game_for(galaxy)
+        with mock.patch.object(navigation, "preview_jumps", wraps=preview_jumps) as spy:
+            ship.get_reachable_systems(galaxy, game)
+            ship.get_reachable_systems(galaxy, game)
+            assert spy.call_count == 1
+            ship.coordinates = sorted(galaxy.systems)[0]
+            ship.get_reachable_systems(galaxy, game)
+            assert spy.call_count == 2
+
+    def test_stat_change_invalidates_but_fuel_does_not(self, galaxy):
+        ship = _ship(galaxy)
+        game = _game_for(galaxy)
+        with mock.patch.object(navigation, "preview_jumps", wraps=preview_jumps) as spy:
+            first = ship.get_reachable_systems(galaxy, game)
+            ship.fuel = 0
+            assert not any(e["affordable"] for e in ship.get_reachable_systems(galaxy, game))
+            assert spy.call_count == 1
+            ship.attribute_profile = {"engine_efficiency": 80.0}
+            cheaper = ship.get_reachable_systems(galaxy, game)
+            assert spy.call_count == 2
+        assert sum(e["fuel"] for e in cheaper) < sum(e["fuel"] for e in first)
+
+    def test_new_danger_region_invalidates(self, galaxy):
+        ship = _ship(galaxy)
+        game = _game_for(galaxy)
+        ship.get_reachable_systems(galaxy, game)
+        game.event_system.dangerous_regions = {tuple(ship.coordinates): {"radius": 500}}
+        game.event_system.is_location_dangerous.return_value = True
+        assert all(e["dangerous"] for e in ship.get_reachable_systems(galaxy, game))
+
+
+# ---------------------------------------------------------------------------
+# Single jumps
+# ---------------------------------------------------------------------------
+
+class TestJumpFuelComputedOnce:
+
+    def test_jump_to_prices_once(self, galaxy):
+        ship = _ship(galaxy)
+        target = ship.get_reachable_systems(galaxy)[0]["coordinates"]
+        with mock.patch.object(navigation, "calculate_fuel_consumption",
+                               wraps=calculate_fuel_consumption) as spy:
+            ok, _msg = ship.jump_to(target, galaxy)
+        assert ok and spy.call_count == 1
+
+    def test_out_of_range_skips_fuel_calculation(self, galaxy):
+        ship = _ship(galaxy, jump_range=1)
+        target = sorted(galaxy.systems)[0]
+        with mock.patch.object(navigation, "calculate_fuel_consumption") as spy:
+            assert ship.can_jump_to(target, galaxy) is False
+        spy.assert_not_called()
@@ -0,0 +1,211 @@
+"""
+Tier-2 tests: multi-jump route planning over the galaxy jump graph.
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_route_planner.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import heapq
+import math
+import pytest
+import unittest.mock as mock
+from ether_energy import FRICTION_MIN
+from navigation import Galaxy, Ship, calculate_fuel_consumption
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def galaxy():
+    return Galaxy()
+
+
+def _game_for(galaxy, dangerous=False):
+    """Game mock wired to a real galaxy so ether friction is live."""
+    g = mock.MagicMock()
+    g.navigation.galaxy = galaxy
+    g.event_system.is_location_dangerous.return_value = dangerous
+    return g
+
+
+def _ship(jump_range=40):
+    ship = Ship("Planner")
+    ship.jump_range = jump_range
+    return ship
+
+
+def _dijkstra(galaxy, ship, start, goal, game, jump_range):
+    """Reference search: plain Dijkstra over the same edge costs."""
+    best = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        cost, node = heapq.heappop(heap)
+        if node == goal:
+            return cost
+        if cost > best[node]:
+            continue
+        for other, _s, dist in galaxy.get_systems_in_radius(*node, jump_range, include_origin=False):
+            c = cost + calculate_fuel_consumption(ship, dist, other, game, source_coords=node)
+            if c < best.get(other, math.inf):
+                best[other] = c
+                heapq.heappush(heap, (c, other))
+    return None
+
+
+def _far_pair(galaxy, jump_range=40):
+    """Return (start, goal): a system and the most distant system reachable
+    from it on the jump graph.  The galaxy is random, so pick a start from
+    the largest connected component rather than hard-coding coordinates."""
+    adjacency = galaxy.get_route_planner().get_adjacency(jump_range)
+    best = None
+    seen = set()
+    for root in sorted(adjacency):
+        if root in seen:
+            continue
+        component, stack = {root}, [root]
+        while stack:
+            node = stack.pop()
+            for other, _d in adjacency[node]:
+                if other not in component:
+                    component.add(other)
+                    stack.append(other)
+        seen |= component
+        if best is None or len(component) > len(best):
+            best = component
+    start = min(best)
+    goal = max(best, key=lambda c: galaxy.calculate_distance(start, c))
+    return start, goal
+
+
+# ---------------------------------------------------------------------------
+# RoutePlanner
+# ---------------------------------------------------------------------------
+
+class TestRoutePlanner:
+
+    def test_route_is_optimal(self, galaxy):
+        ship = _ship(80)
+        game = _game_for(galaxy)
+        start, goal = _far_pair(galaxy, 80)
+        plan = galaxy.get_route_planner().plan_route(ship, start, goal, game)
+        expected = _dijkstra(galaxy, ship, start, goal, game, 80)
+        assert plan is not None and expected is not None
+        assert plan["total_fuel"] == expected
+
+    def test_short_legs_rounding_down_stay_optimal(self):
+        # Legs of ~1.5 fuel at the friction floor round to 1 each, so the
+        # fuel left can fall well short of distance × cheapest rate; a
+        # heuristic that only allowed 0.5 of slack chose an 8-fuel route here
+        small = Galaxy(seed=1)
+        for coords in list(small.systems):
+            small.remove_system(coords)
+        points = [(0.0, 0.0, 100.0), (1.49, 0.8, 100.0), (3.48, 1.4, 100.0), (4.53, 0.15, 100.0),
+                  (5.48, 1.9, 100.0), (7.39, 0.94, 100.0), (12.0, 0.0, 100.0)]
+        for i, coords in enumerate(points):
+            small.add_system(coords, {"name": f"P{i}", "coordinates": coords})
+        game = _game_for(small)
+        game.navigation.galaxy = mock.MagicMock()
+        ether = game.navigation.galaxy.ether_energy
+        ether.get_path_friction.return_value = FRICTION_MIN
+        ether.get_path_frictions.side_effect = lambda _src, targets: [FRICTION_MIN] * len(targets)
+        ship = _ship(6)
+        plan = small.get_route_planner().plan_route(ship, points[0], points[-1], game)
+        expected = _dijkstra(small, ship, points[0], points[-1], game, 6)
+        assert plan["jumps"] > 2
+        assert plan["total_fuel"] == expected == 7
+
+    def test_legs_respect_jump_range_and_chain(self, galaxy):
+        ship = _ship(80)
+        start, goal = _far_pair(galaxy, 80)
+        plan = galaxy.get_route_planner().plan_route(ship, start, goal, _game_for(galaxy))
+        assert plan["path"][0] == start and plan["path"][-1] == goal
+        for leg, (a, b) in zip(plan["legs"], zip(plan["path"], plan["path"][1:])):
+            assert (leg["from"], leg["to"]) == (a, b)
+            assert leg["distance"] <= 80
+        assert plan["jumps"] == len(plan["legs"]) >= 1
+
+    def test_leg_costs_include_interlayer_surcharge(self, galaxy):
+        ship = _ship(80)
+        start, goal = _far_pair(galaxy, 80)
+        plan = galaxy.get_route_planner().plan_route(ship, start, goal, None)
+        for leg in plan["legs"]:
+            assert leg["fuel"] == calculate_fuel_consumption(
+                ship, leg["distance"], leg["to"], None, source_coords=leg["from"])
+
+    def test_unreachable_goal_returns_none(self, galaxy):
+        ship = _ship(1)
+        start, goal = _far_pair(galaxy, 80)  # connected at 80, not at 1
+        assert galaxy.get_route_planner().plan_route(ship, start, goal) is None
+
+    def test_deep_space_start(self, galaxy):
+        ship = _ship(80)
+        goal = next(iter(galaxy.systems))
+        start = (goal[0] + 3.5, goal[1] - 2.0, goal[2])
+        plan = galaxy.get_route_planner().plan_route(ship, start, goal)
+        assert plan["path"] == [start, goal]
+
+    def test_adjacency_cached_per_range_and_invalidated(self, galaxy):
+        planner = galaxy.get_route_planner()
+        a = planner.get_adjacency(25)
+        assert planner.get_adjacency(25) is a
+        assert planner.get_adjacency(30) is not a
+        coords = (498, 2, 100)
+        galaxy.add_system(coords, {"name": "Probe", "coordinates": coords})
+        try:
+            assert coords in planner.get_adjacency(25)
+        finally:
+            galaxy.remove_system(coords)
+        assert coords not in planner.get_adjacency(25)
+
+
+# ---------------------------------------------------------------------------
+# Scale: 1,000 systems
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def big():
+    galaxy = Galaxy(seed=1, num_systems=1000)
+    game = _game_for(galaxy)
+    game.event_system.are_locations_dangerous.side_effect = lambda targets: [False] * len(targets)
+    return galaxy, game
+
+
+class TestRoutePlannerScale:
+    """Plans on a 1,000-system galaxy must stay in the milliseconds.
+
+    Pricing each leg separately (one friction integral and one danger query
+    per relaxed edge) took ~80 ms per plan at range 45 here; batched
+    per-node pricing over the neutral-aware friction field takes ~12 ms.
+    The budget sits between the two so a regression to per-edge pricing
+    fails while slow CI machines still pass.
+    """
+
+    BUDGET_MS = 50.0
+
+    def test_plans_at_1000_systems_are_fast_and_optimal(self, big):
+        import random
+        import time
+        galaxy, game = big
+        ship = _ship(45)
+        planner = galaxy.get_route_planner()
+        planner.get_adjacency(45)
+        galaxy.ether_energy.get_field()      # one-off lattice build
+        rng = random.Random(4)
+        pairs = [tuple(rng.sample(sorted(galaxy.systems), 2)) for _ in range(10)]
+
+        t0 = time.perf_counter()
+        plans = [planner.plan_route(ship, a, b, game) for a, b in pairs]
+        per_plan_ms = (time.perf_counter() - t0) * 1000 / len(pairs)
+
+        assert all(plan is not None for plan in plans)
+        start, goal = pairs[0]
+        assert plans[0]["total_fuel"] == _dijkstra(galaxy, ship, start, goal, game, 45)
+        assert per_plan_ms < self.BUDGET_MS, f"{per_plan_ms:.1f} ms per plan"
@@ -272,6 +272,57 @@ class TestCorruptedSave:
         assert game.credits == 10000  # save_data.get('credits', 10000)
 
 
+# ---------------------------------------------------------------------------
+# World seed + galaxy delta
+# ---------------------------------------------------------------------------
+
+class TestWorldSeed:
+
+    def test_same_seed_builds_identical_galaxy(self):
+        from navigation import Galaxy
+        a, b = Galaxy(seed=1234), Galaxy(seed=1234)
+        assert list(a.systems) == list(b.systems)
+        assert a.systems == b.systems
+
+    def test_different_seeds_differ(self):
+        from navigation import Galaxy
+        assert set(Galaxy(seed=1).systems) != set(Galaxy(seed=2).systems)
+
+    def test_fresh_galaxy_has_empty_delta(self):
+        from navigation import Galaxy
+        delta = Galaxy(seed=99).get_system_delta()
+        assert delta == {"seed": 99, "num_systems": 300, "removed": [], "changed": []}
+
+    def test_galaxy_delta_round_trips(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(save_game, "SAVE_DIR", tmp_path)
+        g1 = Game(seed=4242)
+        galaxy = g1.navigation.galaxy
+        coords = sorted(galaxy.systems)
+        visited, gone = coords[0], coords[1]
+        galaxy.systems[visited]["visited"] = True
+        galaxy.systems[visited]["threat_level"] = 9
+        galaxy.remove_system(gone)
+        save_game.save_game(g1, "seeded")
+
+        g2 = Game(seed=1)
+        save_game.load_game(g2, str(tmp_path / "seeded.json"))
+        loaded = g2.navigation.galaxy
+        assert g2.world_seed == 4242
+        assert loaded.systems[visited]["visited"] is True
+        assert loaded.systems[visited]["threat_level"] == 9
+        assert gone not in loaded.systems
+        assert set(loaded.systems) == set(galaxy.systems)
+
+    def test_save_stores_delta_not_systems(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(save_game, "SAVE_DIR", tmp_path)
+        save_game.save_game(Game(seed=7), "small")
+        data = json.loads((tmp_path / "small.json").read_text(encoding="utf-8"))
+        assert data["world_seed"] == 7
+        # Game setup may touch a few systems; the bulk is regenerated from the seed.
+        assert len(data["galaxy_state"]["changed"]) < 10
+        assert "systems" not in data["galaxy_state"]
+
+
 # ---------------------------------------------------------------------------
 # start_research_project
 # ---------------------------------------------------------------------------
@@ -0,0 +1,96 @@
+"""
+Tier-2 tests: per-player session registry (backend/sessions.py) — LRU
+eviction to disk, rehydration and id handling.
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_sessions.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import pytest
+from backend.sessions import SessionRegistry
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _factory():
+    return {"game": None, "score": 0, "cache": {"built": True}}
+
+
+@pytest.fixture()
+def registry(tmp_path):
+    return SessionRegistry(_factory, tmp_path / "sessions", max_live=2, transient=("cache",))
+
+
+# ---------------------------------------------------------------------------
+# SessionRegistry
+# ---------------------------------------------------------------------------
+
+class TestSessionRegistry:
+
+    def test_unknown_or_malformed_ids_get_a_fresh_session(self, registry):
+        a = registry.get(None)
+        b = registry.get("../../etc/passwd")
+        assert a.is_new and b.is_new and a.id != b.id
+        assert registry.valid_id(a.id)
+
+    def test_same_id_returns_same_bundle(self, registry):
+        a = registry.get(None)
+        a.state["score"] = 7
+        assert registry.get(a.id) is a
+
+    def test_lru_session_is_evicted_and_rehydrated(self, registry):
+        a = registry.get(None)
+        a.state["score"] = 42
+        a.state["cache"]["built"] = "stale"
+        b = registry.get(None)
+        c = registry.get(None)                  # over the cap: a is LRU
+        assert registry.live_count == 2
+        assert registry.stored_ids() == [a.id]
+
+        back = registry.get(a.id)
+        assert back is not a and not back.is_new
+        assert back.state["score"] == 42
+        assert back.state["cache"] == {"built": True}    # transient: rebuilt
+        assert registry.stored_ids() == [b.id]            # b was LRU this time
+        assert {s.id for s in registry.live()} == {c.id, a.id}
+
+    def test_pinned_sessions_are_not_evicted(self, tmp_path):
+        registry = SessionRegistry(_factory, tmp_path, max_live=1,
+                                   can_evict=lambda s: s.state["score"] == 0)
+        a = registry.get(None)
+        a.state["score"] = 1                    # e.g. an open SSE stream
+        registry.get(None)
+        assert a in registry.live() and registry.stored_ids() == []
+
+    def test_evict_all_and_prune(self, registry):
+        ids = [registry.get(None).id for _ in range(2)]
+        registry.evict_all()
+        assert sorted(registry.stored_ids()) == sorted(ids)
+        old = time.time() - 10_000
+        os.utime(registry._path(ids[0]), (old, old))
+        assert registry.prune(max_age_seconds=5_000) == 1
+        assert registry.stored_ids() == [ids[1]]
+
+    def test_game_bundle_round_trips(self, tmp_path):
+        from game import Game
+        from backend.colony import ColonyManager
+        registry = SessionRegistry(lambda: {"game": None, "colony_manager": None},
+                                   tmp_path, max_live=1)
+        a = registry.get(None)
+        g = Game(seed=4242, background_thread=False)
+        g.credits = 12345
+        a.state.update(game=g, colony_manager=ColonyManager(g))
+        registry.get(None)                      # evicts a
+        restored = registry.get(a.id).state
+        assert restored["game"].credits == 12345
+        assert restored["colony_manager"].game is restored["game"]
+        assert len(restored["game"].navigation.galaxy.systems) == len(g.navigation.galaxy.systems)
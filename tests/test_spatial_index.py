@@ -0,0 +1,210 @@
+"""
+Tier-2 tests: voxel-grid spatial index and the Galaxy proximity queries
+built on top of it.  Every indexed query is checked against a brute-force
+scan over the same points.
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_spatial_index.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import random
+import pytest
+from spatial_index import SpatialIndex
+from navigation import Galaxy, Ship, GALAXY_LAYERS, MIN_SYSTEM_SPACING
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _random_points(n=400, seed=7):
+    rng = random.Random(seed)
+    return [(rng.randint(0, 500), rng.randint(0, 500), rng.randint(0, 200)) for _ in range(n)]
+
+
+def _dist(a, b):
+    return math.sqrt(sum((p - q) ** 2 for p, q in zip(a, b)))
+
+
+@pytest.fixture(scope="module")
+def galaxy():
+    return Galaxy()
+
+
+# ---------------------------------------------------------------------------
+# SpatialIndex — raw queries
+# ---------------------------------------------------------------------------
+
+class TestSpatialIndex:
+
+    def setup_method(self):
+        self.points = _random_points()
+        self.index = SpatialIndex()
+        self.index.rebuild((p, p) for p in self.points)
+
+    def test_radius_matches_brute_force(self):
+        center = (250, 250, 100)
+        expected = {p for p in self.points if _dist(p, center) <= 60}
+        got = {k for k, _d in self.index.query_radius(center, 60)}
+        assert got == expected
+
+    def test_radius_sorted_distances(self):
+        hits = self.index.query_radius((100, 100, 50), 80, sort=True)
+        distances = [d for _k, d in hits]
+        assert distances == sorted(distances)
+
+    def test_box_matches_brute_force(self):
+        lo, hi = (100, 50, 20), (180, 300, 90)
+        expected = {p for p in self.points
+                    if all(lo[i] <= p[i] <= hi[i] for i in range(3))}
+        assert set(self.index.query_box(lo, hi)) == expected
+
+    def test_cylinder_ignores_depth(self):
+        center = (300, 120, 0)
+        expected = {p for p in self.points
+                    if math.hypot(p[0] - center[0], p[1] - center[1]) <= 45}
+        got = {k for k, _d in self.index.query_cylinder(center, 45)}
+        assert got == expected
+
+    @pytest.mark.parametrize("k", [1, 5, 25])
+    def test_k_nearest_matches_brute_force(self, k):
+        center = (37, 410, 150)
+        expected = sorted(_dist(p, center) for p in self.points)[:k]
+        got = [d for _k, d in self.index.nearest(center, k)]
+        assert got == pytest.approx(expected)
+
+    def test_nearest_far_outside_bounds(self):
+        center = (-900, -900, -900)
+        expected = min(_dist(p, center) for p in self.points)
+        assert self.index.nearest(center, 1)[0][1] == pytest.approx(expected)
+
+    def test_any_within_is_strict(self):
+        index = SpatialIndex()
+        index.insert((0, 0, 0))
+        assert not index.any_within((15, 0, 0), 15)
+        assert index.any_within((14, 0, 0), 15)
+
+    def test_remove_and_move(self):
+        p = self.points[0]
+        assert self.index.remove(p)
+        assert p not in self.index
+        assert not self.index.remove(p)
+        self.index.insert("probe", (1, 2, 3))
+        self.index.insert("probe", (400, 400, 190))
+        assert self.index.nearest((400, 400, 190), 1)[0] == ("probe", 0.0)
+        assert "probe" not in {k for k, _d in self.index.query_radius((1, 2, 3), 0.5)}
+
+
+# ---------------------------------------------------------------------------
+# Galaxy integration
+# ---------------------------------------------------------------------------
+
+class TestGalaxySpatialQueries:
+
+    def test_index_covers_every_system(self, galaxy):
+        assert len(galaxy.spatial_index) == len(galaxy.systems)
+
+    def test_get_nearby_systems_matches_linear_scan(self, galaxy):
+        origin = next(iter(galaxy.systems))
+        expected = sorted(
+            _dist(origin, c) for c in galaxy.systems
+            if 0 < _dist(origin, c) <= 60
+        )
+        got = [d for _s, d in galaxy.get_nearby_systems(*origin, range_limit=60)]
+        assert got == pytest.approx(expected)
+
+    def test_procedural_spacing_respected(self, galaxy):
+        # Spot-check: the nearest neighbour of most procedural systems is at
+        # least 15 units away (a handful may fall back after 50 attempts).
+        coords = list(galaxy.systems)[:80]
+        close = [c for c in coords if galaxy.get_nearest_systems(*c, k=1)[0][2] < 15]
+        assert len(close) < len(coords) // 4
+
+    def test_add_and_remove_system_update_index(self, galaxy):
+        coords = (499, 499, 199)
+        galaxy.add_system(coords, {"name": "Probe", "coordinates": coords})
+        assert galaxy.get_nearest_systems(498, 498, 198, k=1)[0][0] == coords
+        galaxy.remove_system(coords)
+        assert coords not in galaxy.spatial_index
+        assert coords not in galaxy.systems
+
+    def test_direct_dict_edit_is_resynced(self, galaxy):
+        coords = (1, 1, 1)
+        galaxy.systems[coords] = {"name": "Legacy", "coordinates": coords}
+        try:
+            assert galaxy.get_nearest_systems(0, 0, 0, k=1)[0][0] == coords
+        finally:
+            galaxy.remove_system(coords)
+
+    def test_system_moved_in_place_is_resynced_on_version_bump(self, galaxy):
+        old, new = (2, 2, 2), (3, 3, 3)
+        galaxy.add_system(old, {"name": "Drifter", "coordinates": old})
+        try:
+            galaxy.get_spatial_index()
+            # Same system count, different key: only systems_version says so.
+            system = galaxy.systems.pop(old)
+            system["coordinates"] = new
+            galaxy.systems[new] = system
+            galaxy.systems_version += 1
+            assert galaxy.get_nearest_systems(3, 3, 4, k=1)[0][0] == new
+            assert old not in galaxy.spatial_index
+        finally:
+            galaxy.remove_system(new)
+
+    def test_scan_range_uses_planar_distance(self, galaxy):
+        ship = Ship("Scanner")
+        ship.coordinates = next(iter(galaxy.systems))
+        ship.scan_range = 70
+        sx, sy, _sz = ship.coordinates
+        expected = sorted(
+            math.hypot(c[0] - sx, c[1] - sy) for c in galaxy.systems
+            if 0 < math.hypot(c[0] - sx, c[1] - sy) <= 70
+        )
+        got = [d for kind, _obj, d in ship.get_objects_in_scan_range(galaxy) if kind == "system"]
+        assert got == pytest.approx(expected)
+
+
+# ---------------------------------------------------------------------------
+# Batched procedural placement
+# ---------------------------------------------------------------------------
+
+class TestProceduralPlacement:
+
+    def test_num_systems_respected(self):
+        galaxy = Galaxy(seed=11, num_systems=50)
+        predefined = sum(1 for s in galaxy.systems.values() if s["name"] == "Proxima b")
+        assert len(galaxy.systems) == 50 + predefined
+
+    def test_default_galaxy_keeps_minimum_spacing(self, galaxy):
+        for coords in galaxy.systems:
+            nearest = galaxy.get_nearest_systems(*coords, k=1)
+            assert nearest[0][2] >= MIN_SYSTEM_SPACING
+
+    def test_large_galaxy_unique_and_inside_layers(self):
+        galaxy = Galaxy(seed=3, num_systems=5000)
+        procedural = [c for c, s in galaxy.systems.items() if s["name"] != "Proxima b"]
+        assert len(procedural) == 5000
+        assert len(set(procedural)) == 5000
+        z_min = min(layer["z_min"] for layer in GALAXY_LAYERS.values())
+        z_max = max(layer["z_max"] for layer in GALAXY_LAYERS.values())
+        for x, y, z in procedural:
+            assert 10 <= x <= galaxy.size_x - 10
+            assert 10 <= y <= galaxy.size_y - 10
+            assert z_min < z < z_max
+        # Layer 3 (Galactic Plane) has the highest density weight
+        layer_counts = {i: 0 for i in GALAXY_LAYERS}
+        for _x, _y, z in procedural:
+            for i, layer in GALAXY_LAYERS.items():
+                if layer["z_min"] <= z < layer["z_max"]:
+                    layer_counts[i] += 1
+        assert layer_counts[3] == max(layer_counts.values())
+
+    def test_placement_is_deterministic(self):
+        assert Galaxy(seed=5, num_systems=400).systems == Galaxy(seed=5, num_systems=400).systems
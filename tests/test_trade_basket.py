@@ -0,0 +1,152 @@
+"""
+Tier-2 tests: order baskets filled in one market update
+(EconomicSystem.execute_orders, Game.perform_trade_basket).
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_trade_basket.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from economy import EconomicSystem
+from market_table import MarketTable
+
+
+GOODS = ["Ore", "Grain", "Silk"]
+
+
+def _economy():
+    economy = EconomicSystem()
+    economy.base_prices.update({g: 20 for g in GOODS})
+    economy.markets = MarketTable.from_dict({
+        "Sol": {
+            "system_name": "Sol",
+            "supply": {"Ore": 300, "Grain": 200, "Silk": 40},
+            "demand": {"Ore": 100, "Grain": 150, "Silk": 200},
+            "prices": {"Ore": 10, "Grain": 20, "Silk": 50},
+        },
+    }, GOODS)
+    return economy
+
+
+def _basket(*lines):
+    return [{"side": side, "commodity": good, "quantity": qty} for side, good, qty in lines]
+
+
+# ---------------------------------------------------------------------------
+# EconomicSystem.execute_orders
+# ---------------------------------------------------------------------------
+
+class TestExecuteOrders:
+
+    def test_basket_fills_at_quoted_prices_and_reprices_once(self):
+        economy = _economy()
+        ok, _msg, fills = economy.execute_orders(
+            "Sol", _basket(("buy", "Ore", 50), ("buy", "Ore", 30), ("sell", "Silk", 20)),
+            player_credits=1_000, player_inventory={"Silk": 20})
+        assert ok
+        assert fills == [
+            {"commodity": "Ore", "side": "buy", "quantity": 80, "price_each": 10, "total": 800},
+            {"commodity": "Silk", "side": "sell", "quantity": 20, "price_each": 50, "total": 1000},
+        ]
+        sol = economy.markets["Sol"]
+        assert sol["supply"]["Ore"] == 220 and sol["supply"]["Silk"] == 60
+        assert sol["demand"]["Silk"] == 180
+        # one history sample per commodity, not one per order line
+        assert economy.market_history["Sol_Ore"] == [sol["prices"]["Ore"]]
+        assert len(economy.market_history["Sol_Silk"]) == 1
+
+    def test_sales_pay_for_purchases(self):
+        economy = _economy()
+        basket = _basket(("sell", "Silk", 10), ("buy", "Grain", 30))   # +500, -600
+        ok, msg, _fills = economy.execute_orders("Sol", basket, 50, {"Silk": 10})
+        assert not ok and "Insufficient credits" in msg
+        ok, _msg, _fills = economy.execute_orders("Sol", basket, 100, {"Silk": 10})
+        assert ok
+
+    def test_any_bad_line_rejects_the_whole_basket(self):
+        economy = _economy()
+        before = economy.markets.to_dict()
+        for basket, inventory, expected in [
+            (_basket(("buy", "Ore", 5), ("buy", "Silk", 41)), {}, "Only 40 Silk"),
+            (_basket(("buy", "Ore", 5), ("sell", "Grain", 1)), {}, "only have 0 Grain"),
+            (_basket(("buy", "Ore", 5), ("sell", "Ore", 1)), {"Ore": 1}, "both buy and sell"),
+            (_basket(("buy", "Ore", 5), ("steal", "Grain", 1)), {}, "side"),
+            (_basket(("buy", "Spice", 1)), {}, "not traded"),
+            (_basket(("buy", "Ore", 0)), {}, "greater than zero"),
+            ([], {}, "No orders"),
+        ]:
+            ok, msg, fills = economy.execute_orders("Sol", basket, 10**6, inventory)
+            assert not ok and expected in msg and fills == []
+        assert economy.markets.to_dict() == before
+        assert len(economy.market_history) == 0
+
+    def test_cargo_counts_net_units(self):
+        economy = _economy()
+        basket = _basket(("sell", "Silk", 20), ("buy", "Ore", 30))
+        ok, msg, _fills = economy.execute_orders("Sol", basket, 10**6, {"Silk": 20}, cargo_space=5)
+        assert not ok and "cargo space" in msg
+        ok, _msg, _fills = economy.execute_orders("Sol", basket, 10**6, {"Silk": 20}, cargo_space=10)
+        assert ok
+
+    def test_sales_free_only_cargo_aboard(self):
+        economy = _economy()
+        basket = _basket(("sell", "Silk", 20), ("buy", "Ore", 30))
+        # Only 5 of the 20 Silk are in the hold, so the sale frees 5 units
+        ok, msg, _fills = economy.execute_orders("Sol", basket, 10**6, {"Silk": 20},
+                                                 cargo_space=10, cargo={"Silk": 5})
+        assert not ok and "Need 25" in msg
+
+
+# ---------------------------------------------------------------------------
+# Game.perform_trade_basket
+# ---------------------------------------------------------------------------
+
+class TestGameBasket:
+
+    def test_updates_credits_inventory_and_cargo(self):
+        from game import Game
+        from navigation import Ship
+        game = Game(seed=5, background_thread=False)
+        ship = game.navigation.current_ship = Ship("Hauler")
+        ship.max_cargo = 50
+        ship.cargo = {"Silk": 20}
+        game.economy = _economy()
+        game.credits = 1_000
+        game.inventory = {"Silk": 20}
+        ok, _msg, fills = game.perform_trade_basket(
+            "Sol", _basket(("buy", "Ore", 30), ("buy", "Grain", 10), ("sell", "Silk", 20)))
+        assert ok and len(fills) == 3
+        assert game.credits == 1_000 - 300 - 200 + 1_000
+        assert game.inventory == {"Ore": 30, "Grain": 10}
+        assert ship.cargo == {"Ore": 30, "Grain": 10}
+
+        # 40 aboard, 50 max: the hold, not supply or credits, stops this one
+        ok, msg, _fills = game.perform_trade_basket("Sol", _basket(("buy", "Ore", 11)))
+        assert not ok and "cargo space" in msg
+        assert game.inventory == {"Ore": 30, "Grain": 10}
+
+    def test_selling_goods_not_in_the_hold_frees_no_cargo(self):
+        from game import Game
+        from navigation import Ship
+        game = Game(seed=5, background_thread=False)
+        ship = game.navigation.current_ship = Ship("Hauler")
+        ship.max_cargo = 50
+        ship.cargo = {"Ore": 50}
+        game.economy = _economy()
+        game.credits = 1_000
+        game.inventory = {"Ore": 50, "Silk": 20}   # the Silk is not aboard
+        basket = _basket(("sell", "Silk", 20), ("buy", "Grain", 10))
+        ok, msg, _fills = game.perform_trade_basket("Sol", basket)
+        assert not ok and "cargo space" in msg
+        assert game.inventory == {"Ore": 50, "Silk": 20} and ship.cargo == {"Ore": 50}
+
+        # Selling on its own goes through the same fill as perform_trade_sell
+        ok, _msg, _fills = game.perform_trade_basket("Sol", _basket(("sell", "Silk", 20)))
+        assert ok
+        assert game.inventory == {"Ore": 50} and ship.cargo == {"Ore": 50}
+        assert game.credits == 1_000 + 20 * 50
@@ -0,0 +1,164 @@
+"""
+Tier-2 tests: the sorted trade-opportunity index (trade_index.py,
+EconomicSystem.get_trade_opportunities).
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_trade_index.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import pickle
+import random
+from market_table import MarketTable
+from trade_index import MIN_MARGIN, MIN_SOURCE_SUPPLY, TradeIndex
+from economy import EconomicSystem
+
+
+GOODS = ["Ore", "Grain", "Silk", "Fuel", "Spice"]
+
+
+def _random_table(n=40, seed=3):
+    rng = random.Random(seed)
+    markets = {}
+    for i in range(n):
+        listed = [g for g in GOODS if rng.random() < 0.8]
+        markets[f"M{i:02d}"] = {
+            "system_name": f"M{i:02d}",
+            "supply": {g: rng.randint(0, 200) for g in listed},
+            "demand": {g: rng.randint(10, 200) for g in listed},
+            "prices": {g: rng.randint(5, 300) for g in listed},
+        }
+    return MarketTable.from_dict(markets, GOODS)
+
+
+def _positions(table, seed=3):
+    rng = random.Random(seed)
+    return {name: (rng.uniform(0, 100), rng.uniform(0, 100), 0) for name in table}
+
+
+def _brute_force(table, ok=lambda name: True):
+    """Every ordered pair of markets, the slow way."""
+    markets = table.to_dict()
+    routes = []
+    for src_name, src in markets.items():
+        for dst_name, dst in markets.items():
+            if src_name == dst_name or not ok(src_name) or not ok(dst_name):
+                continue
+            for good, supply in src["supply"].items():
+                if supply > MIN_SOURCE_SUPPLY and good in dst["prices"]:
+                    buy, sell = src["prices"][good], dst["prices"][good]
+                    if sell > buy * MIN_MARGIN:
+                        routes.append((sell / buy, good, src_name, dst_name))
+    routes.sort(reverse=True)
+    return routes
+
+
+def _margins(routes):
+    return [round(r["sell_price"] / r["buy_price"], 9) for r in routes]
+
+
+# ---------------------------------------------------------------------------
+# TradeIndex
+# ---------------------------------------------------------------------------
+
+class TestTradeIndex:
+
+    def test_top_routes_match_a_full_scan(self):
+        table = _random_table()
+        routes = TradeIndex(table).opportunities(25)
+        expected = _brute_force(table)[:25]
+        assert _margins(routes) == [round(m, 9) for m, *_ in expected]
+        for route in routes:
+            src = table[route["source"]]
+            assert route["source"] != route["destination"]
+            assert route["buy_price"] == src["prices"][route["commodity"]]
+            assert route["available_supply"] == src["supply"][route["commodity"]] > MIN_SOURCE_SUPPLY
+            assert route["profit_margin"] > (MIN_MARGIN - 1) * 100
+
+    def test_single_cell_writes_refile_without_rebuilding(self):
+        table = _random_table()
+        index = TradeIndex(table)
+        index.opportunities(5)
+        assert index.rebuilds == 1
+        cheapest = index.sources("Ore", 1)[0][0]
+        table[cheapest]["supply"]["Ore"] = 0          # sold out: no longer a source
+        table["M07"]["prices"]["Ore"] = 1
+        table["M07"]["supply"]["Ore"] = 500
+        table["M11"]["prices"]["Ore"] = 10_000
+        assert index.sources("Ore", 1) == [("M07", 1)]
+        assert index.sinks("Ore", 1) == [("M11", 10_000)]
+        assert cheapest not in [name for name, _ in index.sources("Ore", 50)]
+        assert index.rebuilds == 1
+        routes = index.opportunities(10)
+        assert _margins(routes) == [round(m, 9) for m, *_ in _brute_force(table)[:10]]
+
+    def test_bulk_changes_rebuild(self):
+        table = _random_table()
+        index = TradeIndex(table)
+        index.opportunities(5)
+        table.scale("supply", ["Silk"], 0.1, {g: 50 for g in GOODS})
+        routes = index.opportunities(10)
+        assert index.rebuilds == 2
+        assert _margins(routes) == [round(m, 9) for m, *_ in _brute_force(table)[:10]]
+        del table["M03"]
+        assert "M03" not in [name for name, _ in index.sinks("Fuel", 50)]
+
+    def test_distance_limits_both_ends(self):
+        table = _random_table(60)
+        positions = _positions(table)
+        ship = (50.0, 50.0, 0.0)
+
+        def ok(name):
+            return math.dist(ship, positions[name]) <= 30
+
+        routes = TradeIndex(table).opportunities(10, near=ship, positions=positions, max_distance=30)
+        assert routes
+        assert _margins(routes) == [round(m, 9) for m, *_ in _brute_force(table, ok)[:10]]
+        for route in routes:
+            assert ok(route["source"]) and ok(route["destination"])
+            assert route["distance"] == math.dist(ship, positions[route["source"]])
+        nearby = TradeIndex(table).sources("Grain", 3, near=ship, positions=positions, max_distance=30)
+        assert all(ok(name) for name, _ in nearby)
+        assert [p for _, p in nearby] == sorted(p for _, p in nearby)
+
+    def test_pickled_index_rebuilds(self):
+        table = _random_table()
+        index = TradeIndex(table)
+        before = index.opportunities(10)
+        restored = pickle.loads(pickle.dumps(index))
+        assert restored._sources == []
+        assert restored.opportunities(10) == before
+
+
+# ---------------------------------------------------------------------------
+# EconomicSystem integration
+# ---------------------------------------------------------------------------
+
+class TestEconomicSystem:
+
+    def test_trades_reprice_the_index(self):
+        economy = EconomicSystem()
+        economy.markets = _random_table().to_dict()
+        index = economy.trade_index
+        economy.get_trade_opportunities()
+        name, price = index.sources("Spice", 1)[0]
+        supply = economy.markets[name]["supply"]["Spice"]
+        ok, _msg = economy.buy_commodity(name, "Spice", supply - MIN_SOURCE_SUPPLY, 10**9)
+        assert ok
+        assert name not in [n for n, _ in index.sources("Spice", 50)]
+        assert index.rebuilds == 1
+        routes = economy.get_trade_opportunities()
+        assert _margins(routes) == [round(m, 9) for m, *_ in _brute_force(economy.markets)[:10]]
+
+    def test_replacing_markets_gets_a_fresh_index(self):
+        economy = EconomicSystem()
+        first = economy.trade_index
+        economy.markets = _random_table().to_dict()
+        assert economy.trade_index is not first
+        assert economy.trade_index.table is economy.markets
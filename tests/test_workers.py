@@ -0,0 +1,207 @@
+"""
+Tier-2 tests: worker-thread jobs (backend/workers.py), handing the actor's
+writer slot on while one runs, and end-of-turn progress reporting.
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_workers.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import threading
+import time
+import pytest
+from backend.actor import GameActor
+from backend.workers import WorkerPool, current_job
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+# ---------------------------------------------------------------------------
+# WorkerPool
+# ---------------------------------------------------------------------------
+
+class TestWorkerPool:
+
+    def test_runs_off_the_loop_thread_and_reports_progress(self):
+        reports = []
+
+        def work(job, n):
+            job.report(0.5, "halfway")
+            assert current_job() is job
+            return n * 2, threading.current_thread().name
+
+        async def scenario():
+            pool = WorkerPool()
+            job = pool.new_job("s1", "test", "Testing", on_progress=reports.append)
+            result = await pool.run(job, work, 21)
+            pool.shutdown()
+            return result, job
+
+        (value, thread_name), job = _run(scenario())
+        assert value == 42
+        assert thread_name.startswith("4x-worker")
+        assert [r["progress"] for r in reports] == [0.0, 0.5, 1.0]
+        assert reports[1]["stage"] == "halfway"
+        assert job.done and job.error is None
+
+    def test_loop_stays_responsive_while_job_runs(self):
+        ticks = []
+
+        def slow(job):
+            time.sleep(0.2)
+            return "done"
+
+        async def heartbeat():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def scenario():
+            pool = WorkerPool()
+            result, _ = await asyncio.gather(pool.run(pool.new_job("s1", "t", "t"), slow), heartbeat())
+            pool.shutdown()
+            return result
+
+        assert _run(scenario()) == "done"
+        assert len(ticks) == 5 and ticks[-1] - ticks[0] < 0.15
+
+    def test_busy_until_done_and_errors_propagate(self):
+        def boom(job):
+            time.sleep(0.02)
+            raise ValueError("bad save")
+
+        async def scenario():
+            pool = WorkerPool()
+            task = asyncio.ensure_future(pool.run(pool.new_job("s1", "save", "Saving"), boom))
+            await asyncio.sleep(0)
+            busy_during = pool.busy("s1") and not pool.busy("s2")
+            await pool.wait_idle("s1")
+            with pytest.raises(ValueError):
+                await task
+            pool.shutdown()
+            return busy_during, pool.busy("s1"), pool.failed
+
+        assert _run(scenario()) == (True, False, 1)
+
+    def test_one_job_per_key(self):
+        async def scenario():
+            pool = WorkerPool()
+            first = asyncio.ensure_future(pool.run(pool.new_job("s1", "t", "t"), lambda job: time.sleep(0.02)))
+            await asyncio.sleep(0)
+            with pytest.raises(RuntimeError):
+                await pool.run(pool.new_job("s1", "t", "t"), lambda job: None)
+            await first
+            pool.shutdown()
+
+        _run(scenario())
+
+    def test_cancelled_caller_keeps_key_busy_until_thread_ends(self):
+        finished = threading.Event()
+
+        def slow(job):
+            time.sleep(0.05)
+            finished.set()
+
+        async def scenario():
+            pool = WorkerPool()
+            task = asyncio.ensure_future(pool.run(pool.new_job("s1", "t", "t"), slow))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            await pool.wait_idle("s1")
+            pool.shutdown()
+            return finished.is_set()
+
+        assert _run(scenario()) is True
+
+    def test_deferred_callbacks_run_on_demand(self):
+        calls = []
+
+        def work(job):
+            current_job().defer(calls.append, threading.current_thread().name)
+
+        async def scenario():
+            pool = WorkerPool()
+            job = pool.new_job("s1", "t", "t")
+            await pool.run(job, work)
+            assert calls == []
+            job.run_deferred()
+            pool.shutdown()
+
+        _run(scenario())
+        assert len(calls) == 1 and calls[0].startswith("4x-worker")
+
+
+# ---------------------------------------------------------------------------
+# GameActor.suspended
+# ---------------------------------------------------------------------------
+
+class TestActorSuspended:
+
+    def test_other_holders_run_while_suspended(self):
+        log = []
+
+        async def scenario():
+            actor = GameActor()
+            pool = WorkerPool()
+
+            async def long_call():
+                async with actor.exclusive():
+                    log.append("long:start")
+                    async with actor.suspended():
+                        assert not actor.held()
+                        await pool.run(pool.new_job("a", "t", "t"), lambda job: time.sleep(0.05))
+                    assert actor.held()
+                    log.append("long:end")
+
+            async def quick_call():
+                async with actor.exclusive():
+                    log.append("quick")
+
+            first = asyncio.ensure_future(long_call())
+            await asyncio.sleep(0)
+            await asyncio.gather(first, quick_call())
+            await actor.stop()
+            pool.shutdown()
+
+        _run(scenario())
+        assert log == ["long:start", "quick", "long:end"]
+
+    def test_suspended_requires_exclusive(self):
+        async def scenario():
+            actor = GameActor()
+            with pytest.raises(RuntimeError):
+                async with actor.suspended():
+                    pass
+            await actor.stop()
+
+        _run(scenario())
+
+
+# ---------------------------------------------------------------------------
+# resolve_end_turn progress
+# ---------------------------------------------------------------------------
+
+class TestTurnProgress:
+
+    def test_resolve_end_turn_reports_each_phase(self):
+        from game import Game
+        g = Game(background_thread=False)
+        g.character_created = True
+        reports = []
+        g.resolve_end_turn(progress=lambda fraction, stage: reports.append((fraction, stage)))
+        fractions = [f for f, _ in reports]
+        assert fractions == sorted(fractions)
+        assert reports[0][0] == 0.0 and len(reports) >= 5
+        assert all(isinstance(stage, str) and stage for _, stage in reports)
@@ -0,0 +1,133 @@
+"""
+Tier-2 tests: the pre-generated world pool (backend/world_pool.py).
+
+Run with:
+    cd 4x_game
+    python -m pytest tests/test_world_pool.py -v
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import itertools
+import threading
+from backend.world_pool import WorldPool
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _counter_factory():
+    counter = itertools.count(1)
+    threads = []
+
+    def build():
+        threads.append(threading.current_thread().name)
+        return next(counter)
+
+    return build, threads
+
+
+async def _until(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.005)
+
+
+# ---------------------------------------------------------------------------
+# WorldPool
+# ---------------------------------------------------------------------------
+
+class TestWorldPool:
+
+    def test_nothing_is_built_before_start(self):
+        build, threads = _counter_factory()
+        pool = WorldPool(build, size=2)
+        assert pool.take() is None
+        assert threads == [] and pool.misses == 1
+
+    def test_fills_off_the_loop_and_refills_after_take(self):
+        build, threads = _counter_factory()
+
+        async def scenario():
+            pool = WorldPool(build, size=2)
+            pool.start()
+            assert pool.ready == 0          # start() returns before building
+            await _until(lambda: pool.ready == 2)
+            first = pool.take()
+            await _until(lambda: pool.ready == 2)
+            pool.stop()
+            return first, pool.stats()
+
+        first, stats = asyncio.run(scenario())
+        assert first == 1
+        assert stats["hits"] == 1 and stats["built"] == 3
+        assert all(name.startswith("4x-worldgen") for name in threads)
+
+    def test_miss_when_dry_still_schedules_a_refill(self):
+        gate = threading.Event()
+
+        def build():
+            gate.wait(1.0)
+            return "world"
+
+        async def scenario():
+            pool = WorldPool(build, size=1)
+            pool.start()
+            missed = pool.take()
+            gate.set()
+            await _until(lambda: pool.ready == 1)
+            taken = pool.take()
+            pool.stop()
+            return missed, taken, pool.misses, pool.hits
+
+        assert asyncio.run(scenario()) == (None, "world", 1, 1)
+
+    def test_size_zero_disables_the_pool(self):
+        build, threads = _counter_factory()
+
+        async def scenario():
+            pool = WorldPool(build, size=0)
+            pool.start()
+            await asyncio.sleep(0.02)
+            result = pool.take()
+            pool.stop()
+            return result
+
+        assert asyncio.run(scenario()) is None
+        assert threads == []
+
+    def test_failed_build_is_counted_not_retried(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            raise RuntimeError("no galaxy")
+
+        async def scenario():
+            pool = WorldPool(build, size=1)
+            pool.start()
+            await _until(lambda: pool.failed == 1)
+            await asyncio.sleep(0.02)
+            pool.stop()
+            return pool.ready
+
+        assert asyncio.run(scenario()) == 0
+        assert len(calls) == 1
+
+    def test_stop_drops_ready_worlds(self):
+        build, _ = _counter_factory()
+
+        async def scenario():
+            pool = WorldPool(build, size=2)
+            pool.start()
+            await _until(lambda: pool.ready == 2)
+            pool.stop()
+            return pool.ready, pool.take()
+
+        assert asyncio.run(scenario()) == (0, None)
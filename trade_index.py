@@ -0,0 +1,273 @@
+"""
+Trade Index - Cheapest Sources and Richest Sinks, Kept Sorted
+
+EconomicSystem.get_trade_opportunities() used to compare every pair of
+markets across every commodity on each call: O(markets² × commodities),
+about 11 million comparisons (~10 s) for a 300-system galaxy, every time
+the trade screen opened.
+
+TradeIndex keeps, per commodity, two sorted lists over the MarketTable:
+
+    sources   (price, market)    markets with more than MIN_SOURCE_SUPPLY
+                                 in stock, cheapest first
+    sinks     (-price, market)   every market listing the good, dearest first
+
+A trade or a single-commodity reprice writes one cell; the table notes it
+and the index moves just that market's entries (a bisect and a list
+insert).  A bulk change - the turn tick, an economic event, a new market -
+bumps the table's version and the lists are rebuilt on the next query.
+
+The best routes are then a best-first walk over (source rank, sink rank)
+pairs from the top of each commodity's lists, so a top-10 lookup touches a
+few dozen entries however many markets there are.  Queries can be limited
+to markets within a distance of the ship:
+
+    index.opportunities(10)
+    index.opportunities(10, near=ship.coordinates, positions=positions,
+                        max_distance=40)
+    index.sources("Ethergrain", 5, near=ship.coordinates, positions=positions)
+"""
+
+import heapq
+import math
+from array import array
+from bisect import bisect_left, insort
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+# A source must hold more than this much of the good to be worth the trip
+MIN_SOURCE_SUPPLY = 50
+# A route must sell for more than this multiple of the buy price (30%)
+MIN_MARGIN = 1.3
+
+
+class _Ranked:
+    """The entries of one sorted list that pass a filter, ranked lazily."""
+
+    __slots__ = ("_entries", "_ok", "_kept", "_scan")
+
+    def __init__(self, entries: List[tuple], ok: Optional[Callable[[str], bool]]):
+        self._entries = entries
+        self._ok = ok
+        self._kept: List[tuple] = []
+        self._scan = 0
+
+    def get(self, rank: int) -> Optional[tuple]:
+        if self._ok is None:
+            return self._entries[rank] if rank < len(self._entries) else None
+        kept, entries = self._kept, self._entries
+        while len(kept) <= rank and self._scan < len(entries):
+            entry = entries[self._scan]
+            self._scan += 1
+            if self._ok(entry[1]):
+                kept.append(entry)
+        return kept[rank] if rank < len(kept) else None
+
+
+class TradeIndex:
+    """Per-commodity sorted sources and sinks over one MarketTable."""
+
+    def __init__(self, table):
+        self.table = table
+        self._version: Optional[int] = None
+        self._sources: List[List[Tuple[int, str]]] = []
+        self._sinks: List[List[Tuple[int, str]]] = []
+        # Price each cell is filed under (-1: not filed), to find it again
+        self._source_price = array('q')
+        self._sink_price = array('q')
+        self.rebuilds = 0
+
+    def __getstate__(self):
+        # The lists are derived; a pickled index rebuilds on first use
+        state = dict(self.__dict__)
+        state.update(_version=None, _sources=[], _sinks=[],
+                     _source_price=array('q'), _sink_price=array('q'))
+        return state
+
+    # ------------------------------------------------------------------
+    # Keeping up with the table
+    # ------------------------------------------------------------------
+
+    def sync(self):
+        """Bring the lists up to date with the table."""
+        table = self.table
+        if table.version != self._version:
+            self._rebuild()
+            return
+        touched = table.drain_touched()
+        if touched:
+            names = table.row_names()
+            w = table.width
+            for i in touched:
+                self._refile(i, names[i // w], i % w)
+
+    def _rebuild(self):
+        table = self.table
+        table.drain_touched()
+        names = table.row_names()
+        w = table.width
+        self._source_price = array('q', [-1]) * (len(names) * w)
+        self._sink_price = array('q', [-1]) * (len(names) * w)
+        self._sources, self._sinks = [], []
+        for col in range(w):
+            prices = table.column('prices', col)
+            supply = table.column('supply', col)
+            present = table.column('present', col)
+            sources = [(p, n) for p, s, x, n in zip(prices, supply, present, names)
+                       if x and s > MIN_SOURCE_SUPPLY and p > 0]
+            sinks = [(-p, n) for p, x, n in zip(prices, present, names) if x and p > 0]
+            sources.sort()
+            sinks.sort()
+            self._sources.append(sources)
+            self._sinks.append(sinks)
+            self._source_price[col::w] = array('q', [p if x and s > MIN_SOURCE_SUPPLY and p > 0 else -1
+                                                     for p, s, x in zip(prices, supply, present)])
+            self._sink_price[col::w] = array('q', [p if x and p > 0 else -1 for p, x in zip(prices, present)])
+        self._version = table.version
+        self.rebuilds += 1
+
+    def _refile(self, i: int, name: str, col: int):
+        a = self.table._a
+        price, listed = a['prices'][i], a['present'][i]
+        source = price if listed and a['supply'][i] > MIN_SOURCE_SUPPLY and price > 0 else -1
+        sink = price if listed and price > 0 else -1
+        if source != self._source_price[i]:
+            _move(self._sources[col], self._source_price[i], source, name, 1)
+            self._source_price[i] = source
+        if sink != self._sink_price[i]:
+            _move(self._sinks[col], self._sink_price[i], sink, name, -1)
+            self._sink_price[i] = sink
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def sources(self, commodity: str, n: int = 5, near: Optional[Sequence[float]] = None,
+                positions: Optional[Mapping[str, Sequence[float]]] = None,
+                max_distance: Optional[float] = None) -> List[Tuple[str, int]]:
+        """Up to n (market, price) where `commodity` is cheapest, in stock."""
+        return self._top('_sources', commodity, n, 1, near, positions, max_distance)
+
+    def sinks(self, commodity: str, n: int = 5, near: Optional[Sequence[float]] = None,
+              positions: Optional[Mapping[str, Sequence[float]]] = None,
+              max_distance: Optional[float] = None) -> List[Tuple[str, int]]:
+        """Up to n (market, price) paying the most for `commodity`."""
+        return self._top('_sinks', commodity, n, -1, near, positions, max_distance)
+
+    def opportunities(self, n: int = 10, near: Optional[Sequence[float]] = None,
+                      positions: Optional[Mapping[str, Sequence[float]]] = None,
+                      max_distance: Optional[float] = None) -> List[Dict]:
+        """
+        The n most profitable routes (by margin) across every commodity:
+        buy where the good is cheap and in stock, sell where it sells for
+        more than MIN_MARGIN times that.  With max_distance, both markets
+        must lie within it of `near` (looked up in `positions`); with
+        `near` each route also reports its 'distance' to the source.
+        """
+        self.sync()
+        ok, where = _distance_filter(near, positions, max_distance)
+        commodities = self.table.commodities
+        ranked: Dict[int, Tuple[_Ranked, _Ranked]] = {}
+
+        def ranks(col: int) -> Tuple[_Ranked, _Ranked]:
+            pair = ranked.get(col)
+            if pair is None:
+                pair = ranked[col] = (_Ranked(self._sources[col], ok), _Ranked(self._sinks[col], ok))
+            return pair
+
+        if ok is None:
+            heap = [(sources[0][0] / -sinks[0][0], col, 0, 0)
+                    for col, (sources, sinks) in enumerate(zip(self._sources, self._sinks))
+                    if sources and sinks]
+        else:
+            heap = []
+            for col, (sources, sinks) in enumerate(zip(self._sources, self._sinks)):
+                if not sources or not sinks:
+                    continue
+                source, sink = (r.get(0) for r in ranks(col))
+                if source is not None and sink is not None:
+                    heap.append((source[0] / -sink[0], col, 0, 0))
+        heapq.heapify(heap)
+        seen = set()
+        supply = self.table._a['supply']
+        rows = self.table._rows
+        w = self.table.width
+        found: List[Dict] = []
+        # Keys are buy / sell: the heap yields the best margin first, so
+        # the first route under MIN_MARGIN ends the walk
+        while heap and len(found) < n:
+            _key, col, i, j = heapq.heappop(heap)
+            source_ranks, sink_ranks = ranks(col)
+            buy, source = source_ranks.get(i)
+            sell, destination = sink_ranks.get(j)
+            sell = -sell
+            if sell <= buy * MIN_MARGIN:
+                break
+            if source != destination:
+                route = {
+                    'commodity': commodities[col],
+                    'source': source,
+                    'destination': destination,
+                    'buy_price': buy,
+                    'sell_price': sell,
+                    'profit_margin': ((sell - buy) / buy) * 100,
+                    'available_supply': supply[rows[source].index * w + col],
+                }
+                if where is not None:
+                    route['distance'] = where(source)
+                found.append(route)
+            for ni, nj in ((i + 1, j), (i, j + 1)):
+                if (col, ni, nj) in seen:
+                    continue
+                seen.add((col, ni, nj))
+                nxt_source, nxt_sink = source_ranks.get(ni), sink_ranks.get(nj)
+                if nxt_source is not None and nxt_sink is not None:
+                    heapq.heappush(heap, (nxt_source[0] / -nxt_sink[0], col, ni, nj))
+        return found
+
+    def _top(self, which, commodity, n, sign, near, positions, max_distance):
+        self.sync()          # may rebuild: look the lists up afterwards
+        col = self.table._col.get(commodity)
+        if col is None:
+            return []
+        ok, _where = _distance_filter(near, positions, max_distance)
+        ranks = _Ranked(getattr(self, which)[col], ok)
+        top = []
+        for rank in range(n):
+            entry = ranks.get(rank)
+            if entry is None:
+                break
+            top.append((entry[1], sign * entry[0]))
+        return top
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _move(entries: List[tuple], old: int, new: int, name: str, sign: int):
+    """Refile `name` in a sorted list from price `old` to `new` (-1: absent)."""
+    if old >= 0:
+        at = bisect_left(entries, (sign * old, name))
+        if at < len(entries) and entries[at] == (sign * old, name):
+            del entries[at]
+    if new >= 0:
+        insort(entries, (sign * new, name))
+
+
+def _distance_filter(near, positions, max_distance):
+    """(ok(name) -> bool or None, distance(name) -> float or None) for a query."""
+    if near is None or positions is None:
+        return None, None
+    cache: Dict[str, float] = {}
+
+    def distance(name: str) -> float:
+        d = cache.get(name)
+        if d is None:
+            pos = positions.get(name)
+            d = cache[name] = math.dist(near, pos) if pos is not None else math.inf
+        return d
+
+    if max_distance is None:
+        return None, distance
+    return (lambda name: distance(name) <= max_distance), distance